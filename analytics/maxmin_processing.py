@@ -10,6 +10,7 @@ import numpy as np
 import logging
 from typing import List, Dict, Any, Tuple, Optional
 from core import config
+from core.data_catalog import load_table
 
 # Default thresholds (used if not specified in config or overrides)
 DEFAULT_MAX_THRESHOLD = 10000
@@ -35,7 +36,7 @@ def _load_distressed_isins(data_folder: str) -> set:
     if not os.path.exists(ref_path):
         return distressed_isins
     try:
-        df = pd.read_csv(ref_path, dtype=str)
+        df = load_table(ref_path, dtype=str)
         if "ISIN" in df.columns and "Is Distressed" in df.columns:
             # Normalize and filter
             mask = df["Is Distressed"].astype(str).str.strip().str.upper() == "TRUE"
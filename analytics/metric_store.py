@@ -0,0 +1,358 @@
+"""
+Metric Store - canonical long-format copy of each sec_<metric>.csv, indexed by ISIN and date
+Preprocessing melts every wide security file once and writes it as column arrays sorted by
+ISIN (rows of one ISIN are contiguous, in date order) plus a date permutation. Queries for one
+security's history or one date's cross-section are then offset lookups into memory-mapped
+arrays instead of a full-file melt. The store is bound to the source file's (mtime, size);
+a stale or missing store makes callers fall back to load_and_process_security_data.
+good_points.csv overrides are applied at query time, so marking a point does not
+invalidate the store. Set SDC_METRIC_STORE_DISABLE=1 to neither build nor use stores.
+"""
+
+import os
+import re
+import json
+import bisect
+import shutil
+import logging
+import pickle
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core import config
+from core.bounded_cache import file_stamp
+from core.columnar_cache import CACHE_DIR_NAME
+
+logger = logging.getLogger(__name__)
+
+
+STORE_SUBDIR = 'metric_store'
+MANIFEST_NAME = 'manifest.json'
+STORE_FORMAT_VERSION = 1
+
+
+def is_metric_store_enabled() -> bool:
+    """Return False when disabled via SDC_METRIC_STORE_DISABLE=1."""
+    return os.getenv('SDC_METRIC_STORE_DISABLE', '0') != '1'
+
+
+def metric_store_dir(data_folder: str, filename: str) -> Path:
+    """Folder holding the store generations for one sec_ file."""
+    return Path(data_folder) / CACHE_DIR_NAME / STORE_SUBDIR / Path(filename).stem
+
+
+def _is_mappable(series: pd.Series) -> bool:
+    """Numeric, boolean and datetime columns are stored as plain .npy arrays."""
+    dtype = series.dtype
+    return isinstance(dtype, np.dtype) and dtype.kind in 'biufM'
+
+
+def build_metric_store(data_folder: str, filename: str) -> Optional[Path]:
+    """
+    Melt *filename* and publish it as a new store generation.
+
+    The generation folder is written completely before the manifest is
+    swapped in atomically; older generations are removed afterwards.
+
+    Returns:
+        Path of the published generation, or None if the file could not be
+        melted, is not keyed by ISIN, or changed while it was being read.
+    """
+    from analytics.security_processing import _read_and_melt_security_file
+
+    filepath = os.path.join(data_folder, filename)
+    stamp = file_stamp(filepath)
+    if stamp is None:
+        return None
+    try:
+        df_long, static_cols, meta = _read_and_melt_security_file(filepath, f"[{filename}] ")
+    except Exception as e:
+        logger.warning(f"Could not build metric store for {filename}: {e}")
+        return None
+    if meta is None or df_long.empty:
+        return None
+    id_col = meta['id_col']
+    frame = df_long.reset_index()
+    ids = frame[id_col]
+    if id_col != config.ISIN_COL or not ids.map(lambda v: isinstance(v, str)).all():
+        logger.info(f"Skipping metric store for {filename}: not keyed by string ISINs")
+        return None
+
+    # Rows grouped by ISIN; the stable sort keeps the melt's date order inside each ISIN
+    codes, isins = pd.factorize(ids, sort=True)
+    order = np.argsort(codes, kind='stable')
+    frame = frame.iloc[order].reset_index(drop=True)
+    isin_offsets = np.searchsorted(codes[order], np.arange(len(isins) + 1))
+
+    dates = frame['Date'].to_numpy(dtype='datetime64[ns]')
+    date_order = np.argsort(dates, kind='stable')
+    date_keys, date_starts = np.unique(dates[date_order], return_index=True)
+    date_offsets = np.append(date_starts, len(dates))
+
+    store_dir = metric_store_dir(data_folder, filename)
+    store_dir.mkdir(parents=True, exist_ok=True)
+    generation = f'gen-{time.time_ns()}-{os.getpid()}'
+    gen_dir = store_dir / generation
+    gen_dir.mkdir()
+
+    value_columns = [c for c in frame.columns if c != id_col]
+    mapped: Dict[str, str] = {}
+    coded: Dict[str, str] = {}
+    categories: Dict[str, np.ndarray] = {}
+    for i, col in enumerate(value_columns):
+        series = frame[col]
+        file_name = f'c{i}.npy'
+        if _is_mappable(series):
+            np.save(gen_dir / file_name, np.ascontiguousarray(series.to_numpy()), allow_pickle=False)
+            mapped[col] = file_name
+        else:
+            col_codes, uniques = pd.factorize(series, use_na_sentinel=True)
+            np.save(gen_dir / file_name, col_codes.astype(np.int32), allow_pickle=False)
+            coded[col] = file_name
+            categories[col] = np.asarray(uniques, dtype=object)
+    np.save(gen_dir / 'isin_offsets.npy', isin_offsets.astype(np.int64), allow_pickle=False)
+    np.save(gen_dir / 'date_order.npy', date_order.astype(np.int64), allow_pickle=False)
+    np.save(gen_dir / 'date_keys.npy', date_keys, allow_pickle=False)
+    np.save(gen_dir / 'date_offsets.npy', date_offsets.astype(np.int64), allow_pickle=False)
+    with open(gen_dir / 'objects.pkl', 'wb') as f:
+        pickle.dump({'isins': list(isins), 'categories': categories}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    if file_stamp(filepath) != stamp:
+        logger.warning(f"{filename} changed while building its metric store; discarding")
+        shutil.rmtree(gen_dir, ignore_errors=True)
+        return None
+
+    manifest = {
+        'version': STORE_FORMAT_VERSION,
+        'source': filename,
+        'stamp': list(stamp),
+        'generation': generation,
+        'id_col': id_col,
+        'columns': value_columns,
+        'static_cols': [c for c in static_cols if c in frame.columns],
+        'mapped': mapped,
+        'coded': coded,
+        'nrows': int(len(frame)),
+    }
+    tmp_fd, tmp_path = tempfile.mkstemp(dir=str(store_dir), prefix=MANIFEST_NAME + '.tmp-')
+    with os.fdopen(tmp_fd, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, store_dir / MANIFEST_NAME)
+    for entry in store_dir.iterdir():
+        if entry.is_dir() and entry.name != generation:
+            shutil.rmtree(entry, ignore_errors=True)
+    logger.info(f"Built metric store for {filename}: {len(frame)} rows, {len(isins)} ISINs")
+    return gen_dir
+
+
+def build_metric_stores(data_folder: str, filenames: Optional[Iterable[str]] = None) -> List[str]:
+    """Build stores for *filenames* (all sec_*.csv in *data_folder* when None).
+
+    Returns the file names a store was published for.
+    """
+    if not is_metric_store_enabled():
+        logger.info("Metric store disabled via SDC_METRIC_STORE_DISABLE=1")
+        return []
+    if filenames is None:
+        try:
+            filenames = sorted(
+                f for f in os.listdir(data_folder)
+                if f.startswith('sec_') and f.lower().endswith('.csv')
+            )
+        except OSError as e:
+            logger.error(f"Cannot list {data_folder} for metric stores: {e}")
+            return []
+    built = []
+    for filename in filenames:
+        if build_metric_store(data_folder, filename) is not None:
+            built.append(filename)
+    return built
+
+
+class MetricStore:
+    """Read-only view of one published store generation."""
+
+    def __init__(self, data_folder: str, gen_dir: Path, manifest: Dict[str, Any]):
+        self.data_folder = data_folder
+        self.filename = manifest['source']
+        self.id_col = manifest['id_col']
+        self.static_cols: List[str] = list(manifest['static_cols'])
+        self._columns: List[str] = list(manifest['columns'])
+        self._manifest = manifest
+        with open(gen_dir / 'objects.pkl', 'rb') as f:
+            objects = pickle.load(f)
+        self.isins: List[str] = objects['isins']
+        self._categories: Dict[str, np.ndarray] = objects['categories']
+
+        def _load(name: str) -> np.ndarray:
+            return np.load(gen_dir / name, mmap_mode='r', allow_pickle=False).view(np.ndarray)
+
+        self._arrays = {
+            col: _load(name)
+            for col, name in {**manifest['mapped'], **manifest['coded']}.items()
+        }
+        self._isin_offsets = np.load(gen_dir / 'isin_offsets.npy', allow_pickle=False)
+        self._date_order = _load('date_order.npy')
+        self._date_keys = np.load(gen_dir / 'date_keys.npy', allow_pickle=False)
+        self._date_offsets = np.load(gen_dir / 'date_offsets.npy', allow_pickle=False)
+
+    def _frame(self, positions: np.ndarray) -> pd.DataFrame:
+        """Rows at *positions*, shaped like load_and_process_security_data output."""
+        data = {}
+        for col in self._columns:
+            values = self._arrays[col][positions]
+            if col in self._categories:
+                cats = self._categories[col]
+                out = np.full(len(values), np.nan, dtype=object)
+                valid = values >= 0
+                out[valid] = cats[values[valid]]
+                values = out
+            data[col] = values
+        isin_codes = np.searchsorted(self._isin_offsets, positions, side='right') - 1
+        data[self.id_col] = np.asarray(self.isins, dtype=object)[isin_codes]
+        df = pd.DataFrame(data)
+        df.set_index(['Date', self.id_col], inplace=True)
+        return df
+
+    def _isin_positions(self, isin: str) -> np.ndarray:
+        i = bisect.bisect_left(self.isins, isin)
+        if i == len(self.isins) or self.isins[i] != isin:
+            return np.empty(0, dtype=np.int64)
+        return np.arange(self._isin_offsets[i], self._isin_offsets[i + 1])
+
+    def variants(self, security_id: str) -> List[str]:
+        """ISINs equal to the base of *security_id* or to a hyphenated variant of it."""
+        base = re.sub(r"-\d+$", "", security_id or "")
+        if not base:
+            return []
+        pattern = re.compile(rf"^{re.escape(base)}-\d+$")
+        found = []
+        for isin in self.isins[bisect.bisect_left(self.isins, base):]:
+            if not isin.startswith(base):
+                break
+            if isin == base or pattern.match(isin):
+                found.append(isin)
+        return found
+
+    def history(self, isins: Iterable[str]) -> pd.DataFrame:
+        """All rows for *isins* (index Date, ISIN), in ISIN then date order."""
+        positions = [self._isin_positions(isin) for isin in isins]
+        positions = np.concatenate(positions) if positions else np.empty(0, dtype=np.int64)
+        return self._frame(positions)
+
+    def date_slice(self, date) -> pd.DataFrame:
+        """All rows for one date (index Date, ISIN), in ISIN order."""
+        key = np.datetime64(pd.Timestamp(date).to_datetime64(), 'ns')
+        i = int(np.searchsorted(self._date_keys, key))
+        if i == len(self._date_keys) or self._date_keys[i] != key:
+            return self._frame(np.empty(0, dtype=np.int64))
+        positions = np.sort(self._date_order[self._date_offsets[i]:self._date_offsets[i + 1]])
+        return self._frame(positions)
+
+    def dates(self) -> pd.DatetimeIndex:
+        return pd.DatetimeIndex(self._date_keys)
+
+
+# Store directory (one per metric file) → (open generation directory, its store)
+_open_stores: Dict[str, Tuple[str, MetricStore]] = {}
+_open_lock = threading.Lock()
+
+
+def open_metric_store(data_folder: str, filename: str) -> Optional[MetricStore]:
+    """Return the store for *filename* if one exists and matches the source file."""
+    if not is_metric_store_enabled():
+        return None
+    store_dir = metric_store_dir(data_folder, filename)
+    try:
+        with open(store_dir / MANIFEST_NAME, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != STORE_FORMAT_VERSION:
+        return None
+    stamp = file_stamp(os.path.join(data_folder, filename))
+    if stamp is None or list(stamp) != manifest.get('stamp'):
+        logger.debug(f"Metric store for {filename} is stale; ignoring it")
+        return None
+    gen_dir = store_dir / manifest['generation']
+    key, generation = str(store_dir.resolve()), str(gen_dir.resolve())
+    with _open_lock:
+        cached = _open_stores.get(key)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+        try:
+            store = MetricStore(data_folder, gen_dir, manifest)
+        except (OSError, KeyError, ValueError, pickle.UnpicklingError) as e:
+            logger.warning(f"Failed to open metric store {gen_dir}: {e}")
+            return None
+        # Replaces this file's previous generation only
+        _open_stores[key] = (generation, store)
+    return store
+
+
+def _with_overrides(df: pd.DataFrame, store: MetricStore) -> pd.DataFrame:
+    from analytics.security_processing import _apply_good_points_overrides
+
+    if not df.empty:
+        _apply_good_points_overrides(df, store.filename, store.data_folder, f"[{store.filename}] ")
+    return df
+
+
+def get_security_history(data_folder: str, filename: str, isin: str) -> Optional[pd.DataFrame]:
+    """
+    Return one security's rows (index Date, ISIN) with good_points overrides applied.
+
+    Returns None when no valid store exists for *filename*, so callers can fall
+    back to load_and_process_security_data.
+    """
+    store = open_metric_store(data_folder, filename)
+    if store is None:
+        return None
+    return _with_overrides(store.history([isin]), store)
+
+
+def get_security_variants(
+    data_folder: str, filename: str, security_id: str
+) -> Optional[Tuple[pd.DataFrame, List[str]]]:
+    """
+    Return ``(rows, static_cols)`` for *security_id* and its hyphenated variants.
+
+    Returns None when no valid store exists or the store holds none of those
+    ISINs; the caller then falls back to the full melt (which also covers
+    lookups by security name).
+    """
+    store = open_metric_store(data_folder, filename)
+    if store is None:
+        return None
+    candidates = store.variants(security_id)
+    if not candidates:
+        return None
+    return _with_overrides(store.history(candidates), store), list(store.static_cols)
+
+
+def get_date_slice(data_folder: str, filename: str, date) -> Optional[pd.DataFrame]:
+    """Return every security's row for *date* (None when no valid store exists)."""
+    store = open_metric_store(data_folder, filename)
+    if store is None:
+        return None
+    return _with_overrides(store.date_slice(date), store)
+
+
+if __name__ == '__main__':
+    # Build stores for the configured data folder (preprocessing does this automatically)
+    import sys
+    try:
+        from core.settings_loader import get_app_config
+        app_cfg = get_app_config() or {}
+        dfolder = app_cfg.get('data_folder') or 'Data'
+    except Exception:
+        dfolder = 'Data'
+    target = sys.argv[1] if len(sys.argv) > 1 else dfolder
+    logging.basicConfig(level=logging.INFO)
+    print(build_metric_stores(target))
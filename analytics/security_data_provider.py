@@ -6,12 +6,14 @@ Ensures consistent data collection and merging across all calculation methods
 import os
 import logging
 import pandas as pd
+from core.data_catalog import load_table
 import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 import threading
+import time
 import json
 
 logger = logging.getLogger(__name__)
@@ -56,21 +58,159 @@ class SecurityData:
     amortization_schedule: Optional[List[Dict[str, Any]]] = None
 
 
+@dataclass
+class SecurityDataBatch:
+    """
+    Security data for a grid of ISINs x dates, stored by column.
+
+    Terms (reference, schedule, price-file attributes) are resolved once per
+    ISIN; price and accrued interest are (ISIN, date) arrays with 0.0 where
+    missing, as on SecurityData. ``security_data(i, j)`` gives the same
+    object get_security_data(isins[i], dates[j]) would.
+    """
+    isins: List[str]
+    dates: List[str]
+    terms: List[SecurityData]
+    prices: np.ndarray
+    accrued: np.ndarray
+    valuation_dates: List[Optional[datetime]] = field(default_factory=list)
+
+    def security_data(self, i: int, j: int) -> SecurityData:
+        """SecurityData for ISIN *i* on date *j* (with date-dependent defaults applied)."""
+        terms = self.terms[i]
+        data = replace(terms, price=float(self.prices[i, j]), accrued_interest=float(self.accrued[i, j]))
+        if terms.amortization_schedule:
+            data.amortization_schedule = [dict(item) for item in terms.amortization_schedule]
+        _apply_date_defaults(data, self.valuation_dates[j])
+        return data
+
+
+def _apply_date_defaults(data: SecurityData, val_date: Optional[datetime]) -> None:
+    """
+    Apply default values for missing fields.
+    
+    Args:
+        data: SecurityData object to update
+        val_date: Parsed valuation date (None for today)
+    """
+    if val_date is None:
+        val_date = datetime.now()
+    
+    # Default maturity: 5 years from valuation (preserve exact date)
+    if data.maturity_date is None:
+        # Use replace to keep same day of month
+        try:
+            data.maturity_date = val_date.replace(year=val_date.year + 5)
+        except ValueError:
+            # Handle leap year edge case (Feb 29)
+            data.maturity_date = val_date + timedelta(days=5*365)
+        logger.debug(f"Using default 5-year maturity for {data.isin}")
+    
+    # Default issue date: 1 year before valuation (preserve exact date)
+    if data.issue_date is None:
+        # Use replace to keep same day of month
+        try:
+            data.issue_date = val_date.replace(year=val_date.year - 1)
+        except ValueError:
+            # Handle leap year edge case (Feb 29)
+            data.issue_date = val_date - timedelta(days=365)
+        logger.debug(f"Using default issue date 1 year ago for {data.isin}")
+    
+    # Default first coupon: 6 months after issue
+    if data.first_coupon_date is None and data.issue_date:
+        months = 12 // data.coupon_frequency if data.coupon_frequency > 0 else 6
+        data.first_coupon_date = data.issue_date + timedelta(days=months*30)
+    
+    # Coupon rate: already defaulted to 0.0 in SecurityData
+    # Frequency: already defaulted to 2 in SecurityData
+    # Currency: already defaulted to USD in SecurityData
+    # Day basis: already defaulted to ACT/ACT in SecurityData
+
+
+def _float_block(values: np.ndarray) -> np.ndarray:
+    """Cells as floats, NaN where missing (float() of each cell, as the scalar lookups do)."""
+    try:
+        return values.astype(float)
+    except (TypeError, ValueError):
+        return np.array(
+            [[float(v) if pd.notna(v) else np.nan for v in row] for row in values], dtype=float
+        ).reshape(values.shape)
+
+
+# Seconds between the source-file mtime checks made by get_security_data
+# (0 checks on every call)
+DEFAULT_FRESHNESS_SECONDS = 2.0
+
+# Parsed-date memo is cleared once it holds this many distinct strings
+_PARSED_DATE_MEMO_LIMIT = 100_000
+
+
+class _TableIndex:
+    """Row positions by ISIN for one loaded table (rebuilt on every reload)."""
+
+    __slots__ = ('df', 'positions', 'columns', 'memo', '_rows')
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.positions: Dict[str, List[int]] = {}
+        for pos, isin in enumerate(df['ISIN'].tolist()):
+            self.positions.setdefault(isin, []).append(pos)
+        self.columns: Dict[Any, int] = {}
+        for pos, col in enumerate(df.columns):
+            self.columns.setdefault(col, pos)
+        # Values derived from this table version (accrued date plans, amortization lists)
+        self.memo: Dict[Any, Any] = {}
+        self._rows: Dict[int, pd.Series] = {}
+
+    def row(self, pos: int) -> pd.Series:
+        """Row at *pos*, built once and shared by later lookups (treat as read-only)."""
+        row = self._rows.get(pos)
+        if row is None:
+            row = self.df.iloc[pos]
+            self._rows[pos] = row
+        return row
+
+    def cell(self, pos: int, column: Any) -> Any:
+        """Value at row *pos* in *column*, or None when the column is absent."""
+        col_pos = self.columns.get(column)
+        return None if col_pos is None else self.df.iat[pos, col_pos]
+
+
 class SecurityDataProvider:
     """
     Unified data provider for security analytics calculations.
     Provides consistent data loading, normalization, and merging logic.
     """
+
+    # Shared-store table key -> attribute holding the DataFrame
+    _TABLE_ATTRS = {
+        'price': '_price_df',
+        'schedule': '_schedule_df',
+        'reference': '_reference_df',
+        'accrued': '_accrued_df',
+        'curves': '_curves_df',
+        'amort': '_amort_df',
+    }
     
-    def __init__(self, data_folder: str):
+    def __init__(self, data_folder: str, use_shared_store: Optional[bool] = None,
+                 freshness_interval: Optional[float] = None):
         """
         Initialize the provider with a data folder.
         
         Args:
             data_folder: Path to the folder containing CSV data files
+            use_shared_store: Attach to tables published by
+                analytics.shared_data_store instead of parsing the CSVs.
+                Defaults to the SDC_SHARED_STORE=1 environment variable.
+            freshness_interval: Minimum seconds between the file mtime checks
+                made by get_security_data. Defaults to the
+                SDC_PROVIDER_FRESHNESS_SECONDS environment variable, else 2.
         """
         self.data_folder = Path(data_folder)
         self._lock = threading.RLock()
+        if use_shared_store is None:
+            use_shared_store = os.getenv('SDC_SHARED_STORE', '0') == '1'
+        self._use_shared_store = use_shared_store
         
         # Data containers
         self._price_df: Optional[pd.DataFrame] = None
@@ -82,13 +222,52 @@ class SecurityDataProvider:
         
         # File modification times for cache invalidation
         self._file_mtimes: Dict[str, float] = {}
+        if freshness_interval is None:
+            try:
+                freshness_interval = float(os.getenv('SDC_PROVIDER_FRESHNESS_SECONDS', DEFAULT_FRESHNESS_SECONDS))
+            except ValueError:
+                freshness_interval = DEFAULT_FRESHNESS_SECONDS
+        self._freshness_interval = freshness_interval
+        self._last_freshness_check = 0.0
+        
+        # Lookup indexes over the loaded tables; generation counts (re)loads so
+        # callers holding derived data can tell when it is stale
+        self._indexes: Dict[str, _TableIndex] = {}
+        self.generation = 0
+        self._parsed_dates: Dict[str, Optional[datetime]] = {}
         
         # Load all data
         self._load_all_data()
     
+    def _attach_shared_store(self) -> bool:
+        """Attach to published shared-store tables. Returns True on success."""
+        from analytics.shared_data_store import attach_tables, PROVIDER_TABLE_FILES
+
+        attached = attach_tables(str(self.data_folder))
+        if attached is None:
+            return False
+        tables, _ = attached
+        for key, attr in self._TABLE_ATTRS.items():
+            setattr(self, attr, tables.get(key))
+        self._file_mtimes = {}
+        for key, file_name in PROVIDER_TABLE_FILES.items():
+            file_path = self.data_folder / file_name
+            if key in tables and file_path.exists():
+                self._file_mtimes[key] = file_path.stat().st_mtime
+        return True
+
+    def export_tables(self) -> Dict[str, Optional[pd.DataFrame]]:
+        """Return the loaded (ISIN-normalized) tables keyed like the shared store."""
+        with self._lock:
+            return {key: getattr(self, attr) for key, attr in self._TABLE_ATTRS.items()}
+
     def _load_all_data(self) -> None:
-        """Load all CSV files into memory."""
+        """Load all CSV files into memory (or attach to the shared store when enabled)."""
         with self._lock:
+            if self._use_shared_store and self._attach_shared_store():
+                self._build_indexes()
+                return
+
             # Load price data
             price_path = self.data_folder / 'sec_Price.csv'
             if price_path.exists():
@@ -108,7 +287,7 @@ class SecurityDataProvider:
             # Load reference data
             reference_path = self.data_folder / 'reference.csv'
             if reference_path.exists():
-                self._reference_df = pd.read_csv(reference_path)
+                self._reference_df = load_table(reference_path)
                 self._normalize_dataframe_isins(self._reference_df)
                 self._file_mtimes['reference'] = reference_path.stat().st_mtime
                 logger.info(f"Loaded {len(self._reference_df)} references from reference.csv")
@@ -124,7 +303,7 @@ class SecurityDataProvider:
             # Load curves data
             curves_path = self.data_folder / 'curves.csv'
             if curves_path.exists():
-                self._curves_df = pd.read_csv(curves_path)
+                self._curves_df = load_table(curves_path)
                 self._file_mtimes['curves'] = curves_path.stat().st_mtime
                 logger.info(f"Loaded {len(self._curves_df)} curve points from curves.csv")
 
@@ -138,6 +317,24 @@ class SecurityDataProvider:
                     logger.info(f"Loaded {len(self._amort_df)} amortization rows from amortization.csv")
                 except Exception as e:
                     logger.warning(f"Failed to load amortization.csv: {e}")
+
+            self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Index the loaded tables by ISIN and start a new generation."""
+        indexes: Dict[str, _TableIndex] = {}
+        for key, attr in self._TABLE_ATTRS.items():
+            df = getattr(self, attr)
+            if key != 'curves' and df is not None and not df.empty and 'ISIN' in df.columns:
+                indexes[key] = _TableIndex(df)
+        self._indexes = indexes
+        self.generation += 1
+        self._last_freshness_check = time.monotonic()
+
+    def _check_freshness(self) -> None:
+        """Check the source files at most once per freshness interval."""
+        if time.monotonic() - self._last_freshness_check >= self._freshness_interval:
+            self._check_cache_validity()
     
     def _check_cache_validity(self) -> None:
         """Check if any files have been modified and reload if needed."""
@@ -164,6 +361,7 @@ class SecurityDataProvider:
             
             if needs_reload:
                 self._load_all_data()
+            self._last_freshness_check = time.monotonic()
     
     def _normalize_dataframe_isins(self, df: pd.DataFrame) -> None:
         """Normalize ISINs in a dataframe in-place."""
@@ -225,43 +423,118 @@ class SecurityDataProvider:
         Returns:
             SecurityData object with all available information
         """
-        # Check cache validity
-        self._check_cache_validity()
+        # Check cache validity (throttled)
+        self._check_freshness()
+        
+        data = self._resolve_terms(self._normalize_isin(isin))
         
-        # Normalize ISIN
-        isin_norm = self._normalize_isin(isin)
-        base_isin = self._get_base_isin(isin_norm)
+        # Get price for specific date
+        prices, pos = self._find_row('price', data.isin)
+        if pos is not None:
+            price_val = prices.cell(pos, date)
+            if pd.notna(price_val):
+                data.price = float(price_val)
         
-        # Create SecurityData object
+        # Get accrued interest
+        data.accrued_interest = self.get_accrued_interest(data.isin, date)
+        
+        # Apply defaults for missing values
+        self._apply_defaults(data, date)
+        
+        return data
+
+    def get_security_data_batch(self, isins: List[str], dates: List[str]) -> SecurityDataBatch:
+        """
+        Get security data for every ISIN on every date.
+        
+        Terms are resolved once per ISIN and the price/accrued lookups are
+        done per column of dates rather than per (ISIN, date).
+        
+        Args:
+            isins: Security ISINs (will be normalized)
+            dates: Valuation dates (price column names)
+            
+        Returns:
+            SecurityDataBatch with one row per ISIN and one column per date
+        """
+        self._check_freshness()
+        
+        isins = [self._normalize_isin(isin) for isin in isins]
+        dates = list(dates)
+        terms = [self._resolve_terms(isin) for isin in isins]
+        prices = np.zeros((len(isins), len(dates)))
+        
+        # Prices: one block read for the ISINs and dates present in sec_Price
+        price_table = self._indexes.get('price')
+        if price_table is not None:
+            hits = [(i, self._find_row('price', isin)[1]) for i, isin in enumerate(isins)]
+            hits = [(i, pos) for i, pos in hits if pos is not None]
+            cols = [(j, price_table.columns[date]) for j, date in enumerate(dates) if date in price_table.columns]
+            if hits and cols:
+                rows_i, rows_pos = zip(*hits)
+                cols_j, cols_pos = zip(*cols)
+                block = _float_block(price_table.df.iloc[list(rows_pos), list(cols_pos)].to_numpy())
+                prices[np.ix_(rows_i, cols_j)] = np.where(np.isnan(block), 0.0, block)
+        
+        # Accrued: each date's column plan applied to all ISINs, then the schedule fallback
+        schedule_accrued = np.array([self._get_schedule_accrued(isin) for isin in isins], dtype=float)
+        accrued = np.repeat(schedule_accrued[:, None], len(dates), axis=1)
+        accrued_table = self._indexes.get('accrued')
+        if accrued_table is not None and dates:
+            hits = [(i, self._find_row('accrued', isin)[1]) for i, isin in enumerate(isins)]
+            hits = [(i, pos) for i, pos in hits if pos is not None]
+            if hits:
+                rows_i, rows_pos = zip(*hits)
+                rows_i = list(rows_i)
+                plans = [self._accrued_date_plan(accrued_table, date) for date in dates]
+                needed = sorted({c for exact, prev in plans for c in exact + ([prev] if prev is not None else [])})
+                if needed:
+                    block = _float_block(accrued_table.df.iloc[list(rows_pos), needed].to_numpy())
+                    column = {c: k for k, c in enumerate(needed)}
+                    for j, (exact, prev) in enumerate(plans):
+                        found = np.full(len(rows_i), np.nan)
+                        for c in exact + ([prev] if prev is not None else []):
+                            found = np.where(np.isnan(found), block[:, column[c]], found)
+                        accrued[rows_i, j] = np.where(np.isnan(found), schedule_accrued[rows_i], found)
+        
+        return SecurityDataBatch(
+            isins=isins,
+            dates=dates,
+            terms=terms,
+            prices=prices,
+            accrued=accrued,
+            valuation_dates=[self._parse_date(date) for date in dates],
+        )
+
+    def _resolve_terms(self, isin_norm: str) -> SecurityData:
+        """
+        SecurityData for a normalized ISIN with every date-independent field
+        merged (price file attributes, reference, schedule, amortization);
+        price, accrued interest and the date defaults are left unset.
+        """
         data = SecurityData(
             isin=isin_norm,
-            base_isin=base_isin
+            base_isin=self._get_base_isin(isin_norm)
         )
         
-        # Get price data
-        if self._price_df is not None and not self._price_df.empty:
-            price_row = self._get_price_row(isin_norm)
-            if price_row is not None:
-                data.security_name = price_row.get('Security Name')
-                data.security_type = price_row.get('Type')
-                data.funds = price_row.get('Funds')
-                
-                # Get price for specific date
-                if date in price_row.index:
-                    price_val = price_row.get(date)
-                    if pd.notna(price_val):
-                        data.price = float(price_val)
-                
-                # Get currency from price (may be overridden)
-                if 'Currency' in price_row.index and pd.notna(price_row.get('Currency')):
-                    data.currency = str(price_row.get('Currency'))
-                
-                # Get callable flag
-                if 'Callable' in price_row.index:
-                    data.callable = str(price_row.get('Callable')).upper() == 'Y'
+        # Get price file attributes (read cell by cell; price rows hold every date column)
+        prices, pos = self._find_row('price', isin_norm)
+        if pos is not None:
+            data.security_name = prices.cell(pos, 'Security Name')
+            data.security_type = prices.cell(pos, 'Type')
+            data.funds = prices.cell(pos, 'Funds')
+            
+            # Get currency from price (may be overridden)
+            currency = prices.cell(pos, 'Currency')
+            if pd.notna(currency):
+                data.currency = str(currency)
+            
+            # Get callable flag
+            if 'Callable' in prices.columns:
+                data.callable = str(prices.cell(pos, 'Callable')).upper() == 'Y'
         
         # Get reference data (overrides some fields)
-        reference_row = self.get_reference_data(isin_norm)
+        reference_row = self._indexed_row('reference', isin_norm)
         if reference_row is not None:
             # Coupon rate from reference
             if pd.notna(reference_row.get('Coupon Rate')):
@@ -310,7 +583,7 @@ class SecurityDataProvider:
                 data.maturity_date = self._parse_date(mat_str)
         
         # Get schedule data (technical details preferred)
-        schedule_row = self.get_schedule_data(isin_norm)
+        schedule_row = self._indexed_row('schedule', isin_norm)
         if schedule_row is not None:
             # Day basis from schedule
             if pd.notna(schedule_row.get('Day Basis')):
@@ -344,9 +617,6 @@ class SecurityDataProvider:
             if data.coupon_rate == 0.0 and pd.notna(schedule_row.get('Coupon Rate')):
                 data.coupon_rate = float(schedule_row.get('Coupon Rate'))
         
-        # Get accrued interest
-        data.accrued_interest = self.get_accrued_interest(isin_norm, date)
-
         # Attach amortization schedule (if available)
         try:
             amort_rows = self.get_amortization_schedule(isin_norm)
@@ -355,29 +625,42 @@ class SecurityDataProvider:
         except Exception as e:
             logger.debug(f"No amortization schedule for {isin_norm}: {e}")
         
-        # Apply defaults for missing values
-        self._apply_defaults(data, date)
-        
         return data
     
+    def _find_rows(self, key: str, isin: str,
+                   any_base: bool = False) -> Tuple[Optional[_TableIndex], List[int]]:
+        """
+        Table index and row positions for an ISIN, falling back to its base ISIN.
+
+        The base ISIN is tried for hyphenated ISINs, or whenever it differs from
+        *isin* if ``any_base`` is set.
+        """
+        table = self._indexes.get(key)
+        if table is None:
+            return None, []
+        positions = table.positions.get(isin)
+        if positions is None and (any_base or '-' in isin):
+            base_isin = self._get_base_isin(isin)
+            if base_isin != isin:
+                positions = table.positions.get(base_isin)
+                if positions is not None:
+                    logger.debug(f"Using base ISIN {base_isin} for {key} lookup of {isin}")
+        return table, positions or []
+
+    def _find_row(self, key: str, isin: str, any_base: bool = False) -> Tuple[Optional[_TableIndex], Optional[int]]:
+        """Table index and position of the first row for an ISIN (see _find_rows)."""
+        table, positions = self._find_rows(key, isin, any_base)
+        return table, (positions[0] if positions else None)
+
+    def _indexed_row(self, key: str, isin: str) -> Optional[pd.Series]:
+        """Shared schedule/reference row for get_security_data (not to be modified)."""
+        table, pos = self._find_row(key, isin, any_base=True)
+        return None if pos is None else table.row(pos)
+
     def _get_price_row(self, isin: str) -> Optional[pd.Series]:
         """Get price row for an ISIN."""
-        if self._price_df is None or self._price_df.empty:
-            return None
-        
-        # Try exact match
-        matches = self._price_df[self._price_df['ISIN'] == isin]
-        if not matches.empty:
-            return matches.iloc[0]
-        
-        # Try base ISIN if hyphenated
-        if '-' in isin:
-            base_isin = self._get_base_isin(isin)
-            matches = self._price_df[self._price_df['ISIN'] == base_isin]
-            if not matches.empty:
-                return matches.iloc[0]
-        
-        return None
+        table, pos = self._find_row('price', isin)
+        return None if pos is None else table.df.iloc[pos]
     
     def get_schedule_data(self, isin: str) -> Optional[pd.Series]:
         """
@@ -389,43 +672,30 @@ class SecurityDataProvider:
         Returns:
             Schedule row or None
         """
-        if self._schedule_df is None or self._schedule_df.empty:
-            return None
-        
-        # Try exact match
-        matches = self._schedule_df[self._schedule_df['ISIN'] == isin]
-        if not matches.empty:
-            return matches.iloc[0]
-        
-        # Try base ISIN
-        base_isin = self._get_base_isin(isin)
-        if base_isin != isin:
-            matches = self._schedule_df[self._schedule_df['ISIN'] == base_isin]
-            if not matches.empty:
-                logger.debug(f"Using base ISIN {base_isin} for schedule lookup of {isin}")
-                return matches.iloc[0]
-        
-        return None
+        table, pos = self._find_row('schedule', isin, any_base=True)
+        return None if pos is None else table.df.iloc[pos]
 
     def get_amortization_schedule(self, isin: str) -> Optional[List[Dict[str, Any]]]:
         """Return amortization rows for an ISIN as list of dicts {date, amount}."""
-        if self._amort_df is None or self._amort_df.empty:
+        table, positions = self._find_rows('amort', isin)
+        if not positions:
             return None
+        memo_key = ('amort', positions[0])
+        if memo_key not in table.memo:
+            table.memo[memo_key] = self._build_amortization_schedule(table.df, positions)
+        out = table.memo[memo_key]
+        return [dict(item) for item in out] if out else None
+
+    def _build_amortization_schedule(self, df: pd.DataFrame, positions: List[int]) -> List[Dict[str, Any]]:
+        """Parsed, date-sorted {date, amount} rows at *positions* of the amortization table."""
         try:
-            df = self._amort_df
             # Accept common column variants
             date_col = 'Date' if 'Date' in df.columns else 'date'
             amt_col = 'Amount' if 'Amount' in df.columns else ('Principal' if 'Principal' in df.columns else 'amount')
-            if 'ISIN' not in df.columns or date_col not in df.columns or amt_col not in df.columns:
-                return None
-            rows = df[df['ISIN'] == isin]
-            if rows.empty and '-' in isin:
-                base_isin = self._get_base_isin(isin)
-                rows = df[df['ISIN'] == base_isin]
-            if rows.empty:
-                return None
+            if date_col not in df.columns or amt_col not in df.columns:
+                return []
             out: List[Dict[str, Any]] = []
-            for _, r in rows.iterrows():
+            for _, r in df.iloc[positions].iterrows():
                 try:
                     dt = self._parse_date(r[date_col])
                     amt = float(r[amt_col])
@@ -435,9 +705,9 @@ class SecurityDataProvider:
                     continue
             # Sort by date
             out.sort(key=lambda x: x['date'])
-            return out if out else None
+            return out
         except Exception:
-            return None
+            return []
     
     def get_reference_data(self, isin: str) -> Optional[pd.Series]:
         """
@@ -449,23 +719,8 @@ class SecurityDataProvider:
         Returns:
             Reference row or None
         """
-        if self._reference_df is None or self._reference_df.empty:
-            return None
-        
-        # Try exact match
-        matches = self._reference_df[self._reference_df['ISIN'] == isin]
-        if not matches.empty:
-            return matches.iloc[0]
-        
-        # Try base ISIN
-        base_isin = self._get_base_isin(isin)
-        if base_isin != isin:
-            matches = self._reference_df[self._reference_df['ISIN'] == base_isin]
-            if not matches.empty:
-                logger.debug(f"Using base ISIN {base_isin} for reference lookup of {isin}")
-                return matches.iloc[0]
-        
-        return None
+        table, pos = self._find_row('reference', isin, any_base=True)
+        return None if pos is None else table.df.iloc[pos]
     
     def get_accrued_interest(self, isin: str, date: str) -> float:
         """
@@ -486,59 +741,64 @@ class SecurityDataProvider:
         Returns:
             Accrued interest value
         """
-        if self._accrued_df is None or self._accrued_df.empty:
-            return self._get_schedule_accrued(isin)
-        
-        # Try exact ISIN
-        accrued_row = self._accrued_df[self._accrued_df['ISIN'] == isin]
-        
-        # If not found, try base ISIN
-        if accrued_row.empty and '-' in isin:
-            base_isin = self._get_base_isin(isin)
-            accrued_row = self._accrued_df[self._accrued_df['ISIN'] == base_isin]
-            if not accrued_row.empty:
-                logger.debug(f"Using base ISIN {base_isin} for accrued lookup of {isin}")
-        
-        if accrued_row.empty:
+        # Try exact ISIN, then base ISIN
+        table, pos = self._find_row('accrued', isin)
+        if pos is None:
             return self._get_schedule_accrued(isin)
         
-        # Get the row
-        row = accrued_row.iloc[0]
+        exact_cols, previous_col = self._accrued_date_plan(table, date)
         
         # Try exact date match (handle various date formats)
-        date_cols = [c for c in self._accrued_df.columns if c != 'ISIN']
-        
-        # Try exact match with various formats
-        for date_col in date_cols:
-            if self._dates_match(date, date_col):
-                val = row.get(date_col)
-                if pd.notna(val):
-                    return float(val)
+        for col_pos in exact_cols:
+            val = table.df.iat[pos, col_pos]
+            if pd.notna(val):
+                return float(val)
         
         # Try nearest previous date
-        parsed_target = self._parse_date(date)
-        if parsed_target:
-            available_dates = []
-            for col in date_cols:
-                parsed_col = self._parse_date(col)
-                if parsed_col and parsed_col <= parsed_target:
-                    available_dates.append((parsed_col, col))
-            
-            if available_dates:
-                # Sort and get most recent
-                available_dates.sort(key=lambda x: x[0])
-                _, best_col = available_dates[-1]
-                val = row.get(best_col)
-                if pd.notna(val):
-                    logger.debug(f"Using previous date {best_col} for accrued on {date}")
-                    return float(val)
+        if previous_col is not None:
+            val = table.df.iat[pos, previous_col]
+            if pd.notna(val):
+                logger.debug(f"Using previous date {table.df.columns[previous_col]} for accrued on {date}")
+                return float(val)
         
         # Fall back to schedule
         return self._get_schedule_accrued(isin)
+
+    def _accrued_date_plan(self, table: _TableIndex, date: Any) -> Tuple[List[int], Optional[int]]:
+        """
+        Accrued column positions for a valuation date: the columns matching it
+        (in column order) and the latest column on or before it. Worked out
+        once per date string and table version.
+        """
+        memo_key = ('date_plan', date)
+        plan = table.memo.get(memo_key)
+        if plan is not None:
+            return plan
+        
+        parsed_target = self._parse_date(date)
+        exact_cols: List[int] = []
+        available_dates = []
+        for col_pos, col in enumerate(table.df.columns):
+            if col == 'ISIN':
+                continue
+            parsed_col = self._parse_date(col)
+            if parsed_target and parsed_col:
+                if parsed_col.date() == parsed_target.date():
+                    exact_cols.append(col_pos)
+            elif date == col:
+                exact_cols.append(col_pos)
+            if parsed_target and parsed_col and parsed_col <= parsed_target:
+                available_dates.append((parsed_col, col_pos))
+        
+        # Sort and get most recent
+        available_dates.sort(key=lambda x: x[0])
+        plan = (exact_cols, available_dates[-1][1] if available_dates else None)
+        table.memo[memo_key] = plan
+        return plan
     
     def _get_schedule_accrued(self, isin: str) -> float:
         """Get accrued from schedule or return 0.0."""
-        schedule_row = self.get_schedule_data(isin)
+        schedule_row = self._indexed_row('schedule', isin)
         if schedule_row is not None and pd.notna(schedule_row.get('Accrued Interest')):
             return float(schedule_row.get('Accrued Interest'))
         return 0.0
@@ -614,7 +874,22 @@ class SecurityDataProvider:
     def _parse_date(self, date_str: Any) -> Optional[datetime]:
         """
         Parse date string robustly, handling various formats including Excel serial dates.
+        Results for strings are memoised (the same few dates are parsed for every ISIN).
         """
+        if not isinstance(date_str, str):
+            return self._parse_date_uncached(date_str)
+        try:
+            return self._parsed_dates[date_str]
+        except KeyError:
+            pass
+        if len(self._parsed_dates) >= _PARSED_DATE_MEMO_LIMIT:
+            self._parsed_dates.clear()
+        parsed = self._parse_date_uncached(date_str)
+        self._parsed_dates[date_str] = parsed
+        return parsed
+
+    def _parse_date_uncached(self, date_str: Any) -> Optional[datetime]:
+        """Parse one date value (see _parse_date)."""
         if pd.isna(date_str):
             return None
         
@@ -666,37 +941,4 @@ class SecurityDataProvider:
             data: SecurityData object to update
             date: Valuation date string
         """
-        # Parse valuation date
-        val_date = self._parse_date(date)
-        if val_date is None:
-            val_date = datetime.now()
-        
-        # Default maturity: 5 years from valuation (preserve exact date)
-        if data.maturity_date is None:
-            # Use replace to keep same day of month
-            try:
-                data.maturity_date = val_date.replace(year=val_date.year + 5)
-            except ValueError:
-                # Handle leap year edge case (Feb 29)
-                data.maturity_date = val_date + timedelta(days=5*365)
-            logger.debug(f"Using default 5-year maturity for {data.isin}")
-        
-        # Default issue date: 1 year before valuation (preserve exact date)
-        if data.issue_date is None:
-            # Use replace to keep same day of month
-            try:
-                data.issue_date = val_date.replace(year=val_date.year - 1)
-            except ValueError:
-                # Handle leap year edge case (Feb 29)
-                data.issue_date = val_date - timedelta(days=365)
-            logger.debug(f"Using default issue date 1 year ago for {data.isin}")
-        
-        # Default first coupon: 6 months after issue
-        if data.first_coupon_date is None and data.issue_date:
-            months = 12 // data.coupon_frequency if data.coupon_frequency > 0 else 6
-            data.first_coupon_date = data.issue_date + timedelta(days=months*30)
-        
-        # Coupon rate: already defaulted to 0.0 in SecurityData
-        # Frequency: already defaulted to 2 in SecurityData
-        # Currency: already defaulted to USD in SecurityData
-        # Day basis: already defaulted to ACT/ACT in SecurityData
+        _apply_date_defaults(data, self._parse_date(date))
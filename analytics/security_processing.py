@@ -18,15 +18,18 @@
 #   various metrics for each security's 'Value' over time, including latest value, change,
 #   historical stats (mean, max, min), and change Z-score. It also preserves the static attributes.
 
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 import pandas as pd
 import os
 import numpy as np
 import re  # For checking date-like column headers
+import hashlib
 import logging
 import traceback
 from core.utils import _is_date_like
 from core import config
+from core.bounded_cache import BoundedCache, budget_from_env, file_stamp, shallow_view
+from core.column_roles import memoize_roles, read_header
 from core.data_utils import (
     read_csv_robustly,
     parse_dates_robustly,
@@ -40,19 +43,39 @@ from core.data_utils import (
 # Get the logger instance. Assumes Flask app has configured logging.
 logger = logging.getLogger(__name__)
 
-# Simple in-memory cache for loaded security data (keyed by (filename, data_folder_path))
-_dataframe_cache = {}
+# In-memory cache for loaded security data, bounded by SDC_SECURITY_CACHE_MAX_MB
+# (LRU) and validated against the (mtime_ns, size) of the CSV and good_points.csv.
+# Key  → (filename, absolute_data_folder)
+# Value → {
+#     'version': int,                 # bumped on every (re)load of this key
+#     'overrides_stamp': Optional[Tuple[int, int]],  # good_points.csv stamp when loaded
+#     'df': pd.DataFrame,             # long-format data, MultiIndex (Date, ID)
+#     'static': List[str],            # static columns returned to callers
+#     'columns': List[str],           # wide-file header when cached
+#     'melt_ids': List[str],          # ID + static columns kept when melting
+#     'essential_ids': List[str],     # ID columns required to be non-null
+#     'id_col': str,                  # ID level name of the MultiIndex
+#     'row_ids': List[Any],           # wide-file ID column, in row order
+#     'block_digest': str,            # digest of the wide-file cells when cached
+#     'delta': Optional[Tuple[int, pd.DataFrame]],  # (base version, appended rows)
+# }
+_dataframe_cache = BoundedCache(
+    "security_data", budget_from_env("SDC_SECURITY_CACHE_MAX_MB", 1024)
+)
 
 # -----------------------------------------------------------------------------
-# NEW: Cache for already-calculated latest-metrics DataFrames
+# Cache for already-calculated latest-metrics DataFrames (SDC_METRICS_CACHE_MAX_MB)
 # -----------------------------------------------------------------------------
 # Key  → (filename, absolute_data_folder)
 # Value → {
-#     'mtime': float,                 # last-modified time of CSV when cached
 #     'df': pd.DataFrame,             # latest metrics per security
-#     'static': List[str]             # static columns list
+#     'static': List[str],            # static columns list
+#     'version': Optional[int],       # _dataframe_cache version the metrics describe
+#     'state': Optional[Dict],        # running aggregates for incremental updates
 # }
-_metrics_cache = {}
+_metrics_cache = BoundedCache(
+    "security_metrics", budget_from_env("SDC_METRICS_CACHE_MAX_MB", 128)
+)
 
 
 def get_latest_metrics_cached(filename: str, data_folder_path: str):
@@ -60,7 +83,9 @@ def get_latest_metrics_cached(filename: str, data_folder_path: str):
 
     The expensive melt + per-security metric calculation only runs once per
     CSV mtime.  Subsequent requests served from `_metrics_cache` are fast and
-    keep the page snappy when the user re-sorts or filters.
+    keep the page snappy when the user re-sorts or filters. When the CSV only
+    gained trailing date columns, the metrics are rolled forward from running
+    per-security aggregates instead of being recomputed over the full history.
     """
     from typing import Tuple, List, Dict, Any  # local import to avoid polluting global namespace
 
@@ -73,99 +98,97 @@ def get_latest_metrics_cached(filename: str, data_folder_path: str):
         logger.error(f"[CACHE] File '{file_path}' does not exist.")
         return pd.DataFrame(), []
 
-    try:
-        mtime = os.path.getmtime(file_path)
-    except Exception as e:
-        logger.error(f"[CACHE] Could not obtain mtime for '{file_path}': {e}")
+    stamp = _data_stamp(file_path, data_folder_path)
+    if stamp is None:
+        logger.error(f"[CACHE] Could not stat '{file_path}'.")
         return pd.DataFrame(), []
 
     cache_key = (filename, os.path.abspath(data_folder_path))
-    cached = _metrics_cache.get(cache_key)
 
     # ------------------------------------------------------------------
-    # Cache hit – same mtime ⇒ return a copy to keep cache immutable
+    # Cache hit – same mtime and size ⇒ return a shallow view (no data copy)
     # ------------------------------------------------------------------
-    if cached and cached.get("mtime") == mtime:
+    hit = _metrics_cache.get(cache_key, stamp)
+    if hit is not None:
         logger.info(f"[CACHE HIT] Returning cached latest-metrics for {filename}")
-        return cached["df"].copy(), list(cached["static"])  # defensive copies
+        return shallow_view(hit["df"]), list(hit["static"])
+    cached = _metrics_cache.peek(cache_key)
 
     # ------------------------------------------------------------------
-    # Cache miss – rebuild metrics
+    # Cache miss – rebuild metrics (incrementally when only dates were appended)
     # ------------------------------------------------------------------
     logger.info(f"[CACHE MISS] Rebuilding latest-metrics for {filename}")
     df_long, static_cols = load_and_process_security_data(filename, data_folder_path)
-    latest_metrics_df = calculate_security_latest_metrics(df_long, static_cols)
+    data_entry = _dataframe_cache.peek(cache_key)
+    delta = data_entry.get("delta") if data_entry else None
+
+    state = None
+    if (
+        cached
+        and delta is not None
+        and cached.get("version") == delta[0]
+        and list(cached["static"]) == list(static_cols)
+    ):
+        try:
+            if cached.get("state") is None:
+                # First incremental refresh: seed the aggregates once from full history
+                state = _build_metrics_state(df_long, static_cols)
+            else:
+                state = _update_metrics_state(cached["state"], delta[1])
+            latest_metrics_df = _metrics_from_state(state, static_cols)
+            logger.info(f"[CACHE] Rolled latest-metrics forward incrementally for {filename}")
+        except Exception as e:
+            logger.warning(
+                f"[CACHE] Incremental metrics update failed for {filename}, recomputing: {e}"
+            )
+            state = None
+    if state is None:
+        latest_metrics_df = calculate_security_latest_metrics(df_long, static_cols)
 
-    # Store in cache (keep original objects for speed; copies returned to callers)
-    _metrics_cache[cache_key] = {
-        "mtime": mtime,
-        "df": latest_metrics_df,
-        "static": static_cols,
-    }
+    # Store in cache (keep original objects for speed; shallow views returned to callers)
+    _metrics_cache.put(
+        cache_key,
+        {
+            "df": latest_metrics_df,
+            "static": static_cols,
+            "version": data_entry.get("version") if data_entry else None,
+            "state": state,
+        },
+        stamp,
+    )
 
-    return latest_metrics_df.copy(), list(static_cols)
+    return shallow_view(latest_metrics_df), list(static_cols)
 
 
 # Removed DATA_FOLDER constant - path is now passed to functions
 
 
 def find_all_date_columns(columns, date_patterns):
-    date_cols = []
-    for col in columns:
-        for pattern in date_patterns:
-            if re.search(pattern, col):
-                date_cols.append(col)
-                break
-    return date_cols
+    """Return the columns matching any of *date_patterns* (memoized per header)."""
+    columns = list(columns)
+
+    def _positions():
+        return [
+            i
+            for i, col in enumerate(columns)
+            if any(re.search(pattern, col) for pattern in date_patterns)
+        ]
 
+    positions = memoize_roles("date_columns", columns, list(date_patterns), _positions)
+    return [columns[i] for i in positions]
 
-def load_and_process_security_data(
-    filename: str, data_folder_path: str
-) -> Tuple[pd.DataFrame, List[str]]:
-    """Loads security data, identifies static/date columns, and melts to long format. Uses in-memory cache to avoid redundant loads."""
-    cache_key = (filename, os.path.abspath(data_folder_path))
-    if cache_key in _dataframe_cache:
-        logger.info(
-            f"[CACHE HIT] Returning cached DataFrame for {filename} in {data_folder_path}"
-        )
-        return _dataframe_cache[cache_key]
-    log_prefix = f"[{filename}] "  # Prefix for logs from this function
-    logger.info(f"{log_prefix}--- Entering load_and_process_security_data ---")
-    if not data_folder_path:
-        logger.error(f"{log_prefix}No data_folder_path provided.")
-        return pd.DataFrame(), []
-    filepath = os.path.join(data_folder_path, filename)
-    logger.info(f"{log_prefix}Attempting to load security data from: {filepath}")
-    try:
-        # --- Read Header ---
-        logger.debug(f"{log_prefix}Reading header...")
-        header_df = read_csv_robustly(
-            filepath,
-            nrows=0,
-            on_bad_lines="skip",
-            encoding="utf-8",
-            encoding_errors="replace",
-        )
-        if header_df is None:
-            logger.error(f"{log_prefix}Failed to read header for {filepath}")
-            return pd.DataFrame(), []
-        all_cols = [str(col).strip() for col in header_df.columns.tolist()]
-        logger.debug(f"{log_prefix}Read header columns: {all_cols}")
-        if not all_cols:
-            logger.error(
-                f"{log_prefix}CSV file appears to be empty or header is missing."
-            )
-            raise ValueError(
-                f"CSV file '{filename}' appears to be empty or header is missing."
-            )
-        # --- Identify Essential Columns Using identify_columns ---
-        patterns = {
-            "id": config.ID_COLUMN_PATTERNS,
-            "static": config.STATIC_COLUMN_PATTERNS,
-        }
-        required = ["id"]
-        found = identify_columns(all_cols, patterns, required)
-        essential_id_cols = [found["id"]] if found["id"] else []
+
+def _detect_security_columns(all_cols: List[str]):
+    """Return (essential_id_cols, static_cols, found) for a wide security header."""
+    patterns = {
+        "id": config.ID_COLUMN_PATTERNS,
+        "static": config.STATIC_COLUMN_PATTERNS,
+    }
+    required = ["id"]
+    found = identify_columns(all_cols, patterns, required)
+    essential_id_cols = [found["id"]] if found["id"] else []
+
+    def _static_cols():
         # Collect *all* static columns that match STATIC_COLUMN_PATTERNS (not just the first)
         static_cols = []
         for regex in config.STATIC_COLUMN_PATTERNS:
@@ -173,151 +196,366 @@ def load_and_process_security_data(
                 if re.search(regex, col, re.IGNORECASE):
                     if col not in static_cols and col not in essential_id_cols:
                         static_cols.append(col)
-        # If nothing matched, fall back to the single column identified (for backward-compatibility)
-        if not static_cols and found["static"]:
-            static_cols = [found["static"]]
-        # Find all date columns for wide format
-        date_cols = find_all_date_columns(all_cols, config.DATE_COLUMN_PATTERNS)
-        if not essential_id_cols:
-            logger.warning(
-                f"{log_prefix}No ID column found using patterns. Columns: {all_cols}"
-            )
-        if not date_cols:
-            logger.error(
-                f"{log_prefix}No date-like columns found using patterns. Cannot process."
-            )
-            raise ValueError("No date-like columns found using patterns.")
-        logger.info(f"{log_prefix}Essential ID Columns identified: {essential_id_cols}")
-        logger.info(f"{log_prefix}Identified Static Cols: {static_cols}")
-        logger.debug(f"{log_prefix}Identified Date Cols: {date_cols}")
-        # --- Read Full Data ---
-        logger.debug(f"{log_prefix}Reading full data...")
-        df_wide = read_csv_robustly(
-            filepath, encoding="utf-8", on_bad_lines="skip", encoding_errors="replace"
+        return static_cols
+
+    static_cols = memoize_roles(
+        "static_columns",
+        all_cols,
+        [config.STATIC_COLUMN_PATTERNS, essential_id_cols],
+        _static_cols,
+    )
+    # If nothing matched, fall back to the single column identified (for backward-compatibility)
+    if not static_cols and found["static"]:
+        static_cols = [found["static"]]
+    return essential_id_cols, list(static_cols), found
+
+
+def _data_stamp(filepath: str, data_folder_path: str):
+    """Cache stamp for a security CSV: its (mtime_ns, size) plus good_points.csv's.
+
+    Returns None when the CSV itself cannot be stat'ed. Editing the cleared
+    points overrides therefore invalidates cached data like editing the CSV.
+    """
+    csv_stamp = file_stamp(filepath)
+    if csv_stamp is None:
+        return None
+    return (csv_stamp, file_stamp(os.path.join(data_folder_path, "good_points.csv")))
+
+
+def _apply_good_points_overrides(
+    df_long: pd.DataFrame, filename: str, data_folder_path: str, log_prefix: str
+) -> None:
+    """Null out Values for points cleared in good_points.csv (in place)."""
+    try:
+        good_points_path = os.path.join(data_folder_path, 'good_points.csv')
+        if os.path.exists(good_points_path):
+            good_df = pd.read_csv(good_points_path, parse_dates=['Date'])
+            # Derive metric name from filename (e.g., sec_Spread.csv → Spread)
+            metric_name_match = re.sub(r'^sec_|SP|sp_', '', filename, flags=re.IGNORECASE)
+            metric_name_match = os.path.splitext(metric_name_match)[0]
+            if {'ISIN', 'Metric', 'Date'}.issubset(good_df.columns):
+                metric_filter = good_df['Metric'].str.lower() == metric_name_match.lower()
+                df_metric = good_df[metric_filter]
+                if not df_metric.empty:
+                    # Iterate and null out matching points
+                    for _, gp_row in df_metric.iterrows():
+                        date_val = pd.to_datetime(gp_row['Date'], errors='coerce')
+                        isin_val = gp_row['ISIN']
+                        if pd.isna(date_val) or not isin_val:
+                            continue
+                        if (date_val, isin_val) in df_long.index:
+                            df_long.loc[(date_val, isin_val), 'Value'] = np.nan
+                    logger.info(f"{log_prefix}Applied {len(df_metric)} cleared good points from overrides.")
+    except Exception as gp_e:
+        logger.error(f"{log_prefix}Failed applying good_points.csv overrides: {gp_e}")
+
+
+def _wide_block_digest(df_wide: pd.DataFrame, n_cols: int) -> str:
+    """Digest of the cells in the first *n_cols* columns of a wide frame."""
+    hashes = pd.util.hash_pandas_object(df_wide.iloc[:, :n_cols], index=False)
+    return hashlib.blake2b(hashes.to_numpy().tobytes(), digest_size=16).hexdigest()
+
+
+def _refresh_security_data_incrementally(
+    cached: dict, filename: str, data_folder_path: str
+):
+    """Append newly added trailing date columns to a cached long frame.
+
+    Returns the refreshed cache entry, or None when the change is anything
+    other than new trailing date columns for the same rows (header edits,
+    added/removed securities, back-dated columns, restated values in the
+    existing columns) so the caller reloads fully.
+    """
+    log_prefix = f"[{filename}] "
+    filepath = os.path.join(data_folder_path, filename)
+    header_cols = read_header(
+        filepath, on_bad_lines="skip", encoding="utf-8", encoding_errors="replace"
+    )
+    if header_cols is None:
+        return None
+    all_cols = [str(col).strip() for col in header_cols]
+    old_cols = cached["columns"]
+    if len(all_cols) <= len(old_cols) or all_cols[: len(old_cols)] != old_cols:
+        return None
+    new_cols = all_cols[len(old_cols):]
+    if find_all_date_columns(new_cols, config.DATE_COLUMN_PATTERNS) != new_cols:
+        return None
+    new_dates = parse_dates_robustly(pd.Series(new_cols), cache_key=(filename, "Date"))
+    cached_df = cached["df"]
+    if (
+        new_dates.isna().any()
+        or cached_df.empty
+        or new_dates.min() <= cached_df.index.get_level_values("Date").max()
+    ):
+        return None
+
+    df_wide = read_csv_robustly(
+        filepath, encoding="utf-8", on_bad_lines="skip", encoding_errors="replace"
+    )
+    if df_wide is None or df_wide.shape[1] != len(all_cols):
+        return None
+    df_wide.columns = all_cols
+    id_col_name = cached["id_col"]
+    if id_col_name not in df_wide.columns or df_wide[id_col_name].tolist() != cached["row_ids"]:
+        logger.info(f"{log_prefix}Security rows changed; incremental refresh not possible.")
+        return None
+    if _wide_block_digest(df_wide, len(old_cols)) != cached["block_digest"]:
+        logger.info(f"{log_prefix}Existing columns changed; incremental refresh not possible.")
+        return None
+
+    # Melt only the ID/static columns and the appended dates (positional so
+    # untrimmed raw headers still match)
+    melt_ids = cached["melt_ids"]
+    positions = [all_cols.index(col) for col in melt_ids] + list(
+        range(len(old_cols), len(all_cols))
+    )
+    df_part = df_wide.iloc[:, positions]
+
+    df_new = melt_wide_data(df_part, id_vars=melt_ids, cache_key=(filename, "Date"))
+    if df_new is None:
+        return None
+    df_new["Value"] = convert_to_numeric_robustly(df_new["Value"])
+    required_cols_for_dropna = ["Date", "Value"] + [
+        col for col in cached["essential_ids"] if col in df_new.columns
+    ]
+    df_new.dropna(subset=required_cols_for_dropna, inplace=True)
+    df_new = df_new.sort_values(by=[id_col_name, "Date"])
+    df_new.set_index(["Date", id_col_name], inplace=True)
+    _apply_good_points_overrides(df_new, filename, data_folder_path, log_prefix)
+
+    # Same (ID, Date) order as a full load
+    df_long = pd.concat([cached_df, df_new[cached_df.columns]]).sort_index(
+        level=[id_col_name, "Date"], sort_remaining=False
+    )
+    logger.info(
+        f"{log_prefix}Incrementally appended {len(new_cols)} date column(s) "
+        f"({len(df_new)} rows). Final shape: {df_long.shape}"
+    )
+    refreshed = dict(cached)
+    refreshed.update(
+        {
+            "version": cached["version"] + 1,
+            "df": df_long,
+            "columns": all_cols,
+            "block_digest": _wide_block_digest(df_wide, len(all_cols)),
+            "delta": (cached["version"], df_new),
+        }
+    )
+    return refreshed
+
+
+def _read_and_melt_security_file(
+    filepath: str, log_prefix: str
+) -> Tuple[pd.DataFrame, List[str], Optional[dict]]:
+    """Read a wide sec_ file and return it melted, cleaned and indexed by (Date, ID).
+
+    Returns ``(df_long, static_cols, meta)``; *meta* (header, melt ids, ID
+    column and wide row ids) is None when the file could not be processed,
+    in which case *df_long* is empty. good_points.csv overrides are not applied.
+    Raises ValueError for files without a header or date columns.
+    """
+    # --- Read Header (cached by file stamp) ---
+    logger.debug(f"{log_prefix}Reading header...")
+    header_cols = read_header(
+        filepath,
+        on_bad_lines="skip",
+        encoding="utf-8",
+        encoding_errors="replace",
+    )
+    if header_cols is None:
+        logger.error(f"{log_prefix}Failed to read header for {filepath}")
+        return pd.DataFrame(), [], None
+    all_cols = [str(col).strip() for col in header_cols]
+    logger.debug(f"{log_prefix}Read header columns: {all_cols}")
+    if not all_cols:
+        logger.error(
+            f"{log_prefix}CSV file appears to be empty or header is missing."
         )
-        if df_wide is None:
-            logger.error(f"{log_prefix}Failed to read full data for {filepath}")
-            return pd.DataFrame(), []
-        df_wide.columns = df_wide.columns.map(lambda x: str(x).strip())
-        logger.info(f"{log_prefix}Read full data. Shape: {df_wide.shape}")
-
-        # --- Melt Data ---
-        id_vars_melt = [col for col in essential_id_cols if col in df_wide.columns] + [
-            col for col in static_cols if col in df_wide.columns
-        ]
-        df_long = melt_wide_data(df_wide, id_vars=id_vars_melt)
-        if df_long is None:
+        raise ValueError(
+            f"CSV file '{os.path.basename(filepath)}' appears to be empty or header is missing."
+        )
+    # --- Identify Essential Columns (memoized per header signature) ---
+    essential_id_cols, static_cols, found = _detect_security_columns(all_cols)
+    # Find all date columns for wide format
+    date_cols = find_all_date_columns(all_cols, config.DATE_COLUMN_PATTERNS)
+    if not essential_id_cols:
+        logger.warning(
+            f"{log_prefix}No ID column found using patterns. Columns: {all_cols}"
+        )
+    if not date_cols:
+        logger.error(
+            f"{log_prefix}No date-like columns found using patterns. Cannot process."
+        )
+        raise ValueError("No date-like columns found using patterns.")
+    logger.info(f"{log_prefix}Essential ID Columns identified: {essential_id_cols}")
+    logger.info(f"{log_prefix}Identified Static Cols: {static_cols}")
+    logger.debug(f"{log_prefix}Identified Date Cols: {date_cols}")
+    # --- Read Full Data ---
+    logger.debug(f"{log_prefix}Reading full data...")
+    df_wide = read_csv_robustly(
+        filepath, encoding="utf-8", on_bad_lines="skip", encoding_errors="replace"
+    )
+    if df_wide is None:
+        logger.error(f"{log_prefix}Failed to read full data for {filepath}")
+        return pd.DataFrame(), [], None
+    df_wide.columns = df_wide.columns.map(lambda x: str(x).strip())
+    logger.info(f"{log_prefix}Read full data. Shape: {df_wide.shape}")
+
+    # --- Melt Data ---
+    id_vars_melt = [col for col in essential_id_cols if col in df_wide.columns] + [
+        col for col in static_cols if col in df_wide.columns
+    ]
+    df_long = melt_wide_data(
+        df_wide, id_vars=id_vars_melt, cache_key=(os.path.basename(filepath), "Date")
+    )
+    if df_long is None:
+        logger.error(
+            f"{log_prefix}Failed to melt wide-format data using melt_wide_data."
+        )
+        return pd.DataFrame(), static_cols, None
+    # Convert Value column
+    df_long["Value"] = convert_to_numeric_robustly(df_long["Value"])
+    # Drop rows where essential data is missing
+    initial_rows = len(df_long)
+    required_cols_for_dropna = ["Date", "Value"] + [
+        col for col in essential_id_cols if col in df_long.columns
+    ]
+    df_long.dropna(subset=required_cols_for_dropna, inplace=True)
+    rows_dropped = initial_rows - len(df_long)
+    if rows_dropped > 0:
+        logger.warning(
+            f"{log_prefix}Dropped {rows_dropped} rows due to missing required values (Date, Value, or Essential IDs)."
+        )
+    if df_long.empty:
+        logger.warning(
+            f"{log_prefix}DataFrame is empty after melting, conversion, and NaN drop."
+        )
+        return pd.DataFrame(), static_cols, None
+    # Determine ID column name for index
+    id_col_name = None
+    if config.ISIN_COL in df_long.columns:
+        id_col_name = config.ISIN_COL
+    elif config.SEC_NAME_COL in df_long.columns:
+        id_col_name = config.SEC_NAME_COL
+    elif essential_id_cols and essential_id_cols[0] in df_long.columns:
+        id_col_name = essential_id_cols[0]
+        logger.warning(
+            f"{log_prefix}Using fallback ID '{id_col_name}' for index setting."
+        )
+    else:
+        logger.error(
+            f"{log_prefix}Cannot determine a valid ID column ({essential_id_cols}) to set index. Columns: {df_long.columns.tolist()}"
+        )
+        return pd.DataFrame(), [], None
+    logger.info(f"{log_prefix}Determined ID column for index: '{id_col_name}'")
+    # Sort before setting index
+    logger.debug(f"{log_prefix}Sorting by '{id_col_name}' and 'Date'...")
+    df_long = df_long.sort_values(by=[id_col_name, "Date"])
+    # --- SET THE MULTIINDEX ---
+    try:
+        # Validate that we have the required columns before setting index
+        required_index_cols = ["Date", id_col_name]
+        missing_cols = [col for col in required_index_cols if col not in df_long.columns]
+        if missing_cols:
             logger.error(
-                f"{log_prefix}Failed to melt wide-format data using melt_wide_data."
-            )
-            return pd.DataFrame(), static_cols
-        # Convert Value column
-        df_long["Value"] = convert_to_numeric_robustly(df_long["Value"])
-        # Drop rows where essential data is missing
-        initial_rows = len(df_long)
-        required_cols_for_dropna = ["Date", "Value"] + [
-            col for col in essential_id_cols if col in df_long.columns
-        ]
-        df_long.dropna(subset=required_cols_for_dropna, inplace=True)
-        rows_dropped = initial_rows - len(df_long)
-        if rows_dropped > 0:
-            logger.warning(
-                f"{log_prefix}Dropped {rows_dropped} rows due to missing required values (Date, Value, or Essential IDs)."
+                f"{log_prefix}Cannot set MultiIndex - missing required columns: {missing_cols}. "
+                f"Available columns: {df_long.columns.tolist()}"
             )
-        if df_long.empty:
+            return pd.DataFrame(), [], None
+        
+        # Check for duplicate index combinations before setting MultiIndex
+        duplicate_mask = df_long.duplicated(subset=required_index_cols, keep=False)
+        if duplicate_mask.any():
+            duplicate_count = duplicate_mask.sum()
             logger.warning(
-                f"{log_prefix}DataFrame is empty after melting, conversion, and NaN drop."
+                f"{log_prefix}Found {duplicate_count} duplicate (Date, {id_col_name}) combinations. "
+                f"These will be aggregated automatically by pandas."
             )
-            return pd.DataFrame(), static_cols
-        # Determine ID column name for index
-        id_col_name = None
-        if config.ISIN_COL in df_long.columns:
-            id_col_name = config.ISIN_COL
-        elif config.SEC_NAME_COL in df_long.columns:
-            id_col_name = config.SEC_NAME_COL
-        elif essential_id_cols and essential_id_cols[0] in df_long.columns:
-            id_col_name = essential_id_cols[0]
-            logger.warning(
-                f"{log_prefix}Using fallback ID '{id_col_name}' for index setting."
-            )
-        else:
-            logger.error(
-                f"{log_prefix}Cannot determine a valid ID column ({essential_id_cols}) to set index. Columns: {df_long.columns.tolist()}"
-            )
-            return pd.DataFrame(), []
-        logger.info(f"{log_prefix}Determined ID column for index: '{id_col_name}'")
-        # Sort before setting index
-        logger.debug(f"{log_prefix}Sorting by '{id_col_name}' and 'Date'...")
-        df_long = df_long.sort_values(by=[id_col_name, "Date"])
-        # --- SET THE MULTIINDEX ---
-        try:
-            # Validate that we have the required columns before setting index
-            required_index_cols = ["Date", id_col_name]
-            missing_cols = [col for col in required_index_cols if col not in df_long.columns]
-            if missing_cols:
-                logger.error(
-                    f"{log_prefix}Cannot set MultiIndex - missing required columns: {missing_cols}. "
-                    f"Available columns: {df_long.columns.tolist()}"
-                )
-                return pd.DataFrame(), []
-            
-            # Check for duplicate index combinations before setting MultiIndex
-            duplicate_mask = df_long.duplicated(subset=required_index_cols, keep=False)
-            if duplicate_mask.any():
-                duplicate_count = duplicate_mask.sum()
-                logger.warning(
-                    f"{log_prefix}Found {duplicate_count} duplicate (Date, {id_col_name}) combinations. "
-                    f"These will be aggregated automatically by pandas."
-                )
-                # Show sample of duplicates for debugging
-                sample_duplicates = df_long[duplicate_mask].head(3)
-                logger.debug(f"{log_prefix}Sample duplicate rows:\n{sample_duplicates}")
-            
-            logger.debug(f"{log_prefix}Setting index to ['Date', '{id_col_name}']...")
-            df_long.set_index(["Date", id_col_name], inplace=True)
-            logger.info(
-                f"{log_prefix}Set MultiIndex ('Date', '{id_col_name}'). Final shape: {df_long.shape}"
-            )
-        except KeyError as e:
-            logger.error(
-                f"{log_prefix}Failed to set index using ['Date', '{id_col_name}']. Error: {e}. Columns: {df_long.columns.tolist()}"
-            )
-            return pd.DataFrame(), []
-        except Exception as e:
-            logger.error(
-                f"{log_prefix}Unexpected error setting MultiIndex: {e}", exc_info=True
-            )
-            return pd.DataFrame(), []
+            # Show sample of duplicates for debugging
+            sample_duplicates = df_long[duplicate_mask].head(3)
+            logger.debug(f"{log_prefix}Sample duplicate rows:\n{sample_duplicates}")
+        
+        logger.debug(f"{log_prefix}Setting index to ['Date', '{id_col_name}']...")
+        df_long.set_index(["Date", id_col_name], inplace=True)
+        logger.info(
+            f"{log_prefix}Set MultiIndex ('Date', '{id_col_name}'). Final shape: {df_long.shape}"
+        )
+    except KeyError as e:
+        logger.error(
+            f"{log_prefix}Failed to set index using ['Date', '{id_col_name}']. Error: {e}. Columns: {df_long.columns.tolist()}"
+        )
+        return pd.DataFrame(), [], None
+    except Exception as e:
+        logger.error(
+            f"{log_prefix}Unexpected error setting MultiIndex: {e}", exc_info=True
+        )
+        return pd.DataFrame(), [], None
+    meta = {
+        "columns": all_cols,
+        "melt_ids": id_vars_melt,
+        "essential_ids": essential_id_cols,
+        "id_col": id_col_name,
+        "row_ids": df_wide[id_col_name].tolist(),
+        "block_digest": _wide_block_digest(df_wide, df_wide.shape[1]),
+    }
+    return df_long, static_cols, meta
+
+
+def load_and_process_security_data(
+    filename: str, data_folder_path: str
+) -> Tuple[pd.DataFrame, List[str]]:
+    """Loads security data, identifies static/date columns, and melts to long format.
+
+    Uses an in-memory cache validated against the file's mtime and size. When
+    the file only gained trailing date columns since it was cached, just those
+    columns are parsed, melted and appended to the cached long frame.
+    """
+    log_prefix = f"[{filename}] "  # Prefix for logs from this function
+    if not data_folder_path:
+        logger.error(f"{log_prefix}No data_folder_path provided.")
+        return pd.DataFrame(), []
+    cache_key = (filename, os.path.abspath(data_folder_path))
+    filepath = os.path.join(data_folder_path, filename)
+    stamp = _data_stamp(filepath, data_folder_path)
+    hit = _dataframe_cache.get(cache_key, stamp) if stamp is not None else None
+    if hit is not None:
+        logger.info(
+            f"[CACHE HIT] Returning cached DataFrame for {filename} in {data_folder_path}"
+        )
+        return shallow_view(hit["df"]), list(hit["static"])
+    cached = _dataframe_cache.peek(cache_key)
+    if cached is not None and stamp is not None and cached["overrides_stamp"] == stamp[1]:
+        refreshed = _refresh_security_data_incrementally(
+            cached, filename, data_folder_path
+        )
+        if refreshed is not None:
+            _dataframe_cache.put(cache_key, refreshed, stamp)
+            return shallow_view(refreshed["df"]), list(refreshed["static"])
+    logger.info(f"{log_prefix}--- Entering load_and_process_security_data ---")
+    logger.info(f"{log_prefix}Attempting to load security data from: {filepath}")
+    try:
+        df_long, static_cols, meta = _read_and_melt_security_file(filepath, log_prefix)
+        if meta is None:
+            return df_long, static_cols
         # --- Apply Cleared Points Overrides (good_points.csv) ---
-        try:
-            good_points_path = os.path.join(data_folder_path, 'good_points.csv')
-            if os.path.exists(good_points_path):
-                good_df = pd.read_csv(good_points_path, parse_dates=['Date'])
-                # Derive metric name from filename (e.g., sec_Spread.csv → Spread)
-                metric_name_match = re.sub(r'^sec_|SP|sp_', '', filename, flags=re.IGNORECASE)
-                metric_name_match = os.path.splitext(metric_name_match)[0]
-                if {'ISIN', 'Metric', 'Date'}.issubset(good_df.columns):
-                    metric_filter = good_df['Metric'].str.lower() == metric_name_match.lower()
-                    df_metric = good_df[metric_filter]
-                    if not df_metric.empty:
-                        # Iterate and null out matching points
-                        for _, gp_row in df_metric.iterrows():
-                            date_val = pd.to_datetime(gp_row['Date'], errors='coerce')
-                            isin_val = gp_row['ISIN']
-                            if pd.isna(date_val) or not isin_val:
-                                continue
-                            if (date_val, isin_val) in df_long.index:
-                                df_long.loc[(date_val, isin_val), 'Value'] = np.nan
-                        logger.info(f"{log_prefix}Applied {len(df_metric)} cleared good points from overrides.")
-        except Exception as gp_e:
-            logger.error(f"{log_prefix}Failed applying good_points.csv overrides: {gp_e}")
+        _apply_good_points_overrides(df_long, filename, data_folder_path, log_prefix)
         # Identify static columns *excluding* essential ID cols to return
         final_static_cols = [col for col in static_cols if col in df_long.columns]
         logger.info(
             f"{log_prefix}--- Exiting load_and_process_security_data. Returning DataFrame and static cols: {final_static_cols} ---"
         )
-        _dataframe_cache[cache_key] = (df_long, final_static_cols)
-        return df_long, final_static_cols  # Return only non-ID static cols
+        previous_version = cached["version"] if cached is not None else -1
+        entry = {
+            "version": previous_version + 1,
+            "overrides_stamp": stamp[1] if stamp is not None else None,
+            "df": df_long,
+            "static": final_static_cols,
+            **meta,
+            "delta": None,
+        }
+        if stamp is not None:
+            _dataframe_cache.put(cache_key, entry, stamp)
+        return shallow_view(df_long), final_static_cols  # Return only non-ID static cols
 
     except Exception as e:
         logger.error(
@@ -592,3 +830,183 @@ def calculate_security_latest_metrics(
         )
         # traceback.print_exc() # Logger handles traceback
         return pd.DataFrame()
+
+
+# -----------------------------------------------------------------------------
+# Running per-security aggregates for incremental latest-metrics updates
+# -----------------------------------------------------------------------------
+_STATE_FLOAT_COLS = [
+    "v_sum", "v_max", "v_min", "c_mean", "c_m2", "c_absmax", "last_value", "last_diff"
+]
+_STATE_COUNT_COLS = ["n_rows", "v_count", "c_count", "c_large"]
+
+
+def _build_metrics_state(df: pd.DataFrame, static_cols: List[str]) -> dict:
+    """Seed running aggregates from a full long-format history.
+
+    The state holds, per security, everything calculate_security_latest_metrics
+    needs (counts, sums, extrema, Welford moments of the daily change and the
+    last observation) so appended dates can be folded in without rescanning.
+    """
+    date_level_name, id_level_name = df.index.names
+    if df.index.duplicated().any():
+        raise ValueError("duplicate (Date, ID) rows; incremental metrics unsupported")
+    ids_in_order = pd.unique(df.index.get_level_values(id_level_name))
+
+    flat = df.reset_index().sort_values(
+        [id_level_name, date_level_name], kind="mergesort"
+    )
+    grouped = flat.groupby(id_level_name, sort=False)
+    values = flat[config.VALUE_COL].astype(float)
+    flat["_diff"] = grouped[config.VALUE_COL].diff().astype(float)
+    flat["_absdiff"] = flat["_diff"].abs()
+    flat["_large"] = flat["_absdiff"] > config.LARGE_MOVE_THRESHOLD_BPS
+    flat["_value"] = values
+
+    grouped = flat.groupby(id_level_name, sort=False)
+    stats = pd.DataFrame(
+        {
+            "n_rows": grouped.size(),
+            "v_count": grouped["_value"].count(),
+            "v_sum": grouped["_value"].sum(min_count=1).fillna(0.0),
+            "v_max": grouped["_value"].max(),
+            "v_min": grouped["_value"].min(),
+            "c_count": grouped["_diff"].count(),
+            "c_mean": grouped["_diff"].mean().fillna(0.0),
+            "c_absmax": grouped["_absdiff"].max(),
+            "c_large": grouped["_large"].sum(),
+        }
+    )
+    centred = flat["_diff"] - grouped["_diff"].transform("mean")
+    stats["c_m2"] = (centred**2).groupby(flat[id_level_name], sort=False).sum()
+
+    last_rows = grouped.tail(1).set_index(id_level_name)
+    stats["last_value"] = last_rows["_value"]
+    stats["last_diff"] = last_rows["_diff"]
+    stats["last_date"] = last_rows[date_level_name]
+    stats = stats.reindex(ids_in_order)
+
+    present_static = [col for col in static_cols if col in flat.columns]
+    static = grouped.head(1).set_index(id_level_name)[present_static].reindex(ids_in_order)
+    return {"stats": stats, "static": static, "id_name": id_level_name}
+
+
+def _update_metrics_state(state: dict, df_new: pd.DataFrame) -> dict:
+    """Fold rows for newly appended dates into a copy of *state*."""
+    id_name = state["id_name"]
+    date_level_name = df_new.index.names[0]
+    if df_new.index.duplicated().any():
+        raise ValueError("duplicate (Date, ID) rows; incremental metrics unsupported")
+    stats = state["stats"]
+    static = state["static"]
+
+    flat = df_new.reset_index().sort_values([date_level_name, id_name], kind="mergesort")
+    new_ids = pd.unique(flat.loc[~flat[id_name].isin(stats.index), id_name])
+    if len(new_ids):
+        blank = pd.DataFrame(index=pd.Index(new_ids, name=stats.index.name))
+        for col in _STATE_COUNT_COLS:
+            blank[col] = 0
+        for col in ("v_sum", "c_mean", "c_m2"):
+            blank[col] = 0.0
+        for col in ("v_max", "v_min", "c_absmax", "last_value", "last_diff"):
+            blank[col] = np.nan
+        blank["last_date"] = pd.NaT
+        stats = pd.concat([stats, blank[stats.columns]])
+        first_rows = flat.drop_duplicates(id_name).set_index(id_name)
+        new_static = first_rows.reindex(new_ids)[
+            [col for col in static.columns if col in first_rows.columns]
+        ].reindex(columns=static.columns)
+        static = pd.concat([static, new_static])
+
+    arrays = {col: stats[col].to_numpy(dtype=float, copy=True) for col in _STATE_FLOAT_COLS}
+    arrays.update(
+        {col: stats[col].to_numpy(dtype=np.int64, copy=True) for col in _STATE_COUNT_COLS}
+    )
+    last_date = stats["last_date"].to_numpy(dtype="datetime64[ns]", copy=True)
+
+    threshold = config.LARGE_MOVE_THRESHOLD_BPS
+    for date_value, rows in flat.groupby(date_level_name, sort=True):
+        idx = stats.index.get_indexer(rows[id_name])
+        v = rows[config.VALUE_COL].to_numpy(dtype=float)
+        d = np.where(arrays["n_rows"][idx] > 0, v - arrays["last_value"][idx], np.nan)
+
+        arrays["n_rows"][idx] += 1
+        has_v = ~np.isnan(v)
+        arrays["v_count"][idx] += has_v
+        arrays["v_sum"][idx] += np.where(has_v, v, 0.0)
+        arrays["v_max"][idx] = np.fmax(arrays["v_max"][idx], v)
+        arrays["v_min"][idx] = np.fmin(arrays["v_min"][idx], v)
+
+        # Welford update of the daily-change mean and sum of squared deviations
+        has_d = ~np.isnan(d)
+        count = arrays["c_count"][idx] + has_d
+        mean = arrays["c_mean"][idx]
+        delta = np.where(has_d, d - mean, 0.0)
+        new_mean = mean + np.divide(delta, count, out=np.zeros_like(delta), where=count > 0)
+        arrays["c_m2"][idx] += np.where(has_d, delta * (d - new_mean), 0.0)
+        arrays["c_mean"][idx] = new_mean
+        arrays["c_count"][idx] = count
+        arrays["c_absmax"][idx] = np.fmax(arrays["c_absmax"][idx], np.abs(d))
+        arrays["c_large"][idx] += np.abs(np.nan_to_num(d)) > threshold
+
+        arrays["last_value"][idx] = v
+        arrays["last_diff"][idx] = d
+        last_date[idx] = np.datetime64(pd.Timestamp(date_value), "ns")
+
+    updated = pd.DataFrame(arrays, index=stats.index)
+    updated["last_date"] = last_date
+    return {"stats": updated[stats.columns], "static": static, "id_name": id_name}
+
+
+def _metrics_from_state(state: dict, static_cols: List[str]) -> pd.DataFrame:
+    """Build the calculate_security_latest_metrics output from running aggregates."""
+    stats = state["stats"]
+    if stats.empty:
+        return pd.DataFrame()
+    latest_date = stats["last_date"].max()
+    at_latest = (stats["last_date"] == latest_date).to_numpy()
+
+    v_count = stats["v_count"].to_numpy()
+    c_count = stats["c_count"].to_numpy()
+    latest_value = np.where(at_latest, stats["last_value"].to_numpy(dtype=float), np.nan)
+    latest_change = np.where(at_latest, stats["last_diff"].to_numpy(dtype=float), np.nan)
+    change_mean = np.where(c_count > 0, stats["c_mean"].to_numpy(dtype=float), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(v_count > 0, stats["v_sum"].to_numpy(dtype=float) / v_count, np.nan)
+        change_std = np.where(
+            c_count > 1,
+            np.sqrt(np.maximum(stats["c_m2"].to_numpy(dtype=float), 0.0) / (c_count - 1)),
+            np.nan,
+        )
+        z_score = (latest_change - change_mean) / change_std
+    # Zero-variance changes: 0 when the latest change equals the mean, else ±inf
+    zero_std = change_std == 0
+    z_score = np.where(
+        zero_std,
+        np.where(
+            latest_change == change_mean,
+            0.0,
+            np.where(latest_change > change_mean, np.inf, -np.inf),
+        ),
+        z_score,
+    )
+    z_score = np.where(np.isnan(latest_change) | np.isnan(change_mean), np.nan, z_score)
+
+    c_large = stats["c_large"].to_numpy()
+    pct_large = np.where(
+        c_large > 0,
+        c_large / stats["n_rows"].to_numpy() * 100,
+        np.where(c_count > 0, 0.0, np.nan),
+    )
+
+    latest_metrics_df = state["static"].reindex(columns=list(static_cols)).copy()
+    latest_metrics_df["Latest Value"] = latest_value
+    latest_metrics_df["Change"] = latest_change
+    latest_metrics_df["Max |Δ| (bps)"] = stats["c_absmax"].to_numpy(dtype=float)
+    latest_metrics_df["% Days >| 50 bps|"] = pct_large
+    latest_metrics_df["Mean"] = mean
+    latest_metrics_df["Max"] = stats["v_max"].to_numpy(dtype=float)
+    latest_metrics_df["Min"] = stats["v_min"].to_numpy(dtype=float)
+    latest_metrics_df["Change Z-Score"] = z_score
+    latest_metrics_df.index.name = state["id_name"]
+    return latest_metrics_df
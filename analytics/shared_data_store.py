@@ -0,0 +1,279 @@
+"""
+Shared Data Store - publish SecurityDataProvider tables once, attach from many processes
+Numeric columns are written as .npy files and attached with numpy memory maps, so every
+worker maps the same page-cache pages instead of holding a private copy of sec_Price,
+sec_accrued and friends. Text columns are small and are stored as JSON, read per process.
+Store folders are private to the user (mode 0o700) and are not read when another user
+owns them or can write to them.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+import stat
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# Provider table key -> source CSV (mirrors SecurityDataProvider._load_all_data)
+PROVIDER_TABLE_FILES: Dict[str, str] = {
+    'price': 'sec_Price.csv',
+    'schedule': 'schedule.csv',
+    'reference': 'reference.csv',
+    'accrued': 'sec_accrued.csv',
+    'curves': 'curves.csv',
+    'amort': 'amortization.csv',
+}
+
+MANIFEST_NAME = 'manifest.json'
+STORE_FORMAT_VERSION = 2
+OBJECTS_NAME = 'objects.json'
+
+
+def default_store_root() -> Path:
+    """
+    Root folder for shared stores.
+
+    Priority: SDC_SHARED_STORE_DIR env var, then /dev/shm (RAM-backed on Linux),
+    then the system temp folder.
+    """
+    env_dir = os.getenv('SDC_SHARED_STORE_DIR')
+    if env_dir:
+        return Path(env_dir)
+    shm = Path('/dev/shm')
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm / 'sdc_shared_store'
+    return Path(tempfile.gettempdir()) / 'sdc_shared_store'
+
+
+def store_dir_for(data_folder: str, store_root: Optional[str] = None) -> Path:
+    """Return the store folder dedicated to one data folder."""
+    root = Path(store_root) if store_root else default_store_root()
+    digest = hashlib.sha1(str(Path(data_folder).resolve()).encode('utf-8')).hexdigest()[:16]
+    return root / digest
+
+
+def _ensure_private_dir(path: Path) -> None:
+    """Create *path* as a folder only this user can access; PermissionError if it is not ours."""
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        raise PermissionError(f"Shared store path {path} is not a folder")
+    if hasattr(os, 'getuid'):
+        if st.st_uid != os.getuid():
+            raise PermissionError(f"Shared store folder {path} is owned by another user")
+        if st.st_mode & 0o077:
+            os.chmod(path, 0o700)
+
+
+def _is_private_dir(path: Path) -> bool:
+    """True if *path* is a folder owned by this user that no other user can write to."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(st.st_mode):
+        return False
+    if hasattr(os, 'getuid'):
+        return st.st_uid == os.getuid() and not st.st_mode & 0o022
+    return True
+
+
+def source_signature(data_folder: str) -> Dict[str, Tuple[int, int]]:
+    """Return {table_key: (mtime_ns, size)} for the provider source files that exist."""
+    signature: Dict[str, Tuple[int, int]] = {}
+    for key, file_name in PROVIDER_TABLE_FILES.items():
+        path = Path(data_folder) / file_name
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        signature[key] = (st.st_mtime_ns, st.st_size)
+    return signature
+
+
+def _is_mappable(series: pd.Series) -> bool:
+    """Numeric, boolean and datetime columns can be stored as plain .npy arrays."""
+    dtype = series.dtype
+    return isinstance(dtype, np.dtype) and dtype.kind in 'biufM'
+
+
+def _json_value(value: Any) -> Any:
+    """json.dump fallback for numpy scalars held in object columns."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot store {type(value).__name__} value in a shared store text column")
+
+
+def _write_table(df: pd.DataFrame, table_dir: Path) -> Dict:
+    """Write one DataFrame into *table_dir*; return its manifest entry."""
+    table_dir.mkdir(parents=True, exist_ok=True)
+    columns = [str(c) for c in df.columns]
+    mapped: Dict[str, str] = {}
+    objects: Dict[str, list] = {}
+    for i, col in enumerate(df.columns):
+        series = df.iloc[:, i]
+        if _is_mappable(series):
+            file_name = f'c{i}.npy'
+            np.save(table_dir / file_name, np.ascontiguousarray(series.to_numpy()), allow_pickle=False)
+            mapped[str(col)] = file_name
+        else:
+            objects[str(col)] = series.tolist()
+    with open(table_dir / OBJECTS_NAME, 'w', encoding='utf-8') as f:
+        json.dump(objects, f, default=_json_value)
+    return {'columns': columns, 'mapped': mapped, 'nrows': int(len(df))}
+
+
+def _attach_table(table_dir: Path, entry: Dict) -> pd.DataFrame:
+    """Rebuild a DataFrame whose numeric columns are read-only memory maps."""
+    with open(table_dir / OBJECTS_NAME, 'r', encoding='utf-8') as f:
+        objects = json.load(f)
+    data = {}
+    for col in entry['columns']:
+        file_name = entry['mapped'].get(col)
+        if file_name is not None:
+            mapped = np.load(table_dir / file_name, mmap_mode='r', allow_pickle=False)
+            # Plain ndarray view over the mapping (avoids np.memmap leaking into results)
+            data[col] = mapped.view(np.ndarray)
+        else:
+            values = np.empty(entry['nrows'], dtype=object)
+            values[:] = objects[col]
+            data[col] = values
+    # copy=False keeps one block per column, so the memory maps are not consolidated
+    return pd.DataFrame(data, columns=entry['columns'], copy=False)
+
+
+def publish_tables(
+    data_folder: str,
+    tables: Dict[str, Optional[pd.DataFrame]],
+    signature: Dict[str, Tuple[int, int]],
+    store_root: Optional[str] = None,
+) -> Path:
+    """
+    Publish provider tables as a new store generation.
+
+    The generation folder is fully written before the manifest is swapped in
+    atomically, so attaching processes never see a half-written store. Older
+    generations are removed afterwards; processes still mapping them keep
+    their pages until they re-attach.
+
+    Args:
+        data_folder: Data folder the tables were loaded from
+        tables: {table_key: DataFrame or None}
+        signature: Source file signature captured *before* the tables were loaded
+        store_root: Optional override of the store root folder
+
+    Returns:
+        Path of the published generation folder
+    """
+    store_dir = store_dir_for(data_folder, store_root)
+    _ensure_private_dir(store_dir.parent)
+    _ensure_private_dir(store_dir)
+    generation = f'gen-{time.time_ns()}-{os.getpid()}'
+    gen_dir = store_dir / generation
+
+    table_entries = {}
+    for key, df in tables.items():
+        if df is None:
+            continue
+        table_entries[key] = _write_table(df, gen_dir / key)
+
+    manifest = {
+        'version': STORE_FORMAT_VERSION,
+        'data_folder': str(Path(data_folder).resolve()),
+        'generation': generation,
+        'published_at': time.time(),
+        'sources': {k: list(v) for k, v in signature.items()},
+        'tables': table_entries,
+    }
+    tmp_fd, tmp_path = tempfile.mkstemp(dir=str(store_dir), prefix=MANIFEST_NAME + '.tmp-')
+    with os.fdopen(tmp_fd, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, store_dir / MANIFEST_NAME)
+    logger.info(f"Published {len(table_entries)} provider tables to shared store {gen_dir}")
+
+    for entry in store_dir.iterdir():
+        if entry.is_dir() and entry.name != generation:
+            shutil.rmtree(entry, ignore_errors=True)
+    return gen_dir
+
+
+def read_manifest(data_folder: str, store_root: Optional[str] = None) -> Optional[Dict]:
+    """Return the current manifest for *data_folder*, or None if nothing is published."""
+    store_dir = store_dir_for(data_folder, store_root)
+    if not store_dir.exists():
+        return None
+    if not (_is_private_dir(store_dir.parent) and _is_private_dir(store_dir)):
+        logger.warning(f"Ignoring shared store {store_dir}: not a private folder owned by this user")
+        return None
+    manifest_path = store_dir / MANIFEST_NAME
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != STORE_FORMAT_VERSION:
+        return None
+    return manifest
+
+
+def attach_tables(
+    data_folder: str, store_root: Optional[str] = None
+) -> Optional[Tuple[Dict[str, pd.DataFrame], Dict[str, Tuple[int, int]]]]:
+    """
+    Attach to the published tables for *data_folder*.
+
+    Returns:
+        (tables, signature) when a store exists and matches the current source
+        files, otherwise None so the caller can load the CSVs itself.
+    """
+    manifest = read_manifest(data_folder, store_root)
+    if manifest is None:
+        return None
+    published = {k: tuple(v) for k, v in manifest.get('sources', {}).items()}
+    if published != source_signature(data_folder):
+        logger.info("Shared store is stale relative to the source CSVs; ignoring it")
+        return None
+    gen_dir = store_dir_for(data_folder, store_root) / manifest['generation']
+    try:
+        tables = {
+            key: _attach_table(gen_dir / key, entry)
+            for key, entry in manifest.get('tables', {}).items()
+        }
+    except (OSError, KeyError, ValueError) as e:
+        logger.warning(f"Failed to attach shared store {gen_dir}: {e}")
+        return None
+    logger.info(f"Attached {len(tables)} provider tables from shared store {gen_dir}")
+    return tables, published
+
+
+def publish_provider_tables(data_folder: str, store_root: Optional[str] = None) -> Path:
+    """Load the provider tables from CSV and publish them for other processes."""
+    from analytics.security_data_provider import SecurityDataProvider
+
+    signature = source_signature(data_folder)
+    provider = SecurityDataProvider(data_folder, use_shared_store=False)
+    return publish_tables(data_folder, provider.export_tables(), signature, store_root)
+
+
+if __name__ == '__main__':
+    # Publish the store for the configured data folder (run once before starting workers)
+    import sys
+    try:
+        from core.settings_loader import get_app_config
+        app_cfg = get_app_config() or {}
+        dfolder = app_cfg.get('data_folder') or 'Data'
+    except Exception:
+        dfolder = 'Data'
+    target = sys.argv[1] if len(sys.argv) > 1 else dfolder
+    logging.basicConfig(level=logging.INFO)
+    print(publish_provider_tables(target))
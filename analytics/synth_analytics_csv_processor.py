@@ -21,6 +21,7 @@ from collections import OrderedDict
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'tools', 'SpreadOMatic'))
 
 from core import config
+from core.data_catalog import load_table
 from analytics.synth_spread_calculator import parse_date_robust, get_supported_day_basis, generate_payment_schedule_from_security_data
 from analytics.security_data_provider import SecurityDataProvider, SecurityData
 
@@ -60,7 +61,7 @@ try:
     # Standard modules for core calculations
     from tools.SpreadOMatic.spreadomatic.daycount import to_datetime
     from tools.SpreadOMatic.spreadomatic.interpolation import linear_interpolate
-    from tools.SpreadOMatic.spreadomatic.cashflows import extract_cashflows, generate_fixed_schedule
+    from tools.SpreadOMatic.spreadomatic.cashflows import extract_cashflows, cached_fixed_schedule
     from tools.SpreadOMatic.spreadomatic.yield_spread import solve_ytm, g_spread, z_spread, discount_margin
     from tools.SpreadOMatic.spreadomatic.discount import pv_cashflows, Compounding
     from tools.SpreadOMatic.spreadomatic.duration import (
@@ -80,7 +81,7 @@ except ImportError as e:
     
     from tools.SpreadOMatic.spreadomatic.daycount import to_datetime, year_fraction as year_fraction_basic
     from tools.SpreadOMatic.spreadomatic.interpolation import linear_interpolate
-    from tools.SpreadOMatic.spreadomatic.cashflows import extract_cashflows, generate_fixed_schedule
+    from tools.SpreadOMatic.spreadomatic.cashflows import extract_cashflows, cached_fixed_schedule
     from tools.SpreadOMatic.spreadomatic.yield_spread import solve_ytm, g_spread, z_spread, discount_margin
     from tools.SpreadOMatic.spreadomatic.discount import pv_cashflows, Compounding
     from tools.SpreadOMatic.spreadomatic.duration import (
@@ -234,7 +235,7 @@ def load_supporting_data(data_folder: str) -> Tuple[SecurityDataProvider, Option
         curves_path = os.path.join(data_folder, 'curves.csv')
         curves_df = None
         if os.path.exists(curves_path):
-            curves_df = pd.read_csv(curves_path)
+            curves_df = load_table(curves_path)
         else:
             logger.warning(f"Curves file not found: {curves_path}")
         # Load optional discount curves (e.g., OIS) for DM
@@ -1103,7 +1104,8 @@ def _build_cashflows_from_combined_data(
             if pd.isna(sr.get('Coupon Rate')):
                 sr['Coupon Rate'] = combined_data.get('Coupon Rate', 0.0)
             
-            # Build payment schedule using SpreadOMatic's generate_fixed_schedule
+            # Build payment schedule using SpreadOMatic's cached_fixed_schedule
+            # (built once per ISIN and terms, then sliced per valuation date)
             issue_date = to_datetime(sr.get('Issue Date'))
             maturity_date = to_datetime(sr.get('Maturity Date'))
             coupon_rate = float(sr.get('Coupon Rate', 0.0)) / 100 if sr.get('Coupon Rate') else 0.0
@@ -1117,7 +1119,8 @@ def _build_cashflows_from_combined_data(
                 months_to_first = 12 // frequency if frequency > 0 else 6
                 first_coupon_date = issue_date + timedelta(days=months_to_first * 30)
             
-            payment_schedule = generate_fixed_schedule(
+            payment_schedule = cached_fixed_schedule(
+                combined_data.get('ISIN'),
                 issue_date=issue_date,
                 first_coupon_date=first_coupon_date,
                 maturity_date=maturity_date,
@@ -1197,8 +1200,9 @@ def _build_cashflows_from_combined_data(
         # Map day basis for cashflows module compatibility
         cashflow_day_basis = '30/360' if day_basis.upper() in {"30E/360", "30E", "30/360E", "30/360-E"} else day_basis
 
-        # Generate payment schedule using correct parameters
-        payment_schedule = generate_fixed_schedule(
+        # Generate payment schedule using correct parameters (cached per ISIN and terms)
+        payment_schedule = cached_fixed_schedule(
+            combined_data.get('ISIN'),
             issue_date=issue_date,
             first_coupon_date=first_coupon_date,
             maturity_date=maturity_date,
@@ -1212,12 +1216,10 @@ def _build_cashflows_from_combined_data(
         # Extract times and cashflows (legacy)
         times = []
         cfs = []
-        for payment in payment_schedule:
-            payment_date = to_datetime(payment['date'])
-            if payment_date > valuation_date:
-                time_to_payment = year_fraction(valuation_date, payment_date, day_basis)
-                times.append(time_to_payment)
-                cfs.append(payment['amount'])
+        for payment_date, payment in payment_schedule.remaining(valuation_date):
+            time_to_payment = year_fraction(valuation_date, payment_date, day_basis)
+            times.append(time_to_payment)
+            cfs.append(payment['amount'])
 
         return times, cfs
 
@@ -0,0 +1,151 @@
+"""
+Synth Result Cache - content-addressed store of per-(ISIN, date) synthetic analytics
+Each cell calculated by calculate_synthetic_spreads is saved under a digest of every input
+that determines it: the SecurityData the provider returned (price, accrued, reference and
+schedule fields), the zero curve used, the valuation date and the engine signature. A rerun
+only recalculates cells whose digest is not in the store, so unchanged history is read back
+instead of being repriced. The store keeps only the cells the latest run used, is written
+atomically under <data_folder>/.sdc_cache, and is ignored when its format differs.
+Set SDC_SYNTH_CACHE_DISABLE=1 to neither read nor write it.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from dataclasses import astuple
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from core.columnar_cache import CACHE_DIR_NAME
+
+logger = logging.getLogger(__name__)
+
+
+CACHE_FILE_NAME = 'synth_results.pkl'
+CACHE_FORMAT_VERSION = 2
+
+# Cached cell: (metric values in calculator order, {KRD bucket: value}, used fallback curve);
+# the file stores {ISIN: {cell key: CellResult}}
+CellResult = Tuple[Tuple[float, ...], Dict[str, float], bool]
+
+
+def is_synth_cache_enabled() -> bool:
+    """Return False when disabled via SDC_SYNTH_CACHE_DISABLE=1."""
+    return os.getenv('SDC_SYNTH_CACHE_DISABLE', '0') != '1'
+
+
+def synth_cache_path(data_folder: str) -> Path:
+    """File holding the cached cells for one data folder."""
+    return Path(data_folder) / CACHE_DIR_NAME / CACHE_FILE_NAME
+
+
+def cell_key(engine: Any, security_data: Any, date: str, curve: Any) -> str:
+    """
+    Digest of one cell's inputs.
+
+    Args:
+        engine: Engine signature (version, analytics settings)
+        security_data: SecurityData for the ISIN and date
+        date: Valuation date column
+        curve: Curve identity, e.g. (knots, is_fallback) or the lookup error
+    """
+    payload = repr((engine, astuple(security_data), date, curve)).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class SynthResultCache:
+    """
+    Cells read from the previous run plus the cells recorded in this one, grouped by ISIN
+    so a shard can be given (and send back) just the cells of its own securities.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, Dict[str, CellResult]]] = None):
+        self._previous: Dict[str, Dict[str, CellResult]] = entries or {}
+        self.used: Dict[str, Dict[str, CellResult]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, isin: str, key: str) -> Optional[CellResult]:
+        result = self._previous.get(isin, {}).get(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.used.setdefault(isin, {})[key] = result
+        return result
+
+    def put(self, isin: str, key: str, result: CellResult) -> None:
+        self.used.setdefault(isin, {})[key] = result
+
+    def for_isins(self, isins: Iterable[str]) -> Dict[str, Dict[str, CellResult]]:
+        """Previous cells of *isins* only, to seed the cache of the shard pricing them."""
+        return {isin: self._previous[isin] for isin in set(isins) if isin in self._previous}
+
+    def session(self) -> 'SynthResultCache':
+        """Cache reading the same previous cells with fresh used/hit counts."""
+        return SynthResultCache(self._previous)
+
+    def delta(self) -> Dict[str, Any]:
+        """Cells used or added in this session and its hit/miss counts (a shard's result)."""
+        return {'used': self.used, 'hits': self.hits, 'misses': self.misses}
+
+    def merge(self, delta: Dict[str, Any]) -> None:
+        """Fold a shard's delta() into this cache."""
+        for isin, cells in delta['used'].items():
+            self.used.setdefault(isin, {}).update(cells)
+        self.hits += delta['hits']
+        self.misses += delta['misses']
+
+    def __len__(self) -> int:
+        return sum(len(cells) for cells in self._previous.values())
+
+
+def load_synth_cache(data_folder: str) -> SynthResultCache:
+    """Cells saved by the last run (an empty cache if missing, unreadable or outdated)."""
+    path = synth_cache_path(data_folder)
+    try:
+        with open(path, 'rb') as f:
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        return SynthResultCache()
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable synth result cache {path}: {e}")
+        return SynthResultCache()
+    if not isinstance(payload, dict) or payload.get('version') != CACHE_FORMAT_VERSION:
+        return SynthResultCache()
+    return SynthResultCache(payload.get('entries') or {})
+
+
+def save_synth_cache(data_folder: str, entries: Dict[str, Dict[str, CellResult]]) -> Optional[Path]:
+    """Atomically replace the cache with *entries*. Returns the path, or None on failure."""
+    path = synth_cache_path(data_folder)
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=path.name + '.tmp-')
+        with os.fdopen(tmp_fd, 'wb') as f:
+            pickle.dump(
+                {'version': CACHE_FORMAT_VERSION, 'entries': entries}, f, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_path, path)
+        return path
+    except OSError as e:
+        logger.warning(f"Could not write synth result cache {path}: {e}")
+        return None
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def clear_synth_cache(data_folder: str) -> bool:
+    """Delete the cache file. Returns True if one was removed."""
+    try:
+        synth_cache_path(data_folder).unlink()
+        return True
+    except OSError:
+        return False
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 import os
 import sys
+import time
 from collections import Counter
 
 # Ensure local SpreadOMatic copy is found *before* any site-packages version
@@ -17,9 +18,18 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'tools', 'SpreadOMati
 
 # Import config for file paths and column names
 from core import config
+from core.data_catalog import load_table
 
 # Import the unified SecurityDataProvider
 from analytics.security_data_provider import SecurityDataProvider, SecurityData
+from analytics.shared_data_store import publish_tables, source_signature
+from analytics.synth_result_cache import (
+    SynthResultCache,
+    cell_key,
+    is_synth_cache_enabled,
+    load_synth_cache,
+    save_synth_cache,
+)
 
 # Setup synthetic spread logger
 synth_logger = logging.getLogger('synth_spread')
@@ -56,8 +66,9 @@ try:
     
     # Still import standard modules for fallback
     from tools.SpreadOMatic.spreadomatic.daycount import to_datetime
-    from tools.SpreadOMatic.spreadomatic.interpolation import linear_interpolate
+    from tools.SpreadOMatic.spreadomatic.interpolation import linear_interpolate, PreparedCurve
     from tools.SpreadOMatic.spreadomatic.cashflows import extract_cashflows, generate_fixed_schedule
+    from tools.SpreadOMatic.spreadomatic.schedule_service import CashflowSchedule, schedule_key, schedule_service
     from tools.SpreadOMatic.spreadomatic.yield_spread import solve_ytm, g_spread, z_spread
     from tools.SpreadOMatic.spreadomatic.discount import pv_cashflows
     from tools.SpreadOMatic.spreadomatic.duration import (
@@ -76,8 +87,9 @@ except ImportError as e:
     synth_logger.info(f"Enhanced modules not available ({e}), using standard SpreadOMatic analytics")
     
     from tools.SpreadOMatic.spreadomatic.daycount import to_datetime, year_fraction
-    from tools.SpreadOMatic.spreadomatic.interpolation import linear_interpolate
+    from tools.SpreadOMatic.spreadomatic.interpolation import linear_interpolate, PreparedCurve
     from tools.SpreadOMatic.spreadomatic.cashflows import extract_cashflows, generate_fixed_schedule
+    from tools.SpreadOMatic.spreadomatic.schedule_service import CashflowSchedule, schedule_key, schedule_service
     from tools.SpreadOMatic.spreadomatic.yield_spread import solve_ytm, g_spread, z_spread
     from tools.SpreadOMatic.spreadomatic.discount import pv_cashflows
     from tools.SpreadOMatic.spreadomatic.duration import (
@@ -206,6 +218,91 @@ def build_zero_curve(curves_df: pd.DataFrame, currency: str, date: str) -> Tuple
         return list(times), list(rates), is_fallback
 
 
+def build_prepared_zero_curve(curves_df: pd.DataFrame, currency: str, date: str) -> Tuple[PreparedCurve, bool]:
+    """Build the zero curve for currency/date as a PreparedCurve.
+
+    Same lookup and fallback rules as build_zero_curve; interpolation
+    coefficients are computed once so the curve can be evaluated repeatedly
+    by every analytic for the security. Returns: (curve, is_fallback).
+    """
+    times, rates, is_fallback = build_zero_curve(curves_df, currency, date)
+    return PreparedCurve(times, rates), is_fallback
+
+
+class ZeroCurveBook:
+    """
+    Prepared zero curves per (currency, date) for one synthetic run.
+
+    curves.csv is partitioned by currency once (with its Date column parsed
+    once), and each (currency, date) curve, including fallback-curve
+    resolution, is built once with build_prepared_zero_curve. Every later
+    lookup is a dict hit. Failed lookups are remembered and re-raised with
+    the same message, so error accounting matches per-call building.
+    """
+
+    def __init__(self, curves_df: pd.DataFrame):
+        self.curves_df = curves_df
+        self._by_currency: Optional[Dict[Any, pd.DataFrame]] = None
+        self._curves: Dict[Tuple[Any, Any], Any] = {}
+        self.fallback_keys: List[Tuple[Any, Any]] = []
+
+    def _currency_curves(self, currency: Any) -> pd.DataFrame:
+        """Rows of *currency* (the whole table for indexed curve frames)."""
+        df = self.curves_df
+        if df.index.nlevels > 1 or 'Currency Code' not in df.columns:
+            return df
+        if self._by_currency is None:
+            parsed = df
+            if 'Date' in df.columns:
+                try:
+                    parsed = df.assign(Date=pd.to_datetime(df['Date']))
+                except Exception:
+                    parsed = df  # leave unparseable dates to build_zero_curve
+            self._by_currency = {code: group for code, group in parsed.groupby('Currency Code', sort=False)}
+        return self._by_currency.get(currency, df.iloc[0:0])
+
+    def currencies(self) -> List[Any]:
+        """Currencies present in the curves table."""
+        df = self.curves_df
+        if df.index.nlevels > 1:
+            return list(df.index.get_level_values(0).unique())
+        if 'Currency Code' not in df.columns:
+            return []
+        self._currency_curves(None)
+        return list(self._by_currency)
+
+    def get(self, currency: Any, date: str) -> Tuple[PreparedCurve, bool]:
+        """(curve, is_fallback) for currency/date; raises like build_zero_curve."""
+        key = (currency, date)
+        entry = self._curves.get(key)
+        if entry is None:
+            try:
+                entry = build_prepared_zero_curve(self._currency_curves(currency), currency, date)
+                if entry[1]:
+                    self.fallback_keys.append(key)
+            except Exception as e:
+                entry = e
+            self._curves[key] = entry
+        if isinstance(entry, Exception):
+            raise type(entry)(*entry.args)
+        return entry
+
+    def prebuild(self, currencies: List[Any], dates: List[str]) -> int:
+        """Build every currency x date curve up front; returns how many resolved."""
+        built = 0
+        for currency in currencies:
+            for date in dates:
+                try:
+                    self.get(currency, date)
+                    built += 1
+                except Exception:
+                    pass
+        return built
+
+    def __len__(self) -> int:
+        return len(self._curves)
+
+
 # Summaries to suppress per-date spam
 curve_lookup_errors: Counter[str] = Counter()
 other_spread_errors: Counter[str] = Counter()
@@ -376,6 +473,26 @@ def generate_payment_schedule(schedule_row: pd.Series) -> List[Dict[str, Any]]:
 
 def generate_payment_schedule_from_security_data(security_data: SecurityData) -> List[Dict[str, Any]]:
     """Generate payment schedule from SecurityData object."""
+    return payment_schedule_for_security(security_data).to_list()
+
+
+def payment_schedule_for_security(security_data: SecurityData) -> CashflowSchedule:
+    """Payment schedule of a security, built once per ISIN and schedule terms.
+
+    Reused across valuation dates; extract_cashflows slices the remaining flows.
+    """
+    key = schedule_key(
+        security_data.isin, "security",
+        security_data.issue_date, security_data.first_coupon_date, security_data.maturity_date,
+        security_data.coupon_rate, security_data.coupon_frequency, security_data.day_basis,
+        security_data.business_day_convention, security_data.currency,
+        getattr(security_data, 'amortization_schedule', None),
+        getattr(security_data, 'payment_schedule', None),
+    )
+    return schedule_service.get(key, lambda: _build_payment_schedule(security_data))
+
+
+def _build_payment_schedule(security_data: SecurityData) -> List[Dict[str, Any]]:
     # If a custom payment schedule is provided, use it as authoritative
     if getattr(security_data, 'payment_schedule', None):
         try:
@@ -572,11 +689,14 @@ def calculate_spread_for_security_using_provider(
     security_data: SecurityData,
     valuation_date: str,
     curves_df: pd.DataFrame,
+    curve_book: Optional[ZeroCurveBook] = None,
 ) -> Dict[str, Any]:
     """
     Calculate first-principles analytics for a single security using SecurityDataProvider data.
     
     This refactored version uses SecurityData from the provider for consistent data access.
+    When curve_book is given the zero curve is looked up there instead of
+    being built from curves_df.
     """
     try:
         # Clean price and accrued from SecurityData
@@ -613,13 +733,18 @@ def calculate_spread_for_security_using_provider(
         call_schedule = parse_call_schedule(security_data.call_schedule)
         if call_schedule:
             synth_logger.debug(f"Parsed {len(call_schedule)} call dates for {security_data.isin}")
-        # Build zero curve
-        z_times, z_rates, curve_is_fallback = build_zero_curve(curves_df, security_data.currency, valuation_date)
+        # Build zero curve once; SpreadOMatic analytics accept the prepared curve
+        # in place of zero_times (zero_rates is then ignored)
+        if curve_book is not None:
+            z_curve, curve_is_fallback = curve_book.get(security_data.currency, valuation_date)
+        else:
+            z_curve, curve_is_fallback = build_prepared_zero_curve(curves_df, security_data.currency, valuation_date)
+        z_times, z_rates = z_curve.knots()
         if curve_is_fallback:
             synth_logger.info(f"Using fallback curve for {security_data.isin} on {valuation_date}")
         
-        # Generate payment schedule from SecurityData
-        payment_schedule = generate_payment_schedule_from_security_data(security_data)
+        # Payment schedule from SecurityData (cached across valuation dates)
+        payment_schedule = payment_schedule_for_security(security_data)
         
         # Get valuation date
         val_dt_parsed = parse_date_robust(valuation_date, dayfirst=True)
@@ -630,7 +755,7 @@ def calculate_spread_for_security_using_provider(
         # Extract cashflows with proper day basis mapping
         try:
             supported_day_basis = get_supported_day_basis(security_data.day_basis)
-            times, cfs = extract_cashflows(payment_schedule, val_dt, z_times, z_rates, supported_day_basis)
+            times, cfs = extract_cashflows(payment_schedule, val_dt, z_curve, None, supported_day_basis)
         except ValueError as e:
             synth_logger.error(f"Skipping security {security_data.isin} due to unsupported day basis '{security_data.day_basis}': {e}")
             return {
@@ -664,11 +789,11 @@ def calculate_spread_for_security_using_provider(
         ytm = solve_ytm(dirty_price, times, cfs, comp=compounding)
         
         # Calculate spreads
-        g_spr = g_spread(ytm, maturity, z_times, z_rates)
-        z_spr = z_spread(dirty_price, times, cfs, z_times, z_rates, comp=compounding)
+        g_spr = g_spread(ytm, maturity, z_curve, None)
+        z_spr = z_spread(dirty_price, times, cfs, z_curve, None, comp=compounding)
         
         # Durations and convexity
-        eff_dur = effective_duration(dirty_price, times, cfs, z_times, z_rates, comp=compounding)
+        eff_dur = effective_duration(dirty_price, times, cfs, z_curve, None, comp=compounding)
         
         freq = security_data.coupon_frequency
         
@@ -688,12 +813,12 @@ def calculate_spread_for_security_using_provider(
             else:
                 mod_dur = sm_modified_duration(eff_dur, ytm, frequency=freq)
         
-        convex = effective_convexity(dirty_price, times, cfs, z_times, z_rates, comp=compounding)
-        spr_dur = effective_spread_duration(dirty_price, times, cfs, z_times, z_rates, comp=compounding)
+        convex = effective_convexity(dirty_price, times, cfs, z_curve, None, comp=compounding)
+        spr_dur = effective_spread_duration(dirty_price, times, cfs, z_curve, None, comp=compounding)
         
         # Key-rate durations
         try:
-            krd = key_rate_durations(clean_price, times, cfs, z_times, z_rates, comp=compounding)
+            krd = key_rate_durations(clean_price, times, cfs, z_curve, None, comp=compounding)
         except Exception:
             krd = {}
 
@@ -816,19 +941,267 @@ def calculate_spread_for_security_using_provider(
         }
 
 
-def calculate_synthetic_spreads(data_folder: str):
+# Output file metric -> (result key, unit multiplier or None to store as-is)
+_SCALAR_METRICS: Dict[str, Tuple[str, Optional[float]]] = {
+    'ZSpread': ('z_spread', 10000.0),  # bps
+    'GSpread': ('g_spread', 10000.0),  # bps
+    'YTM': ('ytm', 100.0),  # percent
+    'EffectiveDuration': ('effective_duration', None),
+    'ModifiedDuration': ('modified_duration', None),
+    'Convexity': ('convexity', None),
+    'SpreadDuration': ('spread_duration', None),
+    'OAS': ('oas_standard', 10000.0),  # bps
+}
+
+# Bump whenever a change to the analytics would alter previously cached results
+SYNTH_ENGINE_VERSION = 1
+
+# Per-process state of pool workers (see _init_shard_worker)
+_worker_state: Dict[str, Any] = {}
+
+
+def _engine_signature() -> Tuple[Any, ...]:
+    """Everything outside a cell's own inputs that its cached result depends on."""
+    from bond_calculation.config import COMPOUNDING
+    return (SYNTH_ENGINE_VERSION, ENHANCED_SYNTH_AVAILABLE, COMPOUNDING, tuple(_SCALAR_METRICS))
+
+
+def _curve_identity(curve_book: ZeroCurveBook, currency: Any, date: str) -> Tuple[Any, ...]:
+    """The curve a cell is priced on (or the lookup failure), for its cache key."""
+    try:
+        curve, is_fallback = curve_book.get(currency, date)
+    except Exception as e:
+        return ('error', type(e).__name__, str(e))
+    return curve.knots(), is_fallback
+
+
+def _as_float(value: Any) -> float:
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+def _run_shard(
+    rows: List[Tuple[int, str]],
+    provider: SecurityDataProvider,
+    curve_book: ZeroCurveBook,
+    date_columns: List[str],
+    log_progress: bool = False,
+    cache: Optional[SynthResultCache] = None,
+) -> Dict[str, Any]:
+    """
+    Calculate every (ISIN, date) cell of a shard of price rows.
+
+    Args:
+        rows: (row position in sec_Price, ISIN) pairs
+        log_progress: Log every 100 securities (single-process runs)
+        cache: Previous results; cells whose inputs are unchanged are read
+            from it and every successfully calculated cell is recorded in it
+
+    Returns:
+        {'cells': [(row, date position, {metric: value}, {bucket: krd})],
+         'fallback_curves': int, 'securities': int, 'elapsed': seconds}
+    """
+    started = time.perf_counter()
+    cells = []
+    fallback_curve_count = 0
+    engine = _engine_signature() if cache is not None else None
+    # Terms resolved once per ISIN; prices and accrued for all dates at once
+    batch = provider.get_security_data_batch([isin for _, isin in rows], date_columns)
+    for count, (row, isin) in enumerate(rows, start=1):
+        for date_pos, date_col in enumerate(date_columns):
+            # Skip calculation if price is zero or invalid
+            price = batch.prices[count - 1, date_pos]
+            if price <= 0 or pd.isna(price):
+                synth_logger.debug(f"Skipping {isin} on {date_col} - price is zero or invalid: {price}")
+                continue
+            
+            security_data = batch.security_data(count - 1, date_pos)
+            
+            # Reuse the previous result when none of the cell's inputs changed
+            cache_key = None
+            if cache is not None:
+                curve_id = _curve_identity(curve_book, security_data.currency, date_col)
+                cache_key = cell_key(engine, security_data, date_col, curve_id)
+                cached = cache.get(isin, cache_key)
+                if cached is not None:
+                    metric_values, krd_dict, used_fallback = cached
+                    fallback_curve_count += int(used_fallback)
+                    cells.append((row, date_pos, dict(zip(_SCALAR_METRICS, metric_values)), krd_dict))
+                    continue
+            
+            # Calculate spreads using unified data
+            parse_fails_before = parse_fail_count
+            spreads = calculate_spread_for_security_using_provider(
+                security_data, date_col, curve_book.curves_df, curve_book=curve_book
+            )
+            
+            # Track if we used a fallback curve
+            used_fallback = bool(spreads.get('used_fallback_curve', False))
+            if used_fallback:
+                fallback_curve_count += 1
+            
+            values = {
+                metric: _safe_convert(spreads.get(key), scale) if scale else _as_float(spreads.get(key))
+                for metric, (key, scale) in _SCALAR_METRICS.items()
+            }
+            krd_dict = spreads.get('key_rate_durations') or {}
+            if not isinstance(krd_dict, dict):
+                krd_dict = {}
+            cells.append((row, date_pos, values, krd_dict))
+            # Failed cells (and ones that hit date parse failures) are not cached, so
+            # later runs recalculate them and the error summaries still count them
+            if cache is not None and spreads.get('calculated') and parse_fail_count == parse_fails_before:
+                cache.put(isin, cache_key, (tuple(values.values()), krd_dict, used_fallback))
+        
+        if log_progress and count % 100 == 0:
+            synth_logger.info(f"Processed {count}/{len(rows)} securities")
+    
+    return {
+        'cells': cells,
+        'fallback_curves': fallback_curve_count,
+        'securities': len(rows),
+        'elapsed': time.perf_counter() - started,
+    }
+
+
+def _init_shard_worker(
+    data_folder: str,
+    curve_book: ZeroCurveBook,
+    date_columns: List[str],
+) -> None:
+    """Pool initializer: attach to the shared provider tables once per worker process."""
+    _worker_state['provider'] = SecurityDataProvider(data_folder, use_shared_store=True)
+    _worker_state['curve_book'] = curve_book
+    _worker_state['date_columns'] = date_columns
+
+
+def _run_shard_in_worker(
+    shard_id: int,
+    rows: List[Tuple[int, str]],
+    cached_cells: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Run one shard in a pool worker and return its results with its error counts.
+
+    cached_cells holds the previous results of the shard's ISINs (None when the
+    cache is off); only the cells the shard used or added are sent back.
+    """
+    global parse_fail_count
+    # Counters are per process; report only what this shard added
+    curve_before = curve_lookup_errors.copy()
+    accrued_before = accrued_lookup_errors.copy()
+    other_before = other_spread_errors.copy()
+    missing_before = len(missing_schedule_isins)
+    parse_before = parse_fail_count
+    
+    cache = SynthResultCache(cached_cells) if cached_cells is not None else None
+    result = _run_shard(
+        rows, _worker_state['provider'], _worker_state['curve_book'], _worker_state['date_columns'],
+        cache=cache,
+    )
+    result.update({
+        'cache': cache.delta() if cache is not None else None,
+        'shard': shard_id,
+        'pid': os.getpid(),
+        'curve_lookup_errors': curve_lookup_errors - curve_before,
+        'accrued_lookup_errors': accrued_lookup_errors - accrued_before,
+        'other_spread_errors': other_spread_errors - other_before,
+        'missing_schedule_isins': missing_schedule_isins[missing_before:],
+        'parse_fail_count': parse_fail_count - parse_before,
+    })
+    return result
+
+
+def _merge_shard_errors(result: Dict[str, Any]) -> None:
+    """Fold a worker shard's error counts into this process's counters."""
+    global parse_fail_count
+    curve_lookup_errors.update(result['curve_lookup_errors'])
+    accrued_lookup_errors.update(result['accrued_lookup_errors'])
+    other_spread_errors.update(result['other_spread_errors'])
+    missing_schedule_isins.extend(result['missing_schedule_isins'])
+    parse_fail_count += result['parse_fail_count']
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    """Worker count: explicit value, else SDC_SYNTH_WORKERS (default 1); 0 means all CPUs."""
+    if workers is None:
+        try:
+            workers = int(os.getenv('SDC_SYNTH_WORKERS', '1'))
+        except ValueError:
+            workers = 1
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def _run_shards_parallel(
+    data_folder: str,
+    shards: List[List[Tuple[int, str]]],
+    curve_book: ZeroCurveBook,
+    date_columns: List[str],
+    workers: int,
+    cache: Optional[SynthResultCache] = None,
+) -> List[Dict[str, Any]]:
+    """Run shards on a process pool; results are returned in shard order."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(shards)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_shard_worker,
+        initargs=(data_folder, curve_book, date_columns),
+    ) as executor:
+        # Each shard is sent the cached cells of its own ISINs only
+        futures = {
+            executor.submit(
+                _run_shard_in_worker, shard_id, rows,
+                cache.for_isins(isin for _, isin in rows) if cache is not None else None,
+            ): shard_id
+            for shard_id, rows in enumerate(shards)
+        }
+        for future in futures:
+            result = future.result()
+            results[futures[future]] = result
+            synth_logger.info(
+                f"Shard {result['shard'] + 1}/{len(shards)}: {result['securities']} securities, "
+                f"{len(result['cells'])} cells in {result['elapsed']:.2f}s (pid {result['pid']})"
+            )
+    return results
+
+
+def calculate_synthetic_spreads(
+    data_folder: str,
+    workers: Optional[int] = None,
+    use_cache: Optional[bool] = None,
+):
     """
     Main function to calculate synthetic analytics using institutional-grade methods when available.
     
     REFACTORED VERSION: Now uses SecurityDataProvider for consistent data access.
+    
+    Args:
+        data_folder: Folder with sec_Price.csv, curves.csv and the provider tables
+        workers: Processes to shard the securities across (default SDC_SYNTH_WORKERS
+            or 1; 0 uses every CPU). Output is identical for any worker count.
+        use_cache: Reuse results of cells whose inputs are unchanged since the
+            last run (default: on unless SDC_SYNTH_CACHE_DISABLE=1)
     """
     enhancement_status = "institutional-grade" if ENHANCED_SYNTH_AVAILABLE else "standard"
     synth_logger.info(f"Starting synthetic spread calculation using {enhancement_status} analytics")
     synth_logger.info("REFACTORED VERSION: Using SecurityDataProvider for unified data access")
     
     try:
+        workers = _resolve_workers(workers)
+        if use_cache is None:
+            use_cache = is_synth_cache_enabled()
+        
         # Initialize the unified SecurityDataProvider
         synth_logger.info("Initializing SecurityDataProvider...")
+        source_files = source_signature(data_folder)
         provider = SecurityDataProvider(data_folder)
         
         # Load curves data separately (still needed for curve building)
@@ -836,7 +1209,7 @@ def calculate_synthetic_spreads(data_folder: str):
         if not os.path.exists(curves_path):
             synth_logger.error(f"Curves file not found: {curves_path}")
             return
-        curves_df = pd.read_csv(curves_path)
+        curves_df = load_table(curves_path)
         
         # Load price data to get date columns and securities list
         price_path = os.path.join(data_folder, 'sec_Price.csv')
@@ -851,40 +1224,20 @@ def calculate_synthetic_spreads(data_folder: str):
         date_columns = [col for col in price_df.columns if col not in 
                        ['ISIN', 'Security Name', 'Funds', 'Type', 'Callable', 'Currency']]
         
-        # Initialize result dataframes
         meta_cols = ['ISIN', 'Security Name', 'Funds', 'Type', 'Callable', 'Currency']
-        z_spread_data = price_df[meta_cols].copy()
-        g_spread_data = price_df[meta_cols].copy()
-        ytm_data = price_df[meta_cols].copy()
-        eff_dur_data = price_df[meta_cols].copy()
-        mod_dur_data = price_df[meta_cols].copy()
-        convexity_data = price_df[meta_cols].copy()
-        spr_dur_data = price_df[meta_cols].copy()
-        oas_data = price_df[meta_cols].copy()
-        
-        # KRD dataframes by bucket label
-        krd_dataframes: Dict[str, pd.DataFrame] = {}
         
-        # Initialize columns
-        for date_col in date_columns:
-            z_spread_data[date_col] = np.nan
-            g_spread_data[date_col] = np.nan
-            ytm_data[date_col] = np.nan
-            eff_dur_data[date_col] = np.nan
-            mod_dur_data[date_col] = np.nan
-            convexity_data[date_col] = np.nan
-            spr_dur_data[date_col] = np.nan
-            oas_data[date_col] = np.nan
+        # Prepared zero curve per (currency, date), fallbacks resolved once
+        curve_book = ZeroCurveBook(curves_df)
+        built = curve_book.prebuild(curve_book.currencies(), date_columns)
+        synth_logger.info(
+            f"Prepared {built} zero curves for {len(date_columns)} dates "
+            f"({len(curve_book.fallback_keys)} using a prior date's curve)"
+        )
         
-        # Process each security
-        total_securities = len(price_df)
-        processed = 0
+        # Securities to process, as (row position, ISIN)
+        rows: List[Tuple[int, str]] = []
         errors = 0
-        fallback_curve_count = 0
-        
-        for idx, price_row in price_df.iterrows():
-            isin = price_row['ISIN']
-            
+        for pos, (idx, isin) in enumerate(price_df['ISIN'].items()):
             # Validate ISIN early to avoid issues later
             if pd.isna(isin):
                 synth_logger.warning(f"Skipping row {idx} with missing ISIN value")
@@ -893,60 +1246,84 @@ def calculate_synthetic_spreads(data_folder: str):
             elif not isinstance(isin, str):
                 synth_logger.warning(f"Converting non-string ISIN to string for row {idx}: {isin}")
                 isin = str(isin)
-            
-            # Calculate spreads for each date using SecurityDataProvider
-            for date_col in date_columns:
-                # Get security data from provider
-                security_data = provider.get_security_data(isin, date_col)
-                
-                if security_data is None:
-                    synth_logger.debug(f"No security data available for {isin} on {date_col}")
-                    continue
-                
-                # Skip calculation if price is zero or invalid
-                if security_data.price <= 0 or pd.isna(security_data.price):
-                    synth_logger.debug(f"Skipping {isin} on {date_col} - price is zero or invalid: {security_data.price}")
-                    continue
-                
-                # Calculate spreads using unified data
-                spreads = calculate_spread_for_security_using_provider(
-                    security_data, date_col, curves_df
+            rows.append((pos, isin))
+        processed = len(rows)
+        
+        # Contiguous shards keep each ISIN's schedule cache local to one worker;
+        # several shards per worker even out uneven securities
+        n_shards = min(len(rows), workers * 4) if workers > 1 else 1
+        chunks = np.array_split(np.arange(len(rows)), max(n_shards, 1))
+        shards = [[rows[i] for i in chunk] for chunk in chunks if len(chunk)]
+        
+        cache = load_synth_cache(data_folder) if use_cache else None
+        if cache is not None:
+            synth_logger.info(f"Loaded {len(cache)} cached security-date results")
+        
+        started = time.perf_counter()
+        shard_results = None
+        if workers > 1 and len(shards) > 1:
+            synth_logger.info(f"Sharding {len(rows)} securities into {len(shards)} shards across {workers} processes")
+            try:
+                # Workers attach to one published copy of the provider tables
+                publish_tables(data_folder, provider.export_tables(), source_files)
+                shard_results = _run_shards_parallel(
+                    data_folder, shards, curve_book, date_columns, workers, cache
                 )
-                
-                # Track if we used a fallback curve
-                if spreads.get('used_fallback_curve', False):
-                    fallback_curve_count += 1
-                
-                # Store results (scalar metrics)
-                z_spread_data.loc[idx, date_col] = _safe_convert(spreads.get('z_spread'), 10000.0)  # Convert to bps
-                g_spread_data.loc[idx, date_col] = _safe_convert(spreads.get('g_spread'), 10000.0)  # Convert to bps
-                ytm_data.loc[idx, date_col] = _safe_convert(spreads.get('ytm'), 100.0)  # Convert to percentage
-                eff_dur_data.loc[idx, date_col] = spreads.get('effective_duration')
-                mod_dur_data.loc[idx, date_col] = spreads.get('modified_duration')
-                convexity_data.loc[idx, date_col] = spreads.get('convexity')
-                spr_dur_data.loc[idx, date_col] = spreads.get('spread_duration')
-                
-                # OAS stored as bps in CSV
-                oas_standard = spreads.get('oas_standard')
-                if oas_standard is not None:
-                    oas_data.loc[idx, date_col] = _safe_convert(oas_standard, 10000.0)  # Convert to bps
-                else:
-                    oas_data.loc[idx, date_col] = np.nan
-                
-                # Store KRD buckets (if any)
-                krd_dict = spreads.get('key_rate_durations') or {}
-                if isinstance(krd_dict, dict) and krd_dict:
-                    for bucket_label, krd_val in krd_dict.items():
-                        if bucket_label not in krd_dataframes:
-                            df_new = price_df[meta_cols].copy()
-                            for dc in date_columns:
-                                df_new[dc] = np.nan
-                            krd_dataframes[bucket_label] = df_new
-                        krd_dataframes[bucket_label].loc[idx, date_col] = krd_val
-            
-            processed += 1
-            if processed % 100 == 0:
-                synth_logger.info(f"Processed {processed}/{total_securities} securities")
+                for result in shard_results:
+                    _merge_shard_errors(result)
+                    if cache is not None:
+                        cache.merge(result['cache'])
+            except Exception as e:
+                synth_logger.warning(f"Parallel calculation failed ({e}); falling back to a single process")
+                shard_results = None
+        if shard_results is None:
+            if cache is not None:
+                cache = cache.session()
+            shard_results = [_run_shard(rows, provider, curve_book, date_columns, log_progress=True, cache=cache)]
+        synth_logger.info(
+            f"Calculated {sum(len(r['cells']) for r in shard_results)} security-dates in "
+            f"{time.perf_counter() - started:.2f}s "
+            f"(slowest shard {max((r['elapsed'] for r in shard_results), default=0.0):.2f}s)"
+        )
+        if cache is not None:
+            # Keep only this run's cells so results of superseded inputs do not accumulate
+            save_synth_cache(data_folder, cache.used)
+            synth_logger.info(f"Result cache: {cache.hits} reused, {cache.misses} recalculated")
+        
+        # Assemble result dataframes, merging shards in order
+        n_rows, n_dates = len(price_df), len(date_columns)
+        metric_values = {metric: np.full((n_rows, n_dates), np.nan) for metric in _SCALAR_METRICS}
+        krd_values: Dict[str, np.ndarray] = {}
+        fallback_curve_count = 0
+        for result in shard_results:
+            fallback_curve_count += result['fallback_curves']
+            for row, date_pos, values, krd_dict in result['cells']:
+                for metric, value in values.items():
+                    metric_values[metric][row, date_pos] = value
+                for bucket_label, krd_val in krd_dict.items():
+                    if bucket_label not in krd_values:
+                        krd_values[bucket_label] = np.full((n_rows, n_dates), np.nan)
+                    krd_values[bucket_label][row, date_pos] = _as_float(krd_val)
+        
+        def _metric_frame(values: np.ndarray) -> pd.DataFrame:
+            frame = price_df[meta_cols].copy()
+            for date_pos, date_col in enumerate(date_columns):
+                frame[date_col] = values[:, date_pos]
+            return frame
+        
+        z_spread_data = _metric_frame(metric_values['ZSpread'])
+        g_spread_data = _metric_frame(metric_values['GSpread'])
+        ytm_data = _metric_frame(metric_values['YTM'])
+        eff_dur_data = _metric_frame(metric_values['EffectiveDuration'])
+        mod_dur_data = _metric_frame(metric_values['ModifiedDuration'])
+        convexity_data = _metric_frame(metric_values['Convexity'])
+        spr_dur_data = _metric_frame(metric_values['SpreadDuration'])
+        oas_data = _metric_frame(metric_values['OAS'])
+        
+        # KRD dataframes by bucket label
+        krd_dataframes: Dict[str, pd.DataFrame] = {
+            bucket_label: _metric_frame(values) for bucket_label, values in krd_values.items()
+        }
         
         # Save results with rounding to 6 decimal places maximum
         z_spread_path = os.path.join(data_folder, 'synth_sec_ZSpread.csv')
@@ -1029,12 +1406,28 @@ def calculate_synthetic_spreads(data_folder: str):
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Calculate synthetic analytics for every security and date")
+    parser.add_argument("--data-folder", help="Data folder (default: data_folder from settings.yaml)")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Worker processes (default: SDC_SYNTH_WORKERS or 1; 0 = all CPUs)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Recalculate every security-date instead of reusing unchanged cached results",
+    )
+    args = parser.parse_args()
+    
     # For testing - resolve data folder from settings.yaml if available
-    try:
-        from core.settings_loader import get_app_config
-        app_cfg = get_app_config() or {}
-        dfolder = app_cfg.get('data_folder') or 'Data'
-        data_folder = dfolder if os.path.isabs(dfolder) else os.path.join(os.path.dirname(__file__), dfolder)
-    except Exception:
-        data_folder = os.path.join(os.path.dirname(__file__), 'Data')
-    calculate_synthetic_spreads(data_folder)
+    data_folder = args.data_folder
+    if not data_folder:
+        try:
+            from core.settings_loader import get_app_config
+            app_cfg = get_app_config() or {}
+            dfolder = app_cfg.get('data_folder') or 'Data'
+            data_folder = dfolder if os.path.isabs(dfolder) else os.path.join(os.path.dirname(__file__), dfolder)
+        except Exception:
+            data_folder = os.path.join(os.path.dirname(__file__), 'Data')
+    calculate_synthetic_spreads(data_folder, workers=args.workers, use_cache=False if args.no_cache else None)
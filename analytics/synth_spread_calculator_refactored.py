@@ -17,6 +17,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'tools', 'SpreadOMati
 
 # Import config for file paths and column names
 from core import config
+from core.data_catalog import load_table
 
 # Import the unified SecurityDataProvider
 from analytics.security_data_provider import SecurityDataProvider, SecurityData
@@ -595,7 +596,7 @@ def calculate_synthetic_spreads(data_folder: str):
         if not os.path.exists(curves_path):
             synth_logger.error(f"Curves file not found: {curves_path}")
             return
-        curves_df = pd.read_csv(curves_path)
+        curves_df = load_table(curves_path)
         
         # Load price data to get date columns and securities list
         price_path = os.path.join(data_folder, 'sec_Price.csv')
@@ -654,19 +655,17 @@ def calculate_synthetic_spreads(data_folder: str):
                 isin = str(isin)
             
             # Calculate spreads for each date using SecurityDataProvider
-            for date_col in date_columns:
-                # Get security data from provider
-                security_data = provider.get_security_data(isin, date_col)
-                
-                if security_data is None:
-                    synth_logger.debug(f"No security data available for {isin} on {date_col}")
-                    continue
-                
+            # (terms resolved once, prices and accrued for all dates at once)
+            batch = provider.get_security_data_batch([isin], date_columns)
+            for date_pos, date_col in enumerate(date_columns):
                 # Skip calculation if price is zero or invalid
-                if security_data.price <= 0 or pd.isna(security_data.price):
-                    synth_logger.debug(f"Skipping {isin} on {date_col} - price is zero or invalid: {security_data.price}")
+                price = batch.prices[0, date_pos]
+                if price <= 0 or pd.isna(price):
+                    synth_logger.debug(f"Skipping {isin} on {date_col} - price is zero or invalid: {price}")
                     continue
                 
+                security_data = batch.security_data(0, date_pos)
+                
                 # Calculate spreads using unified data
                 spreads = calculate_spread_for_security_using_provider(
                     security_data, date_col, curves_df
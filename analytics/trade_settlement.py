@@ -11,11 +11,10 @@ from typing import Dict, List, Optional, Any, Tuple
 
 from core.settlement_utils import (
     calculate_settlement_date,
-    validate_settlement,
     get_standard_settlement_days,
     get_settlement_calculator
 )
-from core.settings_loader import get_settlement_conventions
+from core.settings_loader import get_settlement_conventions, get_settlement_days
 from core.data_utils import read_csv_robustly, parse_dates_robustly
 
 logger = logging.getLogger(__name__)
@@ -52,56 +51,56 @@ def process_trades_with_settlement(
     if settlement_date_col in df.columns:
         df[settlement_date_col] = pd.to_datetime(df[settlement_date_col], errors='coerce')
     
-    # Calculate expected settlement dates
+    # Calculate expected settlement dates, one array offset per currency/security type
     calculator = get_settlement_calculator()
     
-    expected_settlements = []
-    settlement_validations = []
-    
-    for idx, row in df.iterrows():
-        try:
-            trade_date = row.get(trade_date_col)
-            currency = row.get(currency_col) if currency_col in df.columns else None
-            security_type = row.get(security_type_col) if security_type_col in df.columns else None
-            
-            if pd.notna(trade_date):
-                # Calculate expected settlement
-                expected_settlement = calculate_settlement_date(
-                    trade_date, 
-                    currency=currency,
-                    security_type=security_type
-                )
-                expected_settlements.append(expected_settlement)
-                
-                # Validate actual settlement if provided
-                if settlement_date_col in df.columns and pd.notna(row.get(settlement_date_col)):
-                    validation = validate_settlement(
-                        trade_date,
-                        row[settlement_date_col],
-                        currency=currency,
-                        security_type=security_type
-                    )
-                    settlement_validations.append(validation)
-                else:
-                    settlement_validations.append(None)
-            else:
-                expected_settlements.append(None)
-                settlement_validations.append(None)
+    has_settlement = settlement_date_col in df.columns
+    expected = np.full(len(df), np.datetime64('NaT'), dtype='datetime64[ns]')
+    valid, variance, expected_t_plus, actual_t_plus = (
+        np.full(len(df), None, dtype=object) for _ in range(4)
+    )
+    
+    group_keys = [
+        df[col] if col in df.columns else pd.Series(None, index=df.index, dtype=object)
+        for col in (currency_col, security_type_col)
+    ]
+    if trade_date_col in df.columns:
+        trade_dates = df[trade_date_col].values
+        actual_dates = df[settlement_date_col].values if has_settlement else None
+        for (currency, security_type), positions in df.groupby(group_keys, dropna=False, sort=False).indices.items():
+            currency = currency if pd.notna(currency) else None
+            security_type = security_type if pd.notna(security_type) else None
+            try:
+                group_expected = calculator.calculate_settlement_dates(
+                    trade_dates[positions], currency=currency, security_type=security_type
+                ).values
+                expected[positions] = group_expected
                 
-        except Exception as e:
-            logger.error(f"Error processing settlement for row {idx}: {e}")
-            expected_settlements.append(None)
-            settlement_validations.append(None)
+                # Validate actual settlement where both dates are present
+                if has_settlement:
+                    mask = ~np.isnat(trade_dates[positions]) & ~np.isnat(actual_dates[positions])
+                    if mask.any():
+                        rows = positions[mask]
+                        days = calculator.business_days_between(
+                            trade_dates[rows], actual_dates[rows], currency
+                        )
+                        t_plus = get_settlement_days(currency, security_type)
+                        valid[rows] = [bool(v) for v in actual_dates[rows] == group_expected[mask]]
+                        actual_t_plus[rows] = [int(d) for d in days]
+                        expected_t_plus[rows] = t_plus
+                        variance[rows] = [int(d) - t_plus for d in days]
+            except Exception as e:
+                logger.error(f"Error processing settlement for {currency}/{security_type}: {e}")
     
     # Add calculated columns
-    df['ExpectedSettlement'] = expected_settlements
+    df['ExpectedSettlement'] = expected
     
     # Add validation columns if actual settlement exists
-    if settlement_date_col in df.columns:
-        df['SettlementValid'] = [v['is_valid'] if v else None for v in settlement_validations]
-        df['SettlementVarianceDays'] = [v['variance_days'] if v else None for v in settlement_validations]
-        df['ExpectedTPlus'] = [v['expected_t_plus'] if v else None for v in settlement_validations]
-        df['ActualTPlus'] = [v['actual_t_plus'] if v else None for v in settlement_validations]
+    if has_settlement:
+        df['SettlementValid'] = list(valid)
+        df['SettlementVarianceDays'] = list(variance)
+        df['ExpectedTPlus'] = list(expected_t_plus)
+        df['ActualTPlus'] = list(actual_t_plus)
     
     # Add standard T+n for reference
     df['StandardTPlus'] = df.apply(
@@ -0,0 +1,226 @@
+# Purpose: Byte-bounded, LRU, stamp-validated in-memory caches with counters.
+# Used for the process-wide caches (security data, latest metrics, lookup
+# table catalog) so long-running workers stay within a memory budget and
+# never serve data for a file that changed on disk. Every cache registers
+# itself by name; get_cache_stats() reports hits, misses, stale lookups,
+# evictions and memory use for the diagnostics API.
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def file_stamp(path: str | os.PathLike) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for *path*, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Approximate memory footprint of a cached value.
+
+    DataFrames/Series use pandas' deep memory usage; dicts, lists and tuples
+    are summed recursively; anything else falls back to sys.getsizeof.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def freeze_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Mark *df*'s value arrays read-only in place and return it.
+
+    Any frame sharing those arrays (see shallow_view) then raises
+    ``ValueError: assignment destination is read-only`` on an in-place
+    write instead of silently changing the data for every other reader.
+    """
+    for values in df._mgr.arrays:
+        # Extension arrays (datetimes, categoricals) keep their data in _ndarray
+        array = values if isinstance(values, np.ndarray) else getattr(values, "_ndarray", None)
+        if isinstance(array, np.ndarray):
+            array.flags.writeable = False
+    return df
+
+
+def shallow_view(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a new DataFrame object sharing *df*'s (frozen) data buffers.
+
+    Callers may rename, re-index, reset_index(inplace=True), sort, or add and
+    replace whole columns without affecting the cached frame, at no copy
+    cost. The shared arrays are read-only (freeze_frame): writing into
+    existing values (``.loc[...] = x``, ``.iloc[...] = x``) raises
+    ValueError, so callers that need to do so must take ``.copy()`` first.
+    """
+    return freeze_frame(df).copy(deep=False)
+
+
+class BoundedCache:
+    """Thread-safe LRU cache bounded by an approximate byte budget.
+
+    Each entry carries a *stamp* (typically the source file's mtime and size);
+    ``get`` only returns entries whose stamp matches the caller's, so data
+    for a changed file is never served. Stale entries stay available via
+    ``peek`` for callers that can refresh them incrementally.
+    """
+
+    def __init__(self, name: str, max_bytes: int, register: bool = True):
+        self.name = name
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        if register:
+            _registry[name] = self
+
+    def get(self, key: Hashable, stamp: Any = None) -> Optional[Any]:
+        """Return the value for *key* if cached with the same *stamp*, else None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if stamp is not None and entry["stamp"] != stamp:
+                self.misses += 1
+                self.stale += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry["value"]
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Return the value for *key* regardless of its stamp (no counters, no LRU touch)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry["value"] if entry is not None else None
+
+    def put(self, key: Hashable, value: Any, stamp: Any = None, nbytes: Optional[int] = None) -> None:
+        """Insert or replace *key*, evicting least recently used entries over budget."""
+        if nbytes is None:
+            nbytes = estimate_nbytes(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old["nbytes"]
+            if nbytes > self.max_bytes:
+                logger.debug(f"[{self.name}] Entry {key} ({nbytes} bytes) exceeds budget; not cached")
+                return
+            self._entries[key] = {"value": value, "stamp": stamp, "nbytes": nbytes}
+            self._total_bytes += nbytes
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= evicted["nbytes"]
+                self.evictions += 1
+                logger.debug(f"[{self.name}] Evicted {evicted_key}")
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove *key* and return its value (None if absent)."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self._total_bytes -= entry["nbytes"]
+            return entry["value"]
+
+    def invalidate(self, predicate=None) -> int:
+        """Drop entries whose key satisfies *predicate* (all when None). Returns count."""
+        with self._lock:
+            keys = [k for k in self._entries if predicate is None or predicate(k)]
+            for key in keys:
+                self._total_bytes -= self._entries.pop(key)["nbytes"]
+            return len(keys)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def keys(self):
+        with self._lock:
+            return list(self._entries.keys())
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters and memory usage for this cache."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "evictions": self.evictions,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.stale = self.evictions = 0
+
+
+# name -> cache, for diagnostics
+_registry: Dict[str, BoundedCache] = {}
+
+
+def budget_from_env(var_name: str, default_mb: float) -> int:
+    """Read a cache budget in megabytes from *var_name* and return bytes."""
+    try:
+        megabytes = float(os.getenv(var_name, str(default_mb)))
+    except ValueError:
+        logger.warning(f"Invalid {var_name}; using {default_mb} MB")
+        megabytes = default_mb
+    return int(megabytes * 1024 * 1024)
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Return {cache name: stats} for every registered cache."""
+    return {name: cache.stats() for name, cache in sorted(_registry.items())}
+
+
+def reset_cache_stats() -> None:
+    """Reset the counters of every registered cache (entries are kept)."""
+    for cache in _registry.values():
+        cache.reset_stats()
+
+
+__all__ = [
+    "BoundedCache",
+    "file_stamp",
+    "estimate_nbytes",
+    "freeze_frame",
+    "shallow_view",
+    "budget_from_env",
+    "get_cache_stats",
+    "reset_cache_stats",
+]
@@ -0,0 +1,174 @@
+# Purpose: Memoize column-role detection (date/code/benchmark/scope/static/date
+# columns) by a hash of the header row, and cache CSV headers by file stamp.
+# Regex matching over wide headers (thousands of date columns) used to run on
+# every load; results are now computed once per distinct header and pattern
+# set and persisted to a small JSON file (SDC_COLUMN_ROLE_CACHE, default in the
+# system temp folder) so they survive restarts. Set
+# SDC_COLUMN_ROLE_CACHE_DISABLE=1 to turn memoization off.
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bound on persisted entries; oldest are dropped first
+MAX_ENTRIES = 512
+
+
+def is_role_cache_enabled() -> bool:
+    """Return False when disabled via SDC_COLUMN_ROLE_CACHE_DISABLE=1."""
+    return os.getenv("SDC_COLUMN_ROLE_CACHE_DISABLE", "0") != "1"
+
+
+def role_cache_path() -> str:
+    """Location of the persisted role cache."""
+    return os.getenv("SDC_COLUMN_ROLE_CACHE") or os.path.join(
+        tempfile.gettempdir(), "sdc_column_roles.json"
+    )
+
+
+def header_signature(columns: Sequence[Any]) -> str:
+    """Stable hash of a header row."""
+    joined = "\x1f".join(str(col) for col in columns)
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()
+
+
+def _params_signature(params: Any) -> str:
+    return hashlib.sha1(repr(params).encode("utf-8")).hexdigest()[:16]
+
+
+class _RoleStore:
+    """JSON-backed key/value store loaded lazily and rewritten atomically on insert."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._loaded_from: Optional[str] = None
+
+    def _ensure_loaded(self, path: str) -> None:
+        if self._loaded_from == path:
+            return
+        self._entries = OrderedDict()
+        self._loaded_from = path
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries.update(data)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable column role cache {path}: {e}")
+
+    def get(self, key: str) -> Any:
+        path = role_cache_path()
+        with self._lock:
+            self._ensure_loaded(path)
+            return self._entries.get(key)
+
+    def put(self, key: str, value: Any) -> None:
+        path = role_cache_path()
+        with self._lock:
+            self._ensure_loaded(path)
+            self._entries[key] = value
+            while len(self._entries) > MAX_ENTRIES:
+                self._entries.popitem(last=False)
+            snapshot = dict(self._entries)
+        self._save(path, snapshot)
+
+    def clear(self) -> None:
+        path = role_cache_path()
+        with self._lock:
+            self._entries = OrderedDict()
+            self._loaded_from = path
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _save(path: str, snapshot: Dict[str, Any]) -> None:
+        directory = os.path.dirname(path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            tmp_fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".column_roles.tmp-")
+            with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not persist column role cache to {path}: {e}")
+
+
+_store = _RoleStore()
+
+
+def memoize_roles(
+    kind: str, columns: Sequence[Any], params: Any, compute: Callable[[], Any]
+) -> Any:
+    """Return ``compute()`` memoized by (kind, header signature, params).
+
+    *compute* must return a JSON-serializable value (lists come back as lists).
+    """
+    if not is_role_cache_enabled():
+        return compute()
+    key = f"{kind}:{header_signature(columns)}:{_params_signature(params)}"
+    cached = _store.get(key)
+    if cached is not None:
+        return cached
+    value = compute()
+    _store.put(key, value)
+    return value
+
+
+def read_header(filepath: str, **read_kwargs) -> Optional[List[str]]:
+    """Return the raw header of a CSV, cached by the file's (mtime_ns, size).
+
+    Extra keyword arguments are passed to ``pd.read_csv(..., nrows=0)`` on a
+    miss. Returns None if the header cannot be read.
+    """
+    abs_path = os.path.abspath(filepath)
+    try:
+        st = os.stat(abs_path)
+    except OSError:
+        return None
+    stamp = [st.st_mtime_ns, st.st_size]
+    key = f"header:{abs_path}"
+    if is_role_cache_enabled():
+        cached = _store.get(key)
+        if cached is not None and cached.get("stamp") == stamp:
+            return list(cached["columns"])
+    try:
+        header_df = pd.read_csv(abs_path, nrows=0, **read_kwargs)
+    except Exception as e:
+        logger.error(f"Error reading header of {abs_path}: {e}")
+        return None
+    columns = [str(col) for col in header_df.columns.tolist()]
+    if is_role_cache_enabled():
+        _store.put(key, {"stamp": stamp, "columns": columns})
+    return columns
+
+
+def clear_column_role_cache() -> None:
+    """Forget all memoized roles and headers (in memory and on disk)."""
+    _store.clear()
+
+
+__all__ = [
+    "header_signature",
+    "memoize_roles",
+    "read_header",
+    "clear_column_role_cache",
+    "is_role_cache_enabled",
+    "role_cache_path",
+]
@@ -0,0 +1,221 @@
+# Purpose: Transparent columnar sidecar cache for the wide sec_/ts_/w_ CSV inputs.
+# The first read of a CSV parses it with pandas and writes a typed sidecar
+# (Feather when pyarrow is installed, pickle otherwise) into a hidden
+# `.sdc_cache` folder next to the source. Later reads with the same read
+# options are served from the sidecar for as long as the source file's
+# mtime and size are unchanged.
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import tempfile
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  # type: ignore
+    import pyarrow.feather  # noqa: F401  # type: ignore
+
+    _ARROW_AVAILABLE = True
+except Exception:  # pragma: no cover - depends on environment
+    _ARROW_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+# Folder (created next to each cached CSV) holding the sidecar files
+CACHE_DIR_NAME = ".sdc_cache"
+
+# Only wide security/time-series/weight files are cached by default
+CACHEABLE_FILE_PATTERN = re.compile(r"^(sec_|ts_|sp_ts_|w_|synth_sec_)", re.IGNORECASE)
+
+# read_csv options that change the shape of the result in ways a sidecar
+# cannot represent (partial reads, iterators, custom index)
+_UNSUPPORTED_KWARGS = {"nrows", "chunksize", "iterator", "index_col", "skipfooter"}
+
+
+def is_cache_enabled() -> bool:
+    """Return False when disabled via SDC_COLUMNAR_CACHE_DISABLE=1."""
+    return os.getenv("SDC_COLUMNAR_CACHE_DISABLE", "0") != "1"
+
+
+def is_cacheable_file(path: str | os.PathLike) -> bool:
+    """Return True if *path* names a CSV that should get a columnar sidecar."""
+    name = os.path.basename(str(path))
+    return name.lower().endswith(".csv") and bool(CACHEABLE_FILE_PATTERN.match(name))
+
+
+def _kwargs_supported(kwargs: Dict[str, Any]) -> bool:
+    """Return True if the read options can be served from a sidecar."""
+    if any(key in kwargs and kwargs[key] is not None for key in _UNSUPPORTED_KWARGS):
+        return False
+    # Callables (converters, skiprows functions) have no stable identity
+    for value in kwargs.values():
+        if callable(value) and not isinstance(value, type):
+            return False
+        if isinstance(value, dict) and any(
+            callable(v) and not isinstance(v, type) for v in value.values()
+        ):
+            return False
+    return True
+
+
+def _source_stamp(path: Path) -> Optional[str]:
+    """Return '<mtime_ns>-<size>' for *path*, or None if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}-{st.st_size}"
+
+
+def _kwargs_digest(kwargs: Dict[str, Any]) -> str:
+    """Stable short digest of the read_csv options used for a sidecar."""
+    items = sorted((str(k), repr(v)) for k, v in kwargs.items())
+    return hashlib.sha1(repr(items).encode("utf-8")).hexdigest()[:12]
+
+
+def _sidecar_path(source: Path, stamp: str, kwargs: Dict[str, Any]) -> Path:
+    ext = ".feather" if _ARROW_AVAILABLE else ".pkl"
+    name = f"{source.name}.{stamp}.{_kwargs_digest(kwargs)}{ext}"
+    return source.parent / CACHE_DIR_NAME / name
+
+
+def sidecar_path_for(path: str | os.PathLike, **kwargs) -> Optional[Path]:
+    """Return the sidecar location for *path* read with *kwargs* (None if unstat-able).
+
+    The file name embeds the source stamp (mtime + size) and a digest of the
+    read options, so any change to the CSV produces a different sidecar.
+    """
+    source = Path(path)
+    stamp = _source_stamp(source)
+    if stamp is None:
+        return None
+    return _sidecar_path(source, stamp, kwargs)
+
+
+def _read_sidecar(sidecar: Path) -> pd.DataFrame:
+    if sidecar.suffix == ".feather":
+        return pd.read_feather(sidecar)
+    return pd.read_pickle(sidecar)
+
+
+def _write_sidecar(df: pd.DataFrame, sidecar: Path) -> bool:
+    """Write *df* to *sidecar* atomically. Returns True on success."""
+    sidecar.parent.mkdir(parents=True, exist_ok=True)
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        dir=str(sidecar.parent), prefix=sidecar.name + ".tmp-"
+    )
+    os.close(tmp_fd)
+    try:
+        if sidecar.suffix == ".feather":
+            try:
+                df.to_feather(tmp_path)
+            except Exception as e:
+                # Mixed-type object columns or non-string headers cannot be
+                # represented in Arrow; skip the sidecar for this file.
+                logger.debug(f"Feather sidecar not written for {sidecar.name}: {e}")
+                return False
+        else:
+            df.to_pickle(tmp_path)
+        os.replace(tmp_path, str(sidecar))
+        return True
+    except OSError as e:
+        logger.warning(f"Could not write columnar sidecar {sidecar}: {e}")
+        return False
+    finally:
+        try:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _prune_stale_sidecars(source: Path, current_stamp: str) -> None:
+    """Delete sidecars of *source* that belong to an older version of the file."""
+    cache_dir = source.parent / CACHE_DIR_NAME
+    prefix = source.name + "."
+    try:
+        entries = list(cache_dir.iterdir())
+    except OSError:
+        return
+    for entry in entries:
+        name = entry.name
+        if not name.startswith(prefix) or ".tmp-" in name:
+            continue
+        stamp = name[len(prefix):].split(".", 1)[0]
+        if stamp != current_stamp:
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
+
+def read_csv_cached(path: str | os.PathLike, **kwargs) -> pd.DataFrame:
+    """Read a CSV, serving it from a columnar sidecar when one is current.
+
+    Behaves like ``pd.read_csv(path, **kwargs)``. Files that are not wide
+    sec_/ts_/w_ inputs, unsupported read options (``nrows``, ``chunksize``,
+    ``index_col``, callables) or a disabled cache fall straight through to
+    pandas. Errors raised by pandas propagate unchanged.
+    """
+    if not isinstance(path, (str, os.PathLike)):
+        return pd.read_csv(path, **kwargs)
+    if not (is_cache_enabled() and is_cacheable_file(path) and _kwargs_supported(kwargs)):
+        return pd.read_csv(path, **kwargs)
+
+    source = Path(path)
+    stamp = _source_stamp(source)
+    if stamp is None:
+        return pd.read_csv(path, **kwargs)
+    sidecar = _sidecar_path(source, stamp, kwargs)
+
+    if sidecar.exists():
+        try:
+            df = _read_sidecar(sidecar)
+            logger.debug(f"[COLUMNAR CACHE HIT] {source.name} <- {sidecar.name}")
+            return df
+        except Exception as e:
+            logger.warning(f"Discarding unreadable sidecar {sidecar}: {e}")
+            try:
+                sidecar.unlink()
+            except OSError:
+                pass
+
+    df = pd.read_csv(path, **kwargs)
+
+    # Only persist if the source did not change while we were parsing it
+    if _source_stamp(source) == stamp and _write_sidecar(df, sidecar):
+        logger.debug(f"[COLUMNAR CACHE MISS] Wrote sidecar {sidecar.name}")
+        _prune_stale_sidecars(source, stamp)
+    return df
+
+
+def clear_columnar_cache(data_folder: str | os.PathLike) -> int:
+    """Remove every sidecar under *data_folder*. Returns the number of files removed."""
+    cache_dir = Path(data_folder) / CACHE_DIR_NAME
+    removed = 0
+    if not cache_dir.is_dir():
+        return removed
+    for entry in cache_dir.iterdir():
+        try:
+            entry.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+__all__ = [
+    "read_csv_cached",
+    "is_cacheable_file",
+    "is_cache_enabled",
+    "sidecar_path_for",
+    "clear_columnar_cache",
+]
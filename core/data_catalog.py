@@ -0,0 +1,127 @@
+# Purpose: Process-wide catalog for the shared lookup tables (reference.csv,
+# w_secs.csv, users.csv, exclusions.csv, curves.csv) that most views and
+# analytics modules read. Each table is parsed once per process and served
+# from memory until the file's mtime or size changes. The catalog is bounded
+# by a byte budget (SDC_CATALOG_MAX_MB, default 256) and evicts the least
+# recently used tables first.
+
+from __future__ import annotations
+
+import os
+import logging
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from core import config
+from core.bounded_cache import BoundedCache, budget_from_env, file_stamp
+from core.columnar_cache import read_csv_cached
+
+logger = logging.getLogger(__name__)
+
+
+# Logical table name -> file name inside the data folder
+CATALOG_TABLES: Dict[str, str] = {
+    "reference": "reference.csv",
+    "w_secs": config.W_SECS_FILENAME,
+    "users": "users.csv",
+    "exclusions": "exclusions.csv",
+    "curves": "curves.csv",
+}
+
+MAX_BYTES_DEFAULT: int = budget_from_env("SDC_CATALOG_MAX_MB", 256)
+
+
+def _kwargs_key(kwargs: Dict[str, Any]) -> str:
+    """Stable key for a set of read_csv options."""
+    return repr(sorted((str(k), repr(v)) for k, v in kwargs.items()))
+
+
+class DataCatalog:
+    """In-memory, mtime-validated LRU cache of parsed lookup tables.
+
+    Entries are keyed by (absolute path, read options) so the same file read
+    with different options (e.g. ``dtype=str``) is cached separately. Callers
+    receive a copy of the cached frame, so in-place edits cannot leak between
+    requests.
+    """
+
+    def __init__(self, max_bytes: int = MAX_BYTES_DEFAULT, name: Optional[str] = None):
+        # Only named catalogs are reported by core.bounded_cache.get_cache_stats()
+        self._cache = BoundedCache(name or "data_catalog", max_bytes, register=name is not None)
+
+    @property
+    def max_bytes(self) -> int:
+        return self._cache.max_bytes
+
+    def read(self, path: str, **read_kwargs) -> pd.DataFrame:
+        """Drop-in replacement for ``pd.read_csv(path, **read_kwargs)``.
+
+        Raises the same errors as pandas (e.g. FileNotFoundError) so existing
+        error handling at call sites keeps working.
+        """
+        abs_path = os.path.abspath(path)
+        key = (abs_path, _kwargs_key(read_kwargs))
+        stamp = file_stamp(abs_path)
+
+        df = self._cache.get(key, stamp) if stamp is not None else None
+        if df is not None:
+            return df.copy()
+
+        df = read_csv_cached(abs_path, **read_kwargs)
+
+        # Only cache if the file did not change while it was being parsed
+        if stamp is not None and file_stamp(abs_path) == stamp:
+            self._cache.put(key, df, stamp)
+        return df.copy()
+
+    def get_table(self, data_folder: str, name: str, **read_kwargs) -> pd.DataFrame:
+        """Return catalog table *name* (see CATALOG_TABLES) from *data_folder*."""
+        try:
+            file_name = CATALOG_TABLES[name]
+        except KeyError:
+            raise KeyError(f"Unknown catalog table '{name}'") from None
+        return self.read(os.path.join(data_folder, file_name), **read_kwargs)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop cached entries for *path* (all entries when path is None)."""
+        if path is None:
+            self._cache.clear()
+            return
+        abs_path = os.path.abspath(path)
+        self._cache.invalidate(lambda key: key[0] == abs_path)
+
+    def cached_paths(self):
+        """Absolute paths currently held in the catalog."""
+        return {key[0] for key in self._cache.keys()}
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters and memory usage of the catalog."""
+        return self._cache.stats()
+
+
+_catalog = DataCatalog(name="data_catalog")
+
+
+def get_catalog() -> DataCatalog:
+    """Return the process-wide catalog instance."""
+    return _catalog
+
+
+def load_table(path: str, **read_kwargs) -> pd.DataFrame:
+    """Read a CSV through the process-wide catalog (same contract as pd.read_csv)."""
+    return _catalog.read(path, **read_kwargs)
+
+
+def get_table(data_folder: str, name: str, **read_kwargs) -> pd.DataFrame:
+    """Return a named catalog table from *data_folder* via the process-wide catalog."""
+    return _catalog.get_table(data_folder, name, **read_kwargs)
+
+
+__all__ = [
+    "CATALOG_TABLES",
+    "DataCatalog",
+    "get_catalog",
+    "load_table",
+    "get_table",
+]
@@ -26,6 +26,7 @@ from core.data_utils import (
     convert_to_numeric_robustly,
 )
 from core.utils import load_yaml_config
+from core.column_roles import read_header
 
 # Get the logger instance. Assumes Flask app has configured logging.
 logger = logging.getLogger(__name__)
@@ -185,11 +186,14 @@ def _parse_date_column(
     df: pd.DataFrame, date_col: str, filename_for_logging: str
 ) -> pd.Series:
     """
-    Parses the date column robustly using data_utils.parse_dates_robustly.
+    Parses the date column robustly using data_utils.parse_dates_robustly,
+    reusing the date format learned for this file and column.
     Returns the parsed date series.
     """
     date_series = df[date_col]
-    parsed_dates = parse_dates_robustly(date_series)
+    parsed_dates = parse_dates_robustly(
+        date_series, cache_key=(os.path.basename(filename_for_logging), date_col)
+    )
     nat_count = parsed_dates.isnull().sum()
     total_count = len(parsed_dates)
     success_count = total_count - nat_count
@@ -346,17 +350,16 @@ def _process_single_file(
         return None
     try:
         # --- Step 1: Read header (discover original columns) -------------------
-        header_df = read_csv_robustly(
+        header_cols = read_header(
             filepath,
-            nrows=0,
             encoding="utf-8",
             encoding_errors="replace",
             on_bad_lines="skip",
         )
-        if header_df is None:
+        if header_cols is None:
             logger.warning(f"Header could not be read for {filepath}")
             return None
-        original_cols = [col.strip() for col in header_df.columns.tolist()]
+        original_cols = [col.strip() for col in header_cols]
         logger.info(
             f"Processing file: '{filename_for_logging}'. Original columns: {original_cols}"
         )
@@ -3,11 +3,13 @@
 
 import logging
 from typing import Optional, Any, List, Dict, Callable
-from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 import re
 
+from core.columnar_cache import read_csv_cached
+from core.column_roles import memoize_roles
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,10 +18,11 @@ def read_csv_robustly(filepath: str, **kwargs) -> Optional[pd.DataFrame]:
     Attempts to read a CSV file robustly, handling common errors gracefully.
     Returns a DataFrame if successful, or None if an error occurs.
     Logs errors with details for diagnostics.
-    Accepts standard pandas.read_csv kwargs.
+    Accepts standard pandas.read_csv kwargs. Wide sec_/ts_/w_ files are served
+    from a columnar sidecar when one is current (see core.columnar_cache).
     """
     try:
-        df = pd.read_csv(filepath, **kwargs)
+        df = read_csv_cached(filepath, **kwargs)
         return df
     except FileNotFoundError:
         logger.error(f"File not found: {filepath}", exc_info=True)
@@ -34,18 +37,123 @@ def read_csv_robustly(filepath: str, **kwargs) -> Optional[pd.DataFrame]:
     return None
 
 
-def parse_dates_robustly(series: pd.Series, formats: list = None) -> pd.Series:
+# Default explicit formats for parse_dates_robustly. They are mutually
+# exclusive (no string matches two of them), so trying a learned format first
+# never changes which format a value ends up parsed with.
+DEFAULT_DATE_FORMATS = ["%Y-%m-%d", "%d/%m/%Y", "%Y-%m-%dT%H:%M:%S"]
+
+# Detected format per caller-supplied key (e.g. (filename, column))
+_learned_date_formats: Dict[Any, str] = {}
+
+_EXCEL_EPOCH = pd.Timestamp("1900-01-01")
+# Largest serial that still fits in datetime64[ns]
+_EXCEL_MAX_SERIAL = (pd.Timestamp.max.date() - _EXCEL_EPOCH.date()).days
+
+
+def detect_date_format(
+    series: pd.Series, formats: List[str], sample_size: int = 200
+) -> Optional[str]:
+    """Return the format in *formats* that parses most of a sample of *series*.
+
+    Ties keep the earlier format. Returns None if no format parses any sample value.
+    """
+    sample = series.dropna()
+    if sample.empty:
+        return None
+    sample = pd.Series(sample.unique()[:sample_size])
+    best_fmt, best_count = None, 0
+    for fmt in formats:
+        count = int(pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum())
+        if count > best_count:
+            best_fmt, best_count = fmt, count
+            if count == len(sample):
+                break
+    return best_fmt
+
+
+def clear_learned_date_formats() -> None:
+    """Forget formats learned by parse_dates_with_learned_format."""
+    _learned_date_formats.clear()
+
+
+def parse_dates_with_learned_format(
+    series: pd.Series, formats: List[str], cache_key: Any = None
+) -> pd.Series:
+    """Parse *series* with explicit formats, learned one first; NaT where none match.
+
+    The format is detected from a sample (and remembered under *cache_key*),
+    the whole column is parsed with one vectorized call, and only the rows it
+    rejects are retried with the remaining formats.
+    """
+    learned = _learned_date_formats.get(cache_key) if cache_key is not None else None
+    if learned not in formats:
+        # Learned by a caller with a different format list
+        learned = None
+    if learned is None:
+        learned = detect_date_format(series, formats)
+        if learned is not None and cache_key is not None:
+            _learned_date_formats[cache_key] = learned
+    ordered = ([learned] if learned else []) + [f for f in formats if f != learned]
+
+    # Filled by position, so duplicate index labels are fine
+    parsed = np.full(len(series), np.datetime64("NaT"), dtype="datetime64[ns]")
+    pending = series.notna().to_numpy()
+    for fmt in ordered:
+        if not pending.any():
+            break
+        positions = np.flatnonzero(pending)
+        try:
+            attempt = pd.to_datetime(series.iloc[positions], format=fmt, errors="coerce")
+        except Exception as e:
+            logger.warning(f"Error parsing dates with format {fmt}: {e}")
+            continue
+        ok = attempt.notna().to_numpy()
+        if ok.any():
+            parsed[positions[ok]] = attempt.to_numpy()[ok]
+            pending[positions[ok]] = False
+        if fmt == learned and ok.mean() < 0.5 and cache_key is not None:
+            # Data changed shape; re-detect next time
+            _learned_date_formats.pop(cache_key, None)
+    return pd.Series(parsed, index=series.index, dtype="datetime64[ns]")
+
+
+def _parse_excel_serials(series: pd.Series) -> pd.Series:
+    """Vectorized Excel serial-date conversion; NaT for values that are not serials."""
+    # Filled by position, so duplicate index labels are fine
+    parsed = np.full(len(series), np.datetime64("NaT"), dtype="datetime64[ns]")
+    # Cheap C-level numeric pass first; the strict digits-only check then runs
+    # on the numeric candidates only
+    positions = np.flatnonzero(pd.to_numeric(series, errors="coerce").notna().to_numpy())
+    if positions.size:
+        as_str = series.iloc[positions].astype(str).str.strip()
+        digits = as_str.str.fullmatch(r"\d+(\.\d*)?").fillna(False).to_numpy(dtype=bool)
+        positions = positions[digits]
+        serial = pd.to_numeric(as_str[digits], errors="coerce").to_numpy(dtype=float)
+        # Excel incorrectly treats 1900 as a leap year
+        serial = np.where(serial < 60, serial, serial - 1)
+        in_range = serial - 1 <= _EXCEL_MAX_SERIAL
+        positions, serial = positions[in_range], serial[in_range]
+        if positions.size:
+            parsed[positions] = (_EXCEL_EPOCH + pd.to_timedelta(serial - 1, unit="D")).to_numpy()
+    return pd.Series(parsed, index=series.index, dtype="datetime64[ns]")
+
+
+def parse_dates_robustly(
+    series: pd.Series, formats: list = None, cache_key: Any = None
+) -> pd.Series:
     """
     Attempts to parse a pandas Series of date strings using multiple common formats and pandas inference.
-    Tries standard formats (YYYY-MM-DD, DD/MM/YYYY, ISO8601), Excel serial dates, then falls back to pandas' flexible parser.
+    Tries Excel serial dates, then standard formats (YYYY-MM-DD, DD/MM/YYYY, ISO8601) - the format
+    detected from a sample first, one vectorized call per format - then falls back to pandas'
+    flexible parser for the rows that are still unparsed.
     Logs warnings on failures and returns a Series with NaT for unparseable values.
     Args:
         series (pd.Series): Series of date strings to parse.
         formats (list, optional): List of date formats to try. If None, uses defaults.
+        cache_key (optional): Key (e.g. (filename, column)) under which the detected format is remembered.
     Returns:
         pd.Series: Series of parsed dates (dtype 'datetime64[ns]'), with NaT for unparseable values.
     """
-    import re
     # Input validation
     if not isinstance(series, pd.Series):
         logger.error("parse_dates_robustly: Input must be a pandas Series")
@@ -61,46 +169,24 @@ def parse_dates_robustly(series: pd.Series, formats: list = None) -> pd.Series:
         return series
     
     if formats is None:
-        formats = ["%Y-%m-%d", "%d/%m/%Y", "%Y-%m-%dT%H:%M:%S"]
+        formats = DEFAULT_DATE_FORMATS
     
     try:
-        parsed = pd.Series([pd.NaT] * len(series), index=series.index, dtype='datetime64[ns]')
-        remaining = series.copy()
-        
         # First, try Excel serial dates for numeric values
-        mask = parsed.isna() & remaining.notna()
+        parsed = _parse_excel_serials(series)
+
+        # Positional masks throughout: the index may repeat labels
+        mask = (parsed.isna() & series.notna()).to_numpy()
         if mask.any():
-            for idx in series[mask].index:
-                val_str = str(remaining.loc[idx]).strip()
-                if re.match(r'^\d+(\.\d*)?$', val_str):
-                    try:
-                        serial_number = float(val_str)
-                        # Excel serial dates: 1 = January 1, 1900 (but Excel incorrectly treats 1900 as a leap year)
-                        # Adjust for Excel's leap year bug and convert to datetime
-                        if serial_number >= 60:  # After Feb 28, 1900
-                            serial_number -= 1  # Adjust for Excel's 1900 leap year bug
-                        excel_epoch = datetime(1900, 1, 1)
-                        parsed.loc[idx] = pd.Timestamp(excel_epoch + timedelta(days=serial_number - 1))
-                    except (ValueError, OverflowError):
-                        pass  # Will be handled by other parsing methods
-        
-        for fmt in formats:
-            mask = parsed.isna() & remaining.notna()
-            if mask.any():
-                try:
-                    parsed_dates = pd.to_datetime(
-                        remaining[mask], format=fmt, errors="coerce"
-                    )
-                    parsed.loc[mask] = parsed_dates
-                except Exception as e:
-                    logger.warning(f"Error parsing dates with format {fmt}: {e}")
+            by_format = parse_dates_with_learned_format(series[mask], formats, cache_key)
+            parsed[mask] = by_format.to_numpy()
         
-        # Final fallback: pandas flexible parser
-        mask = parsed.isna() & remaining.notna()
+        # Final fallback: pandas flexible parser, only for rows still unparsed
+        mask = (parsed.isna() & series.notna()).to_numpy()
         if mask.any():
             try:
-                parsed_dates = pd.to_datetime(remaining[mask], errors="coerce")
-                parsed.loc[mask] = parsed_dates
+                parsed_dates = pd.to_datetime(series[mask], errors="coerce")
+                parsed[mask] = parsed_dates.to_numpy()
             except Exception as e:
                 logger.warning(f"Error in fallback flexible date parsing: {e}")
         
@@ -108,7 +194,7 @@ def parse_dates_robustly(series: pd.Series, formats: list = None) -> pd.Series:
         total = len(series)
         nat_count = parsed.isna().sum()
         if nat_count > 0:
-            failed_examples = series[parsed.isna()].unique()[:5]
+            failed_examples = series[parsed.isna().to_numpy()].unique()[:5]
             logger.warning(
                 f"parse_dates_robustly: {nat_count}/{total} values could not be parsed as dates. "
                 f"Examples of failed values: {failed_examples.tolist()}"
@@ -126,6 +212,24 @@ def parse_dates_robustly(series: pd.Series, formats: list = None) -> pd.Series:
         return pd.Series([pd.NaT] * len(series), index=series.index, dtype='datetime64[ns]')
 
 
+def _match_column_patterns(
+    columns: List[str], patterns: Dict[str, List[str]]
+) -> Dict[str, Optional[str]]:
+    """First column matching each category's patterns (patterns tried in order)."""
+    result = {}
+    for category, regex_list in patterns.items():
+        found = None
+        for regex in regex_list:
+            for col in columns:
+                if re.search(regex, col, re.IGNORECASE):
+                    found = col
+                    break
+            if found:
+                break
+        result[category] = found
+    return result
+
+
 def identify_columns(
     columns: List[str], patterns: Dict[str, List[str]], required: List[str]
 ) -> Dict[str, Optional[str]]:
@@ -139,17 +243,14 @@ def identify_columns(
         Dict[str, Optional[str]]: Mapping from category to found column name (or None if not found).
     Logs warnings if required categories are not found.
     """
-    result = {}
+    result = memoize_roles(
+        "identify_columns",
+        columns,
+        patterns,
+        lambda: _match_column_patterns(columns, patterns),
+    )
     for category, regex_list in patterns.items():
-        found = None
-        for regex in regex_list:
-            for col in columns:
-                if re.search(regex, col, re.IGNORECASE):
-                    found = col
-                    break
-            if found:
-                break
-        result[category] = found
+        found = result.get(category)
         if found:
             logger.info(
                 f"identify_columns: Found {category} column: '{found}' using pattern(s) {regex_list}"
@@ -241,6 +342,7 @@ def melt_wide_data(
     df: pd.DataFrame,
     id_vars: List[str],
     date_like_check_func: Optional[Callable] = None,
+    cache_key: Any = None,
 ) -> Optional[pd.DataFrame]:
     """
     Converts a wide-format DataFrame (dates as columns) to long format using melt.
@@ -250,6 +352,7 @@ def melt_wide_data(
         df (pd.DataFrame): Input wide-format DataFrame.
         id_vars (List[str]): List of columns to use as identifier variables.
         date_like_check_func (Callable, optional): Function to check if a column is date-like. If None, uses utils._is_date_like.
+        cache_key (optional): Key (e.g. (filename, "Date")) under which the detected date format is remembered.
     Returns:
         Optional[pd.DataFrame]: Melted long-format DataFrame, or None on error.
     """
@@ -274,7 +377,7 @@ def melt_wide_data(
             var_name="Date_Str",
             value_name="Value",
         )
-        melted["Date"] = parse_dates_robustly(melted["Date_Str"])
+        melted["Date"] = parse_dates_robustly(melted["Date_Str"], cache_key=cache_key)
         melted.drop(columns=["Date_Str"], inplace=True)
         logger.info(f"melt_wide_data: Melted DataFrame shape: {melted.shape}")
         return melted
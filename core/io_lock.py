@@ -1,6 +1,11 @@
 # Purpose: Centralize safe, cross-process file I/O with file-based locks.
 # Provides locking wrappers and installs a global monkey-patch so all
 # pandas CSV reads/writes use file locks, minimizing race-condition risk.
+# Readers take a shared lock and writers an exclusive one (fcntl.flock on
+# POSIX), so concurrent readers of a hot file no longer serialize. Writers
+# take priority: a waiting writer holds an intent lock that new readers wait
+# on, so a stream of readers cannot starve it. Where fcntl is unavailable
+# (Windows) both modes fall back to an exclusive FileLock.
 
 from __future__ import annotations
 
@@ -8,13 +13,24 @@ import os
 import io
 import csv
 import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any
 
 import pandas as pd
 from filelock import FileLock, Timeout
 import logging
 
+try:
+    import fcntl  # POSIX only
+
+    _FCNTL_AVAILABLE = True
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    _FCNTL_AVAILABLE = False
+
 
 _logger = logging.getLogger(__name__)
 
@@ -22,6 +38,12 @@ _logger = logging.getLogger(__name__)
 # Defaults can be tuned via env vars
 READ_TIMEOUT_DEFAULT: float = float(os.getenv("SDC_FILELOCK_READ_TIMEOUT", "15"))
 WRITE_TIMEOUT_DEFAULT: float = float(os.getenv("SDC_FILELOCK_WRITE_TIMEOUT", "30"))
+# Waits longer than this (milliseconds) are logged as contention warnings
+SLOW_WAIT_MS_DEFAULT: float = float(os.getenv("SDC_FILELOCK_SLOW_WAIT_MS", "500"))
+
+# Polling interval bounds while waiting for a contended flock
+_POLL_INTERVAL_MIN = 0.005
+_POLL_INTERVAL_MAX = 0.05
 
 
 def _as_path(path_or_buf: Any) -> Optional[Path]:
@@ -37,15 +59,211 @@ def _as_path(path_or_buf: Any) -> Optional[Path]:
     return None
 
 
+def _intent_file_for(lock_path: Path) -> Path:
+    """Return the writer-intent lock file paired with a lock file (e.g., file.csv.lock.intent)."""
+    return lock_path.with_suffix(lock_path.suffix + ".intent")
+
+
 def _lockfile_for(path: Path) -> Path:
     """Return a lock file path next to the target (e.g., file.csv.lock)."""
     # Always suffix with .lock (keep original suffix too to avoid collisions)
     return path.with_suffix(path.suffix + ".lock")
 
 
+# ---------------------------------------------------------------------------
+# Lock wait metrics
+# ---------------------------------------------------------------------------
+
+_metrics_lock = threading.Lock()
+_lock_metrics: Dict[str, Dict[str, Any]] = {}
+
+
+def _record_wait(lock_path: Path, mode: str, waited: float, contended: bool, timed_out: bool) -> None:
+    """Accumulate wait statistics for one lock acquisition attempt."""
+    with _metrics_lock:
+        stats = _lock_metrics.setdefault(
+            str(lock_path),
+            {
+                "read": {"acquired": 0, "contended": 0, "timeouts": 0, "total_wait_s": 0.0, "max_wait_s": 0.0},
+                "write": {"acquired": 0, "contended": 0, "timeouts": 0, "total_wait_s": 0.0, "max_wait_s": 0.0},
+            },
+        )[mode]
+        if timed_out:
+            stats["timeouts"] += 1
+        else:
+            stats["acquired"] += 1
+        if contended:
+            stats["contended"] += 1
+        stats["total_wait_s"] += waited
+        stats["max_wait_s"] = max(stats["max_wait_s"], waited)
+    if waited * 1000.0 >= SLOW_WAIT_MS_DEFAULT:
+        _logger.warning(f"Waited {waited * 1000.0:.0f} ms for {mode} lock on {lock_path}")
+
+
+def get_lock_metrics() -> Dict[str, Dict[str, Any]]:
+    """Return a snapshot of lock wait statistics keyed by lock file.
+
+    Each entry has ``read`` and ``write`` sections with ``acquired``,
+    ``contended`` (had to wait), ``timeouts``, ``total_wait_s`` and
+    ``max_wait_s``.
+    """
+    with _metrics_lock:
+        return {
+            path: {mode: dict(values) for mode, values in modes.items()}
+            for path, modes in _lock_metrics.items()
+        }
+
+
+def reset_lock_metrics() -> None:
+    """Clear all accumulated lock wait statistics."""
+    with _metrics_lock:
+        _lock_metrics.clear()
+
+
+# ---------------------------------------------------------------------------
+# Shared/exclusive file lock
+# ---------------------------------------------------------------------------
+
+
+class LockTimeout(Timeout):
+    """``filelock.Timeout`` raised by ReadWriteFileLock, naming the lock mode and wait."""
+
+    def __init__(self, lock_file: str, mode: str, waited: float) -> None:
+        super().__init__(lock_file)
+        self.mode = mode
+        self.waited = waited
+
+    def __reduce__(self):
+        return self.__class__, (self.lock_file, self.mode, self.waited)
+
+    def __str__(self) -> str:
+        message = f"Timed out after {self.waited:.2f}s waiting for the {self.mode} lock on '{self.lock_file}'"
+        if self.mode == "write":
+            message += (
+                "; readers or another writer held the file for the whole timeout "
+                "(see SDC_FILELOCK_WRITE_TIMEOUT)"
+            )
+        return message
+
+
+class ReadWriteFileLock:
+    """Cross-process reader/writer lock backed by a ``.lock`` file.
+
+    ``read()`` takes a shared lock (any number of concurrent readers) and
+    ``write()`` an exclusive one. On POSIX this uses ``fcntl.flock``, which is
+    the same primitive ``filelock.FileLock`` uses, so exclusive FileLock holders
+    elsewhere still exclude our readers. Without fcntl both modes use FileLock.
+
+    Writers have priority over new readers: a writer first takes the paired
+    ``.intent`` lock exclusively, and every reader passes through that lock
+    (shared, released at once) before taking its own. While a writer waits,
+    new readers queue behind it and the readers already inside drain, so a
+    steady stream of readers cannot keep it out. A thread that already holds
+    a read lock must not take a second one on the same file while a writer
+    may be waiting.
+
+    Timeouts raise ``LockTimeout`` (a ``filelock.Timeout``) naming the mode
+    and how long the caller waited. A writer that times out means readers
+    or another writer held the file for the whole timeout.
+    """
+
+    def __init__(self, lock_path: str | os.PathLike, timeout: float) -> None:
+        self.lock_path = Path(lock_path)
+        self.timeout = timeout
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._acquire(shared=True):
+            yield
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._acquire(shared=False):
+            yield
+
+    @contextmanager
+    def _acquire(self, shared: bool) -> Iterator[None]:
+        mode = "read" if shared else "write"
+        start = time.monotonic()
+        if not _FCNTL_AVAILABLE:
+            lock = FileLock(str(self.lock_path), timeout=self.timeout)
+            try:
+                lock.acquire()
+            except Timeout:
+                waited = time.monotonic() - start
+                _record_wait(self.lock_path, mode, waited, True, True)
+                raise LockTimeout(str(self.lock_path), mode, waited) from None
+            waited = time.monotonic() - start
+            _record_wait(self.lock_path, mode, waited, waited > _POLL_INTERVAL_MIN, False)
+            try:
+                yield
+            finally:
+                lock.release()
+            return
+
+        try:
+            fd = os.open(str(self.lock_path), os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            if not shared:
+                raise
+            # Missing or read-only folder: nothing can be writing there either
+            _logger.debug(f"Reading without lock, cannot open {self.lock_path}: {e}")
+            yield
+            return
+        try:
+            contended = self._acquire_flock(fd, shared, start)
+            _record_wait(self.lock_path, mode, time.monotonic() - start, contended, False)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def _acquire_flock(self, fd: int, shared: bool, start: float) -> bool:
+        """Take the flock on *fd* behind the writer-intent lock. Returns True if it had to wait."""
+        try:
+            intent_fd = os.open(str(_intent_file_for(self.lock_path)), os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            _logger.debug(f"No writer-intent lock for {self.lock_path}: {e}")
+            intent_fd = None
+        try:
+            contended = False
+            if intent_fd is not None:
+                # Readers pass through (and wait behind a waiting writer);
+                # writers hold it until they have the lock itself
+                contended = self._poll_flock(intent_fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX, shared, start)
+                if shared:
+                    fcntl.flock(intent_fd, fcntl.LOCK_UN)
+            contended |= self._poll_flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX, shared, start)
+            return contended
+        finally:
+            if intent_fd is not None:
+                os.close(intent_fd)
+
+    def _poll_flock(self, fd: int, operation: int, shared: bool, start: float) -> bool:
+        """Poll a non-blocking flock until acquired or timed out. Returns True if it had to wait."""
+        contended = False
+        interval = _POLL_INTERVAL_MIN
+        while True:
+            try:
+                fcntl.flock(fd, operation | fcntl.LOCK_NB)
+                return contended
+            except BlockingIOError:
+                contended = True
+                waited = time.monotonic() - start
+                if self.timeout >= 0 and waited >= self.timeout:
+                    mode = "read" if shared else "write"
+                    _record_wait(self.lock_path, mode, waited, True, True)
+                    raise LockTimeout(str(self.lock_path), mode, waited)
+                time.sleep(interval)
+                interval = min(interval * 2, _POLL_INTERVAL_MAX)
+
+
 def read_csv_locked(path: str | os.PathLike, *, timeout: float = READ_TIMEOUT_DEFAULT, **kwargs) -> pd.DataFrame:
-    """Read a CSV under a file lock to avoid reading while another process writes.
+    """Read a CSV under a shared lock to avoid reading while another process writes.
 
+    Concurrent readers do not block each other; only writers are excluded.
     Falls back to normal read when the argument is not a filesystem path.
     Additional pandas.read_csv kwargs are supported.
     """
@@ -53,9 +271,9 @@ def read_csv_locked(path: str | os.PathLike, *, timeout: float = READ_TIMEOUT_DE
     if target is None:
         return pd.read_csv(path, **kwargs)
 
-    lock = FileLock(str(_lockfile_for(target)), timeout=timeout)
+    lock = ReadWriteFileLock(_lockfile_for(target), timeout=timeout)
     try:
-        with lock:
+        with lock.read():
             return pd.read_csv(str(target), **kwargs)
     except Timeout as e:
         _logger.error(f"Timeout acquiring read lock for {target}: {e}")
@@ -85,10 +303,10 @@ def to_csv_locked(
     target.parent.mkdir(parents=True, exist_ok=True)
 
     mode = kwargs.get("mode", "w") or "w"
-    lock = FileLock(str(_lockfile_for(target)), timeout=timeout)
+    lock = ReadWriteFileLock(_lockfile_for(target), timeout=timeout)
 
     try:
-        with lock:
+        with lock.write():
             if "a" in mode:
                 # Append is not atomic, but lock ensures exclusive write
                 return pd.DataFrame.to_csv(df, str(target), *args, **kwargs)
@@ -130,10 +348,10 @@ def append_rows_locked(
     """
     target = Path(path)
     target.parent.mkdir(parents=True, exist_ok=True)
-    lock = FileLock(str(_lockfile_for(target)), timeout=timeout)
+    lock = ReadWriteFileLock(_lockfile_for(target), timeout=timeout)
 
     try:
-        with lock:
+        with lock.write():
             file_exists = target.exists()
             with target.open("a", newline=newline, encoding=encoding) as f:
                 writer = csv.writer(f)
@@ -171,8 +389,8 @@ def install_pandas_file_locks() -> None:
         if target is None:
             return _orig_read_csv(filepath_or_buffer, *args, **kwargs)
         timeout = kwargs.pop("lock_timeout", READ_TIMEOUT_DEFAULT)
-        lock = FileLock(str(_lockfile_for(target)), timeout=timeout)
-        with lock:
+        lock = ReadWriteFileLock(_lockfile_for(target), timeout=timeout)
+        with lock.read():
             return _orig_read_csv(str(target), *args, **kwargs)
 
     pd.read_csv = _read_csv_wrapper  # type: ignore[assignment]
@@ -186,9 +404,9 @@ def install_pandas_file_locks() -> None:
             return _orig_to_csv(self, path_or_buf, *args, **kwargs)
         timeout = kwargs.pop("lock_timeout", WRITE_TIMEOUT_DEFAULT)
         mode = kwargs.get("mode", "w") or "w"
-        lock = FileLock(str(_lockfile_for(target)), timeout=timeout)
+        lock = ReadWriteFileLock(_lockfile_for(target), timeout=timeout)
         target.parent.mkdir(parents=True, exist_ok=True)
-        with lock:
+        with lock.write():
             if "a" in mode:
                 return _orig_to_csv(self, str(target), *args, **kwargs)
             # overwrite atomically
@@ -215,6 +433,10 @@ def install_pandas_file_locks() -> None:
 
 
 __all__ = [
+    "ReadWriteFileLock",
+    "LockTimeout",
+    "get_lock_metrics",
+    "reset_lock_metrics",
     "install_pandas_file_locks",
     "read_csv_locked",
     "to_csv_locked",
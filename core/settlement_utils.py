@@ -5,10 +5,10 @@ Provides functions for calculating settlement dates based on configured conventi
 
 import logging
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
-from pandas.tseries.offsets import BDay
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, Iterable
 
 from core.settings_loader import (
     get_settlement_conventions,
@@ -19,6 +19,12 @@ from core.settings_loader import (
 
 logger = logging.getLogger(__name__)
 
+def _market_calendar(currency: Optional[str]):
+    """Shared holiday calendar for a settlement currency (weekends only if unknown)."""
+    # Imported lazily: the SpreadOMatic package pulls in scipy on import
+    from tools.SpreadOMatic.spreadomatic.calendars import get_calendar
+    return get_calendar(currency if isinstance(currency, str) else None)
+
 class SettlementCalculator:
     """Calculate settlement dates based on conventions."""
     
@@ -77,10 +83,45 @@ class SettlementCalculator:
         """Add business days considering market calendar."""
         if days == 0:
             return start_date
+        return pd.Timestamp(_market_calendar(currency).add(start_date.to_pydatetime(), days))
+
+    def calculate_settlement_dates(
+        self,
+        trade_dates: Iterable,
+        currency: Optional[str] = None,
+        security_type: Optional[str] = None,
+        trade_type: str = 'standard'
+    ) -> pd.DatetimeIndex:
+        """
+        Settlement dates for many trades sharing one currency/security type.
         
-        # Use pandas BDay for now (can be enhanced with market calendars)
-        # In production, you'd integrate with proper market calendar libraries
-        return start_date + BDay(days)
+        Equivalent to calling calculate_settlement_date per trade, as one
+        array offset on the market calendar. Missing trade dates give NaT.
+        """
+        trade_index = pd.DatetimeIndex(pd.to_datetime(trade_dates, errors='coerce'))
+        settlement_days = get_settlement_days(currency, security_type, trade_type)
+        if settlement_days == 0 or len(trade_index) == 0:
+            return trade_index
+        
+        valid = ~trade_index.isna()
+        result = np.full(len(trade_index), np.datetime64('NaT'), dtype='datetime64[ns]')
+        days = trade_index[valid].values.astype('datetime64[D]')
+        time_of_day = trade_index[valid].values - days.astype('datetime64[ns]')
+        shifted = _market_calendar(currency).add(days, settlement_days)
+        result[valid] = shifted.astype('datetime64[ns]') + time_of_day
+        return pd.DatetimeIndex(result)
+    
+    def business_days_between(
+        self,
+        trade_dates: Iterable,
+        settlement_dates: Iterable,
+        currency: Optional[str] = None
+    ) -> np.ndarray:
+        """Actual T+n of each trade: business days after the trade date up to settlement."""
+        start = pd.DatetimeIndex(pd.to_datetime(trade_dates)).values.astype('datetime64[D]')
+        end = pd.DatetimeIndex(pd.to_datetime(settlement_dates)).values.astype('datetime64[D]')
+        calendar = _market_calendar(currency)
+        return calendar.count(start, end) + calendar.is_business_day(end).astype(int) - 1
     
     def _apply_special_rules(
         self,
@@ -145,7 +186,7 @@ class SettlementCalculator:
         )
         
         # Calculate actual T+n
-        actual_days = pd.bdate_range(trade_date, settlement_date).size - 1
+        actual_days = int(self.business_days_between([trade_date], [settlement_date], currency)[0])
         expected_days = get_settlement_days(currency, security_type)
         
         return {
@@ -184,6 +225,21 @@ def calculate_settlement_date(
     calculator = get_settlement_calculator()
     return calculator.calculate_settlement_date(trade_date, currency, security_type, trade_type)
 
+def calculate_settlement_dates(
+    trade_dates: Iterable,
+    currency: Optional[str] = None,
+    security_type: Optional[str] = None,
+    trade_type: str = 'standard'
+) -> pd.DatetimeIndex:
+    """
+    Convenience function to calculate settlement dates for many trades.
+    
+    Returns:
+        pd.DatetimeIndex aligned with trade_dates (NaT where missing)
+    """
+    calculator = get_settlement_calculator()
+    return calculator.calculate_settlement_dates(trade_dates, currency, security_type, trade_type)
+
 def validate_settlement(
     trade_date: Union[datetime, pd.Timestamp],
     settlement_date: Union[datetime, pd.Timestamp],
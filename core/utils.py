@@ -372,7 +372,10 @@ def load_exclusions(exclusion_file_path: str) -> Optional[pd.DataFrame]:
     try:
         if os.path.exists(exclusion_file_path):
             logger.info(f"Loading exclusions from {exclusion_file_path}")
-            exclusions_df = pd.read_csv(exclusion_file_path)
+            # Local import: core.data_catalog depends on core.config, which imports this module
+            from core.data_catalog import load_table
+
+            exclusions_df = load_table(exclusion_file_path)
 
             # Convert date columns to datetime
             for date_col in ["AddDate", "EndDate"]:
@@ -417,7 +420,7 @@ def load_weights_and_held_status(
 
         # Identify id column and melt to long format
         id_vars = [id_col_override] if id_col_override in df.columns else [df.columns[0]]
-        df_long = melt_wide_data(df, id_vars=id_vars)
+        df_long = melt_wide_data(df, id_vars=id_vars, cache_key=(weights_filename, "Date"))
         if df_long is None or df_long.empty:
             logger.warning("Weights file could not be melted into long format or is empty after melt: %s", weights_path)
             return pd.Series(dtype=bool)
@@ -599,6 +602,28 @@ def check_holidays(data_folder_path: str, currencies: Optional[List[str]] = None
     return result
 
 
+def _holiday_calendar(
+    data_folder_path: str,
+    countries: Optional[List[str]] = None,
+    currencies: Optional[List[str]] = None,
+):
+    """
+    Business calendar holding the Data/holidays.csv holidays of the given
+    country and currency codes (any row whose 'country' or 'currency' matches),
+    built from the shared spreadomatic.calendars registry.
+    """
+    # Imported here: the SpreadOMatic package pulls in scipy
+    from tools.SpreadOMatic.spreadomatic.calendars import BusinessCalendar, get_calendar
+
+    holidays_file = os.path.join(data_folder_path, 'holidays.csv')
+    codes = list(countries or []) + list(currencies or [])
+    calendars = [get_calendar(code, holidays_file, rules=False) for code in codes]
+    if len(calendars) == 1:
+        return calendars[0]
+    holidays = [day for calendar in calendars for day in calendar.holidays]
+    return BusinessCalendar(holidays, name='+'.join(codes))
+
+
 def _load_holidays_set(
     data_folder_path: str,
     countries: Optional[List[str]] = None,
@@ -610,30 +635,11 @@ def _load_holidays_set(
 
     Expected CSV columns: 'date' (YYYY-MM-DD), optional 'country', optional 'currency'.
     """
-    logger = logging.getLogger(__name__)
-    holidays_file = os.path.join(data_folder_path, 'holidays.csv')
-
-    if not os.path.exists(holidays_file):
-        return set()
-
     try:
-        df = pd.read_csv(holidays_file)
-        if 'date' not in df.columns:
-            logger.warning("holidays.csv missing required 'date' column; ignoring file")
-            return set()
-
-        # Normalize and filter
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
-        df = df.dropna(subset=['date'])
-
-        if countries is not None and 'country' in df.columns:
-            df = df[df['country'].isin(countries)]
-        if currencies is not None and 'currency' in df.columns:
-            df = df[df['currency'].isin(currencies)]
-
-        return set(df['date'].dt.date.tolist())
+        calendar = _holiday_calendar(data_folder_path, countries, currencies)
+        return set(calendar.holidays.astype(object).tolist())
     except Exception as e:
-        logger.warning(f"Failed to load holidays from {holidays_file}: {e}")
+        logging.getLogger(__name__).warning(f"Failed to load holidays from {data_folder_path}: {e}")
         return set()
 
 
@@ -654,9 +660,8 @@ def filter_business_dates(
 
     # Load holidays (default to UK/GBP if not specified)
     if countries is None and currencies is None:
-        holidays = _load_holidays_set(data_folder_path, countries=['UK'], currencies=['GBP'])
-    else:
-        holidays = _load_holidays_set(data_folder_path, countries=countries, currencies=currencies)
+        countries, currencies = ['UK'], ['GBP']
+    calendar = _holiday_calendar(data_folder_path, countries, currencies)
 
     parsed = pd.to_datetime(pd.Series(date_strings), errors='coerce', dayfirst=False)
     # Drop invalid
@@ -664,13 +669,9 @@ def filter_business_dates(
     if parsed.empty:
         return []
 
-    # Filter weekdays and not in holidays
-    def _is_business_day(ts: pd.Timestamp) -> bool:
-        d = ts.date()
-        return ts.weekday() < 5 and d not in holidays
-
-    filtered = [ts.strftime('%Y-%m-%d') for ts in parsed if _is_business_day(ts)]
-    return filtered
+    # Weekdays not in holidays, checked for all dates at once
+    mask = calendar.is_business_day(parsed.values.astype('datetime64[D]'))
+    return parsed[mask].dt.strftime('%Y-%m-%d').tolist()
 
 def get_business_day_offset(date: datetime, offset: int) -> datetime:
     """
@@ -683,20 +684,12 @@ def get_business_day_offset(date: datetime, offset: int) -> datetime:
     Returns:
         datetime object representing the business day
     """
-    current_date = date
-    days_moved = 0
-    
-    while days_moved != abs(offset):
-        if offset > 0:
-            current_date += timedelta(days=1)
-        else:
-            current_date -= timedelta(days=1)
-        
-        # Check if it's a weekday (Monday=0, Sunday=6)
-        if current_date.weekday() < 5:  # Monday to Friday
-            days_moved += 1
-    
-    return current_date
+    if offset == 0:
+        return date
+    day = np.datetime64(date.strftime('%Y-%m-%d'), 'D')
+    # Count from the date itself: roll back before moving forward and vice versa
+    target = np.busday_offset(day, offset, roll='preceding' if offset > 0 else 'following')
+    return date + timedelta(days=int((target - day).astype(int)))
 
 # Example usage (for testing purposes, typically called from app.py or scripts)
 # if __name__ == '__main__':
@@ -7,7 +7,8 @@ import pandas as pd
 import logging
 from typing import List, Optional
 from core import config
-from core.data_utils import read_csv_robustly
+from core.data_utils import read_csv_robustly, parse_dates_with_learned_format
+from core.data_catalog import load_table
 import re
 
 # --- Filename prefix constants (5.1.2) ---
@@ -286,20 +287,29 @@ def process_input_file(
 
             # 1) Parse and normalise the Date column (handle ISO format like 2025-06-02T00:00:00)
             try:
-                # First attempt ISO parsing
-                iso_parsed = pd.to_datetime(df["Date"], errors="coerce")
-                if iso_parsed.isna().all():
-                    # ISO failed for every row – try dayfirst
-                    logger.info("ISO date parse failed for all rows – retrying with dayfirst=True")
-                    dayfirst_parsed = pd.to_datetime(df["Date"], dayfirst=True, errors="coerce")
-                    parsed = dayfirst_parsed
-                    detected_fmt = "dayfirst"
+                # Explicit ISO and day-first formats: one vectorized pass with the
+                # format learned for this file, so inference only runs on leftover rows
+                parsed = parse_dates_with_learned_format(
+                    df["Date"],
+                    [
+                        "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%Y-%m-%d %H:%M:%S",
+                        "%d/%m/%Y", "%d/%m/%Y %H:%M:%S",
+                    ],
+                    cache_key=(os.path.basename(input_path), "Date"),
+                )
+                remaining = parsed.isna() & df["Date"].notna()
+                if not remaining.any():
+                    detected_fmt = "explicit formats"
                 else:
-                    # Use ISO parsed, but still try dayfirst for rows that failed individually
-                    dayfirst_parsed = pd.to_datetime(df.loc[iso_parsed.isna(), "Date"], dayfirst=True, errors="coerce")
-                    parsed = iso_parsed
-                    parsed.loc[iso_parsed.isna()] = dayfirst_parsed
-                    detected_fmt = "mixed (ISO + fallback dayfirst)"
+                    # Anything else is inferred day-first (e.g. 02.06.2025 is 2 June)
+                    logger.info(
+                        f"{int(remaining.sum())} dates matched none of the explicit formats – "
+                        "retrying with dayfirst=True"
+                    )
+                    parsed.loc[remaining] = pd.to_datetime(
+                        df.loc[remaining, "Date"], dayfirst=True, errors="coerce"
+                    )
+                    detected_fmt = "explicit formats + fallback dayfirst"
                 failed_rows = parsed.isna().sum()
                 df["Date"] = parsed
                 if failed_rows:
@@ -321,7 +331,7 @@ def process_input_file(
                 ref_df = None
             else:
                 try:
-                    ref_df = pd.read_csv(reference_path)
+                    ref_df = load_table(reference_path)
                 except Exception as exc:
                     logger.error(
                         "Could not read reference file %s: %s – proceeding without enrichment.",
@@ -0,0 +1,100 @@
+# Purpose: Tests for the closed-form PV derivatives and the analytic Newton/Halley
+# YTM and Z-spread solvers in SpreadOMatic.
+
+import math
+
+import numpy as np
+import pytest
+
+from tools.SpreadOMatic.spreadomatic.discount import (
+    discount_factor,
+    discount_factor_derivatives,
+    pv_cashflows,
+    pv_with_derivatives,
+)
+from tools.SpreadOMatic.spreadomatic.pricing_kernel import pad_cashflows, solve_ytm_batch
+from tools.SpreadOMatic.spreadomatic.yield_spread import (
+    solve_ytm,
+    solve_ytm_analytic,
+    z_spread,
+    z_spread_analytic,
+)
+
+ZERO_TIMES = [0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.0, 10.0, 20.0, 30.0]
+ZERO_RATES = [0.031, 0.032, 0.034, 0.033, 0.036, 0.038, 0.039, 0.041, 0.043, 0.042]
+COMPS = ["annual", "semiannual", "quarterly", "monthly", "continuous", 2]
+
+TIMES = [0.4 + 0.5 * i for i in range(20)]
+CFS = [3.0] * 19 + [103.0]
+
+
+@pytest.mark.parametrize("comp", COMPS)
+def test_discount_factor_derivatives_match_finite_differences(comp):
+    r, t, h = 0.045, 7.3, 1e-5
+    df, d1, d2 = discount_factor_derivatives(r, t, comp)
+    up, dn = discount_factor(r + h, t, comp), discount_factor(r - h, t, comp)
+    assert df == pytest.approx(discount_factor(r, t, comp), rel=1e-14)
+    assert d1 == pytest.approx((up - dn) / (2 * h), rel=1e-8)
+    assert d2 == pytest.approx((up - 2 * df + dn) / h ** 2, rel=1e-4)
+
+
+@pytest.mark.parametrize("comp", COMPS)
+def test_pv_with_derivatives_single_pass(comp):
+    pv, d1, d2 = pv_with_derivatives(TIMES, CFS, 0.05, comp)
+    assert pv == pytest.approx(sum(c * discount_factor(0.05, t, comp) for c, t in zip(CFS, TIMES)), rel=1e-14)
+    expected = [discount_factor_derivatives(0.05, t, comp) for t in TIMES]
+    assert d1 == pytest.approx(sum(c * e[1] for c, e in zip(CFS, expected)), rel=1e-12)
+    assert d2 == pytest.approx(sum(c * e[2] for c, e in zip(CFS, expected)), rel=1e-12)
+    # Per-cash-flow rates (zero curve + spread) use the same pass
+    rates = [0.03 + 0.001 * i for i in range(len(TIMES))]
+    pv_curve, _, _ = pv_with_derivatives(TIMES, CFS, rates, comp)
+    assert pv_curve == pytest.approx(
+        sum(c * discount_factor(r, t, comp) for c, t, r in zip(CFS, TIMES, rates)), rel=1e-14
+    )
+
+
+@pytest.mark.parametrize("comp", ["annual", "semiannual", "continuous"])
+@pytest.mark.parametrize("method", ["halley", "newton"])
+@pytest.mark.parametrize("target", [-0.01, 0.0, 0.04, 0.12, 0.35])
+def test_solve_ytm_analytic_recovers_yield(comp, method, target):
+    price, _, _ = pv_with_derivatives(TIMES, CFS, target, comp)
+    result = solve_ytm_analytic(price, TIMES, CFS, comp=comp, method=method)
+    assert result.converged and result.method == method
+    assert result.value == pytest.approx(target, abs=1e-10)
+    assert result.pv_evaluations == result.iterations
+    assert result.pv_evaluations <= (6 if method == "halley" else 8)
+
+
+@pytest.mark.parametrize("interp", ["linear", "cubic"])
+def test_z_spread_analytic_recovers_spread(interp):
+    target = 0.0125
+    price = pv_cashflows(TIMES, CFS, ZERO_TIMES, ZERO_RATES, spread=target, comp="semiannual", interp=interp)
+    result = z_spread_analytic(price, TIMES, CFS, ZERO_TIMES, ZERO_RATES, comp="semiannual", interp=interp)
+    assert result.converged
+    assert result.value == pytest.approx(target, abs=1e-10)
+    assert result.pv_evaluations <= 5
+
+
+def test_root_outside_bounds_fails_fast_and_wrappers_fall_back():
+    # Spread of 70% lies outside the default (-10%, 50%) bounds
+    price = pv_cashflows(TIMES, CFS, ZERO_TIMES, ZERO_RATES, spread=0.7, comp="annual")
+    result = z_spread_analytic(price, TIMES, CFS, ZERO_TIMES, ZERO_RATES, comp="annual")
+    assert not result.converged and math.isnan(result.value)
+    assert result.pv_evaluations <= 3
+    # z_spread falls back to the bracket-expanding kernel
+    assert z_spread(price, TIMES, CFS, ZERO_TIMES, ZERO_RATES, comp="annual") == pytest.approx(0.7, abs=1e-9)
+
+    unsolvable = solve_ytm_analytic(-5.0, TIMES, CFS)
+    assert not unsolvable.converged and math.isnan(unsolvable.value)
+    with pytest.raises(ValueError):
+        solve_ytm_analytic(100.0, TIMES, CFS, method="secant")
+
+
+def test_solve_ytm_and_batch_iteration_counts():
+    price, _, _ = pv_with_derivatives(TIMES, CFS, 0.061, "semiannual")
+    assert solve_ytm(price, TIMES, CFS, comp="semiannual") == pytest.approx(0.061, abs=1e-10)
+
+    times, cfs = pad_cashflows([TIMES, TIMES], [CFS, CFS])
+    values, iterations = solve_ytm_batch([price, 100.0], times, cfs, comp="semiannual", return_iterations=True)
+    assert values[0] == pytest.approx(0.061, abs=1e-10)
+    assert iterations.dtype == np.int64 and (iterations > 0).all()
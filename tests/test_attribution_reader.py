@@ -0,0 +1,92 @@
+# Purpose: Tests for views.attribution_reader chunked, filtered reads of att_factors files.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from views.attribution_reader import (
+    read_attribution,
+    scan_date_range,
+    select_columns,
+    sum_attribution_columns,
+)
+
+
+@pytest.fixture
+def att_file(tmp_path):
+    rng = np.random.default_rng(1)
+    dates = pd.bdate_range("2025-01-01", periods=12)
+    rows = []
+    for dt in dates:
+        for fund in ("F1", "F2"):
+            for isin in ("XS1", "XS2", "XS3"):
+                rows.append(
+                    {
+                        "Date": dt.strftime("%Y-%m-%d"),
+                        " Fund ": fund,
+                        "ISIN": isin,
+                        "L0 Port Total Daily": rng.normal(),
+                        "L2 Port Rates Carry Daily": rng.normal(),
+                        "Port Exp Wgt": "25.00%",
+                    }
+                )
+    rows.append({"Date": "not a date", " Fund ": "F1", "ISIN": "XS9"})
+    path = tmp_path / "att_factors_F1.csv"
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return str(path)
+
+
+def test_read_attribution_filters_rows_and_projects_columns(att_file):
+    df = read_attribution(
+        att_file,
+        columns=["Date", "Fund", "ISIN", "L2 Port Rates Carry Daily"],
+        numeric_columns=["L2 Port Rates Carry Daily"],
+        start=pd.Timestamp("2025-01-03"),
+        end=pd.Timestamp("2025-01-07"),
+        funds=["F1"],
+        isins=["XS2"],
+        chunksize=5,
+    )
+    assert list(df.columns) == ["Date", "Fund", "ISIN", "L2 Port Rates Carry Daily"]
+    assert df["Date"].dt.strftime("%Y-%m-%d").tolist() == ["2025-01-03", "2025-01-06", "2025-01-07"]
+    assert (df["Fund"] == "F1").all() and (df["ISIN"] == "XS2").all()
+    assert df["L2 Port Rates Carry Daily"].dtype == np.float64
+
+
+def test_sum_matches_full_read(att_file):
+    full = pd.read_csv(att_file)
+    full.columns = full.columns.str.strip()
+    full["Date"] = pd.to_datetime(full["Date"], errors="coerce")
+    full = full.dropna(subset=["Date", "Fund"])
+    value_columns = ["L0 Port Total Daily", "L2 Port Rates Carry Daily"]
+
+    result = sum_attribution_columns(
+        att_file, value_columns, start=pd.Timestamp("2025-01-06"), isins=["XS1", "XS3"],
+        required=("Date", "Fund"), chunksize=4,
+    )
+    expected = full[(full["Date"] >= "2025-01-06") & full["ISIN"].isin(["XS1", "XS3"])]
+    np.testing.assert_allclose(result["sums"][value_columns], expected[value_columns].sum())
+    assert result["rows"] == len(expected)
+    assert result["min_date"] == full["Date"].min()
+    assert result["max_date"] == full["Date"].max()
+    assert result["isins"] == {"XS1", "XS2", "XS3"}
+
+
+def test_nat_bound_matches_nothing_and_scan_date_range(att_file):
+    empty = read_attribution(att_file, columns=["Date", "ISIN"], start=pd.NaT)
+    assert empty.empty and list(empty.columns) == ["Date", "ISIN"]
+    assert scan_date_range(att_file) == (pd.Timestamp("2025-01-01"), pd.Timestamp("2025-01-16"))
+
+
+def test_non_numeric_values_fall_back_to_coercion(tmp_path):
+    path = tmp_path / "att_factors_BAD.csv"
+    pd.DataFrame(
+        {"Date": ["2025-01-01", "2025-01-02"], "ISIN": ["A", "B"], "L2 Port X": ["1.5", "n/a"]}
+    ).to_csv(path, index=False)
+    result = sum_attribution_columns(str(path), ["L2 Port X"])
+    assert result["sums"]["L2 Port X"] == 1.5
+
+
+def test_select_columns_keeps_header_order():
+    header = ["Date", "ISIN", "L2 Port A", "L2 Bench A", "Other"]
+    assert select_columns(header, names=["ISIN", "Missing"], prefixes=("L2 Bench ",)) == ["ISIN", "L2 Bench A"]
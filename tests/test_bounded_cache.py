@@ -0,0 +1,76 @@
+# Purpose: Unit tests for core.bounded_cache LRU eviction, stamp validation and counters.
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics import security_processing as sp
+from core.bounded_cache import BoundedCache, estimate_nbytes, get_cache_stats
+
+
+def _frame(n):
+    return pd.DataFrame({"Value": np.arange(n, dtype=float)})
+
+
+def test_stamp_mismatch_is_a_miss_but_peekable():
+    cache = BoundedCache("test_stamp", 10_000_000, register=False)
+    cache.put("k", "v", stamp=(1, 10))
+    assert cache.get("k", (1, 10)) == "v"
+    assert cache.get("k", (2, 10)) is None
+    assert cache.peek("k") == "v"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["stale"]) == (1, 1, 1)
+
+
+def test_lru_eviction_within_byte_budget():
+    size = estimate_nbytes(_frame(100))
+    cache = BoundedCache("test_lru", int(size * 2.5), register=False)
+    cache.put("a", _frame(100))
+    cache.put("b", _frame(100))
+    assert cache.get("a") is not None  # "b" becomes least recently used
+    cache.put("c", _frame(100))
+    assert set(cache.keys()) == {"a", "c"}
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+    cache.put("huge", _frame(10_000))  # larger than the whole budget: not cached
+    assert "huge" not in cache and len(cache) == 2
+
+
+def test_security_caches_are_registered_and_return_views(tmp_path):
+    assert {"security_data", "security_metrics"} <= set(get_cache_stats())
+
+    sp._dataframe_cache.clear()
+    pd.DataFrame(
+        {"ISIN": ["XS1", "XS2"], "Security Name": ["A", "B"], "2024-01-01": [1.0, 2.0],
+         "2024-01-02": [1.5, 2.5]}
+    ).to_csv(tmp_path / "sec_Spread.csv", index=False)
+    first, _ = sp.load_and_process_security_data("sec_Spread.csv", str(tmp_path))
+    first.reset_index(inplace=True)  # must not touch the cached frame
+    # In-place value writes on a view fail instead of corrupting the cache
+    with pytest.raises(ValueError, match="read-only"):
+        first.loc[0, "Value"] = -1.0
+    writable = first.copy()
+    writable.loc[0, "Value"] = -1.0
+    second, _ = sp.load_and_process_security_data("sec_Spread.csv", str(tmp_path))
+    assert second.index.names == ["Date", "ISIN"]
+    assert (second["Value"] > 0).all()
+    assert np.shares_memory(
+        second["Value"].to_numpy(),
+        sp._dataframe_cache.peek(("sec_Spread.csv", os.path.abspath(str(tmp_path))))["df"][
+            "Value"
+        ].to_numpy(),
+    )
+
+    # A rewritten file is never served from the stale entry
+    pd.DataFrame(
+        {"ISIN": ["XS1", "XS2"], "Security Name": ["A", "B"], "2024-01-01": [9.0, 9.0],
+         "2024-01-02": [9.0, 9.0]}
+    ).to_csv(tmp_path / "sec_Spread.csv", index=False)
+    st = os.stat(tmp_path / "sec_Spread.csv")
+    os.utime(tmp_path / "sec_Spread.csv", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    third, _ = sp.load_and_process_security_data("sec_Spread.csv", str(tmp_path))
+    assert (third["Value"] == 9.0).all()
+    sp._dataframe_cache.clear()
@@ -0,0 +1,113 @@
+# Purpose: Tests for the array-backed holiday calendar registry (rolls, offsets,
+# counts, holidays.csv loading) and the vectorised settlement date calculation.
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.settlement_utils import calculate_settlement_date, calculate_settlement_dates
+from core.utils import filter_business_dates
+from tools.SpreadOMatic.spreadomatic.calendars import (
+    BusinessCalendar,
+    clear_calendars,
+    get_calendar,
+    holiday_file_dates,
+)
+from tools.SpreadOMatic.spreadomatic.daycount_enhanced import (
+    BusinessDayConvention,
+    HolidayCalendar,
+    add_business_days,
+    adjust_business_day,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    clear_calendars()
+    yield
+    clear_calendars()
+
+
+def test_scalar_ops_keep_type_and_time_of_day():
+    cal = BusinessCalendar([datetime(2024, 12, 25)], name="T")
+    friday_noon = datetime(2024, 12, 20, 12, 30)
+    assert cal.add(friday_noon, 1) == datetime(2024, 12, 23, 12, 30)
+    assert cal.add(friday_noon, 3) == datetime(2024, 12, 26, 12, 30)
+    assert cal.add(datetime(2024, 12, 21), 1) == datetime(2024, 12, 23)
+    assert cal.add(datetime(2024, 12, 21), -1) == datetime(2024, 12, 20)
+    assert cal.add(datetime(2024, 12, 21), 0) == datetime(2024, 12, 21)
+    assert cal.roll(datetime(2024, 12, 25), "F") == datetime(2024, 12, 26)
+    assert cal.roll(datetime(2024, 12, 25), "P") == datetime(2024, 12, 24)
+    assert cal.roll(datetime(2024, 11, 30), "MF") == datetime(2024, 11, 29)
+    assert cal.is_holiday(datetime(2024, 12, 25)) and not cal.is_business_day(datetime(2024, 12, 25))
+    assert cal.count(datetime(2024, 12, 23), datetime(2024, 12, 30)) == 4
+
+
+def test_array_ops_match_scalar_ops():
+    cal = get_calendar("GBP")
+    days = np.arange("2024-01-01", "2024-03-01", dtype="datetime64[D]")
+    shifted = cal.add(days, 3)
+    rolled = cal.roll(days, "MF")
+    for day, s, r in zip(days, shifted, rolled):
+        dt = datetime.combine(day.item(), datetime.min.time())
+        assert cal.add(dt, 3).date() == s.item()
+        assert cal.roll(dt, "MF").date() == r.item()
+
+
+@pytest.mark.parametrize("country,currency", [("US", "USD"), ("EUR", "EUR"), ("GB", "GBP"), ("JP", "JPY")])
+def test_registry_matches_rule_calendar(country, currency):
+    rules = HolidayCalendar(country)
+    cal = get_calendar(currency)
+    day = datetime(2023, 1, 1)
+    while day < datetime(2026, 1, 1):
+        assert cal.is_business_day(day) == rules.is_business_day(day)
+        day = datetime.fromordinal(day.toordinal() + 1)
+    assert get_calendar(currency.lower()) is cal
+
+
+def test_enhanced_functions_still_honour_custom_calendars():
+    class Custom(HolidayCalendar):
+        def is_business_day(self, date):
+            return date != datetime(2024, 6, 18) and super().is_business_day(date)
+
+    custom = Custom("US")
+    assert add_business_days(datetime(2024, 6, 17), 1, custom) == datetime(2024, 6, 20)
+    assert adjust_business_day(datetime(2024, 6, 18), BusinessDayConvention.FOLLOWING, custom) == datetime(2024, 6, 20)
+    assert add_business_days(datetime(2024, 6, 17), 1, HolidayCalendar("US")) == datetime(2024, 6, 18)
+
+
+def test_holiday_file_merged_and_reloaded_on_change(tmp_path):
+    path = tmp_path / "holidays.csv"
+    path.write_text("date,currency\n2024-06-18,USD\n2024-06-19,EUR\n", encoding="utf-8")
+    assert list(holiday_file_dates(str(path))["USD"]) == [np.datetime64("2024-06-18")]
+    cal = get_calendar("USD", str(path), rules=False)
+    assert cal.is_holiday(datetime(2024, 6, 18)) and not cal.is_holiday(datetime(2024, 6, 19))
+    assert get_calendar("USD", str(path), rules=False) is cal
+
+    path.write_text("date,currency\n2024-06-20,USD\n", encoding="utf-8")
+    reloaded = get_calendar("USD", str(path), rules=False)
+    assert reloaded is not cal and reloaded.is_holiday(datetime(2024, 6, 20))
+    assert holiday_file_dates(str(tmp_path / "missing.csv")) == {}
+
+
+def test_core_business_dates_use_registry_holidays(tmp_path):
+    (tmp_path / "holidays.csv").write_text(
+        "date,country,currency\n2025-01-01,UK,GBP\n03/01/2025,US,USD\n", encoding="utf-8"
+    )
+    dates = ["2025-01-01", "2025-01-02", "2025-01-03", "2025-01-04"]
+    assert filter_business_dates(dates, str(tmp_path)) == ["2025-01-02", "2025-01-03"]
+    assert filter_business_dates(dates, str(tmp_path), currencies=["USD"]) == ["2025-01-01", "2025-01-02"]
+    assert list(holiday_file_dates(str(tmp_path / "holidays.csv"))["US"]) == [np.datetime64("2025-01-03")]
+
+
+def test_vectorised_settlement_matches_per_trade():
+    trades = pd.date_range("2024-12-16", "2025-01-10", freq="D").append(pd.DatetimeIndex([pd.NaT]))
+    for currency in ("USD", "GBP", "CAD"):
+        settled = calculate_settlement_dates(trades, currency)
+        assert pd.isna(settled[-1])
+        for trade, expected in zip(trades[:-1], settled[:-1]):
+            assert calculate_settlement_date(trade, currency) == expected
+    # Christmas and Boxing Day are skipped in London
+    assert calculate_settlement_date("2024-12-24", "GBP") == pd.Timestamp("2024-12-30")
@@ -0,0 +1,92 @@
+# Purpose: Tests for core.column_roles header-signature memoization and header caching.
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from core import column_roles
+from core.column_roles import (
+    clear_column_role_cache,
+    header_signature,
+    memoize_roles,
+    read_header,
+)
+from core.data_utils import identify_columns
+
+
+@pytest.fixture(autouse=True)
+def _isolated_store(tmp_path, monkeypatch):
+    monkeypatch.setenv("SDC_COLUMN_ROLE_CACHE", str(tmp_path / "roles.json"))
+    clear_column_role_cache()
+    yield
+    clear_column_role_cache()
+
+
+def test_memoize_roles_computes_once_and_persists(tmp_path):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"date": "Date"}
+
+    cols = ["Date", "Code", "Fund A"]
+    assert memoize_roles("kind", cols, {"p": 1}, compute) == {"date": "Date"}
+    assert memoize_roles("kind", cols, {"p": 1}, compute) == {"date": "Date"}
+    assert len(calls) == 1
+
+    # Different header or parameters are separate entries
+    memoize_roles("kind", cols + ["X"], {"p": 1}, compute)
+    memoize_roles("kind", cols, {"p": 2}, compute)
+    assert len(calls) == 3
+
+    with open(tmp_path / "roles.json") as f:
+        persisted = json.load(f)
+    key = next(k for k in persisted if header_signature(cols) in k)
+    assert persisted[key] == {"date": "Date"}
+
+
+def test_identify_columns_uses_memo_and_still_raises_for_missing(monkeypatch):
+    cols = ["Position Date", "Fund Code", "Value"]
+    patterns = {"date": [r"\bDate\b"], "code": [r"\bCode\b"]}
+    assert identify_columns(cols, patterns, ["date"]) == {
+        "date": "Position Date",
+        "code": "Fund Code",
+    }
+    with pytest.raises(ValueError):
+        identify_columns(cols, {"isin": [r"ISIN"]}, ["isin"])
+
+    # Second call must be served from the memo (no regex matching)
+    def _fail(*args, **kwargs):
+        raise AssertionError("patterns re-matched")
+
+    monkeypatch.setattr("core.data_utils._match_column_patterns", _fail)
+    assert identify_columns(cols, patterns, ["date"])["code"] == "Fund Code"
+    # Memoized misses still raise for required categories
+    with pytest.raises(ValueError):
+        identify_columns(cols, {"isin": [r"ISIN"]}, ["isin"])
+
+
+def test_read_header_is_cached_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "ts_Duration.csv"
+    pd.DataFrame({"Date": ["2024-01-01"], " Code ": ["F1"]}).to_csv(path, index=False)
+    assert read_header(str(path)) == ["Date", " Code "]
+
+    real_read_csv = pd.read_csv
+    reads = []
+
+    def _counting_read_csv(*args, **kwargs):
+        reads.append(1)
+        return real_read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(column_roles.pd, "read_csv", _counting_read_csv)
+    assert read_header(str(path)) == ["Date", " Code "]
+    assert reads == []
+
+    pd.DataFrame({"Date": ["2024-01-01"], "Code": ["F1"], "Fund": [1]}).to_csv(path, index=False)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert read_header(str(path)) == ["Date", "Code", "Fund"]
+    assert reads == [1]
+    assert read_header(str(tmp_path / "missing.csv")) is None
@@ -0,0 +1,102 @@
+# Purpose: Unit tests for core.columnar_cache sidecar reads, invalidation and bypass rules.
+
+import os
+
+import pandas as pd
+
+from core import columnar_cache
+from core.columnar_cache import (
+    CACHE_DIR_NAME,
+    clear_columnar_cache,
+    is_cacheable_file,
+    read_csv_cached,
+    sidecar_path_for,
+)
+
+
+def _write_sec_file(path, values):
+    df = pd.DataFrame(
+        {
+            "ISIN": ["XS1", "XS2"],
+            "Security Name": ["A", "B"],
+            "2024-01-01": values,
+        }
+    )
+    df.to_csv(path, index=False)
+
+
+def test_is_cacheable_file_matches_wide_prefixes():
+    assert is_cacheable_file("/data/sec_Spread.csv")
+    assert is_cacheable_file("ts_Duration.csv")
+    assert is_cacheable_file("w_secs.csv")
+    assert not is_cacheable_file("reference.csv")
+    assert not is_cacheable_file("sec_Spread.xlsx")
+
+
+def test_first_read_writes_sidecar_and_second_read_uses_it(tmp_path, monkeypatch):
+    csv_path = tmp_path / "sec_Spread.csv"
+    _write_sec_file(csv_path, [1.5, 2.5])
+
+    first = read_csv_cached(str(csv_path))
+    sidecar = sidecar_path_for(str(csv_path))
+    assert sidecar is not None and sidecar.exists()
+
+    # Second read must not touch the CSV parser
+    def _fail(*args, **kwargs):
+        raise AssertionError("CSV should be served from the sidecar")
+
+    monkeypatch.setattr(columnar_cache.pd, "read_csv", _fail)
+    second = read_csv_cached(str(csv_path))
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_source_change_invalidates_and_prunes_old_sidecar(tmp_path):
+    csv_path = tmp_path / "sec_Spread.csv"
+    _write_sec_file(csv_path, [1.5, 2.5])
+    read_csv_cached(str(csv_path))
+    old_sidecar = sidecar_path_for(str(csv_path))
+
+    _write_sec_file(csv_path, [10.25, 20.75])
+    st = os.stat(csv_path)
+    os.utime(csv_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    df = read_csv_cached(str(csv_path))
+    assert df["2024-01-01"].tolist() == [10.25, 20.75]
+    assert not old_sidecar.exists()
+    assert sidecar_path_for(str(csv_path)).exists()
+
+
+def test_read_options_are_part_of_the_key(tmp_path):
+    csv_path = tmp_path / "sec_Spread.csv"
+    _write_sec_file(csv_path, [1.5, 2.5])
+    full = read_csv_cached(str(csv_path))
+    subset = read_csv_cached(str(csv_path), usecols=["ISIN"])
+    assert list(full.columns) == ["ISIN", "Security Name", "2024-01-01"]
+    assert list(subset.columns) == ["ISIN"]
+
+
+def test_bypass_for_other_files_and_partial_reads(tmp_path, monkeypatch):
+    ref_path = tmp_path / "reference.csv"
+    pd.DataFrame({"ISIN": ["XS1"]}).to_csv(ref_path, index=False)
+    read_csv_cached(str(ref_path))
+    assert not (tmp_path / CACHE_DIR_NAME).exists()
+
+    csv_path = tmp_path / "sec_Spread.csv"
+    _write_sec_file(csv_path, [1.5, 2.5])
+    header = read_csv_cached(str(csv_path), nrows=0)
+    assert header.empty and "ISIN" in header.columns
+    assert not (tmp_path / CACHE_DIR_NAME).exists()
+
+    monkeypatch.setenv("SDC_COLUMNAR_CACHE_DISABLE", "1")
+    read_csv_cached(str(csv_path))
+    assert not (tmp_path / CACHE_DIR_NAME).exists()
+
+
+def test_clear_columnar_cache(tmp_path):
+    csv_path = tmp_path / "ts_Duration.csv"
+    pd.DataFrame({"Date": ["2024-01-01"], "Code": ["F1"], "Value": [1.0]}).to_csv(
+        csv_path, index=False
+    )
+    read_csv_cached(str(csv_path))
+    assert clear_columnar_cache(str(tmp_path)) == 1
+    assert clear_columnar_cache(str(tmp_path)) == 0
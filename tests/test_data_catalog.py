@@ -0,0 +1,89 @@
+# Purpose: Unit tests for core.data_catalog caching, invalidation and LRU eviction.
+
+import os
+
+import pandas as pd
+import pytest
+
+from core import columnar_cache
+from core.data_catalog import DataCatalog, get_table, load_table
+
+
+def _write_reference(path, isins):
+    pd.DataFrame({"ISIN": isins, "Security Name": [f"Name {i}" for i in isins]}).to_csv(
+        path, index=False
+    )
+
+
+def _bump_mtime(path, seconds=1):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def test_second_read_is_served_from_memory(tmp_path, monkeypatch):
+    ref_path = tmp_path / "reference.csv"
+    _write_reference(ref_path, ["XS1", "XS2"])
+    catalog = DataCatalog()
+    first = catalog.read(str(ref_path))
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("reference.csv should come from the catalog")
+
+    monkeypatch.setattr(columnar_cache.pd, "read_csv", _fail)
+    second = catalog.get_table(str(tmp_path), "reference")
+    pd.testing.assert_frame_equal(first, second)
+
+    # Callers get private copies; mutating one must not affect the cache
+    second.loc[0, "ISIN"] = "CHANGED"
+    assert catalog.read(str(ref_path)).loc[0, "ISIN"] == "XS1"
+
+
+def test_file_change_invalidates_entry(tmp_path):
+    ref_path = tmp_path / "reference.csv"
+    _write_reference(ref_path, ["XS1"])
+    catalog = DataCatalog()
+    assert catalog.read(str(ref_path))["ISIN"].tolist() == ["XS1"]
+
+    _write_reference(ref_path, ["XS1", "XS9"])
+    _bump_mtime(ref_path)
+    assert catalog.read(str(ref_path))["ISIN"].tolist() == ["XS1", "XS9"]
+    assert catalog.stats()["entries"] == 1
+
+
+def test_read_options_are_cached_separately(tmp_path):
+    ref_path = tmp_path / "reference.csv"
+    pd.DataFrame({"ISIN": ["XS1"], "Coupon": [5]}).to_csv(ref_path, index=False)
+    catalog = DataCatalog()
+    assert catalog.read(str(ref_path))["Coupon"].dtype.kind == "i"
+    assert catalog.read(str(ref_path), dtype=str)["Coupon"].tolist() == ["5"]
+    assert catalog.stats()["entries"] == 2
+
+
+def test_lru_eviction_respects_byte_budget(tmp_path):
+    paths = []
+    for name in ("users.csv", "exclusions.csv", "curves.csv"):
+        path = tmp_path / name
+        pd.DataFrame({"Name": [f"{name}-{i}" for i in range(50)]}).to_csv(path, index=False)
+        paths.append(str(path))
+
+    probe = DataCatalog()
+    probe.read(paths[0])
+    one_table = probe.stats()["bytes"]
+
+    catalog = DataCatalog(max_bytes=int(one_table * 2.5))
+    catalog.read(paths[0])
+    catalog.read(paths[1])
+    catalog.read(paths[0])  # touch: paths[1] becomes least recently used
+    catalog.read(paths[2])
+    cached_paths = catalog.cached_paths()
+    assert cached_paths == {os.path.abspath(paths[0]), os.path.abspath(paths[2])}
+    assert catalog.stats()["bytes"] <= catalog.max_bytes
+
+
+def test_module_helpers_and_errors(tmp_path):
+    _write_reference(tmp_path / "reference.csv", ["XS1"])
+    assert get_table(str(tmp_path), "reference")["ISIN"].tolist() == ["XS1"]
+    with pytest.raises(FileNotFoundError):
+        load_table(str(tmp_path / "users.csv"))
+    with pytest.raises(KeyError):
+        get_table(str(tmp_path), "not_a_table")
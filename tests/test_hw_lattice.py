@@ -0,0 +1,92 @@
+# Purpose: Tests for the calibrated Hull-White trinomial lattice and its use by
+# OASCalculator's TREE method (curve fit, option bounds, lattice reuse).
+
+import math
+import warnings
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from tools.SpreadOMatic.spreadomatic.curve_construction import YieldCurve
+from tools.SpreadOMatic.spreadomatic.hw_lattice import HullWhiteTrinomialTree
+from tools.SpreadOMatic.spreadomatic.oas_enhanced_v2 import (
+    CallableInstrument,
+    CallOption,
+    create_hull_white_calculator,
+)
+
+SETTLEMENT = datetime(2024, 1, 15)
+
+
+@pytest.fixture
+def curve():
+    dates = [datetime(2024, 7, 15), datetime(2025, 1, 15), datetime(2027, 1, 15),
+             datetime(2029, 1, 15), datetime(2034, 1, 15)]
+    return YieldCurve(dates, [0.050, 0.048, 0.045, 0.044, 0.043], SETTLEMENT)
+
+
+@pytest.fixture
+def calculator(curve):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        calc = create_hull_white_calculator(curve, 0.1, 0.015)
+    calc.method = "TREE"
+    calc.tree_steps = 100
+    return calc
+
+
+def _bond(schedule):
+    return CallableInstrument(
+        maturity_date=datetime(2029, 1, 15), coupon_rate=0.05,
+        call_schedule=schedule, coupon_frequency=2,
+    )
+
+
+def test_tree_reprices_curve_discount_factors(curve):
+    tree = HullWhiteTrinomialTree(curve.discount_factor, 0.1, 0.015, 5.0, 50)
+    for t in (0.1, 1.0, 2.5, 5.0):
+        assert tree.price([t], [1.0]) == pytest.approx(curve.discount_factor(t), rel=1e-10)
+    # A spread shifts every node rate, so it discounts like a flat add-on
+    assert tree.price([5.0], [1.0], spread=0.01) == pytest.approx(
+        curve.discount_factor(5.0) * math.exp(-0.05), rel=1e-10
+    )
+    assert np.allclose(tree.pu + tree.pm + tree.pd, 1.0)
+    assert (tree.pu >= 0).all() and (tree.pm >= 0).all() and (tree.pd >= 0).all()
+
+
+def test_option_free_bond_matches_straight_price(calculator):
+    bond = _bond([])
+    for oas in (-0.01, 0.0, 0.02):
+        assert calculator._tree_price(bond, oas, SETTLEMENT) == pytest.approx(
+            calculator._price_straight_bond(bond, oas, SETTLEMENT), rel=1e-9
+        )
+
+
+def test_calls_lower_and_puts_raise_price(calculator):
+    straight = calculator._tree_price(_bond([]), 0.0, SETTLEMENT)
+    callable_price = calculator._tree_price(
+        _bond([CallOption(datetime(2026, 1, 15), 100.0)]), 0.0, SETTLEMENT
+    )
+    putable_price = calculator._tree_price(
+        _bond([CallOption(datetime(2026, 1, 15), 100.0, call_type="PUT")]), 0.0, SETTLEMENT
+    )
+    unexercisable = calculator._tree_price(
+        _bond([CallOption(datetime(2026, 1, 15), 100.0, is_exercisable=False)]), 0.0, SETTLEMENT
+    )
+    assert callable_price < straight < putable_price
+    assert unexercisable == pytest.approx(straight)
+
+
+def test_oas_search_reuses_one_lattice(calculator):
+    bond = _bond([CallOption(datetime(2027, 1, 15), 102.0), CallOption(datetime(2028, 1, 15), 101.0)])
+    target = calculator._tree_price(bond, 0.0125, SETTLEMENT)
+    result = calculator.calculate_oas(bond, target, SETTLEMENT)
+    assert result["oas_spread"] == pytest.approx(0.0125, abs=1e-8)
+    assert len(calculator._lattices) == 1
+
+
+def test_public_names_all_exist():
+    import tools.SpreadOMatic.spreadomatic.oas_enhanced_v2 as module
+
+    assert [name for name in module.__all__ if not hasattr(module, name)] == []
@@ -1,7 +1,22 @@
 # Purpose: Unit tests for io_lock module ensuring idempotent installation and basic lock I/O works.
 
+import threading
+import time
+
 import pandas as pd
-from core.io_lock import install_pandas_file_locks, to_csv_locked, append_rows_locked
+import pytest
+from filelock import Timeout
+
+from core.io_lock import (
+    LockTimeout,
+    ReadWriteFileLock,
+    append_rows_locked,
+    get_lock_metrics,
+    install_pandas_file_locks,
+    read_csv_locked,
+    reset_lock_metrics,
+    to_csv_locked,
+)
 
 
 def test_install_pandas_file_locks_idempotent():
@@ -30,3 +45,114 @@ def test_locked_append_rows(tmp_path):
     assert out.shape == (2, 2)
     assert list(out.columns) == header
 
+
+def _hold_lock(lock_cm, acquired, release):
+    with lock_cm:
+        acquired.set()
+        release.wait(5)
+
+
+def test_readers_share_but_writers_are_excluded(tmp_path):
+    lock_path = tmp_path / "hot.csv.lock"
+    acquired, release = threading.Event(), threading.Event()
+    holder = threading.Thread(
+        target=_hold_lock,
+        args=(ReadWriteFileLock(lock_path, timeout=5).read(), acquired, release),
+    )
+    holder.start()
+    try:
+        assert acquired.wait(5)
+        # A second reader gets in immediately
+        with ReadWriteFileLock(lock_path, timeout=0.2).read():
+            pass
+        # A writer has to wait and times out
+        with pytest.raises(Timeout):
+            with ReadWriteFileLock(lock_path, timeout=0.2).write():
+                pass
+    finally:
+        release.set()
+        holder.join()
+
+    with ReadWriteFileLock(lock_path, timeout=0.2).write():
+        pass
+
+
+def test_waiting_writer_has_priority_over_new_readers(tmp_path):
+    lock_path = tmp_path / "hot.csv.lock"
+    acquired, release = threading.Event(), threading.Event()
+    reader = threading.Thread(
+        target=_hold_lock,
+        args=(ReadWriteFileLock(lock_path, timeout=5).read(), acquired, release),
+    )
+    reader.start()
+    assert acquired.wait(5)
+
+    written = threading.Event()
+
+    def write():
+        with ReadWriteFileLock(lock_path, timeout=5).write():
+            written.set()
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        time.sleep(0.1)  # writer is now queued behind the active reader
+        with pytest.raises(LockTimeout, match="read lock"):
+            with ReadWriteFileLock(lock_path, timeout=0.2).read():
+                pass
+        assert not written.is_set()
+    finally:
+        release.set()
+        reader.join()
+        writer.join(5)
+    assert written.is_set()
+
+    # Writer timeouts say what they were waiting for
+    acquired, release = threading.Event(), threading.Event()
+    reader = threading.Thread(
+        target=_hold_lock,
+        args=(ReadWriteFileLock(lock_path, timeout=5).read(), acquired, release),
+    )
+    reader.start()
+    try:
+        assert acquired.wait(5)
+        with pytest.raises(LockTimeout, match="write lock") as excinfo:
+            with ReadWriteFileLock(lock_path, timeout=0.1).write():
+                pass
+        assert isinstance(excinfo.value, Timeout) and excinfo.value.waited >= 0.1
+    finally:
+        release.set()
+        reader.join()
+
+
+def test_lock_metrics_record_reads_and_timeouts(tmp_path):
+    reset_lock_metrics()
+    csv_path = tmp_path / "reference.csv"
+    to_csv_locked(pd.DataFrame({"a": [1]}), str(csv_path), index=False)
+    read_csv_locked(str(csv_path))
+
+    lock_key = str(tmp_path / "reference.csv.lock")
+    metrics = get_lock_metrics()[lock_key]
+    assert metrics["write"]["acquired"] >= 1
+    assert metrics["read"]["acquired"] >= 1
+    assert metrics["read"]["timeouts"] == 0
+
+    acquired, release = threading.Event(), threading.Event()
+    holder = threading.Thread(
+        target=_hold_lock,
+        args=(ReadWriteFileLock(lock_key, timeout=5).write(), acquired, release),
+    )
+    holder.start()
+    try:
+        assert acquired.wait(5)
+        with pytest.raises(Timeout):
+            read_csv_locked(str(csv_path), timeout=0.1)
+    finally:
+        release.set()
+        holder.join()
+
+    read_stats = get_lock_metrics()[lock_key]["read"]
+    assert read_stats["timeouts"] == 1
+    assert read_stats["contended"] == 1
+    assert read_stats["max_wait_s"] >= 0.1
+
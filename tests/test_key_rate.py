@@ -0,0 +1,104 @@
+# Purpose: Tests for the single-pass key-rate duration engine (weight matrix + one product)
+# against bump-and-reprice reference values.
+
+from bisect import bisect_left
+
+import numpy as np
+import pytest
+
+from tools.SpreadOMatic.spreadomatic.discount import pv_cashflows
+from tools.SpreadOMatic.spreadomatic.duration import _KRD_TENORS, key_rate_durations
+from tools.SpreadOMatic.spreadomatic.duration_enhanced import key_rate_durations_enhanced
+from tools.SpreadOMatic.spreadomatic.interpolation import PreparedCurve, linear_interpolate
+from tools.SpreadOMatic.spreadomatic.key_rate import (
+    key_rate_durations_batch,
+    key_rate_weights,
+    linear_basis,
+)
+from tools.SpreadOMatic.spreadomatic.pricing_kernel import pad_cashflows
+
+ZERO_TIMES = [0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.0, 10.0, 20.0, 30.0]
+ZERO_RATES = [0.031, 0.032, 0.034, 0.033, 0.036, 0.038, 0.039, 0.041, 0.043, 0.042]
+
+
+def _bond(maturity, first=0.2):
+    times = list(np.arange(first, maturity, 0.5))
+    cfs = [2.0] * len(times)
+    cfs[-1] += 100.0
+    return times, cfs
+
+
+def _reprice_krd(price, times, cfs, t_key, delta, comp):
+    """Reference: insert/bump the key tenor and reprice up and down."""
+    out = []
+    for bump in (delta, -delta):
+        t_list, r_list = list(ZERO_TIMES), list(ZERO_RATES)
+        idx = bisect_left(t_list, t_key)
+        if idx < len(t_list) and abs(t_list[idx] - t_key) < 1e-9:
+            r_list[idx] += bump
+        else:
+            base = linear_interpolate(t_list, r_list, t_key)
+            t_list.insert(idx, t_key)
+            r_list.insert(idx, base + bump)
+        out.append(pv_cashflows(times, cfs, t_list, r_list, comp=comp))
+    return (out[1] - out[0]) / (2 * price * delta)
+
+
+def test_linear_basis_reproduces_interpolation():
+    t = np.array([0.0, 0.25, 0.4, 1.0, 6.3, 30.0, 45.0])
+    expected = [linear_interpolate(ZERO_TIMES, ZERO_RATES, x) for x in t]
+    np.testing.assert_allclose(linear_basis(ZERO_TIMES, t) @ np.array(ZERO_RATES), expected, atol=1e-15)
+
+
+def test_point_weights_are_hat_functions():
+    w = key_rate_weights(ZERO_TIMES, [4.0, 50.0, 1 / 12], np.array([3.0, 4.0, 4.5, 5.0, 40.0, 0.05]))
+    # 4Y is inserted between the 3Y and 5Y knots
+    np.testing.assert_allclose(w[:, 0], [0.0, 1.0, 0.5, 0.0, 0.0, 0.0])
+    # 50Y lies beyond the last knot: linear from 30Y, flat afterwards
+    assert w[4, 1] == pytest.approx(0.5)
+    # 1M lies before the first knot: flat below it
+    assert w[5, 2] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("comp", ["annual", "semiannual", "continuous"])
+@pytest.mark.parametrize("maturity", [0.4, 4.2, 12.0, 44.0])
+def test_key_rate_durations_match_bump_and_reprice(comp, maturity):
+    times, cfs = _bond(maturity)
+    krds = key_rate_durations(97.0, times, cfs, ZERO_TIMES, ZERO_RATES, comp=comp)
+    assert list(krds) == list(_KRD_TENORS)
+    for label, t_key in _KRD_TENORS.items():
+        assert krds[label] == pytest.approx(_reprice_krd(97.0, times, cfs, t_key, 1e-4, comp), abs=1e-10)
+    # Prepared curves give the same numbers
+    assert key_rate_durations(97.0, times, cfs, PreparedCurve(ZERO_TIMES, ZERO_RATES), None, comp=comp) == pytest.approx(krds)
+
+
+def test_enhanced_triangular_matches_reprice():
+    times, cfs = _bond(12.0)
+    krds = key_rate_durations_enhanced(97.0, times, cfs, ZERO_TIMES, ZERO_RATES, interpolation="triangular")
+    key = 7.0
+    up = [r + 1e-4 * max(0.0, 1 - abs(t - key)) for t, r in zip(ZERO_TIMES, ZERO_RATES)]
+    dn = [r - 1e-4 * max(0.0, 1 - abs(t - key)) for t, r in zip(ZERO_TIMES, ZERO_RATES)]
+    expected = (
+        pv_cashflows(times, cfs, ZERO_TIMES, dn, comp="semiannual")
+        - pv_cashflows(times, cfs, ZERO_TIMES, up, comp="semiannual")
+    ) / (2 * 97.0 * 1e-4)
+    assert krds["7Y"] == pytest.approx(expected, abs=1e-10)
+    assert krds["15Y"] == pytest.approx(0.0, abs=1e-12)  # no knot within a year of 15Y
+
+
+def test_batch_matches_single_bonds_and_analytic_limit():
+    bonds = [_bond(3.3), _bond(17.0, 0.1), _bond(29.0)]
+    prices = [99.0, 101.0, 88.0]
+    times, cfs = pad_cashflows([b[0] for b in bonds], [b[1] for b in bonds])
+    tenors = list(_KRD_TENORS.values())
+
+    finite = key_rate_durations_batch(prices, times, cfs, ZERO_TIMES, ZERO_RATES, tenors, comp="semiannual", delta=1e-4)
+    analytic = key_rate_durations_batch(prices, times, cfs, ZERO_TIMES, ZERO_RATES, tenors, comp="semiannual")
+    assert finite.shape == (3, len(tenors))
+    for row, (price, (t, c)) in enumerate(zip(prices, bonds)):
+        single = key_rate_durations(price, t, c, ZERO_TIMES, ZERO_RATES, comp="semiannual")
+        np.testing.assert_allclose(finite[row], list(single.values()), atol=1e-12)
+    np.testing.assert_allclose(analytic, finite, rtol=1e-5, atol=1e-9)
+
+    with pytest.raises(ValueError):
+        key_rate_weights(ZERO_TIMES, tenors, times, shock="gaussian")
@@ -0,0 +1,137 @@
+# Purpose: Tests for analytics.metric_store build/query and its use by load_filter_and_extract.
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import views.security_helpers as sh
+from analytics import metric_store
+from analytics.metric_store import (
+    build_metric_store,
+    build_metric_stores,
+    get_date_slice,
+    get_security_history,
+    open_metric_store,
+)
+from analytics.security_processing import _dataframe_cache, load_and_process_security_data
+
+
+class _DummyLogger:
+    def info(self, *args, **kwargs):
+        pass
+
+    warning = error = debug = info
+
+
+class _DummyApp:
+    logger = _DummyLogger()
+
+
+@pytest.fixture(autouse=True)
+def _isolate(monkeypatch):
+    monkeypatch.setattr(sh, "current_app", _DummyApp())
+    _dataframe_cache.clear()
+    yield
+    _dataframe_cache.clear()
+
+
+@pytest.fixture
+def sec_folder(tmp_path):
+    dates = [d.strftime("%Y-%m-%d") for d in pd.bdate_range("2025-01-01", periods=6)]
+    isins = ["XS300", "XS100", "XS100-1", "XS200", "XS1000"]
+    rng = np.random.default_rng(3)
+    rows = []
+    for i, isin in enumerate(isins):
+        row = {"ISIN": isin, "Security Name": f"Bond {i}", "Funds": "[F1]", "Type": "Corp"}
+        for d in dates:
+            row[d] = round(float(rng.normal(100, 5)), 4)
+        rows.append(row)
+    rows[2][dates[0]] = None  # XS100-1 has fewer points than XS100
+    pd.DataFrame(rows).to_csv(tmp_path / "sec_Spread.csv", index=False)
+    return tmp_path
+
+
+def test_history_and_date_slice_match_full_melt(sec_folder):
+    folder = str(sec_folder)
+    assert build_metric_store(folder, "sec_Spread.csv") is not None
+    full, static_cols = load_and_process_security_data("sec_Spread.csv", folder)
+
+    history = get_security_history(folder, "sec_Spread.csv", "XS200")
+    expected = full[full.index.get_level_values("ISIN") == "XS200"]
+    pd.testing.assert_frame_equal(history, expected, check_like=True)
+    assert open_metric_store(folder, "sec_Spread.csv").static_cols == static_cols
+
+    day = pd.Timestamp("2025-01-03")
+    sliced = get_date_slice(folder, "sec_Spread.csv", day)
+    expected = full.xs(day, level="Date", drop_level=False).sort_index(level="ISIN")
+    pd.testing.assert_frame_equal(sliced, expected, check_like=True)
+    assert get_date_slice(folder, "sec_Spread.csv", "2030-01-01").empty
+
+
+def test_load_filter_and_extract_uses_store_without_melting(sec_folder, monkeypatch):
+    folder = str(sec_folder)
+    expected = {
+        sid: sh.load_filter_and_extract(folder, "sec_Spread.csv", sid)
+        for sid in ("XS100", "XS100-1", "XS1000", "XS300")
+    }
+    build_metric_stores(folder)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("full melt used despite a current metric store")
+
+    monkeypatch.setattr(sh, "load_and_process_security_data", _fail)
+    for sid, (series, dates, static) in expected.items():
+        got_series, got_dates, got_static = sh.load_filter_and_extract(folder, "sec_Spread.csv", sid)
+        pd.testing.assert_series_equal(got_series, series)
+        assert got_dates == dates and got_static == static
+
+
+def test_good_points_applied_at_query_time(sec_folder):
+    folder = str(sec_folder)
+    os.replace(sec_folder / "sec_Spread.csv", sec_folder / "sec_Duration.csv")
+    build_metric_store(folder, "sec_Duration.csv")
+    pd.DataFrame(
+        [{"ISIN": "XS300", "Metric": "Duration", "Date": "2025-01-02"}]
+    ).to_csv(sec_folder / "good_points.csv", index=False)
+
+    history = get_security_history(folder, "sec_Duration.csv", "XS300")
+    assert pd.isna(history.loc[(pd.Timestamp("2025-01-02"), "XS300"), "Value"])
+    assert history["Value"].notna().sum() == 5
+
+
+def test_stale_or_disabled_store_is_ignored(sec_folder, monkeypatch):
+    folder = str(sec_folder)
+    build_metric_store(folder, "sec_Spread.csv")
+    path = os.path.join(folder, "sec_Spread.csv")
+    monkeypatch.setenv("SDC_METRIC_STORE_DISABLE", "1")
+    assert open_metric_store(folder, "sec_Spread.csv") is None
+    monkeypatch.delenv("SDC_METRIC_STORE_DISABLE")
+
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert get_security_history(folder, "sec_Spread.csv", "XS300") is None
+
+    # Rebuilding replaces the previous generation
+    first = build_metric_store(folder, "sec_Spread.csv")
+    second = build_metric_store(folder, "sec_Spread.csv")
+    assert not first.exists() and second.exists()
+    assert metric_store.metric_store_dir(folder, "sec_Spread.csv") == second.parent
+
+
+def test_open_stores_are_kept_per_file(sec_folder):
+    folder = str(sec_folder)
+    pd.read_csv(sec_folder / "sec_Spread.csv").to_csv(sec_folder / "sec_Duration.csv", index=False)
+    build_metric_stores(folder)
+
+    spread = open_metric_store(folder, "sec_Spread.csv")
+    duration = open_metric_store(folder, "sec_Duration.csv")
+    assert spread is not duration
+    assert open_metric_store(folder, "sec_Spread.csv") is spread
+    assert open_metric_store(folder, "sec_Duration.csv") is duration
+
+    # A rebuild replaces only that file's open generation
+    build_metric_store(folder, "sec_Spread.csv")
+    assert open_metric_store(folder, "sec_Spread.csv") is not spread
+    assert open_metric_store(folder, "sec_Duration.csv") is duration
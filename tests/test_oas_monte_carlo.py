@@ -0,0 +1,108 @@
+# Purpose: Tests for the path-vectorised Hull-White Monte Carlo pricer in
+# oas_enhanced_v2 (shock generation, parity with the per-path pricer, grid reuse).
+
+import warnings
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from tools.SpreadOMatic.spreadomatic.curve_construction import YieldCurve
+from tools.SpreadOMatic.spreadomatic.oas_enhanced_v2 import (
+    CallableInstrument,
+    CallOption,
+    create_hull_white_calculator,
+    standard_normals,
+)
+
+SETTLEMENT = datetime(2024, 1, 15)
+
+
+@pytest.fixture
+def calculator():
+    dates = [datetime(2024, 7, 15), datetime(2025, 1, 15), datetime(2027, 1, 15),
+             datetime(2029, 1, 15), datetime(2034, 1, 15)]
+    curve = YieldCurve(dates, [0.050, 0.048, 0.045, 0.044, 0.043], SETTLEMENT)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        calc = create_hull_white_calculator(curve, 0.1, 0.015)
+    calc.num_paths = 64
+    calc.num_time_steps = 30
+    return calc
+
+
+@pytest.fixture
+def bond():
+    return CallableInstrument(
+        maturity_date=datetime(2029, 1, 15),
+        coupon_rate=0.05,
+        call_schedule=[CallOption(datetime(2027, 1, 15), 102.0), CallOption(datetime(2028, 1, 15), 101.0)],
+        coupon_frequency=2,
+    )
+
+
+def test_standard_normals_match_per_step_draws():
+    np.random.seed(7)
+    expected = np.column_stack([np.random.normal(0, 1, 5) for _ in range(4)])
+    np.testing.assert_array_equal(standard_normals(5, 4, 7), expected)
+
+
+def test_antithetic_and_sobol_shocks():
+    shocks = standard_normals(7, 3, 1, antithetic=True)
+    assert shocks.shape == (7, 3)
+    np.testing.assert_array_equal(shocks[4:7], -shocks[0:3])
+
+    sobol = standard_normals(1024, 6, 3, sampler="sobol")
+    assert sobol.shape == (1024, 6)
+    assert np.abs(sobol.mean(axis=0)).max() < 0.01
+    assert np.abs(sobol.std(axis=0) - 1).max() < 0.02
+    with pytest.raises(ValueError):
+        standard_normals(4, 2, sampler="halton")
+
+
+def test_vectorised_pricing_matches_per_path_pricer(calculator, bond):
+    for spread in (0.0, 0.012):
+        price = calculator._monte_carlo_price(bond, spread, SETTLEMENT)
+
+        # Reference: simulate the same paths and price them one at a time
+        maturity = (bond.maturity_date - SETTLEMENT).days / 365.0
+        times = np.linspace(0, maturity, calculator.num_time_steps)
+        paths = calculator.vol_model.simulate_paths(
+            calculator.yield_curve.zero_rate(0.25), times, calculator.num_paths, calculator.random_seed
+        )
+        cf_times, cf_amounts = calculator._generate_cashflows(bond, SETTLEMENT)
+        expected = np.mean([
+            calculator._price_single_path(path, times, cf_times, cf_amounts, bond.call_schedule, spread, SETTLEMENT)
+            for path in paths
+        ])
+        assert price == pytest.approx(expected, rel=1e-13)
+
+
+def test_grid_reused_across_spreads_and_rebuilt_on_settings_change(calculator, bond):
+    calculator._monte_carlo_price(bond, 0.0, SETTLEMENT)
+    grid = calculator._mc_grid
+    calculator._monte_carlo_price(bond, 0.01, SETTLEMENT)
+    assert calculator._mc_grid is grid
+
+    calculator.antithetic = True
+    calculator._monte_carlo_price(bond, 0.01, SETTLEMENT)
+    assert calculator._mc_grid is not grid
+    assert calculator._mc_grid["path_discount"].shape == (64, len(calculator._mc_grid["amounts"]))
+
+
+def test_closed_form_drift_matches_integrated_theta(calculator):
+    model = calculator.vol_model
+    times = np.linspace(1.2, 2.8, 9)  # between curve knots, where θ(t) is smooth
+    alpha = model._drift_terms(times)
+    integrated = [model._calculate_alpha_integral(t, dt) for t, dt in zip(times[:-1], np.diff(times))]
+    np.testing.assert_allclose(alpha, integrated, rtol=1e-3)
+
+
+def test_drift_terms_cached_until_recalibration(calculator):
+    model = calculator.vol_model
+    times = np.linspace(0, 5, 30)
+    first = model._drift_terms(times)
+    assert model._drift_terms(times) is first
+    model.calibrate({"yield_curve": calculator.yield_curve})
+    assert model._drift_terms(times) is not first
+    np.testing.assert_array_equal(model._drift_terms(times), first)
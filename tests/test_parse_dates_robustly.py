@@ -26,3 +26,74 @@ def test_parse_dates_robustly_mixed_formats():
     assert is_datetime64_any_dtype(
         parsed
     ), "Parsed Series should have datetime64 dtype."
+
+
+def test_parse_dates_robustly_excel_serials():
+    parsed = parse_dates_robustly(pd.Series(["45000", 45001.5, "59", "61", "abc"]))
+    assert parsed.iloc[0] == pd.Timestamp("2023-03-15")
+    assert parsed.iloc[1] == pd.Timestamp("2023-03-16 12:00")
+    assert parsed.iloc[2] == pd.Timestamp("1900-02-28")
+    assert parsed.iloc[3] == pd.Timestamp("1900-03-01")
+    assert pd.isna(parsed.iloc[4])
+
+
+def test_learned_format_is_remembered_and_reused(monkeypatch):
+    from core import data_utils
+
+    data_utils.clear_learned_date_formats()
+    key = ("sec_Spread.csv", "Date")
+    values = pd.Series(["31/01/2024", "29/02/2024", "not a date"])
+    parsed = data_utils.parse_dates_with_learned_format(
+        values, data_utils.DEFAULT_DATE_FORMATS, cache_key=key
+    )
+    assert parsed.iloc[1] == pd.Timestamp("2024-02-29")
+    assert pd.isna(parsed.iloc[2])
+    assert data_utils._learned_date_formats[key] == "%d/%m/%Y"
+
+    # Second call must not re-detect
+    def _fail(*args, **kwargs):
+        raise AssertionError("format re-detected")
+
+    monkeypatch.setattr(data_utils, "detect_date_format", _fail)
+    again = data_utils.parse_dates_with_learned_format(
+        pd.Series(["01/03/2024"]), data_utils.DEFAULT_DATE_FORMATS, cache_key=key
+    )
+    assert again.iloc[0] == pd.Timestamp("2024-03-01")
+    data_utils.clear_learned_date_formats()
+
+
+def test_parse_dates_robustly_fallback_only_for_unmatched_rows():
+    values = pd.Series(["2024-06-01"] * 50 + ["June 3, 2024"])
+    parsed = parse_dates_robustly(values, cache_key=("mixed.csv", "Date"))
+    assert parsed.notna().all()
+    assert parsed.iloc[-1] == pd.Timestamp("2024-06-03")
+
+
+def test_parse_dates_robustly_duplicate_index_labels():
+    values = pd.Series(["2024-01-05", "05/01/2024", "45000", "June 3, 2024"], index=[0, 0, 1, 1])
+    parsed = parse_dates_robustly(values)
+    assert list(parsed.index) == [0, 0, 1, 1]
+    assert list(parsed) == [
+        pd.Timestamp("2024-01-05"),
+        pd.Timestamp("2024-01-05"),
+        pd.Timestamp("2023-03-15"),
+        pd.Timestamp("2024-06-03"),
+    ]
+
+
+def test_melt_path_learns_format_per_file():
+    from core import data_utils
+    from core.data_utils import melt_wide_data
+
+    data_utils.clear_learned_date_formats()
+    wide = pd.DataFrame({"ISIN": ["XS1"], "31/01/2024": [1.0], "29/02/2024": [2.0]})
+    melt_wide_data(wide, id_vars=["ISIN"], cache_key=("sec_Spread.csv", "Date"))
+    assert data_utils._learned_date_formats[("sec_Spread.csv", "Date")] == "%d/%m/%Y"
+
+    # A format learned against a different list is not forced on this caller
+    data_utils._learned_date_formats[("x.csv", "Date")] = "%m/%d/%Y"
+    parsed = data_utils.parse_dates_with_learned_format(
+        pd.Series(["01/02/2024"]), data_utils.DEFAULT_DATE_FORMATS, cache_key=("x.csv", "Date")
+    )
+    assert parsed.iloc[0] == pd.Timestamp("2024-02-01")
+    data_utils.clear_learned_date_formats()
@@ -0,0 +1,139 @@
+# Purpose: Tests for PreparedCurve (precomputed zero-curve interpolation) and its use
+# by SpreadOMatic analytics and the synthetic spread calculator.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tools.SpreadOMatic.spreadomatic.discount import pv_cashflows
+from tools.SpreadOMatic.spreadomatic.duration import (
+    effective_convexity,
+    effective_duration,
+    key_rate_durations,
+)
+from tools.SpreadOMatic.spreadomatic.interpolation import (
+    PreparedCurve,
+    forward_rate,
+    linear_interpolate,
+)
+from tools.SpreadOMatic.spreadomatic.yield_spread import g_spread, z_spread
+
+ZERO_TIMES = [0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.0, 10.0, 20.0, 30.0]
+ZERO_RATES = [0.031, 0.032, 0.034, 0.033, 0.036, 0.038, 0.039, 0.041, 0.043, 0.042]
+QUERY = [0.0, 0.25, 0.3, 0.5, 1.0, 1.7, 2.0, 4.2, 9.99, 10.0, 25.0, 30.0, 31.0]
+
+
+@pytest.mark.parametrize("method", ["linear", "cubic"])
+def test_rate_matches_linear_interpolate(method):
+    curve = PreparedCurve(ZERO_TIMES, ZERO_RATES)
+    expected = [linear_interpolate(ZERO_TIMES, ZERO_RATES, x, method=method) for x in QUERY]
+
+    scalar = [curve.rate(x, method) for x in QUERY]
+    assert all(isinstance(v, float) for v in scalar)
+    np.testing.assert_allclose(scalar, expected, rtol=0, atol=1e-15)
+    np.testing.assert_allclose(curve.rate(np.array(QUERY), method), expected, rtol=0, atol=1e-15)
+    # linear_interpolate dispatches to the prepared coefficients
+    assert linear_interpolate(curve, None, 4.2, method=method) == pytest.approx(expected[7], abs=1e-15)
+
+
+def test_invalid_knots_raise():
+    with pytest.raises(ValueError):
+        PreparedCurve([1.0], [0.02])
+    with pytest.raises(ValueError):
+        PreparedCurve([1.0, 2.0], [0.02])
+
+
+def test_shifted_curve_matches_bumped_knots():
+    curve = PreparedCurve(ZERO_TIMES, ZERO_RATES)
+    curve.rate(1.0, "cubic")  # build cubic coefficients before shifting
+    bumped = [r + 0.001 for r in ZERO_RATES]
+    shifted = curve.shifted(0.001)
+    for method in ("linear", "cubic"):
+        expected = [linear_interpolate(ZERO_TIMES, bumped, x, method=method) for x in QUERY]
+        np.testing.assert_allclose(shifted.rate(np.array(QUERY), method), expected, atol=1e-15)
+    # The original curve is untouched
+    assert curve.rate(30.0) == ZERO_RATES[-1]
+
+
+def test_grid_discount_factors_close_to_exact():
+    curve = PreparedCurve(ZERO_TIMES, ZERO_RATES, grid_step=1 / 365, grid_comp="semiannual", grid_method="cubic")
+    t = np.linspace(0.01, 29.9, 500)
+    exact = curve.discount_factors(t, "semiannual", "cubic")
+    np.testing.assert_allclose(curve.grid_discount_factors(t), exact, rtol=1e-6)
+    with pytest.raises(ValueError):
+        PreparedCurve(ZERO_TIMES, ZERO_RATES).grid_discount_factors(t)
+
+
+def test_analytics_accept_prepared_curve():
+    curve = PreparedCurve(ZERO_TIMES, ZERO_RATES)
+    times = [0.5 * i for i in range(1, 15)]
+    cfs = [2.5] * 13 + [102.5]
+    price = 97.0
+
+    assert pv_cashflows(times, cfs, curve, None, comp="semiannual", interp="cubic") == pytest.approx(
+        pv_cashflows(times, cfs, ZERO_TIMES, ZERO_RATES, comp="semiannual", interp="cubic"), rel=1e-14
+    )
+    assert z_spread(price, times, cfs, curve, None, comp="semiannual") == pytest.approx(
+        z_spread(price, times, cfs, ZERO_TIMES, ZERO_RATES, comp="semiannual"), abs=1e-10
+    )
+    assert g_spread(0.05, 7.0, curve, None) == pytest.approx(g_spread(0.05, 7.0, ZERO_TIMES, ZERO_RATES))
+    assert forward_rate(curve, None, 1.0, 2.0) == pytest.approx(forward_rate(ZERO_TIMES, ZERO_RATES, 1.0, 2.0))
+    for func in (effective_duration, effective_convexity):
+        assert func(price, times, cfs, curve, None) == pytest.approx(
+            func(price, times, cfs, ZERO_TIMES, ZERO_RATES), rel=1e-8
+        )
+    assert key_rate_durations(price, times, cfs, curve, None) == pytest.approx(
+        key_rate_durations(price, times, cfs, ZERO_TIMES, ZERO_RATES)
+    )
+
+
+def test_build_prepared_zero_curve_matches_build_zero_curve():
+    from analytics.synth_spread_calculator import build_prepared_zero_curve, build_zero_curve
+
+    curves = pd.DataFrame(
+        {
+            "Currency Code": ["USD"] * 4,
+            "Date": ["2025-01-02"] * 4,
+            "Term": ["1M", "1Y", "5Y", "10Y"],
+            "Daily Value": [5.0, 5.5, 6.0, 6.2],
+        }
+    )
+    times, rates, fallback = build_zero_curve(curves, "USD", "02/01/2025")
+    curve, curve_fallback = build_prepared_zero_curve(curves, "USD", "02/01/2025")
+
+    assert curve_fallback is fallback is False
+    assert curve.knots() == (times, rates)
+    assert curve.rate(3.0, "cubic") == pytest.approx(linear_interpolate(times, rates, 3.0, method="cubic"))
+
+
+def test_zero_curve_book_matches_per_call_building(monkeypatch):
+    import analytics.synth_spread_calculator as ssc
+
+    curves = pd.DataFrame(
+        {
+            "Currency Code": ["USD"] * 3 + ["EUR"] * 2 + ["USD"] * 3,
+            "Date": ["2025-01-02"] * 5 + ["2025-01-03"] * 3,
+            "Term": ["1M", "1Y", "5Y", "1Y", "5Y", "5Y", "1Y", "1M"],
+            "Daily Value": [5.0, 5.5, 6.0, 3.0, 3.2, 6.1, 5.6, 5.1],
+        }
+    )
+    book = ssc.ZeroCurveBook(curves)
+    assert sorted(book.currencies()) == ["EUR", "USD"]
+    assert book.prebuild(book.currencies() + ["GBP"], ["02/01/2025", "03/01/2025", "01/01/2025"]) == 4
+    assert book.fallback_keys == [("EUR", "03/01/2025")]
+
+    for key in [("USD", "02/01/2025"), ("USD", "03/01/2025"), ("EUR", "03/01/2025")]:
+        curve, fallback = book.get(*key)
+        expected, expected_fallback = ssc.build_prepared_zero_curve(curves, *key)
+        assert curve.knots() == expected.knots() and fallback is expected_fallback
+
+    # Later lookups, including failures, never rebuild
+    def _fail(*args, **kwargs):
+        raise AssertionError("curve rebuilt")
+
+    monkeypatch.setattr(ssc, "build_zero_curve", _fail)
+    assert book.get("USD", "02/01/2025")[0].knots()[0] == [1 / 12, 1.0, 5.0]
+    with pytest.raises(ValueError, match="No curve data found for USD on or before"):
+        book.get("USD", "01/01/2025")
+    with pytest.raises(ValueError, match="No curve data found for GBP"):
+        book.get("GBP", "02/01/2025")
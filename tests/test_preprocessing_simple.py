@@ -280,3 +280,25 @@ class TestPreprocessingConstants:
         for const in constants:
             assert isinstance(const, str)
             assert len(const) > 0
+
+
+class TestProcessInputFileLongFormat:
+    """Test date parsing of long-format (ISIN, Date, Value) input files."""
+
+    def test_mixed_iso_and_day_first_dates(self, tmp_path):
+        """Non-ISO rows in a mixed file are read day-first."""
+        from data_processing.preprocessing import process_input_file
+
+        input_file = tmp_path / 'pre_accrued.csv'
+        create_test_csv(str(input_file), {
+            'ISIN': ['US001'] * 4,
+            'Date': ['2025-06-01', '02/06/2025', '03/06/2025 00:00:00', '04.06.2025'],
+            'Value': [1.0, 2.0, 3.0, 4.0],
+        })
+        output_file = tmp_path / 'sec_accrued.csv'
+
+        process_input_file(str(input_file), str(output_file), str(tmp_path / 'Dates.csv'), {})
+
+        result = pd.read_csv(output_file)
+        assert list(result.columns) == ['ISIN', '2025-06-01', '2025-06-02', '2025-06-03', '2025-06-04']
+        assert result.iloc[0, 1:].tolist() == [1.0, 2.0, 3.0, 4.0]
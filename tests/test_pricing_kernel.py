@@ -0,0 +1,82 @@
+# Purpose: Tests for the batched SpreadOMatic pricing kernel (PV, YTM and Z-spread for N bonds).
+
+import numpy as np
+import pytest
+
+from tools.SpreadOMatic.spreadomatic.discount import discount_factor, pv_cashflows
+from tools.SpreadOMatic.spreadomatic.interpolation import interpolate_array, linear_interpolate
+from tools.SpreadOMatic.spreadomatic.pricing_kernel import (
+    pad_cashflows,
+    pv_batch,
+    solve_ytm_batch,
+    z_spread_batch,
+)
+from tools.SpreadOMatic.spreadomatic.yield_spread import solve_ytm, z_spread
+
+ZERO_TIMES = [0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.0, 10.0, 20.0, 30.0]
+ZERO_RATES = [0.031, 0.032, 0.034, 0.033, 0.036, 0.038, 0.039, 0.041, 0.043, 0.042]
+
+
+def _bond(maturity, coupon, freq, first=0.3):
+    times = list(np.arange(first, maturity + 1e-9, 1.0 / freq))
+    cfs = [coupon / freq] * len(times)
+    cfs[-1] += 100.0
+    return times, cfs
+
+
+def _scalar_pv(times, cfs, spread, comp, interp):
+    return sum(
+        cf * discount_factor(linear_interpolate(ZERO_TIMES, ZERO_RATES, t, method=interp) + spread, t, comp)
+        for cf, t in zip(cfs, times)
+    )
+
+
+@pytest.mark.parametrize("method", ["linear", "cubic"])
+def test_interpolate_array_matches_scalar(method):
+    xs = np.array([0.0, 0.25, 0.3, 1.0, 4.2, 10.0, 25.0, 31.0])
+    expected = [linear_interpolate(ZERO_TIMES, ZERO_RATES, x, method=method) for x in xs]
+    np.testing.assert_allclose(interpolate_array(ZERO_TIMES, ZERO_RATES, xs, method=method), expected, rtol=0, atol=1e-15)
+
+
+@pytest.mark.parametrize("comp", ["annual", "semiannual", "quarterly", "continuous", 2])
+@pytest.mark.parametrize("interp", ["linear", "cubic"])
+def test_pv_batch_matches_per_cashflow_loop(comp, interp):
+    bonds = [_bond(5.0, 4.0, 2), _bond(12.5, 6.0, 1), _bond(1.2, 0.0, 4)]
+    times, cfs = pad_cashflows([b[0] for b in bonds], [b[1] for b in bonds])
+    pv = pv_batch(times, cfs, ZERO_TIMES, ZERO_RATES, spread=[0.0, 0.01, -0.002], comp=comp, interp=interp)
+    expected = [
+        _scalar_pv(t, c, s, comp, interp) for (t, c), s in zip(bonds, [0.0, 0.01, -0.002])
+    ]
+    np.testing.assert_allclose(pv, expected, rtol=1e-13)
+    assert pv_cashflows(*bonds[0], ZERO_TIMES, ZERO_RATES, comp=comp, interp=interp) == pytest.approx(
+        _scalar_pv(*bonds[0], 0.0, comp, interp), rel=1e-13
+    )
+
+
+def test_batch_solvers_recover_spreads_and_yields():
+    rng = np.random.default_rng(7)
+    bonds = [_bond(rng.uniform(1.5, 30), rng.uniform(0, 8), int(rng.choice([1, 2, 4])), rng.uniform(0.05, 0.25)) for _ in range(50)]
+    true_spreads = rng.uniform(-0.005, 0.06, len(bonds))
+    prices = [_scalar_pv(t, c, s, "semiannual", "cubic") for (t, c), s in zip(bonds, true_spreads)]
+    times, cfs = pad_cashflows([b[0] for b in bonds], [b[1] for b in bonds])
+
+    spreads = z_spread_batch(prices, times, cfs, ZERO_TIMES, ZERO_RATES, comp="semiannual", interp="cubic")
+    np.testing.assert_allclose(spreads, true_spreads, atol=1e-9)
+
+    yields = solve_ytm_batch(prices, times, cfs, comp="semiannual")
+    repriced = pv_batch(times, cfs, [0.0, 100.0], [0.0, 0.0], spread=yields, comp="semiannual")
+    np.testing.assert_allclose(repriced, prices, atol=1e-8)
+
+
+def test_unsolvable_rows_are_nan_and_scalar_wrappers_agree():
+    times, cfs = _bond(5.0, 5.0, 2)
+    padded_t, padded_c = pad_cashflows([times, times], [cfs, cfs])
+    # No yield gives a negative PV for positive cash flows
+    result = solve_ytm_batch([101.0, -5.0], padded_t, padded_c, comp="semiannual")
+    assert np.isfinite(result[0]) and np.isnan(result[1])
+
+    assert solve_ytm(101.0, times, cfs, comp="semiannual") == pytest.approx(result[0], abs=1e-10)
+    assert z_spread(101.0, times, cfs, ZERO_TIMES, ZERO_RATES, comp="semiannual") == pytest.approx(
+        z_spread_batch([101.0], padded_t[:1], padded_c[:1], ZERO_TIMES, ZERO_RATES, comp="semiannual")[0],
+        abs=1e-10,
+    )
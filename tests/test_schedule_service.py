@@ -0,0 +1,90 @@
+# Purpose: Tests for the memoized schedule service (CashflowSchedule slicing,
+# per-ISIN schedule reuse, cached business-day adjustment).
+
+from datetime import datetime
+
+import pytest
+
+from tools.SpreadOMatic.spreadomatic.cashflows import (
+    cached_fixed_schedule,
+    extract_cashflows,
+    generate_fixed_schedule,
+)
+from tools.SpreadOMatic.spreadomatic.schedule_service import (
+    CashflowSchedule,
+    ScheduleService,
+    adjusted_date,
+    schedule_key,
+    schedule_service,
+)
+
+TERMS = dict(
+    issue_date=datetime(2020, 3, 15),
+    first_coupon_date=datetime(2020, 9, 15),
+    maturity_date=datetime(2030, 3, 15),
+    coupon_rate=0.045,
+    day_basis="30/360",
+    currency="USD",
+    coupon_frequency=2,
+    business_day_convention="MF",
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_service():
+    schedule_service.clear()
+    yield
+    schedule_service.clear()
+
+
+def test_sliced_flows_match_list_extraction():
+    items = generate_fixed_schedule(**TERMS)
+    schedule = CashflowSchedule(items)
+    for valuation in (datetime(2019, 1, 1), datetime(2023, 9, 15), datetime(2027, 6, 1), datetime(2031, 1, 1)):
+        expected = extract_cashflows(items, valuation, [1.0], [0.03], "30/360")
+        assert extract_cashflows(schedule, valuation, [1.0], [0.03], "30/360") == expected
+        assert schedule.flows(valuation, "30/360") == expected
+    last = datetime(2025, 1, 1)
+    assert extract_cashflows(schedule, datetime(2022, 1, 1), [1.0], [0.03], "30/360", last_date=last) == \
+        extract_cashflows(items, datetime(2022, 1, 1), [1.0], [0.03], "30/360", last_date=last)
+
+
+def test_unsorted_schedule_keeps_row_order():
+    items = [{"date": "2026-01-01", "amount": 2.0}, {"date": "2025-01-01", "amount": 1.0}]
+    schedule = CashflowSchedule(items)
+    assert [item["amount"] for _, item in schedule.remaining(datetime(2024, 1, 1))] == [2.0, 1.0]
+
+
+def test_fixed_schedule_built_once_per_isin_and_terms():
+    first = cached_fixed_schedule("XS0001", **TERMS)
+    assert cached_fixed_schedule("XS0001", **TERMS) is first
+    assert schedule_service.hits == 1 and schedule_service.misses == 1
+    assert first.to_list() == generate_fixed_schedule(**TERMS)
+
+    changed = dict(TERMS, coupon_rate=0.05)
+    assert cached_fixed_schedule("XS0001", **changed) is not first
+    assert cached_fixed_schedule("XS0002", **TERMS) is not first
+
+
+def test_service_evicts_least_recently_used():
+    service = ScheduleService(max_entries=2)
+
+    def build():
+        return [{"date": "2030-01-01", "amount": 100.0}]
+
+    a = service.get(schedule_key("A"), build)
+    service.get(schedule_key("B"), build)
+    service.get(schedule_key("A"), build)
+    service.get(schedule_key("C"), build)
+    assert len(service) == 2
+    assert service.get(schedule_key("A"), build) is a
+    assert service.misses == 3
+
+
+def test_adjusted_date_rolls_weekends():
+    saturday = datetime(2024, 6, 15)
+    assert adjusted_date(saturday, "F", "USD") == datetime(2024, 6, 17)
+    assert adjusted_date(saturday, "P", "USD") == datetime(2024, 6, 14)
+    assert adjusted_date(saturday, "NONE", "USD") == saturday
+    # Modified following stays in the month
+    assert adjusted_date(datetime(2024, 8, 31), "MF", "USD") == datetime(2024, 8, 30)
@@ -0,0 +1,102 @@
+# Purpose: Tests for the SecurityDataProvider lookup indexes (ISIN/base-ISIN row
+# positions, accrued date plans), the throttled source-file freshness check and
+# the columnar get_security_data_batch API.
+
+import os
+
+import pandas as pd
+import pytest
+
+import analytics.security_data_provider as sdp
+from analytics.security_data_provider import SecurityDataProvider
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    pd.DataFrame(
+        {
+            "ISIN": ["xs0001–1", "XS0002", "XS0002", "XS0003"],
+            "Security Name": ["A", "B", "B duplicate", "C"],
+            "Currency": ["EUR", "USD", "USD", None],
+            "Callable": ["Y", "N", "N", None],
+            "2025-01-02": [100.0, 95.0, 1.0, None],
+        }
+    ).to_csv(tmp_path / "sec_Price.csv", index=False)
+    pd.DataFrame(
+        {"ISIN": ["XS0001", "XS0002"], "02/01/2025": [0.5, None], "2024-12-31": [0.4, 0.2]}
+    ).to_csv(tmp_path / "sec_accrued.csv", index=False)
+    pd.DataFrame(
+        {"ISIN": ["XS0001", "XS0003"], "Coupon Rate": [4.0, 3.0], "Position Currency": [None, "GBP"]}
+    ).to_csv(tmp_path / "reference.csv", index=False)
+    pd.DataFrame(
+        {"ISIN": ["XS0002"], "Day Basis": ["30/360"], "Coupon Frequency": [1], "Accrued Interest": [0.9]}
+    ).to_csv(tmp_path / "schedule.csv", index=False)
+    return tmp_path
+
+
+def test_indexed_lookups_with_base_isin_fallback(data_folder):
+    provider = SecurityDataProvider(str(data_folder), use_shared_store=False)
+
+    hyphenated = provider.get_security_data("XS0001-1", "2025-01-02")
+    assert (hyphenated.price, hyphenated.callable, hyphenated.security_name) == (100.0, True, "A")
+    assert (hyphenated.coupon_rate, hyphenated.currency, hyphenated.accrued_interest) == (4.0, "EUR", 0.5)
+    assert provider.get_reference_data("XS0001-1")["Coupon Rate"] == 4.0
+
+    # First row wins for duplicated ISINs; a blank accrued cell falls back to the schedule
+    duplicated = provider.get_security_data("XS0002", "2025-01-02")
+    assert (duplicated.security_name, duplicated.price, duplicated.accrued_interest) == ("B", 95.0, 0.9)
+    assert duplicated.day_basis == "30/360"
+    # Dates without a column use the latest earlier one
+    assert provider.get_accrued_interest("XS0002", "2025-01-01") == 0.2
+
+    # No accrued row: schedule accrued, then 0.0
+    assert provider.get_accrued_interest("XS0003", "2025-01-02") == 0.0
+    assert provider.get_security_data("XS0003", "2025-01-02").currency == "GBP"
+    assert provider.get_security_data("XS9999", "2025-01-02").security_name is None
+    assert provider._get_price_row("XS0004") is None
+
+
+def test_batch_matches_per_cell_lookups(data_folder):
+    provider = SecurityDataProvider(str(data_folder), use_shared_store=False)
+    isins = ["XS0001-1", "xs0002", "XS0003", "XS9999"]
+    dates = ["2025-01-02", "2024-12-31", "2025-01-01", "2025-02-01"]
+
+    batch = provider.get_security_data_batch(isins, dates)
+    assert batch.isins == ["XS0001-1", "XS0002", "XS0003", "XS9999"]
+    assert batch.prices.shape == batch.accrued.shape == (4, 4)
+    assert list(batch.prices[:, 0]) == [100.0, 95.0, 0.0, 0.0]
+    for i, isin in enumerate(isins):
+        for j, date in enumerate(dates):
+            assert batch.security_data(i, j) == provider.get_security_data(isin, date)
+
+
+def test_freshness_check_is_throttled(data_folder, monkeypatch):
+    provider = SecurityDataProvider(str(data_folder), use_shared_store=False, freshness_interval=60)
+    checks = []
+    original = provider._check_cache_validity
+    monkeypatch.setattr(provider, "_check_cache_validity", lambda: checks.append(1) or original())
+
+    for _ in range(5):
+        provider.get_security_data("XS0002", "2025-01-02")
+    assert checks == []
+
+    monkeypatch.setattr(sdp.time, "monotonic", lambda: provider._last_freshness_check + 61)
+    provider.get_security_data("XS0002", "2025-01-02")
+    assert checks == [1]
+
+
+def test_reload_bumps_generation(data_folder):
+    provider = SecurityDataProvider(str(data_folder), use_shared_store=False, freshness_interval=0)
+    generation = provider.generation
+    provider.get_security_data("XS0002", "2025-01-02")
+    assert provider.generation == generation
+
+    price_path = data_folder / "sec_Price.csv"
+    prices = pd.read_csv(price_path)
+    prices.loc[1, "2025-01-02"] = 96.0
+    prices.to_csv(price_path, index=False)
+    stat = os.stat(price_path)
+    os.utime(price_path, (stat.st_atime, stat.st_mtime + 5))
+
+    assert provider.get_security_data("XS0002", "2025-01-02").price == 96.0
+    assert provider.generation == generation + 1
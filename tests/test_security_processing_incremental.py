@@ -0,0 +1,129 @@
+# Purpose: Tests for incremental reloads of appended date columns in analytics.security_processing.
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics import security_processing as sp
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    sp._dataframe_cache.clear()
+    sp._metrics_cache.clear()
+    yield
+    sp._dataframe_cache.clear()
+    sp._metrics_cache.clear()
+
+
+def _write_wide(path, n_dates, seed=0):
+    # Generate a fixed-width history and slice it so shorter files are prefixes
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2024-01-01", periods=n_dates)
+    data = {
+        "ISIN": ["XS1", "XS2", "XS3", "XS4"],
+        "Security Name": ["A", "B", "C", "D"],
+        "Currency": ["USD", "EUR", "USD", "GBP"],
+    }
+    values = rng.normal(100, 40, size=(4, 13)).round(2)
+    values[1, 12] = np.nan  # XS2 missing the latest date of the longest file
+    values[2, 3] = np.nan
+    values[3, :] = 5.0  # constant series → zero-variance changes
+    for j, d in enumerate(dates):
+        data[d.strftime("%Y-%m-%d")] = values[:, j]
+    pd.DataFrame(data).to_csv(path, index=False)
+    st = os.stat(path)
+    # Make every rewrite visible to the mtime check
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + n_dates * 1_000_000_000))
+
+
+def _assert_metrics_close(left, right):
+    left = left.sort_index()
+    right = right.sort_index()
+    assert list(left.columns) == list(right.columns)
+    assert list(left.index) == list(right.index)
+    for col in left.columns:
+        a, b = left[col], right[col]
+        if pd.api.types.is_numeric_dtype(b):
+            np.testing.assert_allclose(
+                a.to_numpy(dtype=float), b.to_numpy(dtype=float), rtol=1e-9, equal_nan=True
+            )
+        else:
+            assert a.tolist() == b.tolist()
+
+
+def test_appended_dates_are_loaded_incrementally(tmp_path, monkeypatch):
+    csv_path = tmp_path / "sec_Spread.csv"
+    _write_wide(csv_path, 10)
+    sp.load_and_process_security_data("sec_Spread.csv", str(tmp_path))
+    _write_wide(csv_path, 12)
+
+    melted = []
+    original_melt = sp.melt_wide_data
+
+    def _tracking_melt(df, id_vars, **kwargs):
+        melted.append(df.shape[1] - len(id_vars))
+        return original_melt(df, id_vars, **kwargs)
+
+    monkeypatch.setattr(sp, "melt_wide_data", _tracking_melt)
+    df_inc, static_inc = sp.load_and_process_security_data("sec_Spread.csv", str(tmp_path))
+    assert melted == [2]  # only the two new date columns were melted
+    entry = sp._dataframe_cache.peek(("sec_Spread.csv", os.path.abspath(str(tmp_path))))
+    assert entry["delta"] is not None and entry["delta"][0] == entry["version"] - 1
+
+    sp._dataframe_cache.clear()
+    df_full, static_full = sp.load_and_process_security_data("sec_Spread.csv", str(tmp_path))
+    assert static_inc == static_full
+    pd.testing.assert_frame_equal(df_inc, df_full)
+
+
+def test_restated_history_with_appended_date_reloads_fully(tmp_path):
+    csv_path = tmp_path / "sec_Spread.csv"
+    _write_wide(csv_path, 10)
+    sp.load_and_process_security_data("sec_Spread.csv", str(tmp_path))
+
+    _write_wide(csv_path, 11)
+    wide = pd.read_csv(csv_path)
+    wide.loc[0, "2024-01-01"] = 150.0  # restate XS1's first date
+    wide.to_csv(csv_path, index=False)
+    os.utime(csv_path, ns=(0, os.stat(csv_path).st_mtime_ns + 5_000_000_000))
+
+    df_inc, _ = sp.load_and_process_security_data("sec_Spread.csv", str(tmp_path))
+    entry = sp._dataframe_cache.peek(("sec_Spread.csv", os.path.abspath(str(tmp_path))))
+    assert entry["delta"] is None
+    assert df_inc.loc[(pd.Timestamp("2024-01-01"), "XS1"), "Value"] == 150.0
+
+    sp._dataframe_cache.clear()
+    df_full, _ = sp.load_and_process_security_data("sec_Spread.csv", str(tmp_path))
+    pd.testing.assert_frame_equal(df_inc, df_full)
+
+
+def test_non_append_change_triggers_full_reload(tmp_path):
+    csv_path = tmp_path / "sec_Spread.csv"
+    _write_wide(csv_path, 10)
+    sp.load_and_process_security_data("sec_Spread.csv", str(tmp_path))
+    _write_wide(csv_path, 10, seed=1)  # same header, edited values
+    os.utime(csv_path, ns=(0, os.stat(csv_path).st_mtime_ns + 5_000_000_000))
+
+    df, _ = sp.load_and_process_security_data("sec_Spread.csv", str(tmp_path))
+    entry = sp._dataframe_cache.peek(("sec_Spread.csv", os.path.abspath(str(tmp_path))))
+    assert entry["delta"] is None
+    expected = pd.read_csv(csv_path).set_index("ISIN").loc["XS1", "2024-01-01"]
+    assert df.loc[(pd.Timestamp("2024-01-01"), "XS1"), "Value"] == expected
+
+
+def test_incremental_metrics_match_full_calculation(tmp_path):
+    csv_path = tmp_path / "sec_Spread.csv"
+    _write_wide(csv_path, 10)
+    sp.get_latest_metrics_cached("sec_Spread.csv", str(tmp_path))
+    for n_dates in (11, 13):
+        _write_wide(csv_path, n_dates)
+        metrics, static_cols = sp.get_latest_metrics_cached("sec_Spread.csv", str(tmp_path))
+        key = ("sec_Spread.csv", os.path.abspath(str(tmp_path)))
+        assert sp._metrics_cache.peek(key)["state"] is not None
+
+        df_long, _ = sp.load_and_process_security_data("sec_Spread.csv", str(tmp_path))
+        expected = sp.calculate_security_latest_metrics(df_long, static_cols)
+        _assert_metrics_close(metrics, expected)
@@ -0,0 +1,87 @@
+# Purpose: Tests for analytics.shared_data_store publish/attach and SecurityDataProvider integration.
+
+import os
+import stat
+
+import numpy as np
+import pandas as pd
+
+from analytics.security_data_provider import SecurityDataProvider
+from analytics.shared_data_store import (
+    attach_tables,
+    publish_provider_tables,
+    read_manifest,
+    store_dir_for,
+)
+
+
+def test_publish_then_attach_roundtrip(mini_dataset, tmp_path):
+    store_root = str(tmp_path / "store")
+    publish_provider_tables(mini_dataset, store_root=store_root)
+
+    attached = attach_tables(mini_dataset, store_root=store_root)
+    assert attached is not None
+    tables, _ = attached
+
+    loaded = SecurityDataProvider(mini_dataset, use_shared_store=False).export_tables()
+    for key, df in loaded.items():
+        if df is None:
+            assert key not in tables
+            continue
+        pd.testing.assert_frame_equal(tables[key], df, check_dtype=False)
+
+    # Numeric price columns are read-only memory maps, not private copies
+    price_col = tables["price"]["2025-01-01"].to_numpy()
+    assert not price_col.flags.writeable
+
+
+def test_attach_rejects_stale_store(mini_dataset, tmp_path):
+    store_root = str(tmp_path / "store")
+    publish_provider_tables(mini_dataset, store_root=store_root)
+
+    price_path = os.path.join(mini_dataset, "sec_Price.csv")
+    st = os.stat(price_path)
+    os.utime(price_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert attach_tables(mini_dataset, store_root=store_root) is None
+
+
+def test_republish_replaces_previous_generation(mini_dataset, tmp_path):
+    store_root = str(tmp_path / "store")
+    first = publish_provider_tables(mini_dataset, store_root=store_root)
+    second = publish_provider_tables(mini_dataset, store_root=store_root)
+    assert not first.exists() and second.exists()
+    assert read_manifest(mini_dataset, store_root=store_root)["generation"] == second.name
+    assert store_dir_for(mini_dataset, store_root) == second.parent
+
+
+def test_provider_uses_shared_store(mini_dataset, tmp_path, monkeypatch):
+    store_root = str(tmp_path / "store")
+    monkeypatch.setenv("SDC_SHARED_STORE_DIR", store_root)
+    publish_provider_tables(mini_dataset)
+
+    # Attaching must not parse any CSV
+    def _fail(*args, **kwargs):
+        raise AssertionError("CSV read while attaching to shared store")
+
+    monkeypatch.setattr(pd, "read_csv", _fail)
+    provider = SecurityDataProvider(mini_dataset, use_shared_store=True)
+    data = provider.get_security_data("US0000001", "2025-01-02")
+    assert np.isclose(data.price, 101.2)
+    assert np.isclose(data.accrued_interest, 1.22)
+    assert data.currency == "EUR"
+
+
+def test_store_is_private_and_holds_no_pickles(mini_dataset, tmp_path):
+    store_root = str(tmp_path / "store")
+    gen_dir = publish_provider_tables(mini_dataset, store_root=store_root)
+    store_dir = store_dir_for(mini_dataset, store_root)
+    assert stat.S_IMODE(os.stat(store_dir).st_mode) == 0o700
+    assert not list(gen_dir.rglob("*.pkl"))
+
+    # A store other users can write to is not trusted
+    os.chmod(store_dir, 0o777)
+    assert attach_tables(mini_dataset, store_root=store_root) is None
+    publish_provider_tables(mini_dataset, store_root=store_root)
+    assert stat.S_IMODE(os.stat(store_dir).st_mode) == 0o700
+    assert attach_tables(mini_dataset, store_root=store_root) is not None
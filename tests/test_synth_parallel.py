@@ -0,0 +1,75 @@
+# Purpose: Tests for the multi-process mode of calculate_synthetic_spreads
+# (identical output to the single-process run, worker count resolution).
+
+import glob
+import os
+
+import pandas as pd
+
+from analytics.synth_spread_calculator import _resolve_workers, calculate_synthetic_spreads
+
+
+DATES = ["2025-01-02", "2025-01-03", "2025-01-06"]
+
+
+def _write_dataset(folder, n_securities=6):
+    """Small bond universe (USD/EUR, one callable, one zero price) with curves for every date."""
+    os.makedirs(folder, exist_ok=True)
+    reference, schedule, prices, accrued = [], [], [], []
+    for i in range(n_securities):
+        isin, currency = f"XS{i:08d}", "EUR" if i % 3 == 0 else "USD"
+        reference.append({"ISIN": isin, "Security Name": f"Bond {i}", "Currency": currency,
+                          "Coupon Rate": 2.0 + i * 0.5, "Funds": "[F1]", "Type": "Corp"})
+        schedule.append({"ISIN": isin, "Coupon Frequency": 2, "Day Basis": "30/360",
+                         "Issue Date": "15/03/2020", "First Coupon": "15/09/2020",
+                         "Maturity Date": f"15/03/{2028 + i}",
+                         "Call Schedule": '[{"Date": "15/03/2027", "Price": 100.5}]' if i == 1 else ""})
+        prices.append({"ISIN": isin, "Security Name": f"Bond {i}", "Funds": "[F1]", "Type": "Corp",
+                       "Callable": "Y" if i == 1 else "N", "Currency": currency,
+                       **{d: 0.0 if i == 4 else 95.0 + i + k for k, d in enumerate(DATES)}})
+        accrued.append({"ISIN": isin, **{d: 0.5 for d in DATES}})
+    curves = [
+        {"Currency Code": ccy, "Date": d, "Term": term, "Daily Value": base + bump}
+        for ccy, base in (("USD", 4.0), ("EUR", 2.5))
+        for d in DATES
+        for term, bump in (("1M", 0.0), ("1Y", 0.2), ("5Y", 0.5), ("10Y", 0.7), ("30Y", 0.9))
+    ]
+    for name, rows in (("reference.csv", reference), ("schedule.csv", schedule), ("sec_Price.csv", prices),
+                       ("sec_accrued.csv", accrued), ("curves.csv", curves)):
+        pd.DataFrame(rows).to_csv(os.path.join(folder, name), index=False)
+
+
+def _outputs(folder):
+    return {
+        os.path.basename(path): pd.read_csv(path)
+        for path in sorted(glob.glob(os.path.join(folder, "synth_sec_*.csv")))
+    }
+
+
+def test_parallel_run_matches_single_process(tmp_path, monkeypatch):
+    monkeypatch.setenv("SDC_SHARED_STORE_DIR", str(tmp_path / "store"))
+    serial_folder, parallel_folder = str(tmp_path / "serial"), str(tmp_path / "parallel")
+    _write_dataset(serial_folder)
+    _write_dataset(parallel_folder)
+
+    calculate_synthetic_spreads(serial_folder, workers=1)
+    calculate_synthetic_spreads(parallel_folder, workers=3)
+
+    serial, parallel = _outputs(serial_folder), _outputs(parallel_folder)
+    z_spreads = serial["synth_sec_ZSpread.csv"][DATES]
+    assert z_spreads.notna().sum().sum() == 5 * len(DATES)
+    assert any(name.startswith("synth_sec_KRD_") for name in serial)
+    assert serial.keys() == parallel.keys()
+    for name, frame in serial.items():
+        pd.testing.assert_frame_equal(parallel[name], frame, obj=name)
+    # Workers attached to the published provider tables
+    assert os.listdir(tmp_path / "store")
+
+
+def test_resolve_workers(monkeypatch):
+    monkeypatch.delenv("SDC_SYNTH_WORKERS", raising=False)
+    assert _resolve_workers(None) == 1
+    assert _resolve_workers(3) == 3
+    assert _resolve_workers(0) == (os.cpu_count() or 1)
+    monkeypatch.setenv("SDC_SYNTH_WORKERS", "6")
+    assert _resolve_workers(None) == 6
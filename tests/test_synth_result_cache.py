@@ -0,0 +1,172 @@
+# Purpose: Tests for the content-addressed synthetic analytics cache (reuse of
+# unchanged cells, recalculation of changed inputs, invalidation rules).
+
+import glob
+import os
+
+import pandas as pd
+import pytest
+
+import analytics.synth_spread_calculator as ssc
+from analytics.synth_result_cache import (
+    SynthResultCache,
+    clear_synth_cache,
+    load_synth_cache,
+    synth_cache_path,
+)
+
+
+DATES = ["2025-01-02", "2025-01-03", "2025-01-06"]
+
+
+@pytest.fixture(autouse=True)
+def _cache_enabled(monkeypatch):
+    monkeypatch.delenv("SDC_SYNTH_CACHE_DISABLE", raising=False)
+
+
+@pytest.fixture
+def synth_folder(tmp_path):
+    """Four bonds (two EUR, two USD, one callable) priced on every date, with curves."""
+    reference, schedule, prices, accrued = [], [], [], []
+    for i in range(4):
+        isin, currency = f"XS{i:08d}", "EUR" if i % 3 == 0 else "USD"
+        reference.append({"ISIN": isin, "Security Name": f"Bond {i}", "Currency": currency,
+                          "Coupon Rate": 2.0 + i * 0.5, "Funds": "[F1]", "Type": "Corp"})
+        schedule.append({"ISIN": isin, "Coupon Frequency": 2, "Day Basis": "30/360",
+                         "Issue Date": "15/03/2020", "First Coupon": "15/09/2020",
+                         "Maturity Date": f"15/03/{2028 + i}",
+                         "Call Schedule": '[{"Date": "15/03/2027", "Price": 100.5}]' if i == 1 else ""})
+        prices.append({"ISIN": isin, "Security Name": f"Bond {i}", "Funds": "[F1]", "Type": "Corp",
+                       "Callable": "Y" if i == 1 else "N", "Currency": currency,
+                       **{d: 95.0 + i + k for k, d in enumerate(DATES)}})
+        accrued.append({"ISIN": isin, **{d: 0.5 for d in DATES}})
+    curves = [
+        {"Currency Code": ccy, "Date": d, "Term": term, "Daily Value": base + bump}
+        for ccy, base in (("USD", 4.0), ("EUR", 2.5))
+        for d in DATES
+        for term, bump in (("1M", 0.0), ("1Y", 0.2), ("5Y", 0.5), ("10Y", 0.7), ("30Y", 0.9))
+    ]
+    folder = tmp_path / "synth"
+    folder.mkdir()
+    for name, rows in (("reference.csv", reference), ("schedule.csv", schedule), ("sec_Price.csv", prices),
+                       ("sec_accrued.csv", accrued), ("curves.csv", curves)):
+        pd.DataFrame(rows).to_csv(folder / name, index=False)
+    return str(folder)
+
+
+def _outputs(folder):
+    return {
+        os.path.basename(path): pd.read_csv(path)
+        for path in sorted(glob.glob(os.path.join(folder, "synth_sec_*.csv")))
+    }
+
+
+def _count_calculations(monkeypatch):
+    calls = []
+    original = ssc.calculate_spread_for_security_using_provider
+
+    def counting(security_data, valuation_date, *args, **kwargs):
+        calls.append((security_data.isin, valuation_date))
+        return original(security_data, valuation_date, *args, **kwargs)
+
+    monkeypatch.setattr(ssc, "calculate_spread_for_security_using_provider", counting)
+    return calls
+
+
+def test_rerun_recalculates_only_changed_cells(synth_folder, monkeypatch):
+    folder = synth_folder
+    calls = _count_calculations(monkeypatch)
+
+    ssc.calculate_synthetic_spreads(folder, workers=1)
+    first = _outputs(folder)
+    assert len(calls) == 12 and len(load_synth_cache(folder)) == 12
+
+    calls.clear()
+    ssc.calculate_synthetic_spreads(folder, workers=1)
+    assert calls == []
+    for name, frame in first.items():
+        pd.testing.assert_frame_equal(_outputs(folder)[name], frame, obj=name)
+
+    # One price and one curve date change: only the affected cells are repriced
+    prices = pd.read_csv(os.path.join(folder, "sec_Price.csv"))
+    prices.loc[2, "2025-01-03"] += 1.0
+    prices.to_csv(os.path.join(folder, "sec_Price.csv"), index=False)
+    curves = pd.read_csv(os.path.join(folder, "curves.csv"))
+    curves.loc[(curves["Currency Code"] == "EUR") & (curves["Date"] == "2025-01-06"), "Daily Value"] += 0.1
+    curves.to_csv(os.path.join(folder, "curves.csv"), index=False)
+
+    calls.clear()
+    ssc.calculate_synthetic_spreads(folder, workers=1)
+    assert sorted(calls) == [("XS00000000", "2025-01-06"), ("XS00000002", "2025-01-03"), ("XS00000003", "2025-01-06")]
+    incremental = _outputs(folder)
+
+    ssc.calculate_synthetic_spreads(folder, workers=1, use_cache=False)
+    for name, frame in _outputs(folder).items():
+        pd.testing.assert_frame_equal(incremental[name], frame, obj=name)
+
+
+def test_engine_version_and_format_invalidate(synth_folder, monkeypatch):
+    folder = synth_folder
+    ssc.calculate_synthetic_spreads(folder, workers=1)
+    calls = _count_calculations(monkeypatch)
+
+    monkeypatch.setattr(ssc, "SYNTH_ENGINE_VERSION", ssc.SYNTH_ENGINE_VERSION + 1)
+    ssc.calculate_synthetic_spreads(folder, workers=1)
+    assert len(calls) == 12
+
+    synth_cache_path(folder).write_bytes(b"not a pickle")
+    assert len(load_synth_cache(folder)) == 0
+    assert clear_synth_cache(folder) and not clear_synth_cache(folder)
+
+
+def test_disabled_cache_is_not_written(synth_folder, monkeypatch):
+    folder = synth_folder
+    monkeypatch.setenv("SDC_SYNTH_CACHE_DISABLE", "1")
+    ssc.calculate_synthetic_spreads(folder, workers=1)
+    assert not synth_cache_path(folder).exists()
+
+
+def test_parallel_shards_reuse_cells(synth_folder, tmp_path, monkeypatch, caplog):
+    monkeypatch.setenv("SDC_SHARED_STORE_DIR", str(tmp_path / "store"))
+    folder = synth_folder
+    ssc.calculate_synthetic_spreads(folder, workers=1)
+    serial = _outputs(folder)
+
+    with caplog.at_level("INFO", logger="synth_spread"):
+        ssc.calculate_synthetic_spreads(folder, workers=3)
+    assert "Result cache: 12 reused, 0 recalculated" in caplog.text
+    assert "falling back" not in caplog.text and len(load_synth_cache(folder)) == 12
+    for name, frame in serial.items():
+        pd.testing.assert_frame_equal(_outputs(folder)[name], frame, obj=name)
+
+
+def test_shards_get_and_return_only_their_cells():
+    cache = SynthResultCache({"XS1": {"a": ((1.0,), {}, False)}, "XS2": {"c": ((3.0,), {}, False)}})
+    cells = cache.for_isins(["XS1", "XS3"])
+    assert cells == {"XS1": {"a": ((1.0,), {}, False)}}
+
+    shard = SynthResultCache(cells)
+    assert shard.get("XS1", "a") == ((1.0,), {}, False) and shard.get("XS3", "b") is None
+    shard.put("XS3", "b", ((2.0,), {"1Y": 0.1}, True))
+    delta = shard.delta()
+    assert delta["used"] == {"XS1": {"a": ((1.0,), {}, False)}, "XS3": {"b": ((2.0,), {"1Y": 0.1}, True)}}
+
+    cache.merge(delta)
+    assert set(cache.used) == {"XS1", "XS3"} and (cache.hits, cache.misses) == (1, 1)
+
+
+def test_failed_cells_are_recalculated_and_counted(synth_folder, monkeypatch):
+    folder = synth_folder
+    for name in ("reference.csv", "sec_Price.csv"):
+        frame = pd.read_csv(os.path.join(folder, name))
+        frame.loc[frame["ISIN"] == "XS00000002", "Currency"] = "JPY"  # no JPY curve
+        frame.to_csv(os.path.join(folder, name), index=False)
+
+    counts = []
+    for _ in range(2):
+        for counter in (ssc.curve_lookup_errors, ssc.accrued_lookup_errors, ssc.other_spread_errors):
+            counter.clear()
+        ssc.calculate_synthetic_spreads(folder, workers=1)
+        counts.append((dict(ssc.curve_lookup_errors), dict(ssc.other_spread_errors)))
+    assert counts[0] == counts[1] and counts[0] != ({}, {})
+    assert len(load_synth_cache(folder)) == 9
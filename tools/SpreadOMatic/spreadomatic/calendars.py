@@ -0,0 +1,226 @@
+# calendars.py
+# Purpose: Holiday calendar registry. Each calendar (currency or country code,
+#          optionally merged with a holidays.csv) is loaded once into a sorted
+#          datetime64[D] array and a numpy.busdaycalendar, and exposes vectorised
+#          business-day checks, rolls, offsets and counts for schedule
+#          generation, settlement and accrual.
+
+from __future__ import annotations
+
+import csv
+import os
+from datetime import date, datetime, timedelta
+from threading import Lock
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+__all__ = [
+    "BusinessCalendar",
+    "get_calendar",
+    "holiday_file_dates",
+    "clear_calendars",
+    "RULE_YEARS",
+]
+
+# Years for which rule-based holidays (daycount_enhanced.HolidayCalendar) are
+# materialised; outside this range only weekends are non-business days
+RULE_YEARS = (1950, 2150)
+
+# Rule set used for each currency/country code
+_RULE_COUNTRY = {
+    "USD": "US", "US": "US",
+    "EUR": "EUR", "DE": "EUR", "TARGET": "EUR",
+    "GBP": "GB", "GB": "GB", "UK": "GB",
+    "JPY": "JP", "JP": "JP",
+}
+
+# numpy roll mode per business-day convention code
+_ROLL = {
+    "NONE": None, "UNADJUSTED": None,
+    "F": "following", "FOLLOWING": "following",
+    "MF": "modifiedfollowing", "MODIFIED_FOLLOWING": "modifiedfollowing",
+    "P": "preceding", "PRECEDING": "preceding",
+    "MP": "modifiedpreceding", "MODIFIED_PRECEDING": "modifiedpreceding",
+}
+
+DateInput = Union[datetime, date, str, np.datetime64, Iterable]
+
+
+def _to_days(dates) -> np.ndarray:
+    """datetime64[D] view of a date, sequence of dates or datetime64 array."""
+    return np.asarray(dates, dtype="datetime64[D]")
+
+
+def _like_input(days: np.ndarray, original):
+    """Return *days* in the type of *original*: datetime in, datetime out (time of day kept)."""
+    if isinstance(original, datetime):
+        shift = (days - _to_days(original)).astype(int)
+        return original + timedelta(days=int(shift))
+    if isinstance(original, date):
+        return days.astype(object)
+    return days
+
+
+class BusinessCalendar:
+    """
+    Weekend (Sat/Sun) plus holiday calendar backed by numpy.busdaycalendar.
+
+    Every method accepts a single date (returning the same type, with the
+    time of day preserved for datetimes) or an array-like of dates
+    (returning a datetime64[D] / int / bool array).
+    """
+
+    def __init__(self, holidays: Iterable = (), name: str = ""):
+        days = np.unique(_to_days(list(holidays))) if holidays is not None else np.array([], "datetime64[D]")
+        self.name = name
+        self.holidays: np.ndarray = days
+        self.busdaycal = np.busdaycalendar(weekmask="1111100", holidays=days)
+
+    def __repr__(self) -> str:
+        return f"BusinessCalendar({self.name!r}, {len(self.holidays)} holidays)"
+
+    def is_business_day(self, dates: DateInput):
+        result = np.is_busday(_to_days(dates), busdaycal=self.busdaycal)
+        return bool(result) if np.ndim(result) == 0 else result
+
+    def is_holiday(self, dates: DateInput):
+        days = _to_days(dates)
+        pos = np.searchsorted(self.holidays, days)
+        pos = np.minimum(pos, max(len(self.holidays) - 1, 0))
+        result = (self.holidays[pos] == days) if len(self.holidays) else np.zeros(np.shape(days), bool)
+        return bool(result) if np.ndim(result) == 0 else result
+
+    def roll(self, dates: DateInput, convention: Optional[str] = "F"):
+        """Roll non-business days by convention code (NONE, F, MF, P, MP)."""
+        mode = _ROLL.get((convention or "NONE").strip().upper())
+        if mode is None:
+            return dates
+        days = np.busday_offset(_to_days(dates), 0, roll=mode, busdaycal=self.busdaycal)
+        return _like_input(days, dates)
+
+    def add(self, dates: DateInput, n):
+        """
+        Move *n* business days from each date (negative *n* moves back).
+
+        Counting starts from the date itself whether or not it is a business
+        day, so adding 1 to a Saturday gives the Monday. ``n == 0`` returns the
+        date unchanged.
+        """
+        days = _to_days(dates)
+        n = np.asarray(n)
+        forward = np.busday_offset(days, n, roll="preceding", busdaycal=self.busdaycal)
+        backward = np.busday_offset(days, n, roll="following", busdaycal=self.busdaycal)
+        result = np.where(n > 0, forward, np.where(n < 0, backward, days))
+        return _like_input(result, dates)
+
+    def count(self, start: DateInput, end: DateInput):
+        """Business days in [start, end) (negative when end < start)."""
+        result = np.busday_count(_to_days(start), _to_days(end), busdaycal=self.busdaycal)
+        return int(result) if np.ndim(result) == 0 else result
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+_calendars: Dict[Tuple, BusinessCalendar] = {}
+_file_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, np.ndarray]]] = {}
+_lock = Lock()
+
+
+def _holiday_day(raw: str) -> Optional[np.datetime64]:
+    """Day of a holidays.csv date: ISO (optionally with a time) or DD/MM/YYYY."""
+    if not raw:
+        return None
+    try:
+        return np.datetime64(raw[:10], "D")
+    except ValueError:
+        pass
+    try:
+        return np.datetime64(datetime.strptime(raw, "%d/%m/%Y").date(), "D")
+    except ValueError:
+        return None
+
+
+def holiday_file_dates(path: str) -> Dict[str, np.ndarray]:
+    """
+    Holidays from a CSV with a ``date`` column and optional ``currency`` /
+    ``country`` columns, as {code: sorted datetime64[D] array}.
+
+    Read once per file version (mtime, size); a missing file gives {}.
+    """
+    abs_path = os.path.abspath(path)
+    try:
+        st = os.stat(abs_path)
+    except OSError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _file_cache.get(abs_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    by_code: Dict[str, set] = {}
+    with open(abs_path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            day = _holiday_day((row.get("date") or "").strip())
+            if day is None:
+                continue
+            for column in ("currency", "country"):
+                code = (row.get(column) or "").strip().upper()
+                if code:
+                    by_code.setdefault(code, set()).add(day)
+    dates = {code: np.array(sorted(days), dtype="datetime64[D]") for code, days in by_code.items()}
+    _file_cache[abs_path] = (stamp, dates)
+    return dates
+
+
+def _rule_holidays(country: str) -> list:
+    # Imported here: daycount_enhanced builds on this registry
+    from .daycount_enhanced import HolidayCalendar
+
+    rules = HolidayCalendar(country)
+    days = []
+    for year in range(RULE_YEARS[0], RULE_YEARS[1] + 1):
+        days.extend(rules._get_holidays_for_year(year))
+    return days
+
+
+def get_calendar(code: Optional[str] = "USD", holiday_file: Optional[str] = None,
+                 *, rules: bool = True) -> BusinessCalendar:
+    """
+    Shared calendar for a currency or country *code*.
+
+    Args:
+        code: e.g. "USD", "EUR", "GBP", "US", "GB" (case-insensitive)
+        holiday_file: Optional holidays.csv whose rows for *code* are added
+        rules: Include the rule-based market holidays of daycount_enhanced
+    """
+    code = (code or "USD").strip().upper()
+    extra = np.array([], dtype="datetime64[D]")
+    file_key = None
+    if holiday_file:
+        extra = holiday_file_dates(holiday_file).get(code, extra)
+        # Keyed by content, so an edited file yields a new calendar
+        file_key = (code, extra.tobytes())
+    country = _RULE_COUNTRY.get(code) if rules else None
+    key = (country, file_key)
+    with _lock:
+        calendar = _calendars.get(key)
+    if calendar is not None:
+        return calendar
+
+    holidays = list(extra)
+    if country:
+        holidays.extend(_rule_holidays(country))
+    calendar = BusinessCalendar(holidays, name=code)
+    with _lock:
+        _calendars[key] = calendar
+    return calendar
+
+
+def clear_calendars() -> None:
+    """Drop all loaded calendars and holiday files."""
+    with _lock:
+        _calendars.clear()
+        _file_cache.clear()
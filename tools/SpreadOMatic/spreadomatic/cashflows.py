@@ -4,18 +4,18 @@
 
 from __future__ import annotations
 
-import csv
 from bisect import bisect_left
-from datetime import datetime, timedelta
-from functools import lru_cache
+from datetime import datetime
 from typing import List, Dict, Optional
 
+from .calendars import get_calendar
 from .daycount import year_fraction, to_datetime
 from .interpolation import linear_interpolate, forward_rate
+from .schedule_service import CashflowSchedule, adjusted_date, schedule_key, schedule_service
 
 # Optional enhanced business-day conventions
 try:
-    from .daycount_enhanced import adjust_business_day as _bdc_adjust, BusinessDayConvention as _BDC, HolidayCalendar as _Cal
+    from .daycount_enhanced import adjust_business_day as _bdc_adjust  # noqa: F401
     _BDC_AVAILABLE = True
 except Exception:
     _BDC_AVAILABLE = False
@@ -23,57 +23,26 @@ except Exception:
 __all__ = [
     "extract_cashflows",
     "generate_fixed_schedule",
+    "cached_fixed_schedule",
 ]
 
 
 # ---------------------------------------------------------------------------
-# Holiday calendar utils (lazy-loaded once per run)
+# Holiday calendar utils (holidays.csv loaded once via the calendar registry)
 # ---------------------------------------------------------------------------
 
 
-@lru_cache(maxsize=1)
-def _holiday_map(path: str = "holidays.csv") -> Dict[str, set]:
-    holiday_map: Dict[str, set] = {}
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                cur, iso = row.get("currency"), row.get("date")
-                if cur and iso:
-                    holiday_map.setdefault(cur, set()).add(to_datetime(iso).date())
-    except FileNotFoundError:
-        pass  # optional file
-    return holiday_map
+def _file_calendar(currency: str):
+    """Weekends plus holidays.csv rows for *currency* (loaded once via the calendar registry)."""
+    return get_calendar(currency, "holidays.csv", rules=False)
 
 
 def _adjust_business_day(dt: datetime, currency: str) -> datetime:
-    holidays = _holiday_map().get(currency, set())
-    while dt.weekday() >= 5 or dt.date() in holidays:
-        dt += timedelta(days=1)
-    return dt
+    return _file_calendar(currency).roll(dt, "F")
 
 
 def _adjust_business_day_preceding(dt: datetime, currency: str) -> datetime:
-    holidays = _holiday_map().get(currency, set())
-    while dt.weekday() >= 5 or dt.date() in holidays:
-        dt -= timedelta(days=1)
-    return dt
-
-
-def _get_calendar_for_currency(cur: str):
-    if not _BDC_AVAILABLE:
-        return None
-    cur = (cur or 'USD').upper()
-    country = 'US'
-    if cur in {'USD'}:
-        country = 'US'
-    elif cur in {'EUR'}:
-        country = 'EUR'
-    elif cur in {'GBP'}:
-        country = 'GB'
-    elif cur in {'JPY'}:
-        country = 'JP'
-    return _Cal(country)
+    return _file_calendar(currency).roll(dt, "P")
 
 
 # ---------------------------------------------------------------------------
@@ -96,15 +65,23 @@ def extract_cashflows(
     floating-rate coupon descriptor with keys ``notional``, ``spread``,
     ``reset_date`` and optional ``basis`` and projects the cash-flow via the
     **forward rate** implied by the zero curve.
+
+    *payment_schedule* may be a CashflowSchedule, whose pre-parsed dates are
+    sliced instead of re-parsing every row.
     """
     times: List[float] = []
     cfs: List[float] = []
 
-    for item in payment_schedule:
-        pay_dt = to_datetime(item["date"])
-        if pay_dt <= valuation_date or (last_date and pay_dt > last_date):
-            continue
+    if isinstance(payment_schedule, CashflowSchedule):
+        remaining = payment_schedule.remaining(valuation_date, last_date)
+    else:
+        remaining = (
+            (pay_dt, item)
+            for pay_dt, item in ((to_datetime(item["date"]), item) for item in payment_schedule)
+            if not (pay_dt <= valuation_date or (last_date and pay_dt > last_date))
+        )
 
+    for pay_dt, item in remaining:
         # Determine accrual basis for this item (allow per-item override)
         accr_basis = item.get("basis", day_basis)
 
@@ -161,6 +138,21 @@ def _add_period(dt: datetime, frequency: int) -> datetime:
         return dt.replace(year=new_year, month=new_month, day=last_day)
 
 
+def _payment_date(dt: datetime, bdc_code: str, currency: str) -> datetime:
+    """Business-day adjusted payment date (enhanced engine, cached per calendar)."""
+    if _BDC_AVAILABLE:
+        try:
+            return adjusted_date(dt, bdc_code, currency)
+        except Exception:
+            return _adjust_business_day(dt, currency)
+    # Fallback: simple adjustment
+    if bdc_code in {'P', 'MP'}:
+        return _adjust_business_day_preceding(dt, currency)
+    if bdc_code in {'F', 'MF'}:
+        return _adjust_business_day(dt, currency)
+    return dt
+
+
 def generate_fixed_schedule(
     issue_date: datetime,
     first_coupon_date: datetime,
@@ -178,32 +170,9 @@ def generate_fixed_schedule(
 
     # Resolve business day adjuster
     bdc_code = (business_day_convention or 'NONE').strip().upper()
-    cal = _get_calendar_for_currency(currency)
 
     while nxt < maturity_date:
-        # Apply BDC using enhanced engine if available
-        if _BDC_AVAILABLE and cal is not None:
-            try:
-                bdc_map = {
-                    'NONE': _BDC.NONE,
-                    'UNADJUSTED': _BDC.UNADJUSTED,
-                    'F': _BDC.FOLLOWING,
-                    'MF': _BDC.MODIFIED_FOLLOWING,
-                    'P': _BDC.PRECEDING,
-                    'MP': _BDC.MODIFIED_PRECEDING,
-                }
-                bdc_enum = bdc_map.get(bdc_code, _BDC.NONE)
-                pay_dt = _bdc_adjust(nxt, bdc_enum, cal)
-            except Exception:
-                pay_dt = _adjust_business_day(nxt, currency)
-        else:
-            # Fallback: simple adjustment
-            if bdc_code in {'P', 'MP'}:
-                pay_dt = _adjust_business_day_preceding(nxt, currency)
-            elif bdc_code in {'F', 'MF'}:
-                pay_dt = _adjust_business_day(nxt, currency)
-            else:
-                pay_dt = nxt
+        pay_dt = _payment_date(nxt, bdc_code, currency)
         
         # Check if this is a regular period
         is_regular_period = True
@@ -227,27 +196,7 @@ def generate_fixed_schedule(
 
     # Final payment (might be irregular if maturity doesn't align)
     # Final payment date with BDC
-    if _BDC_AVAILABLE and cal is not None:
-        try:
-            bdc_map = {
-                'NONE': _BDC.NONE,
-                'UNADJUSTED': _BDC.UNADJUSTED,
-                'F': _BDC.FOLLOWING,
-                'MF': _BDC.MODIFIED_FOLLOWING,
-                'P': _BDC.PRECEDING,
-                'MP': _BDC.MODIFIED_PRECEDING,
-            }
-            bdc_enum = bdc_map.get(bdc_code, _BDC.NONE)
-            pay_dt = _bdc_adjust(maturity_date, bdc_enum, cal)
-        except Exception:
-            pay_dt = _adjust_business_day(maturity_date, currency)
-    else:
-        if bdc_code in {'P', 'MP'}:
-            pay_dt = _adjust_business_day_preceding(maturity_date, currency)
-        elif bdc_code in {'F', 'MF'}:
-            pay_dt = _adjust_business_day(maturity_date, currency)
-        else:
-            pay_dt = maturity_date
+    pay_dt = _payment_date(maturity_date, bdc_code, currency)
     
     # Check if final period is regular
     expected_period = 1.0 / coupon_frequency
@@ -261,3 +210,32 @@ def generate_fixed_schedule(
     
     schedule.append({"date": pay_dt.isoformat(), "amount": round(coupon_amount + notional, 6)})
     return schedule 
+
+
+def cached_fixed_schedule(
+    isin: Optional[str],
+    issue_date: datetime,
+    first_coupon_date: datetime,
+    maturity_date: datetime,
+    coupon_rate: float,
+    day_basis: str,
+    currency: str,
+    *,
+    notional: float = 100.0,
+    coupon_frequency: int = 1,
+    business_day_convention: str = 'NONE',
+) -> CashflowSchedule:
+    """``generate_fixed_schedule`` built once per ISIN and terms.
+
+    The returned CashflowSchedule is shared; pass it to ``extract_cashflows``
+    for each valuation date or call ``to_list()`` for a mutable copy.
+    """
+    key = schedule_key(
+        isin, "fixed", issue_date, first_coupon_date, maturity_date, coupon_rate,
+        day_basis, currency, notional, coupon_frequency, business_day_convention,
+    )
+    return schedule_service.get(key, lambda: generate_fixed_schedule(
+        issue_date, first_coupon_date, maturity_date, coupon_rate, day_basis, currency,
+        notional=notional, coupon_frequency=coupon_frequency,
+        business_day_convention=business_day_convention,
+    ))
@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 from typing import Union, Optional, List, Tuple
 from enum import Enum
 
+from .calendars import RULE_YEARS, get_calendar
+
 __all__ = [
     "DayCountConvention", 
     "BusinessDayConvention",
@@ -202,6 +204,10 @@ def add_business_days(start_date: datetime, num_days: int,
     if calendar is None:
         calendar = HolidayCalendar("US")
     
+    fast = _registry_calendar(calendar, start_date, abs(num_days))
+    if fast is not None:
+        return fast.add(start_date, num_days)
+    
     current = start_date
     days_added = 0
     direction = 1 if num_days > 0 else -1
@@ -215,6 +221,17 @@ def add_business_days(start_date: datetime, num_days: int,
     return current
 
 
+def _registry_calendar(calendar: HolidayCalendar, date: datetime, span_days: int = 0):
+    """Array-backed equivalent of a built-in HolidayCalendar (None for custom calendars
+    or dates beyond the pre-computed years)."""
+    if type(calendar) is not HolidayCalendar:
+        return None
+    span_years = span_days // 200 + 1
+    if not (RULE_YEARS[0] + span_years <= date.year <= RULE_YEARS[1] - span_years):
+        return None
+    return get_calendar(calendar.country_code)
+
+
 def adjust_business_day(date: datetime, convention: BusinessDayConvention,
                        calendar: Optional[HolidayCalendar] = None) -> datetime:
     """Adjust date according to business day convention"""
@@ -224,6 +241,10 @@ def adjust_business_day(date: datetime, convention: BusinessDayConvention,
     if convention == BusinessDayConvention.NONE or convention == BusinessDayConvention.UNADJUSTED:
         return date
     
+    fast = _registry_calendar(calendar, date)
+    if fast is not None:
+        return fast.roll(date, convention.value)
+    
     if calendar.is_business_day(date):
         return date
     
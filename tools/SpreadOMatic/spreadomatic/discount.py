@@ -5,13 +5,18 @@
 from __future__ import annotations
 
 import math
-from typing import List, Literal, Union
+from typing import List, Literal, Sequence, Tuple, Union
 
-from .interpolation import linear_interpolate
+import numpy as np
+
+from .interpolation import PreparedCurve, linear_interpolate
+from .pricing_kernel import pv_batch
 
 __all__ = [
     "discount_factor",
+    "discount_factor_derivatives",
     "pv_cashflows",
+    "pv_with_derivatives",
     "Compounding",
 ]
 
@@ -51,6 +56,67 @@ def discount_factor(rate: float, t: float, comp: Union[Compounding, int] = "annu
         raise ValueError(f"Unsupported compounding convention: {comp}")
 
 
+_PERIODS_PER_YEAR = {"annual": 1, "semiannual": 2, "quarterly": 4, "monthly": 12}
+
+
+def discount_factor_derivatives(
+    rate: float, t: float, comp: Union[Compounding, int] = "annual"
+) -> Tuple[float, float, float]:
+    """Return (DF, dDF/dr, d2DF/dr2) in closed form for *comp* compounding.
+
+    With ``b = 1 + r/m`` and ``DF = b**(-m*t)``: ``dDF/dr = -t*DF/b`` and
+    ``d2DF/dr2 = t*(t + 1/m)*DF/b**2``; continuous: ``-t*DF`` and ``t**2*DF``.
+    """
+    comp = _normalise_compounding(comp)
+    if comp == "continuous":
+        df = math.exp(-rate * t)
+        return df, -t * df, t * t * df
+    try:
+        m = _PERIODS_PER_YEAR[comp]
+    except KeyError:
+        raise ValueError(f"Unsupported compounding convention: {comp}") from None
+    base = 1.0 + rate / m
+    df = base ** (-m * t)
+    return df, -t * df / base, t * (t + 1.0 / m) * df / (base * base)
+
+
+def pv_with_derivatives(
+    times: Sequence[float],
+    cfs: Sequence[float],
+    rates: Union[float, Sequence[float]],
+    comp: Union[Compounding, int] = "annual",
+) -> Tuple[float, float, float]:
+    """PV of *cfs* and its first two derivatives under a parallel rate shift.
+
+    *rates* is one flat rate (YTM) or one discount rate per cash flow (zero
+    rate plus spread). PV, dPV/dr and d2PV/dr2 come from a single pass over
+    the cash flows, so a Newton or Halley step costs one PV evaluation.
+    """
+    comp = _normalise_compounding(comp)
+    if isinstance(rates, (int, float)):
+        rates = [float(rates)] * len(times)
+    pv = d1 = d2 = 0.0
+    if comp == "continuous":
+        for cf, t, r in zip(cfs, times, rates):
+            df = cf * math.exp(-r * t)
+            pv += df
+            d1 -= t * df
+            d2 += t * t * df
+        return pv, d1, d2
+    try:
+        m = _PERIODS_PER_YEAR[comp]
+    except KeyError:
+        raise ValueError(f"Unsupported compounding convention: {comp}") from None
+    inv_m = 1.0 / m
+    for cf, t, r in zip(cfs, times, rates):
+        base = 1.0 + r * inv_m
+        df = cf * base ** (-m * t)
+        pv += df
+        d1 -= t * df / base
+        d2 += t * (t + inv_m) * df / (base * base)
+    return pv, d1, d2
+
+
 def pv_cashflows(
     times: List[float],
     cfs: List[float],
@@ -66,9 +132,21 @@ def pv_cashflows(
     Notes
     - ``interp`` selects interpolation method for the zero curve ("linear" or "cubic").
     - ``spread`` is an additive yield adjustment in the same compounding basis as ``comp``.
+    - ``zero_times`` may be a ``PreparedCurve`` (``zero_rates`` is then ignored).
     """
-    total = 0.0
-    for cf, t in zip(cfs, times):
-        r = linear_interpolate(zero_times, zero_rates, t, method=interp) + spread
-        total += cf * discount_factor(r, t, comp)
-    return total 
+    if len(times) == 0:
+        return 0.0
+    ragged_curve = not isinstance(zero_times, PreparedCurve) and len(zero_times) != len(zero_rates)
+    if len(times) != len(cfs) or ragged_curve:
+        # Ragged inputs: keep the original per-cash-flow loop (zip truncation semantics)
+        total = 0.0
+        for cf, t in zip(cfs, times):
+            r = linear_interpolate(zero_times, zero_rates, t, method=interp) + spread
+            total += cf * discount_factor(r, t, comp)
+        return total
+    # Single-row call into the batched kernel (one vectorised pass over the cash flows)
+    row_times = np.asarray(times, dtype=float)[None, :]
+    row_cfs = np.asarray(cfs, dtype=float)[None, :]
+    return float(
+        pv_batch(row_times, row_cfs, zero_times, zero_rates, spread=spread, comp=comp, interp=interp)[0]
+    )
@@ -6,7 +6,8 @@ from __future__ import annotations
 from typing import List, Dict
 
 from .discount import pv_cashflows, discount_factor, Compounding
-from .interpolation import linear_interpolate
+from .interpolation import PreparedCurve, linear_interpolate
+from .key_rate import key_rate_durations_dict
 
 __all__ = [
     "effective_duration",
@@ -38,6 +39,16 @@ _KRD_TENORS = {
 }
 
 
+def _parallel_bumps(zero_times, zero_rates, delta: float):
+    """(times, rates) arguments for the curve shifted up and down by *delta*."""
+    if isinstance(zero_times, PreparedCurve):
+        return (zero_times.shifted(delta), None), (zero_times.shifted(-delta), None)
+    return (
+        (zero_times, [r + delta for r in zero_rates]),
+        (zero_times, [r - delta for r in zero_rates]),
+    )
+
+
 def effective_duration(
     price: float,
     times: List[float],
@@ -48,10 +59,9 @@ def effective_duration(
     delta: float = 1e-4,
     comp: Compounding = "annual",
 ) -> float:
-    zero_up = [r + delta for r in zero_rates]
-    zero_down = [r - delta for r in zero_rates]
-    p_up = pv_cashflows(times, cfs, zero_times, zero_up, comp=comp)
-    p_down = pv_cashflows(times, cfs, zero_times, zero_down, comp=comp)
+    zero_up, zero_down = _parallel_bumps(zero_times, zero_rates, delta)
+    p_up = pv_cashflows(times, cfs, *zero_up, comp=comp)
+    p_down = pv_cashflows(times, cfs, *zero_down, comp=comp)
     return (p_down - p_up) / (2 * price * delta)
 
 
@@ -82,10 +92,9 @@ def effective_convexity(
     delta: float = 0.001,
     comp: Compounding = "annual",
 ) -> float:
-    zero_up = [r + delta for r in zero_rates]
-    zero_down = [r - delta for r in zero_rates]
-    p_up = pv_cashflows(times, cfs, zero_times, zero_up, comp=comp)
-    p_down = pv_cashflows(times, cfs, zero_times, zero_down, comp=comp)
+    zero_up, zero_down = _parallel_bumps(zero_times, zero_rates, delta)
+    p_up = pv_cashflows(times, cfs, *zero_up, comp=comp)
+    p_down = pv_cashflows(times, cfs, *zero_down, comp=comp)
     return (p_down + p_up - 2 * price) / (price * delta ** 2)
 
 
@@ -146,30 +155,15 @@ def key_rate_durations(
     delta: float = 1e-4,
     comp: Compounding = "annual",
 ) -> Dict[str, float]:
-    import copy
-    from bisect import bisect_left
-
-    out: Dict[str, float] = {}
-    for label, t_key in _KRD_TENORS.items():
-        t_up, r_up = copy.deepcopy(zero_times), copy.deepcopy(zero_rates)
-        t_dn, r_dn = copy.deepcopy(zero_times), copy.deepcopy(zero_rates)
-
-        def _insert_or_shift(t_list, r_list, bump):
-            idx = bisect_left(t_list, t_key)
-            if idx < len(t_list) and abs(t_list[idx] - t_key) < 1e-9:
-                r_list[idx] += bump
-            else:
-                base = linear_interpolate(t_list, r_list, t_key)
-                t_list.insert(idx, t_key)
-                r_list.insert(idx, base + bump)
-
-        _insert_or_shift(t_up, r_up, delta)
-        _insert_or_shift(t_dn, r_dn, -delta)
-
-        p_up = pv_cashflows(times, cfs, t_up, r_up, comp=comp)
-        p_dn = pv_cashflows(times, cfs, t_dn, r_dn, comp=comp)
-        out[label] = (p_dn - p_up) / (2 * price * delta)
-    return out
+    """KRDs for the standard tenors, each a symmetric *delta* bump of one key rate.
+
+    Computed by ``key_rate.key_rate_durations_dict`` from a cash-flow x tenor
+    weight matrix in one pass, with the same numbers as repricing the bond
+    twice per tenor on a curve with the key tenor inserted and bumped.
+    """
+    return key_rate_durations_dict(
+        price, times, cfs, zero_times, zero_rates, _KRD_TENORS, comp=comp, delta=delta
+    )
 
 
 def effective_spread_duration(
@@ -11,6 +11,7 @@ from enum import Enum
 
 from .discount import pv_cashflows, discount_factor, Compounding
 from .interpolation import linear_interpolate
+from .key_rate import key_rate_durations_dict
 
 
 class DurationMethod(Enum):
@@ -380,9 +381,6 @@ def key_rate_durations_enhanced(
     Returns:
         Dictionary of tenor -> duration
     """
-    import copy
-    from bisect import bisect_left
-    
     # Default key rate tenors if not provided
     if key_tenors is None:
         key_tenors = [0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.0, 10.0, 15.0, 20.0, 30.0]
@@ -393,53 +391,15 @@ def key_rate_durations_enhanced(
         3.0: "3Y", 5.0: "5Y", 7.0: "7Y", 10.0: "10Y", 15.0: "15Y",
         20.0: "20Y", 30.0: "30Y"
     }
-    
-    krds = {}
-    
-    for key_tenor in key_tenors:
-        # Create shocked curves
-        zero_times_up = copy.deepcopy(zero_times)
-        zero_rates_up = copy.deepcopy(zero_rates)
-        zero_times_down = copy.deepcopy(zero_times)
-        zero_rates_down = copy.deepcopy(zero_rates)
-        
-        if interpolation == "triangular":
-            # Triangular shock centered at key tenor
-            width = 1.0  # 1-year width
-            for i, t in enumerate(zero_times):
-                distance = abs(t - key_tenor)
-                if distance < width:
-                    shock_factor = 1.0 - distance / width
-                    zero_rates_up[i] += delta * shock_factor
-                    zero_rates_down[i] -= delta * shock_factor
-        else:  # linear (point shock)
-            # Insert or update the key tenor point
-            idx = bisect_left(zero_times_up, key_tenor)
-            
-            if idx < len(zero_times_up) and abs(zero_times_up[idx] - key_tenor) < 1e-9:
-                # Exact match - shock this point
-                zero_rates_up[idx] += delta
-                zero_rates_down[idx] -= delta
-            else:
-                # Insert new point with shocked rate
-                base_rate = linear_interpolate(zero_times, zero_rates, key_tenor)
-                zero_times_up.insert(idx, key_tenor)
-                zero_rates_up.insert(idx, base_rate + delta)
-                zero_times_down.insert(idx, key_tenor)
-                zero_rates_down.insert(idx, base_rate - delta)
-        
-        # Calculate prices with shocked curves
-        p_up = pv_cashflows(times, cfs, zero_times_up, zero_rates_up, comp=comp)
-        p_down = pv_cashflows(times, cfs, zero_times_down, zero_rates_down, comp=comp)
-        
-        # Key rate duration
-        krd = (p_down - p_up) / (2 * price * delta)
-        
-        # Store with appropriate label
-        label = tenor_labels.get(key_tenor, f"{key_tenor}Y")
-        krds[label] = krd
-    
-    return krds
+    tenors = {tenor_labels.get(key_tenor, f"{key_tenor}Y"): key_tenor for key_tenor in key_tenors}
+    
+    # All tenors at once from the cash-flow x tenor shock weight matrix
+    # (same finite difference as bumping and repricing each tenor)
+    shock = "triangular" if interpolation == "triangular" else "point"
+    return key_rate_durations_dict(
+        price, times, cfs, zero_times, zero_rates, tenors,
+        comp=comp, delta=delta, shock=shock,
+    )
 
 
 def partial_durations(
@@ -1,13 +1,24 @@
 # interpolation.py
 # Purpose: Shape-preserving monotone-convex (PCHIP-style) interpolation helpers for
-#          zero curves, plus forward-rate calculation utilities.
+#          zero curves, a PreparedCurve with precomputed coefficients for
+#          repeated evaluation, plus forward-rate calculation utilities.
 
 from __future__ import annotations
 
 from bisect import bisect_left
-from typing import List
+from typing import List, Optional, Sequence, Tuple
 
-__all__ = ["linear_interpolate", "forward_rate"]
+import numpy as np
+
+__all__ = [
+    "linear_interpolate",
+    "interpolate_array",
+    "pchip_slopes",
+    "PreparedCurve",
+    "as_prepared_curve",
+    "curve_knots",
+    "forward_rate",
+]
 
 
 # ---------------------------------------------------------------------------
@@ -33,7 +44,11 @@ def linear_interpolate(x_list: List[float], y_list: List[float], x: float, metho
     - For backward compatibility and simplicity, defaults to true linear interpolation
     - "cubic" uses monotone shape‑preserving cubic Hermite (PCHIP) interpolation
     - Outside the knot range the nearest endpoint value is returned (flat extrapolation)
+    - ``x_list`` may be a ``PreparedCurve`` (``y_list`` is then ignored)
     """
+    if isinstance(x_list, PreparedCurve):
+        return x_list.rate(x, method)
+
     n = len(x_list)
     if n < 2:
         raise ValueError("Need at least two points for interpolation")
@@ -92,6 +107,184 @@ def linear_interpolate(x_list: List[float], y_list: List[float], x: float, metho
         return linear_interpolate(x_list, y_list, x, "linear")
 
 
+def pchip_slopes(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Knot derivatives of the PCHIP interpolant used by ``linear_interpolate``."""
+    dx = np.diff(x)
+    m = np.diff(y) / dx
+    d = np.empty(len(x))
+    d[0] = m[0]
+    d[-1] = m[-1]
+    if len(x) > 2:
+        m0, m1 = m[:-1], m[1:]
+        w1 = 2.0 * dx[1:] + dx[:-1]
+        w2 = dx[1:] + 2.0 * dx[:-1]
+        same_sign = m0 * m1 > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            harmonic = (w1 + w2) / (w1 / m0 + w2 / m1)
+        d[1:-1] = np.where(same_sign, harmonic, 0.0)
+    return d
+
+
+class PreparedCurve:
+    """Zero curve with interpolation coefficients computed once.
+
+    Knots are held as arrays together with per-segment polynomial
+    coefficients for linear and PCHIP ("cubic") interpolation, so each
+    evaluation is a binary search plus a cubic polynomial - O(log n) instead
+    of recomputing every knot derivative per call. Build one per
+    (currency, date) and evaluate it as often as needed, scalar or vectorised.
+
+    SpreadOMatic functions taking ``zero_times, zero_rates`` accept a
+    PreparedCurve in place of ``zero_times``; ``zero_rates`` is then ignored
+    and may be None.
+
+    Parameters
+    ----------
+    times, rates : sequence of float
+        Curve knots (times strictly increasing, at least two points).
+    grid_step : float, optional
+        If given, discount factors are also precomputed on a uniform grid of
+        this spacing (years) for ``grid_discount_factors``.
+    grid_comp, grid_method : str
+        Compounding and interpolation used for the precomputed grid.
+    """
+
+    def __init__(
+        self,
+        times: Sequence[float],
+        rates: Sequence[float],
+        *,
+        grid_step: Optional[float] = None,
+        grid_comp: str = "annual",
+        grid_method: str = "linear",
+    ):
+        self.times = np.asarray(times, dtype=float)
+        self.rates = np.asarray(rates, dtype=float)
+        if self.times.ndim != 1 or len(self.times) < 2:
+            raise ValueError("Need at least two points for interpolation")
+        if len(self.times) != len(self.rates):
+            raise ValueError("Curve times and rates must have the same length")
+        self._times_list = self.times.tolist()
+        h = np.diff(self.times)
+        m = np.diff(self.rates) / h
+        self._h = h
+        self._linear = (self.rates[:-1], m)
+        self._cubic: Optional[Tuple[np.ndarray, ...]] = None
+        self._grid: Optional[Tuple[float, np.ndarray]] = None
+        if grid_step is not None:
+            self._build_grid(float(grid_step), grid_comp, grid_method)
+
+    # -- coefficients -----------------------------------------------------
+    def _cubic_coefficients(self) -> Tuple[np.ndarray, ...]:
+        if self._cubic is None:
+            h = self._h
+            y0 = self.rates[:-1]
+            m = self._linear[1]
+            d = pchip_slopes(self.times, self.rates)
+            d0, d1 = d[:-1], d[1:]
+            # Hermite segment rewritten as y0 + b*s + c*s**2 + e*s**3, s = x - x_k
+            self._cubic = (y0, d0, (3.0 * m - 2.0 * d0 - d1) / h, (d0 + d1 - 2.0 * m) / h ** 2)
+        return self._cubic
+
+    def knots(self) -> Tuple[List[float], List[float]]:
+        """Knot times and rates as plain lists."""
+        return list(self._times_list), self.rates.tolist()
+
+    def shifted(self, delta: float) -> "PreparedCurve":
+        """Curve with every rate moved by *delta* (coefficients reused)."""
+        other = PreparedCurve.__new__(PreparedCurve)
+        other.__dict__.update(self.__dict__)
+        other.rates = self.rates + delta
+        other._linear = (self._linear[0] + delta, self._linear[1])
+        if self._cubic is not None:
+            a, b, c, e = self._cubic
+            other._cubic = (a + delta, b, c, e)
+        other._grid = None
+        return other
+
+    # -- evaluation -------------------------------------------------------
+    def rate(self, x, method: str = "linear"):
+        """Interpolated rate at *x* (float for scalar input, array otherwise).
+
+        Matches ``linear_interpolate``: flat extrapolation outside the knots,
+        ``method="cubic"`` for PCHIP and linear for anything else.
+        """
+        coeffs = self._cubic_coefficients() if method == "cubic" else self._linear
+        if np.ndim(x) == 0:
+            x = float(x)
+            if x <= self._times_list[0]:
+                return float(self.rates[0])
+            if x >= self._times_list[-1]:
+                return float(self.rates[-1])
+            k = bisect_left(self._times_list, x) - 1
+            s = x - self._times_list[k]
+            if len(coeffs) == 2:
+                return float(coeffs[0][k] + coeffs[1][k] * s)
+            a, b, c, e = coeffs
+            return float(a[k] + s * (b[k] + s * (c[k] + s * e[k])))
+
+        x = np.asarray(x, dtype=float)
+        k = np.clip(np.searchsorted(self.times, x, side="left") - 1, 0, len(self.times) - 2)
+        s = x - self.times[k]
+        if len(coeffs) == 2:
+            out = coeffs[0][k] + coeffs[1][k] * s
+        else:
+            a, b, c, e = coeffs
+            out = a[k] + s * (b[k] + s * (c[k] + s * e[k]))
+        out = np.where(x <= self.times[0], self.rates[0], out)
+        return np.where(x >= self.times[-1], self.rates[-1], out)
+
+    def discount_factors(self, t, comp="annual", method: str = "linear", spread=0.0) -> np.ndarray:
+        """Discount factors at times *t* from the interpolated rate plus *spread*."""
+        from .pricing_kernel import discount_factors  # local import avoids a cycle
+
+        t = np.asarray(t, dtype=float)
+        return discount_factors(self.rate(t, method) + spread, t, comp)
+
+    def _build_grid(self, step: float, comp: str, method: str) -> None:
+        if step <= 0:
+            raise ValueError("grid_step must be positive")
+        n = int(np.ceil(self.times[-1] / step)) + 1
+        grid_t = np.arange(n + 1) * step
+        self._grid = (step, np.log(self.discount_factors(grid_t, comp, method)))
+
+    def grid_discount_factors(self, t) -> np.ndarray:
+        """Discount factors at *t* from the precomputed grid (log-linear, O(1) per point).
+
+        Requires ``grid_step``; beyond the grid the last zero rate is
+        extrapolated flat in log-discount space.
+        """
+        if self._grid is None:
+            raise ValueError("PreparedCurve was built without grid_step")
+        step, log_df = self._grid
+        pos = np.asarray(t, dtype=float) / step
+        i = np.clip(np.floor(pos).astype(np.int64), 0, len(log_df) - 2)
+        w = pos - i
+        return np.exp(log_df[i] + w * (log_df[i + 1] - log_df[i]))
+
+
+def as_prepared_curve(zero_times, zero_rates=None) -> PreparedCurve:
+    """Return *zero_times* if it already is a PreparedCurve, else prepare the knots."""
+    if isinstance(zero_times, PreparedCurve):
+        return zero_times
+    return PreparedCurve(zero_times, zero_rates)
+
+
+def curve_knots(zero_times, zero_rates=None) -> Tuple[List[float], List[float]]:
+    """Plain knot lists for code that edits the curve (bumps, inserted tenors)."""
+    if isinstance(zero_times, PreparedCurve):
+        return zero_times.knots()
+    return zero_times, zero_rates
+
+
+def interpolate_array(x_list, y_list, x, method: str = "linear") -> np.ndarray:
+    """Vectorised ``linear_interpolate`` over an array of query points *x*.
+
+    *x_list* may be a PreparedCurve (``y_list`` is then ignored).
+    """
+    return np.asarray(as_prepared_curve(x_list, y_list).rate(np.asarray(x, dtype=float), method))
+
+
 def forward_rate(
     zero_times: List[float],
     zero_rates: List[float],
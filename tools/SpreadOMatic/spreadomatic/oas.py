@@ -9,7 +9,7 @@ from typing import List, Dict, Optional
 from scipy.optimize import brentq
 
 from .discount import discount_factor, pv_cashflows, Compounding
-from .interpolation import linear_interpolate
+from .interpolation import curve_knots, linear_interpolate
 from .cashflows import extract_cashflows
 from .duration import effective_duration
 from .yield_spread import solve_ytm, z_spread
@@ -62,6 +62,9 @@ def compute_oas(
     if next_call_date is None or next_call_date <= valuation_date:
         return None
 
+    # The OAS search bumps the knot rates, so work on plain lists
+    zero_times, zero_rates = curve_knots(zero_times, zero_rates)
+
     # --- Helper: estimate accrued interest from full schedule ---------------
     def _estimate_accrued_from_schedule(schedule: List[Dict], val_dt) -> float:
         try:
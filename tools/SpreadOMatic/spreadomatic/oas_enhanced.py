@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import math
 import numpy as np
-from typing import List, Dict, Optional, Tuple, Union
+from typing import List, Dict, Optional, Sequence, Tuple, Union
 from datetime import datetime, timedelta
 from bisect import bisect_left
 from scipy.optimize import brentq
@@ -212,52 +212,76 @@ class BinomialOASCalculator:
         """
         if not strikes:
             return 0.0
+        return float(self.calculate_option_values(
+            [spot], [strikes], [rate], volatility, [time_to_maturity]
+        )[0])
+    
+    def calculate_option_values(self,
+                                spots: Sequence[float],
+                                strikes_list: Sequence[List[Tuple[float, float]]],
+                                rates: Sequence[float],
+                                volatility: float,
+                                times_to_maturity: Sequence[float]) -> np.ndarray:
+        """
+        Value the call options of several bonds on trees with the same number
+        of steps and volatility.
         
-        dt = time_to_maturity / self.steps
-        u = math.exp(volatility * math.sqrt(dt))  # Up factor
-        d = 1 / u  # Down factor
-        p = (math.exp(rate * dt) - d) / (u - d)  # Risk-neutral probability
+        Each tree slice is one array per bond, exercise steps are located once
+        up front and exercise is checked for all nodes of a slice together.
         
-        # Build price tree
-        price_tree = np.zeros((self.steps + 1, self.steps + 1))
-        price_tree[0, 0] = spot
+        Parameters
+        ----------
+        spots, rates, times_to_maturity : sequences of float
+            Per-bond inputs, as in ``calculate_option_value``
+        strikes_list : sequence of lists of (time_in_years, strike_price)
+            Call schedule of each bond
+        volatility : float
+            Calibrated volatility shared by all bonds
         
-        for i in range(1, self.steps + 1):
-            for j in range(i + 1):
-                price_tree[i, j] = spot * (u ** j) * (d ** (i - j))
+        Returns
+        -------
+        np.ndarray
+            Option value of each bond
+        """
+        n = self.steps
+        spots = np.asarray(spots, dtype=float)
+        rates = np.asarray(rates, dtype=float)
+        dt = np.asarray(times_to_maturity, dtype=float) / n
+        u = np.exp(volatility * np.sqrt(dt))  # Up factor
+        d = 1 / u  # Down factor
+        p = (np.exp(rates * dt) - d) / (u - d)  # Risk-neutral probability
+        growth = np.exp(-rates * dt)
         
-        # Build option value tree (backward induction)
-        option_tree = np.zeros((self.steps + 1, self.steps + 1))
+        exercise = np.full((len(spots), n), np.nan)
+        for b, strikes in enumerate(strikes_list):
+            exercise[b] = self._step_strikes(strikes, dt[b])
         
-        # Terminal payoff (no call at maturity, so value = 0)
-        # This assumes bond is not called at maturity
+        # Terminal payoff is zero: the bond is not called at maturity
+        values = np.zeros((len(spots), n + 1))
+        j = np.arange(n + 1)
         
-        # Work backwards through tree
-        for i in range(self.steps - 1, -1, -1):
-            current_time = i * dt
-            
-            # Find applicable strike for this time
-            applicable_strike = None
-            for call_time, strike in strikes:
-                if abs(current_time - call_time) < dt / 2:
-                    applicable_strike = strike
-                    break
-            
-            for j in range(i + 1):
-                # Continuation value
-                cont_value = math.exp(-rate * dt) * (
-                    p * option_tree[i + 1, j + 1] + 
-                    (1 - p) * option_tree[i + 1, j]
-                )
-                
-                # Exercise value if call date
-                if applicable_strike is not None:
-                    exercise_value = max(0, price_tree[i, j] - applicable_strike)
-                    option_tree[i, j] = max(cont_value, exercise_value)
-                else:
-                    option_tree[i, j] = cont_value
-        
-        return option_tree[0, 0]
+        for i in range(n - 1, -1, -1):
+            values = growth[:, None] * (
+                p[:, None] * values[:, 1:i + 2] + (1 - p[:, None]) * values[:, :i + 1]
+            )
+            strike = exercise[:, i]
+            rows = ~np.isnan(strike)
+            if rows.any():
+                prices = spots[rows, None] * (u[rows, None] ** j[:i + 1]) * (d[rows, None] ** (i - j[:i + 1]))
+                payoff = np.maximum(0, prices - strike[rows, None])
+                values[rows] = np.maximum(values[rows], payoff)
+        
+        return values[:, 0]
+    
+    def _step_strikes(self, strikes: List[Tuple[float, float]], dt: float) -> np.ndarray:
+        """Strike exercisable at each step (NaN where none); the first matching call wins"""
+        step_strikes = np.full(self.steps, np.nan)
+        for call_time, strike in reversed(strikes):
+            centre = int(math.floor(call_time / dt + 0.5))
+            for i in (centre - 1, centre, centre + 1):
+                if 0 <= i < self.steps and abs(i * dt - call_time) < dt / 2:
+                    step_strikes[i] = strike
+        return step_strikes
 
 
 def compute_oas_enhanced(
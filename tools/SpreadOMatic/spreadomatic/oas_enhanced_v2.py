@@ -17,6 +17,7 @@ import warnings
 
 from .daycount_enhanced import year_fraction_precise, DayCountConvention
 from .curve_construction import YieldCurve
+from .hw_lattice import HullWhiteTrinomialTree
 
 __all__ = [
     "VolatilityModel", 
@@ -24,19 +25,62 @@ __all__ = [
     "BlackKarasinskiModel",
     "OASCalculator", 
     "CallableInstrument",
-    "MonteCarloOAS",
-    "TreeBasedOAS",
-    "VolatilitySurface"
+    "VolatilitySurface",
+    "standard_normals",
 ]
 
 
+def standard_normals(num_paths: int, num_steps: int,
+                     random_seed: Optional[int] = None,
+                     antithetic: bool = False,
+                     sampler: str = "pseudo") -> np.ndarray:
+    """
+    Standard normal shocks of shape (num_paths, num_steps) for path simulation.
+    
+    Args:
+        antithetic: Pair every path with its mirror image (-Z); halves the
+            number of independent draws and cancels odd-order noise
+        sampler: "pseudo" (NumPy global RNG, seeded with random_seed) or
+            "sobol" (scrambled Sobol points mapped through the normal inverse CDF)
+    
+    With the defaults the draws equal the per-step
+    ``np.random.normal(0, 1, num_paths)`` calls of the original simulators.
+    """
+    if num_steps <= 0 or num_paths <= 0:
+        return np.zeros((max(num_paths, 0), max(num_steps, 0)))
+    
+    draws = (num_paths + 1) // 2 if antithetic else num_paths
+    sampler = sampler.lower()
+    if sampler == "pseudo":
+        if random_seed is not None:
+            np.random.seed(random_seed)
+        # Step-major draw order matches drawing one vector per time step
+        shocks = np.random.normal(0, 1, (num_steps, draws)).T
+    elif sampler == "sobol":
+        from scipy.stats import qmc
+        
+        engine = qmc.Sobol(d=num_steps, scramble=True, seed=random_seed)
+        with warnings.catch_warnings():
+            # Balance properties need a power-of-two sample size; others still work
+            warnings.simplefilter("ignore", UserWarning)
+            uniforms = engine.random(draws)
+        shocks = stats.norm.ppf(np.clip(uniforms, 1e-12, 1 - 1e-12))
+    else:
+        raise ValueError(f"Unknown sampler: {sampler}")
+    
+    if antithetic:
+        shocks = np.concatenate([shocks, -shocks])[:num_paths]
+    return shocks
+
+
 class VolatilityModel(ABC):
     """Abstract base class for interest rate volatility models"""
     
     @abstractmethod
     def simulate_paths(self, initial_rate: float, times: np.ndarray, 
-                      num_paths: int, random_seed: Optional[int] = None) -> np.ndarray:
-        """Simulate interest rate paths"""
+                      num_paths: int, random_seed: Optional[int] = None,
+                      shocks: Optional[np.ndarray] = None) -> np.ndarray:
+        """Simulate interest rate paths (optionally from given standard normal shocks)"""
         pass
     
     @abstractmethod
@@ -101,6 +145,10 @@ class HullWhiteModel(VolatilityModel):
         self.sigma = volatility
         self.theta_function = theta_function
         self._calibrated_curve: Optional[YieldCurve] = None
+        # θ(t) fitted by calibrate() (drift has a closed form) and α(t, t+dt)
+        # per simulation grid; cleared on recalibration
+        self._curve_theta: Optional[Callable[[float], float]] = None
+        self._drift_cache: Dict[tuple, np.ndarray] = {}
     
     def calibrate(self, market_data: Dict) -> None:
         """
@@ -114,6 +162,7 @@ class HullWhiteModel(VolatilityModel):
             raise ValueError("Yield curve required for Hull-White calibration")
         
         self._calibrated_curve = yield_curve
+        self._drift_cache.clear()
         
         # Calibrate θ(t) to match the initial yield curve
         def theta_calibration(t: float) -> float:
@@ -130,6 +179,7 @@ class HullWhiteModel(VolatilityModel):
                 if t > 2 * dt_base:
                     # Central difference for better accuracy
                     dt = dt_base
+                    f_t = yield_curve.forward_rate(t, t + dt)
                     f_t_plus = yield_curve.forward_rate(t + dt, t + dt + dt)
                     f_t_minus = yield_curve.forward_rate(t - dt, t - dt + dt)
                     df_dt = (f_t_plus - f_t_minus) / (2 * dt)
@@ -155,6 +205,7 @@ class HullWhiteModel(VolatilityModel):
                 return self.sigma**2 / (2 * self.a)
         
         self.theta_function = theta_calibration
+        self._curve_theta = theta_calibration
         
         # If swaption data available, calibrate volatility to swaptions
         swaptions = market_data.get('swaptions')
@@ -240,7 +291,8 @@ class HullWhiteModel(VolatilityModel):
             return np.sqrt(max(0.0, variance)) * B_T
     
     def simulate_paths(self, initial_rate: float, times: np.ndarray, 
-                      num_paths: int, random_seed: Optional[int] = None) -> np.ndarray:
+                      num_paths: int, random_seed: Optional[int] = None,
+                      shocks: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Simulate Hull-White interest rate paths using exact discretization.
         
@@ -249,47 +301,82 @@ class HullWhiteModel(VolatilityModel):
             times: Time points for simulation
             num_paths: Number of Monte Carlo paths
             random_seed: Random seed for reproducibility
+            shocks: Optional (num_paths, len(times) - 1) standard normals, e.g.
+                antithetic or Sobol draws from standard_normals()
             
         Returns:
             Array of shape (num_paths, len(times)) containing rate paths
         """
-        if random_seed is not None:
-            np.random.seed(random_seed)
+        if shocks is None:
+            shocks = standard_normals(num_paths, len(times) - 1, random_seed)
         
         n_steps = len(times)
         paths = np.zeros((num_paths, n_steps))
         paths[:, 0] = initial_rate
         
+        # Hull-White exact simulation
+        # r(t+dt) = r(t)*exp(-a*dt) + α(t,t+dt) + σ*sqrt(V(t,t+dt))*Z
+        dts = np.diff(times)
+        discount = np.exp(-self.a * dts)
+        alpha = self._drift_terms(times)
+        
+        # Variance: V(t, t+dt) = σ²/(2a) * (1 - exp(-2a*dt))
+        if self.a > 1e-8:
+            variance = (self.sigma**2) / (2 * self.a) * (1 - np.exp(-2 * self.a * dts))
+        else:
+            variance = self.sigma**2 * dts  # Zero mean reversion limit
+        vol = np.sqrt(variance)
+        
         for i in range(1, n_steps):
-            dt = times[i] - times[i-1]
-            
-            # Hull-White exact simulation
-            # r(t+dt) = r(t)*exp(-a*dt) + α(t,t+dt) + σ*sqrt(V(t,t+dt))*Z
-            
-            discount = np.exp(-self.a * dt)
-            
-            # Calculate α(t, t+dt) - drift correction
-            if self.theta_function is not None:
-                # Numerical integration of θ(s)*exp(-a*(t+dt-s)) from t to t+dt
-                alpha = self._calculate_alpha_integral(times[i-1], dt)
-            else:
-                alpha = 0.0
-            
-            # Variance: V(t, t+dt) = σ²/(2a) * (1 - exp(-2a*dt))
+            paths[:, i] = paths[:, i-1] * discount[i-1] + alpha[i-1] + vol[i-1] * shocks[:, i-1]
+        
+        return paths
+    
+    def _drift_terms(self, times: np.ndarray) -> np.ndarray:
+        """
+        α(t_i, t_{i+1}) for each step of *times*, cached per grid.
+        
+        With θ(t) fitted to the curve, θ = φ' + aφ where
+        φ(t) = f(0,t) + σ²/(2a²) * (1 - exp(-at))², so the integral of
+        θ(s)exp(-a(t+dt-s)) is exactly φ(t+dt) - φ(t)exp(-a*dt). A user-supplied
+        θ(t) is integrated numerically, once per grid.
+        """
+        times = np.asarray(times, dtype=float)
+        if self.theta_function is None:
+            return np.zeros(len(times) - 1)
+        key = (times.tobytes(), self.a, self.sigma, id(self.theta_function))
+        alpha = self._drift_cache.get(key)
+        if alpha is not None:
+            return alpha
+        
+        dts = np.diff(times)
+        if self.theta_function is self._curve_theta and self._calibrated_curve is not None:
+            phi = self._instantaneous_forwards(times)
             if self.a > 1e-8:
-                variance = (self.sigma**2) / (2 * self.a) * (1 - np.exp(-2 * self.a * dt))
+                phi += (self.sigma**2) / (2 * self.a**2) * (1 - np.exp(-self.a * times))**2
             else:
-                variance = self.sigma**2 * dt  # Zero mean reversion limit
-            
-            vol = np.sqrt(variance)
-            
-            # Generate correlated random shocks
-            random_shocks = np.random.normal(0, 1, num_paths)
-            
-            # Update paths
-            paths[:, i] = paths[:, i-1] * discount + alpha + vol * random_shocks
+                phi += 0.5 * self.sigma**2 * times**2
+            alpha = phi[1:] - phi[:-1] * np.exp(-self.a * dts)
+        else:
+            alpha = np.array([
+                self._calculate_alpha_integral(t, dt) for t, dt in zip(times[:-1], dts)
+            ])
         
-        return paths
+        if len(self._drift_cache) >= 8:
+            self._drift_cache.pop(next(iter(self._drift_cache)))
+        self._drift_cache[key] = alpha
+        return alpha
+    
+    def _instantaneous_forwards(self, times: np.ndarray, h: float = 1e-4) -> np.ndarray:
+        """f(0,t) = -d ln P(0,t)/dt from the calibrated curve (central difference)"""
+        curve = self._calibrated_curve
+        lo = np.maximum(times - h, 0.0)
+        hi = lo + 2 * h
+
+        def log_df(ts: np.ndarray) -> np.ndarray:
+            return np.array([np.log(curve.discount_factor(float(t))) for t in ts])
+
+        return (log_df(lo) - log_df(hi)) / (hi - lo)
     
     def _calculate_alpha_integral(self, t: float, dt: float) -> float:
         """Calculate integral of θ(s)exp(-a(t+dt-s)) from t to t+dt"""
@@ -360,14 +447,15 @@ class BlackKarasinskiModel(VolatilityModel):
         self._calibrated_curve = market_data.get('yield_curve')
     
     def simulate_paths(self, initial_rate: float, times: np.ndarray, 
-                      num_paths: int, random_seed: Optional[int] = None) -> np.ndarray:
+                      num_paths: int, random_seed: Optional[int] = None,
+                      shocks: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Simulate Black-Karasinski paths using Euler discretization.
         
         Note: This requires numerical methods as no analytical solution exists.
         """
-        if random_seed is not None:
-            np.random.seed(random_seed)
+        if shocks is None:
+            shocks = standard_normals(num_paths, len(times) - 1, random_seed)
         
         n_steps = len(times)
         paths = np.zeros((num_paths, n_steps))
@@ -385,7 +473,7 @@ class BlackKarasinskiModel(VolatilityModel):
             theta_t = self._estimate_theta(times[i-1])
             
             drift = (theta_t - self.a * log_paths[:, i-1]) * dt
-            diffusion = self.sigma * np.sqrt(dt) * np.random.normal(0, 1, num_paths)
+            diffusion = self.sigma * np.sqrt(dt) * shocks[:, i-1]
             
             log_paths[:, i] = log_paths[:, i-1] + drift + diffusion
             paths[:, i] = np.exp(log_paths[:, i])
@@ -453,7 +541,9 @@ class OASCalculator:
     def __init__(self, 
                  volatility_model: VolatilityModel,
                  yield_curve: YieldCurve,
-                 method: str = "MONTE_CARLO"):
+                 method: str = "MONTE_CARLO",
+                 antithetic: bool = False,
+                 sampler: str = "pseudo"):
         """
         Initialize OAS calculator.
         
@@ -461,6 +551,8 @@ class OASCalculator:
             volatility_model: Interest rate volatility model
             yield_curve: Base yield curve for discounting
             method: "MONTE_CARLO", "TREE", or "ANALYTICAL"
+            antithetic: Use antithetic variates in Monte Carlo pricing
+            sampler: "pseudo" or "sobol" normals for Monte Carlo pricing
         """
         self.vol_model = volatility_model
         self.yield_curve = yield_curve
@@ -470,6 +562,18 @@ class OASCalculator:
         self.num_paths = 10000
         self.num_time_steps = 252
         self.random_seed = 42
+        self.antithetic = antithetic
+        self.sampler = sampler
+        
+        # Simulated paths and cashflow grid of the last bond priced; OAS and
+        # duration solves reprice the same bond at many spreads
+        self._mc_grid_key: Optional[tuple] = None
+        self._mc_grid: Optional[Dict[str, np.ndarray]] = None
+        
+        # Tree settings; lattices are cached per (curve, a, sigma, grid) so an
+        # OAS search only changes the spread applied on the same tree
+        self.tree_steps = 200
+        self._lattices: Dict[tuple, HullWhiteTrinomialTree] = {}
     
     def calculate_oas(self, 
                      callable_bond: CallableInstrument,
@@ -533,6 +637,29 @@ class OASCalculator:
                           oas_spread: float,
                           settlement_date: datetime) -> float:
         """Price using Monte Carlo simulation"""
+        grid = self._monte_carlo_grid(callable_bond, settlement_date)
+        
+        # Return average price across all paths
+        return np.mean(self._price_paths(grid, oas_spread))
+    
+    def _monte_carlo_grid(self, callable_bond: CallableInstrument,
+                          settlement_date: datetime) -> Dict[str, np.ndarray]:
+        """
+        Simulate paths and map cashflows/call dates onto the time grid once.
+        
+        The grid does not depend on the OAS, so it is reused while the same bond,
+        settlement date, model parameters and Monte Carlo settings are priced.
+        """
+        key = (
+            callable_bond.maturity_date, callable_bond.coupon_rate, callable_bond.face_value,
+            callable_bond.coupon_frequency,
+            tuple((c.call_date, c.call_price) for c in callable_bond.call_schedule),
+            settlement_date, self.num_paths, self.num_time_steps, self.random_seed,
+            self.antithetic, self.sampler, id(self.vol_model), id(self.yield_curve),
+            tuple(sorted(self.vol_model.get_parameters().items())),
+        )
+        if self._mc_grid_key == key and self._mc_grid is not None:
+            return self._mc_grid
         
         # Generate time grid
         maturity_time = year_fraction_precise(
@@ -544,26 +671,55 @@ class OASCalculator:
         initial_rate = self.yield_curve.zero_rate(0.25)  # 3M rate as proxy
         
         # Simulate rate paths
+        shocks = standard_normals(
+            self.num_paths, len(times) - 1, self.random_seed,
+            antithetic=self.antithetic, sampler=self.sampler
+        )
         rate_paths = self.vol_model.simulate_paths(
-            initial_rate, times, self.num_paths, self.random_seed
+            initial_rate, times, self.num_paths, self.random_seed, shocks=shocks
         )
         
         # Generate cashflow dates and amounts
         cashflow_times, cashflow_amounts = self._generate_cashflows(
             callable_bond, settlement_date
         )
+        cf_times = np.asarray(cashflow_times, dtype=float)
         
-        # Price each path
-        path_prices = np.zeros(self.num_paths)
+        # Grid index and accrual period of each cashflow (as in _price_single_path)
+        idx = np.minimum(np.searchsorted(times, cf_times), len(times) - 1)
+        dt = np.where(idx == 0, cf_times, cf_times - times[np.maximum(idx - 1, 0)])
         
-        for path in range(self.num_paths):
-            path_prices[path] = self._price_single_path(
-                rate_paths[path], times, cashflow_times, cashflow_amounts,
-                callable_bond.call_schedule, oas_spread, settlement_date
-            )
-        
-        # Return average price across all paths
-        return np.mean(path_prices)
+        # Call price where a cashflow falls on a call date, NaN elsewhere
+        call_prices = {
+            year_fraction_precise(settlement_date, call.call_date, "ACT/365-FIXED"): call.call_price
+            for call in callable_bond.call_schedule
+        }
+        cf_call = np.array([call_prices.get(t, np.nan) for t in cashflow_times], dtype=float)
+        
+        grid = {
+            "amounts": np.asarray(cashflow_amounts, dtype=float),
+            "dt": dt,
+            "call_prices": cf_call,
+            # exp(-r*dt) per path and cashflow; the OAS enters as exp(-oas*dt)
+            "path_discount": np.exp(-rate_paths[:, idx] * dt),
+        }
+        self._mc_grid_key, self._mc_grid = key, grid
+        return grid
+    
+    @staticmethod
+    def _price_paths(grid: Dict[str, np.ndarray], oas_spread: float) -> np.ndarray:
+        """Backward pass over cashflows for all paths at once (see _price_single_path)"""
+        path_discount = grid["path_discount"]
+        values = np.zeros(path_discount.shape[0])
+        spread_discount = np.exp(-oas_spread * grid["dt"])
+        
+        for j in range(len(grid["amounts"]) - 1, -1, -1):
+            values += grid["amounts"][j] * spread_discount[j] * path_discount[:, j]
+            call_price = grid["call_prices"][j]
+            if not np.isnan(call_price):
+                # Bond gets called on paths where it is worth more than the call price
+                np.minimum(values, call_price, out=values)
+        return values
     
     def _price_single_path(self,
                           rate_path: np.ndarray,
@@ -573,7 +729,8 @@ class OASCalculator:
                           call_schedule: List[CallOption],
                           oas_spread: float,
                           settlement_date: datetime) -> float:
-        """Price callable bond along single interest rate path"""
+        """Price callable bond along single interest rate path (per-path reference
+        for the vectorised _price_paths)"""
         
         # Start from maturity and work backwards
         remaining_cashflows = list(zip(cashflow_times, cashflow_amounts))
@@ -615,10 +772,50 @@ class OASCalculator:
     
     def _tree_price(self, callable_bond: CallableInstrument,
                    oas_spread: float, settlement_date: datetime) -> float:
-        """Price using binomial/trinomial tree (simplified implementation)"""
-        # This is a placeholder for a full tree implementation
-        # Real implementation would build interest rate tree and backward induction
-        return self._analytical_price(callable_bond, oas_spread, settlement_date)
+        """Price by backward induction on a calibrated Hull-White trinomial lattice.
+        
+        Models other than Hull-White fall back to the analytical approximation.
+        """
+        if not isinstance(self.vol_model, HullWhiteModel) or self.vol_model.a <= 0:
+            return self._analytical_price(callable_bond, oas_spread, settlement_date)
+        
+        cashflow_times, cashflow_amounts = self._generate_cashflows(callable_bond, settlement_date)
+        maturity_time = max(cashflow_times, default=0.0)
+        if maturity_time <= 0:
+            return 0.0
+        tree = self._lattice(maturity_time)
+        
+        call_times, call_prices, put_times, put_prices = [], [], [], []
+        for option in callable_bond.call_schedule:
+            if not option.is_exercisable:
+                continue
+            t = year_fraction_precise(settlement_date, option.call_date, "ACT/365-FIXED")
+            if option.call_type.upper() == "PUT":
+                put_times.append(t)
+                put_prices.append(option.call_price)
+            else:  # CALL and BERMUDAN are issuer calls
+                call_times.append(t)
+                call_prices.append(option.call_price)
+        
+        return tree.price(
+            cashflow_times, cashflow_amounts, oas_spread,
+            call_times, call_prices, put_times, put_prices,
+        )
+    
+    def _lattice(self, maturity_time: float) -> HullWhiteTrinomialTree:
+        """Hull-White lattice for this curve and model, built once per grid"""
+        key = (id(self.yield_curve), self.vol_model.a, self.vol_model.sigma,
+               round(maturity_time, 12), self.tree_steps)
+        tree = self._lattices.get(key)
+        if tree is None:
+            if len(self._lattices) >= 8:
+                self._lattices.pop(next(iter(self._lattices)))
+            tree = HullWhiteTrinomialTree(
+                self.yield_curve.discount_factor, self.vol_model.a, self.vol_model.sigma,
+                maturity_time, self.tree_steps,
+            )
+            self._lattices[key] = tree
+        return tree
     
     def _analytical_price(self, callable_bond: CallableInstrument,
                          oas_spread: float, settlement_date: datetime) -> float:
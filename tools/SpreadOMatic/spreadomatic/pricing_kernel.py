@@ -0,0 +1,259 @@
+# pricing_kernel.py
+# Purpose: Array-based pricing kernel. Cash flows for N bonds are padded into
+#          N x M time/amount matrices so PV, YTM and Z-spread for all bonds are
+#          computed together with NumPy, using safeguarded Newton steps
+#          (analytic dPV/dy) inside per-bond bisection brackets.
+
+from __future__ import annotations
+
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .interpolation import as_prepared_curve
+
+__all__ = [
+    "pad_cashflows",
+    "discount_factors",
+    "discount_factor_slopes",
+    "pv_batch",
+    "solve_ytm_batch",
+    "z_spread_batch",
+]
+
+# Periods per year for each compounding convention (0 = continuous)
+_PERIODS = {"annual": 1, "semiannual": 2, "quarterly": 4, "monthly": 12, "continuous": 0}
+
+
+def _periods(comp: Union[str, int]) -> int:
+    if isinstance(comp, int):
+        if comp in (1, 2, 4, 12):
+            return comp
+        raise ValueError(f"Unsupported integer compounding: {comp}")
+    try:
+        return _PERIODS[comp]
+    except KeyError:
+        raise ValueError(f"Unsupported compounding convention: {comp}") from None
+
+
+def pad_cashflows(
+    times_list: Sequence[Sequence[float]], cfs_list: Sequence[Sequence[float]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Pad per-bond ``times``/``cfs`` lists into two N x M float matrices.
+
+    Padding uses a zero cash flow at time zero, which contributes nothing to
+    PV or its derivatives.
+    """
+    n = len(times_list)
+    width = max((len(t) for t in times_list), default=0)
+    times = np.zeros((n, max(width, 1)))
+    cfs = np.zeros((n, max(width, 1)))
+    for i, (t, c) in enumerate(zip(times_list, cfs_list)):
+        times[i, : len(t)] = t
+        cfs[i, : len(c)] = c
+    return times, cfs
+
+
+def discount_factors(rates, times, comp: Union[str, int] = "annual") -> np.ndarray:
+    """Vectorised ``discount.discount_factor``."""
+    m = _periods(comp)
+    rates = np.asarray(rates, dtype=float)
+    times = np.asarray(times, dtype=float)
+    if m == 0:
+        return np.exp(-rates * times)
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        return 1.0 / (1.0 + rates / m) ** (m * times)
+
+
+def _df_and_slope(rates: np.ndarray, times: np.ndarray, m: int):
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        if m == 0:
+            df = np.exp(-rates * times)
+            return df, -times * df
+        base = 1.0 + rates / m
+        df = base ** (-m * times)
+        return df, -times * df / base
+
+
+def discount_factor_slopes(rates, times, comp: Union[str, int] = "annual") -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorised discount factors and their derivatives dDF/dr (closed form)."""
+    return _df_and_slope(np.asarray(rates, dtype=float), np.asarray(times, dtype=float), _periods(comp))
+
+
+def _pv_and_slope(rates: np.ndarray, times: np.ndarray, cfs: np.ndarray, m: int):
+    """Row-wise PV and dPV/dr for a parallel shift *r* of every discount rate."""
+    df, ddf = _df_and_slope(rates, times, m)
+    return (cfs * df).sum(axis=1), (cfs * ddf).sum(axis=1)
+
+
+def _curve_rates(times: np.ndarray, zero_times, zero_rates, interp: str) -> np.ndarray:
+    return as_prepared_curve(zero_times, zero_rates).rate(times, interp)
+
+
+def pv_batch(
+    times: np.ndarray,
+    cfs: np.ndarray,
+    zero_times,
+    zero_rates,
+    *,
+    spread=0.0,
+    comp: Union[str, int] = "annual",
+    interp: str = "linear",
+) -> np.ndarray:
+    """PV of each row of *cfs* on the zero curve plus *spread* (scalar or per bond).
+
+    *zero_times* may be a PreparedCurve, in which case *zero_rates* is ignored.
+    """
+    times = np.atleast_2d(np.asarray(times, dtype=float))
+    cfs = np.atleast_2d(np.asarray(cfs, dtype=float))
+    spread = np.asarray(spread, dtype=float).reshape(-1, 1) if np.ndim(spread) else float(spread)
+    rates = _curve_rates(times, zero_times, zero_rates, interp) + spread
+    return (cfs * discount_factors(rates, times, comp)).sum(axis=1)
+
+
+def _solve_batch(
+    base_rates: np.ndarray,
+    times: np.ndarray,
+    cfs: np.ndarray,
+    prices: np.ndarray,
+    m: int,
+    guess: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    tol: float,
+    max_iter: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find x per row with PV(base_rates + x) = price.
+
+    Each bond keeps a bracket; a Newton step is taken when it stays inside
+    the bracket and bisection otherwise, so every bond converges whenever its
+    bracket holds a sign change. Brackets without one are widened up to ten
+    times, mirroring ``BrentMethod._expand_bracket``.
+
+    Returns (solutions with NaN where no root was found, converged mask,
+    iterations used per bond).
+    """
+    n = len(prices)
+
+    def f_and_df(x, rows=slice(None)):
+        pv, dpv = _pv_and_slope(base_rates[rows] + x[:, None], times[rows], cfs[rows], m)
+        return pv - prices[rows], dpv
+
+    f_lo, _ = f_and_df(lo)
+    f_hi, _ = f_and_df(hi)
+    for _ in range(10):
+        bad = ~(f_lo * f_hi < 0) & np.isfinite(f_lo) & np.isfinite(f_hi)
+        if not bad.any():
+            break
+        width = hi - lo
+        left = bad & (np.abs(f_lo) < np.abs(f_hi))
+        right = bad & ~left
+        # Never widen past the rate where (1 + r/m) hits zero
+        floor = -m * 0.999 - base_rates.min(axis=1) if m else -np.inf
+        lo = np.where(left, np.maximum(lo - width, floor), lo)
+        hi = np.where(right, hi + width, hi)
+        f_lo, _ = f_and_df(lo)
+        f_hi, _ = f_and_df(hi)
+
+    bracketed = (f_lo * f_hi <= 0) & np.isfinite(f_lo) & np.isfinite(f_hi)
+    x = np.where((guess > lo) & (guess < hi), guess, 0.5 * (lo + hi))
+    converged = np.zeros(n, dtype=bool)
+    iterations = np.zeros(n, dtype=np.int64)
+    converged[bracketed & (f_lo == 0)] = True
+    x = np.where(bracketed & (f_lo == 0), lo, x)
+    converged[bracketed & (f_hi == 0)] = True
+    x = np.where(bracketed & (f_hi == 0) & (f_lo != 0), hi, x)
+
+    active = bracketed & ~converged
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        idx = np.flatnonzero(active)
+        xa = x[idx]
+        f, dpv = f_and_df(xa, idx)
+        iterations[idx] += 1
+
+        done = np.abs(f) < tol
+        converged[idx[done]] = True
+
+        # Shrink the bracket around the root: same sign as f(lo) -> new lower end
+        move_lo = np.sign(f) == np.sign(f_lo[idx])
+        lo[idx] = np.where(move_lo, xa, lo[idx])
+        f_lo[idx] = np.where(move_lo, f, f_lo[idx])
+        hi[idx] = np.where(move_lo, hi[idx], xa)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = xa - f / dpv
+        inside = np.isfinite(newton) & (newton > lo[idx]) & (newton < hi[idx])
+        step = np.where(inside, newton, 0.5 * (lo[idx] + hi[idx]))
+        narrow = (hi[idx] - lo[idx]) < tol
+        converged[idx[narrow & ~done]] = True
+        x[idx] = np.where(done | narrow, xa, step)
+        active[idx] = ~(done | narrow)
+
+    return np.where(converged, x, np.nan), converged, iterations
+
+
+def _as_bounds(bounds, default, n):
+    lo, hi = bounds if bounds is not None else default
+    return np.full(n, float(lo)), np.full(n, float(hi))
+
+
+def solve_ytm_batch(
+    prices,
+    times: np.ndarray,
+    cfs: np.ndarray,
+    *,
+    comp: Union[str, int] = "annual",
+    guess=0.05,
+    tol: float = 1e-10,
+    max_iter: int = 100,
+    bounds: Optional[Tuple[float, float]] = None,
+    return_iterations: bool = False,
+):
+    """Yield to maturity for every row of *times*/*cfs* (NaN where unsolved).
+
+    With ``return_iterations=True`` returns (yields, iterations per bond).
+    """
+    times = np.atleast_2d(np.asarray(times, dtype=float))
+    cfs = np.atleast_2d(np.asarray(cfs, dtype=float))
+    prices = np.atleast_1d(np.asarray(prices, dtype=float))
+    n = len(prices)
+    lo, hi = _as_bounds(bounds, (-0.5, 2.0), n)
+    values, _, iterations = _solve_batch(
+        np.zeros_like(times), times, cfs, prices, _periods(comp),
+        np.broadcast_to(np.asarray(guess, dtype=float), (n,)).copy(), lo, hi, tol, max_iter,
+    )
+    return (values, iterations) if return_iterations else values
+
+
+def z_spread_batch(
+    prices,
+    times: np.ndarray,
+    cfs: np.ndarray,
+    zero_times,
+    zero_rates,
+    *,
+    comp: Union[str, int] = "annual",
+    guess=0.0,
+    tol: float = 1e-10,
+    max_iter: int = 100,
+    bounds: Optional[Tuple[float, float]] = None,
+    interp: str = "linear",
+    return_iterations: bool = False,
+):
+    """Z-spread over one zero curve for every row of *times*/*cfs* (NaN where unsolved).
+
+    With ``return_iterations=True`` returns (spreads, iterations per bond).
+    """
+    times = np.atleast_2d(np.asarray(times, dtype=float))
+    cfs = np.atleast_2d(np.asarray(cfs, dtype=float))
+    prices = np.atleast_1d(np.asarray(prices, dtype=float))
+    n = len(prices)
+    lo, hi = _as_bounds(bounds, (-0.1, 0.5), n)
+    values, _, iterations = _solve_batch(
+        _curve_rates(times, zero_times, zero_rates, interp), times, cfs, prices,
+        _periods(comp), np.broadcast_to(np.asarray(guess, dtype=float), (n,)).copy(),
+        lo, hi, tol, max_iter,
+    )
+    return (values, iterations) if return_iterations else values
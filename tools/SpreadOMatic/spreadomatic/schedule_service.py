@@ -0,0 +1,172 @@
+# schedule_service.py
+# Purpose: Memoized payment schedules. A bond's full schedule is built once per
+#          ISIN + terms hash and kept as a CashflowSchedule with parsed dates, so
+#          each valuation date only slices off the remaining flows. Business-day
+#          adjusted dates are cached per (date, convention, calendar).
+
+from __future__ import annotations
+
+import hashlib
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .daycount import to_datetime, year_fraction
+
+# Optional enhanced business-day conventions
+try:
+    from .daycount_enhanced import adjust_business_day as _bdc_adjust, BusinessDayConvention as _BDC, HolidayCalendar as _Cal
+    _BDC_AVAILABLE = True
+except Exception:
+    _BDC_AVAILABLE = False
+
+__all__ = [
+    "CashflowSchedule",
+    "ScheduleService",
+    "schedule_service",
+    "schedule_key",
+    "holiday_calendar",
+    "adjusted_date",
+]
+
+
+# ---------------------------------------------------------------------------
+# Business-day adjustment (cached per calendar)
+# ---------------------------------------------------------------------------
+
+_COUNTRY_BY_CURRENCY = {"USD": "US", "EUR": "EUR", "GBP": "GB", "JPY": "JP"}
+
+
+@lru_cache(maxsize=None)
+def holiday_calendar(currency: Optional[str]):
+    """Shared HolidayCalendar for *currency* (None when the enhanced engine is missing).
+
+    One instance per currency keeps its per-year holiday sets across schedules.
+    """
+    if not _BDC_AVAILABLE:
+        return None
+    return _Cal(_COUNTRY_BY_CURRENCY.get((currency or "USD").upper(), "US"))
+
+
+def _convention(code: Optional[str]):
+    return {
+        "NONE": _BDC.NONE,
+        "UNADJUSTED": _BDC.UNADJUSTED,
+        "F": _BDC.FOLLOWING,
+        "MF": _BDC.MODIFIED_FOLLOWING,
+        "P": _BDC.PRECEDING,
+        "MP": _BDC.MODIFIED_PRECEDING,
+    }.get((code or "NONE").strip().upper(), _BDC.NONE)
+
+
+@lru_cache(maxsize=65536)
+def adjusted_date(dt: datetime, business_day_convention: Optional[str], currency: Optional[str]) -> datetime:
+    """*dt* rolled per the convention code (NONE/F/MF/P/MP) on the currency's calendar.
+
+    Returns *dt* unchanged when the enhanced calendar engine is unavailable.
+    """
+    if not _BDC_AVAILABLE:
+        return dt
+    return _bdc_adjust(dt, _convention(business_day_convention), holiday_calendar(currency))
+
+
+# ---------------------------------------------------------------------------
+# Schedules
+# ---------------------------------------------------------------------------
+
+
+class CashflowSchedule:
+    """
+    Read-only payment schedule with dates parsed once.
+
+    Iterates like the ``[{"date": ..., "amount": ...}, ...]`` list it was built
+    from (items must not be mutated), and can be passed wherever SpreadOMatic
+    takes a payment schedule. ``extract_cashflows`` slices it by valuation date
+    instead of re-parsing every row.
+    """
+
+    __slots__ = ("items", "dates", "_sorted")
+
+    def __init__(self, items: Iterable[Dict[str, Any]]):
+        self.items: Tuple[Dict[str, Any], ...] = tuple(dict(item) for item in items)
+        self.dates: Tuple[datetime, ...] = tuple(to_datetime(item["date"]) for item in self.items)
+        self._sorted = all(a <= b for a, b in zip(self.dates, self.dates[1:]))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Independent copy of the schedule as a list of dicts."""
+        return [dict(item) for item in self.items]
+
+    def remaining(self, valuation_date: datetime,
+                  last_date: Optional[datetime] = None) -> List[Tuple[datetime, Dict[str, Any]]]:
+        """(payment date, item) pairs paid after *valuation_date* (and not after *last_date*)."""
+        if not self._sorted:
+            return [
+                (dt, item) for dt, item in zip(self.dates, self.items)
+                if dt > valuation_date and not (last_date and dt > last_date)
+            ]
+        start = bisect_right(self.dates, valuation_date)
+        stop = bisect_right(self.dates, last_date) if last_date else len(self.dates)
+        return list(zip(self.dates[start:stop], self.items[start:stop]))
+
+    def flows(self, valuation_date: datetime, day_basis: str) -> Tuple[List[float], List[float]]:
+        """Times and amounts of the fixed flows after *valuation_date*."""
+        pairs = self.remaining(valuation_date)
+        return (
+            [year_fraction(valuation_date, dt, day_basis) for dt, _ in pairs],
+            [float(item["amount"]) for _, item in pairs],
+        )
+
+
+def schedule_key(isin: Optional[str], *terms: Any) -> Tuple[str, str]:
+    """Cache key of a bond schedule: (ISIN, hash of the terms it is built from)."""
+    digest = hashlib.sha1(repr(terms).encode("utf-8")).hexdigest()
+    return (str(isin or ""), digest)
+
+
+class ScheduleService:
+    """Bounded LRU of CashflowSchedules keyed by ``schedule_key``."""
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, CashflowSchedule]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, build: Callable[[], Sequence[Dict[str, Any]]]) -> CashflowSchedule:
+        """Return the schedule for *key*, calling *build* only on a miss."""
+        with self._lock:
+            schedule = self._entries.get(key)
+            if schedule is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return schedule
+        schedule = build()
+        if not isinstance(schedule, CashflowSchedule):
+            schedule = CashflowSchedule(schedule)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = schedule
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return schedule
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+schedule_service = ScheduleService()
@@ -4,21 +4,165 @@
 from __future__ import annotations
 
 import math
-from typing import List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
 
-from .discount import discount_factor, pv_cashflows, Compounding
+import numpy as np
+
+from .discount import discount_factor, pv_cashflows, pv_with_derivatives, Compounding
+from .pricing_kernel import solve_ytm_batch, z_spread_batch
 try:
     # Prefer robust Brent solver; fallback to legacy if unavailable
     from .numerical_methods import BrentMethod, NumericalConfig  # type: ignore
     _ROBUST_AVAILABLE = True
 except Exception:
     _ROBUST_AVAILABLE = False
-from .interpolation import linear_interpolate
+from .interpolation import as_prepared_curve, linear_interpolate
 
 from .cashflows import extract_cashflows
 from .daycount import to_datetime, year_fraction
 
-__all__ = ["solve_ytm", "z_spread", "g_spread", "discount_margin"]
+__all__ = [
+    "solve_ytm",
+    "z_spread",
+    "g_spread",
+    "discount_margin",
+    "SolverResult",
+    "solve_ytm_analytic",
+    "z_spread_analytic",
+]
+
+
+@dataclass
+class SolverResult:
+    """Outcome of an analytic-derivative yield/spread solve."""
+    value: float  # NaN when not converged
+    converged: bool
+    iterations: int
+    pv_evaluations: int
+    method: str
+
+
+def _safeguarded_newton(
+    fdd: Callable[[float], Tuple[float, float, float]],
+    guess: float,
+    lo: float,
+    hi: float,
+    tol: float,
+    max_iter: int,
+    halley: bool,
+) -> Tuple[float, bool, int, int]:
+    """Newton or Halley iteration on ``f`` kept inside the bracket [lo, hi].
+
+    *fdd(x)* returns (f, f', f'') from one pass over the cash flows. ``f`` is
+    assumed monotone on the bracket (PV is, in yield or spread, for
+    non-negative cash flows), so each evaluation tells which side of x the
+    root lies on and the bracket shrinks to that side. A step past a bound
+    that has not been evaluated yet moves to that bound (so a root outside
+    the bounds is detected after one extra evaluation); other steps that
+    leave the bracket are replaced by bisection.
+
+    Returns (x, converged, iterations, evaluations).
+    """
+    x = min(max(guess, lo), hi)
+    lo_seen = hi_seen = False
+    for it in range(1, max_iter + 1):
+        f, d1, d2 = fdd(x)
+        if not (math.isfinite(f) and math.isfinite(d1)) or d1 == 0.0:
+            return x, False, it, it
+        if abs(f) < tol:
+            return x, True, it, it
+
+        newton = f / d1
+        if newton > 0:
+            hi, hi_seen = x, True
+        else:
+            lo, lo_seen = x, True
+        step = newton
+        if halley and math.isfinite(d2):
+            denom = 1.0 - 0.5 * newton * d2 / d1
+            if denom > 0.1:
+                step = newton / denom
+        x_new = x - step
+        if lo < x_new < hi:
+            if abs(step) <= 1e-15 * (1.0 + abs(x)):
+                # Step below double precision: x is as close as it gets
+                return x_new, True, it, it
+        elif x_new <= lo and not lo_seen:
+            x_new, lo_seen = lo, True
+        elif x_new >= hi and not hi_seen:
+            x_new, hi_seen = hi, True
+        else:
+            if hi - lo <= 1e-15 * (1.0 + abs(x)):
+                return x, False, it, it
+            x_new = 0.5 * (lo + hi)
+        x = x_new
+    return x, False, max_iter, max_iter
+
+
+def _analytic_result(fdd, guess, bounds, tol, max_iter, method) -> SolverResult:
+    if method not in ("newton", "halley"):
+        raise ValueError(f"Unknown solver method: {method}")
+    lo, hi = bounds
+    x, ok, iterations, evals = _safeguarded_newton(
+        fdd, guess, lo, hi, tol, max_iter, halley=method == "halley"
+    )
+    return SolverResult(x if ok else math.nan, ok, iterations, evals, method)
+
+
+def solve_ytm_analytic(
+    price: float,
+    times: List[float],
+    cfs: List[float],
+    *,
+    comp: Compounding = "annual",
+    guess: float = 0.05,
+    tol: float = 1e-10,
+    max_iter: int = 50,
+    bounds: Optional[Tuple[float, float]] = None,
+    method: str = "halley",
+) -> SolverResult:
+    """YTM by safeguarded Halley (or ``method="newton"``) with closed-form dPV/dy.
+
+    Every iteration is one pass over the cash flows; the result reports the
+    iteration and PV-evaluation counts. ``value`` is NaN when no root is found
+    inside *bounds* (default -50%..200%).
+    """
+    def fdd(y: float):
+        pv, d1, d2 = pv_with_derivatives(times, cfs, y, comp)
+        return pv - price, d1, d2
+
+    return _analytic_result(fdd, guess, bounds or (-0.5, 2.0), tol, max_iter, method)
+
+
+def z_spread_analytic(
+    price: float,
+    times: List[float],
+    cfs: List[float],
+    zero_times: List[float],
+    zero_rates: List[float],
+    *,
+    comp: Compounding = "annual",
+    guess: float = 0.0,
+    tol: float = 1e-10,
+    max_iter: int = 50,
+    bounds: Optional[Tuple[float, float]] = None,
+    interp: str = "linear",
+    method: str = "halley",
+) -> SolverResult:
+    """Z-spread by safeguarded Halley (or Newton) with closed-form dPV/ds.
+
+    The zero rates at the cash-flow times are interpolated once; each
+    iteration is then one pass over the cash flows. ``value`` is NaN when no
+    root is found inside *bounds* (default -10%..50%).
+    """
+    base = as_prepared_curve(zero_times, zero_rates).rate(np.asarray(times, dtype=float), interp).tolist()
+
+    def fdd(s: float):
+        pv, d1, d2 = pv_with_derivatives(times, cfs, [r + s for r in base], comp)
+        return pv - price, d1, d2
+
+    return _analytic_result(fdd, guess, bounds or (-0.1, 0.5), tol, max_iter, method)
 
 
 def solve_ytm(
@@ -35,13 +179,26 @@ def solve_ytm(
 ) -> float:
     """Solve for YTM given *price* and cash-flows.
 
-    Uses a robust Brent bracketing solver by default. Set ``robust=False`` to
-    use the legacy damped-Newton method.
+    Uses ``solve_ytm_analytic`` (Halley, closed-form derivatives) by default,
+    then the bracket-expanding solver of ``pricing_kernel`` and Brent if that
+    finds no root. Set ``robust=False`` to use the legacy damped-Newton method.
     """
     def _npv(y: float) -> float:
         return sum(cf * discount_factor(y, t, comp) for cf, t in zip(cfs, times)) - price
 
-    # Robust path (default)
+    # Robust path (default): analytic Halley, then the batched kernel
+    if robust and len(times) > 0:
+        result = solve_ytm_analytic(
+            price, times, cfs, comp=comp, guess=guess, tol=tol, max_iter=max_iter, bounds=bounds
+        )
+        if result.converged:
+            return result.value
+        y = solve_ytm_batch(
+            [price], np.asarray(times, dtype=float)[None, :], np.asarray(cfs, dtype=float)[None, :],
+            comp=comp, guess=guess, tol=tol, max_iter=max_iter, bounds=bounds,
+        )[0]
+        if np.isfinite(y):
+            return float(y)
     if robust and _ROBUST_AVAILABLE:
         try:
             bm = BrentMethod(NumericalConfig(tolerance=tol, max_iterations=max_iter))
@@ -98,14 +255,28 @@ def z_spread(
 ) -> float:
     """Constant additive spread over the zero curve matching *price*.
 
-    Uses a robust Brent solver by default. Set ``robust=False`` to use the
-    legacy damped-Newton method.
+    Uses ``z_spread_analytic`` (Halley, closed-form derivatives) by default,
+    then the bracket-expanding solver of ``pricing_kernel`` and Brent if that
+    finds no root. Set ``robust=False`` to use the legacy damped-Newton method.
     """
     def _npv(spread: float) -> float:
         return pv_cashflows(
             times, cfs, zero_times, zero_rates, spread=spread, comp=comp, interp=interp
         ) - price
 
+    if robust and len(times) > 0:
+        result = z_spread_analytic(
+            price, times, cfs, zero_times, zero_rates,
+            comp=comp, guess=guess, bounds=bounds, interp=interp,
+        )
+        if result.converged:
+            return result.value
+        s = z_spread_batch(
+            [price], np.asarray(times, dtype=float)[None, :], np.asarray(cfs, dtype=float)[None, :],
+            zero_times, zero_rates, comp=comp, guess=guess, bounds=bounds, interp=interp,
+        )[0]
+        if np.isfinite(s):
+            return float(s)
     if robust and _ROBUST_AVAILABLE:
         try:
             bm = BrentMethod(NumericalConfig(tolerance=1e-10, max_iterations=100))
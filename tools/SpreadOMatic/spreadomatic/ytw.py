@@ -14,11 +14,7 @@ import logging
 
 from .yield_spread import solve_ytm
 from .daycount import year_fraction, to_datetime
-try:
-    from .daycount_enhanced import adjust_business_day, BusinessDayConvention, HolidayCalendar
-    _BDC_AVAILABLE = True
-except Exception:
-    _BDC_AVAILABLE = False
+from .schedule_service import adjusted_date
 
 logger = logging.getLogger(__name__)
 
@@ -277,37 +273,9 @@ def generate_cashflows_to_call(
     
     cashflows = []
 
-    # Prepare business day convention and calendar
-    bdc_enum = None
-    cal = None
-    if _BDC_AVAILABLE:
-        try:
-            bdc_map = {
-                'NONE': BusinessDayConvention.NONE,
-                'UNADJUSTED': BusinessDayConvention.UNADJUSTED,
-                'F': BusinessDayConvention.FOLLOWING,
-                'MF': BusinessDayConvention.MODIFIED_FOLLOWING,
-                'P': BusinessDayConvention.PRECEDING,
-                'MP': BusinessDayConvention.MODIFIED_PRECEDING,
-            }
-            bdc_code = (business_day_convention or 'NONE').strip().upper()
-            bdc_enum = bdc_map.get(bdc_code, BusinessDayConvention.NONE)
-        except Exception:
-            bdc_enum = BusinessDayConvention.NONE
-        try:
-            cur = (currency or 'USD').upper()
-            country = 'US'
-            if cur in {'USD'}:
-                country = 'US'
-            elif cur in {'EUR'}:
-                country = 'EUR'
-            elif cur in {'GBP'}:
-                country = 'GB'
-            elif cur in {'JPY'}:
-                country = 'JP'
-            cal = HolidayCalendar(country)
-        except Exception:
-            cal = HolidayCalendar('US')
+    # Business day adjustment, cached per (date, convention, calendar)
+    def adjust(dt: datetime) -> datetime:
+        return adjusted_date(dt, business_day_convention, currency)
     
     # Calculate coupon payment amount
     coupon_payment = principal * coupon_rate / frequency
@@ -323,18 +291,18 @@ def generate_cashflows_to_call(
     
     # Find next coupon date (then apply BDC)
     next_coupon = current_date + relativedelta(months=months_per_period)
-    next_coupon_adj = adjust_business_day(next_coupon, bdc_enum, cal) if _BDC_AVAILABLE and bdc_enum and cal else next_coupon
+    next_coupon_adj = adjust(next_coupon)
     
     # Generate coupons up to call date
     while next_coupon_adj <= call_date:
         time_years = year_fraction(settlement_date, next_coupon_adj, day_basis)
         cashflows.append((time_years, coupon_payment))
         next_coupon = next_coupon + relativedelta(months=months_per_period)
-        next_coupon_adj = adjust_business_day(next_coupon, bdc_enum, cal) if _BDC_AVAILABLE and bdc_enum and cal else next_coupon
+        next_coupon_adj = adjust(next_coupon)
     
     # Add final payment at call date (principal at call price plus any accrued interest)
     # Adjust call date per BDC
-    call_date_adj = adjust_business_day(call_date, bdc_enum, cal) if _BDC_AVAILABLE and bdc_enum and cal else call_date
+    call_date_adj = adjust(call_date)
     time_to_call = year_fraction(settlement_date, call_date_adj, day_basis)
     
     # Find the last coupon date before call and next coupon after call
@@ -347,7 +315,7 @@ def generate_cashflows_to_call(
     while temp_date < call_date_adj:
         prev_date = temp_date
         temp_date = temp_date + relativedelta(months=months_per_period)
-        temp_date_adj = adjust_business_day(temp_date, bdc_enum, cal) if _BDC_AVAILABLE and bdc_enum and cal else temp_date
+        temp_date_adj = adjust(temp_date)
         if temp_date_adj >= call_date_adj:
             last_coupon_date = prev_date
             next_coupon_after_call = temp_date_adj
@@ -355,7 +323,7 @@ def generate_cashflows_to_call(
     
     # Calculate precise accrued interest
     if last_coupon_date and next_coupon_after_call:
-        last_coupon_adj = adjust_business_day(last_coupon_date, bdc_enum, cal) if _BDC_AVAILABLE and bdc_enum and cal else last_coupon_date
+        last_coupon_adj = adjust(last_coupon_date)
         
         # Check if call is exactly on a coupon date
         if abs((call_date_adj - last_coupon_adj).days) < 2:  # Within 2 days considered same date
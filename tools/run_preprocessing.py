@@ -146,6 +146,16 @@ def main(data_dir: str | None = None, *, config_dict: dict | None = None, quiet:
     except Exception as e:
         logger.error(f"Error calculating synthetic spreads: {e}", exc_info=True)
 
+    # Emit the canonical long-format store for every sec_ file (after synth
+    # spreads, which write sec_ files too)
+    logger.info("--- Building metric stores ---")
+    try:
+        from analytics.metric_store import build_metric_stores
+        built = build_metric_stores(data_dir)
+        logger.info(f"--- Built metric stores for {len(built)} file(s) ---")
+    except Exception as e:
+        logger.error(f"Error building metric stores: {e}", exc_info=True)
+
 
 # -----------------------------------------------------------------------------
 # CLI entry-point
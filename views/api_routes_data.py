@@ -15,6 +15,8 @@ import json
 from views.api_core import api_bp, get_data_file_statuses
 from core.utils import load_fund_groups, time_api_calls  # Import the fund group loader and timing decorator
 from data_processing.data_audit import run_data_consistency_audit  # Import the audit function
+from core.io_lock import get_lock_metrics
+from core.bounded_cache import get_cache_stats
 
 
 @api_bp.route("/get_data")
@@ -257,3 +259,15 @@ def fetch_schedule_from_sql() -> Response:
     except Exception as e:
         current_app.logger.error(f"Error exporting schedule from SQL: {e}", exc_info=True)
         return jsonify({"status": "error", "message": str(e)}), 500
+
+
+@api_bp.route("/diagnostics/io_locks")
+def get_io_lock_metrics():
+    """Return per-file CSV lock wait statistics (shared reads vs exclusive writes)."""
+    return jsonify({"success": True, "locks": get_lock_metrics()})
+
+
+@api_bp.route("/diagnostics/caches")
+def get_cache_metrics():
+    """Return hit/miss/eviction counters and memory use of the in-process data caches."""
+    return jsonify({"success": True, "caches": get_cache_stats()})
@@ -0,0 +1,257 @@
+# Purpose: Streaming reader for large att_factors_<FUNDCODE>.csv files (~100MB).
+# Pages that cannot use AttributionCache (radar, security, timeseries) read only
+# the columns they need, in fixed-size chunks with fixed dtypes, and keep just the
+# rows matching their date/fund/ISIN filters (or only running column sums), so
+# memory stays flat regardless of file size. Chunk size: SDC_ATTRIBUTION_CHUNKSIZE.
+
+import os
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from core.column_roles import read_header
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNKSIZE: int = int(os.getenv("SDC_ATTRIBUTION_CHUNKSIZE", "50000"))
+
+# Identifier columns read as text; Date is parsed per chunk
+ID_COLUMNS = ["Date", "Fund", "ISIN"]
+
+
+def attribution_header(file_path: str) -> List[str]:
+    """Return the stripped header of an attribution file (empty list if unreadable)."""
+    header = read_header(file_path)
+    return [col.strip() for col in header] if header else []
+
+
+def select_columns(
+    header: Sequence[str],
+    names: Iterable[str] = (),
+    prefixes: Iterable[str] = (),
+) -> List[str]:
+    """Return header columns that are in *names* or start with one of *prefixes*.
+
+    Header order is preserved; names missing from the file are skipped.
+    """
+    wanted = set(names)
+    prefixes = tuple(prefixes)
+    return [
+        col for col in header
+        if col in wanted or (prefixes and col.startswith(prefixes))
+    ]
+
+
+def _chunk_reader(
+    file_path: str,
+    columns: Optional[Sequence[str]],
+    numeric_columns: Sequence[str],
+    chunksize: int,
+    typed: bool,
+):
+    """Open a chunked reader projecting *columns* (stripped names) by position."""
+    raw_header = read_header(file_path) or []
+    stripped = [col.strip() for col in raw_header]
+    if columns is None:
+        positions = list(range(len(stripped)))
+    else:
+        wanted = set(columns)
+        positions = [i for i, col in enumerate(stripped) if col in wanted]
+    names = [stripped[i] for i in positions]
+
+    dtype: Dict[int, Any] = {}
+    for i, name in zip(positions, names):
+        if name in ("Fund", "ISIN", "Date"):
+            dtype[i] = str
+        elif typed and name in numeric_columns:
+            dtype[i] = np.float64
+    reader = pd.read_csv(
+        file_path,
+        usecols=positions,
+        dtype=dtype,
+        chunksize=chunksize,
+    )
+    return reader, names
+
+
+def iter_attribution_chunks(
+    file_path: str,
+    columns: Optional[Sequence[str]] = None,
+    numeric_columns: Sequence[str] = (),
+    start: Optional[pd.Timestamp] = None,
+    end: Optional[pd.Timestamp] = None,
+    funds: Optional[Iterable[str]] = None,
+    isins: Optional[Iterable[str]] = None,
+    required: Sequence[str] = ("Date",),
+    chunksize: Optional[int] = None,
+    typed: bool = True,
+) -> Iterator[pd.DataFrame]:
+    """Yield filtered chunks of an attribution file.
+
+    Args:
+        columns: Stripped column names to read (all columns when None).
+        numeric_columns: Columns read as float64 (others are inferred).
+        start, end: Inclusive Date bounds; a NaT bound matches nothing.
+        funds, isins: Keep only rows whose Fund/ISIN is in these collections.
+        required: Rows with a missing value in any of these columns are dropped.
+        typed: When False, numeric columns are inferred and coerced instead;
+            used as a fallback for files with non-numeric values.
+
+    Chunks keep the file's row order and carry a parsed ``Date`` column.
+    """
+    reader, names = _chunk_reader(
+        file_path, columns, numeric_columns, chunksize or DEFAULT_CHUNKSIZE, typed
+    )
+    fund_set = set(funds) if funds is not None else None
+    isin_set = set(isins) if isins is not None else None
+    with reader:
+        for chunk in reader:
+            chunk.columns = names
+            if not typed:
+                for col in numeric_columns:
+                    if col in chunk.columns:
+                        chunk[col] = pd.to_numeric(chunk[col], errors="coerce")
+            if "Date" in chunk.columns:
+                chunk["Date"] = pd.to_datetime(chunk["Date"], errors="coerce")
+            mask = chunk[[c for c in required if c in chunk.columns]].notna().all(axis=1)
+            if start is not None:
+                mask &= chunk["Date"] >= start
+            if end is not None:
+                mask &= chunk["Date"] <= end
+            if fund_set is not None:
+                mask &= chunk["Fund"].isin(fund_set)
+            if isin_set is not None:
+                mask &= chunk["ISIN"].isin(isin_set)
+            if mask.all():
+                yield chunk
+            elif mask.any():
+                yield chunk[mask]
+
+
+def _with_untyped_fallback(func, file_path: str, **kwargs):
+    """Run *func* with fixed float dtypes, retrying inferred+coerced on bad values."""
+    try:
+        return func(file_path, typed=True, **kwargs)
+    except (ValueError, TypeError) as e:
+        logger.warning(
+            f"Non-numeric values in {file_path}; re-reading with inferred dtypes: {e}"
+        )
+        return func(file_path, typed=False, **kwargs)
+
+
+def _read(file_path: str, typed: bool, columns=None, numeric_columns=(), **filters) -> pd.DataFrame:
+    chunks = list(
+        iter_attribution_chunks(
+            file_path, columns, numeric_columns, typed=typed, **filters
+        )
+    )
+    if chunks:
+        return pd.concat(chunks, ignore_index=True)
+    _, names = _chunk_reader(file_path, columns, numeric_columns, 1, typed)
+    empty = pd.DataFrame(columns=names)
+    if "Date" in empty.columns:
+        empty["Date"] = pd.to_datetime(empty["Date"])
+    return empty
+
+
+def read_attribution(
+    file_path: str,
+    columns: Optional[Sequence[str]] = None,
+    numeric_columns: Sequence[str] = (),
+    **filters,
+) -> pd.DataFrame:
+    """Return only the rows and columns of an attribution file that match *filters*.
+
+    Accepts the filter arguments of iter_attribution_chunks. Memory use is
+    bounded by the matching rows plus one chunk.
+    """
+    return _with_untyped_fallback(
+        _read, file_path, columns=columns, numeric_columns=numeric_columns, **filters
+    )
+
+
+def scan_date_range(file_path: str, required: Sequence[str] = ("Date",)):
+    """Return (min_date, max_date) over rows with all *required* values (NaT if none)."""
+    min_date = max_date = pd.NaT
+    columns = list(dict.fromkeys(["Date", *required]))
+    for chunk in iter_attribution_chunks(file_path, columns, required=required):
+        lo, hi = chunk["Date"].min(), chunk["Date"].max()
+        min_date = lo if pd.isna(min_date) else min(min_date, lo)
+        max_date = hi if pd.isna(max_date) else max(max_date, hi)
+    return min_date, max_date
+
+
+def _sum(file_path: str, typed: bool, value_columns=(), start=None, end=None,
+         isins=None, required=("Date",), chunksize=None) -> Dict[str, Any]:
+    value_columns = list(value_columns)
+    columns = list(dict.fromkeys([*required, "Date", "ISIN", *value_columns]))
+    sums = pd.Series(0.0, index=value_columns)
+    rows = 0
+    min_date = max_date = pd.NaT
+    seen_isins: set = set()
+    isin_set = set(isins) if isins is not None else None
+    for chunk in iter_attribution_chunks(
+        file_path, columns, value_columns, required=required,
+        chunksize=chunksize, typed=typed,
+    ):
+        lo, hi = chunk["Date"].min(), chunk["Date"].max()
+        min_date = lo if pd.isna(min_date) else min(min_date, lo)
+        max_date = hi if pd.isna(max_date) else max(max_date, hi)
+        if "ISIN" in chunk.columns:
+            seen_isins.update(chunk["ISIN"].dropna().unique())
+        mask = pd.Series(True, index=chunk.index)
+        if start is not None:
+            mask &= chunk["Date"] >= start
+        if end is not None:
+            mask &= chunk["Date"] <= end
+        if isin_set is not None:
+            mask &= chunk["ISIN"].isin(isin_set)
+        if mask.any():
+            selected = chunk.loc[mask, value_columns]
+            sums = sums.add(selected.sum(), fill_value=0.0)
+            rows += int(mask.sum())
+    return {
+        "sums": sums,
+        "rows": rows,
+        "min_date": min_date,
+        "max_date": max_date,
+        "isins": seen_isins,
+    }
+
+
+def sum_attribution_columns(
+    file_path: str,
+    value_columns: Sequence[str],
+    start: Optional[pd.Timestamp] = None,
+    end: Optional[pd.Timestamp] = None,
+    isins: Optional[Iterable[str]] = None,
+    required: Sequence[str] = ("Date",),
+    chunksize: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Stream an attribution file and sum *value_columns* over the filtered rows.
+
+    Only running sums are kept, so memory does not grow with the file. The date
+    range and ISIN set are collected over all rows with the *required* values,
+    before the start/end/ISIN filters are applied.
+
+    Returns:
+        Dict with ``sums`` (Series indexed by value column), ``rows`` (rows
+        summed), ``min_date``, ``max_date`` and ``isins`` (set of ISINs seen).
+    """
+    return _with_untyped_fallback(
+        _sum, file_path, value_columns=value_columns, start=start, end=end,
+        isins=isins, required=required, chunksize=chunksize,
+    )
+
+
+__all__ = [
+    "DEFAULT_CHUNKSIZE",
+    "attribution_header",
+    "select_columns",
+    "iter_attribution_chunks",
+    "read_attribution",
+    "scan_date_range",
+    "sum_attribution_columns",
+]
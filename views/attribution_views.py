@@ -10,6 +10,7 @@
 # - Supports filtering by fund, date, characteristic, and more
 # - Used by Flask Blueprint 'attribution_bp'
 # - Uses caching system for improved performance with large files
+# - Radar, security and timeseries pages stream att_factors files (attribution_reader)
 #
 # Each endpoint is heavily commented for clarity. See function docstrings for details.
 
@@ -36,8 +37,16 @@ from .attribution_processing import (
 import typing
 from typing import Any, Dict, List, Optional
 from core import config
+from core.data_catalog import load_table
 from .security_helpers import load_filter_and_extract
 from .attribution_cache import AttributionCache
+from .attribution_reader import (
+    attribution_header,
+    read_attribution,
+    scan_date_range,
+    select_columns,
+    sum_attribution_columns,
+)
 
 attribution_bp = Blueprint("attribution_bp", __name__, url_prefix="/attribution")
 
@@ -169,7 +178,7 @@ def attribution_summary() -> Response:
 
     # --- Load reference.csv and extract static characteristics ---
     ref_path = os.path.join(data_folder, "reference.csv")
-    ref_df = pd.read_csv(ref_path)
+    ref_df = load_table(ref_path)
     ref_df.columns = ref_df.columns.str.strip()
     # Filter available static columns to user-approved list
     static_cols_raw = [
@@ -596,7 +605,7 @@ def attribution_charts() -> Response:
 
     # --- Load reference.csv and extract static characteristics ---
     ref_path = os.path.join(data_folder, "reference.csv")
-    ref_df = pd.read_csv(ref_path)
+    ref_df = load_table(ref_path)
     ref_df.columns = ref_df.columns.str.strip()
     static_cols_raw = [
         col for col in ref_df.columns if col not in ["ISIN"] and not _is_date_like(col)
@@ -726,15 +735,9 @@ def attribution_radar() -> Response:
             no_data_message="No attribution available.",
         )
 
-    # Load data
-    df = pd.read_csv(file_path)
-    df.columns = df.columns.str.strip()
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-    df = df.dropna(subset=["Date", "Fund"])
-
     # --- Load reference.csv and extract static characteristics ---
     ref_path = os.path.join(data_folder, "reference.csv")
-    ref_df = pd.read_csv(ref_path)
+    ref_df = load_table(ref_path)
     ref_df.columns = ref_df.columns.str.strip()
     static_cols_raw = [
         col for col in ref_df.columns if col not in ["ISIN"] and not _is_date_like(col)
@@ -755,18 +758,45 @@ def attribution_radar() -> Response:
         "characteristic_value", default="", type=str
     )
 
-    # Join att_factors with w_secs static info
-    df = df.merge(ref_static, on="ISIN", how="left")
-
-    # Get date range for UI
-    min_date = df["Date"].min()
-    max_date = df["Date"].max()
-
     # Get filter parameters from query string
     start_date_str = request.args.get("start_date", default=None, type=str)
     end_date_str = request.args.get("end_date", default=None, type=str)
     selected_level = request.args.get("level", default="L2", type=str)  # Default to L2
 
+    # Use L1 and L2 groupings from config
+    l1_groups = config.ATTRIBUTION_L1_GROUPS
+    l2_all = sum(config.ATTRIBUTION_L2_GROUPS.values(), [])
+
+    # Stream the file, keeping only running sums of the factor columns. The
+    # characteristic filter becomes an ISIN filter via the reference data.
+    radar_prefixes = [
+        ATTR_COLS['prefixes'][key] for key in ("bench", "prod", "sp_bench", "sp_prod")
+    ]
+    value_columns = select_columns(
+        attribution_header(file_path),
+        names=[ATTR_COLS['prefixes']['l0_bench'], ATTR_COLS['prefixes']['l0_prod']]
+        + [f"{pfx} {l2}" for pfx in radar_prefixes for l2 in l2_all],
+    )
+    characteristic_isins = None
+    if selected_characteristic and selected_characteristic_value:
+        characteristic_isins = ref_static.loc[
+            ref_static[selected_characteristic] == selected_characteristic_value, "ISIN"
+        ]
+    aggregated = sum_attribution_columns(
+        file_path,
+        value_columns,
+        start=pd.to_datetime(start_date_str, errors="coerce") if start_date_str else None,
+        end=pd.to_datetime(end_date_str, errors="coerce") if end_date_str else None,
+        isins=characteristic_isins,
+        required=("Date", "Fund"),
+    )
+    # One-row frame of column totals; the *_block helpers sum it like the full data
+    df = aggregated["sums"].to_frame().T
+
+    # Get date range for UI
+    min_date = aggregated["min_date"]
+    max_date = aggregated["max_date"]
+
     # Parse date range
     start_date = (
         pd.to_datetime(start_date_str, errors="coerce") if start_date_str else min_date
@@ -775,25 +805,15 @@ def attribution_radar() -> Response:
         pd.to_datetime(end_date_str, errors="coerce") if end_date_str else max_date
     )
 
-    # Compute available values for the selected characteristic
+    # Compute available values for the selected characteristic (ISINs present in the file)
     if selected_characteristic:
+        present = ref_static[ref_static["ISIN"].isin(aggregated["isins"])]
         available_characteristic_values = sorted(
-            df[selected_characteristic].dropna().unique()
+            present[selected_characteristic].dropna().unique()
         )
     else:
         available_characteristic_values = []
 
-    # Filter by characteristic value if set
-    if selected_characteristic and selected_characteristic_value:
-        df = df[df[selected_characteristic] == selected_characteristic_value]
-
-    # Filter by date range
-    df = df[(df["Date"] >= start_date) & (df["Date"] <= end_date)]
-
-    # Use L1 and L2 groupings from config
-    l1_groups = config.ATTRIBUTION_L1_GROUPS
-    l2_all = sum(config.ATTRIBUTION_L2_GROUPS.values(), [])
-
     # --- Aggregation for Radar Chart ---
     # sum_l2s_block, sum_l1s_block, and compute_residual_block are now imported from attribution_processing
 
@@ -927,13 +947,11 @@ def attribution_security_page() -> Response:
             no_data_message="No attribution available.",
         )
 
-    # Load data
-    df = pd.read_csv(file_path)
-    df.columns = df.columns.str.strip()
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-    df = df.dropna(subset=["Date", "Fund", "ISIN"])
+    # Only the date range is needed up front; rows are streamed once the
+    # selected fund and date window are known
+    min_date, max_date = scan_date_range(file_path, required=("Date", "Fund", "ISIN"))
     ref_path = os.path.join(data_folder, "reference.csv")
-    ref_df = pd.read_csv(ref_path)
+    ref_df = load_table(ref_path)
     ref_df.columns = ref_df.columns.str.strip()
     static_cols_raw = [
         col for col in ref_df.columns if col not in ["ISIN"] and not _is_date_like(col)
@@ -958,7 +976,6 @@ def attribution_security_page() -> Response:
 
     # --- UI Controls ---
     # Date picker: default to previous business day
-    max_date = df["Date"].max()
     prev_bday = max_date if max_date is not pd.NaT else pd.Timestamp.today()
     prev_bday = prev_bday if prev_bday.weekday() < 5 else prev_bday - BDay(1)
     selected_date_str = request.args.get(
@@ -986,6 +1003,29 @@ def attribution_security_page() -> Response:
     page = request.args.get("page", 1, type=int)
     per_page = 50
 
+    # --- Load only the selected fund and date window ---
+    if mtd and selected_date is pd.NaT:
+        selected_date = max_date
+    window_start = selected_date.replace(day=1) if mtd and selected_date is not pd.NaT else selected_date
+    security_prefixes = tuple(
+        f"{ATTR_COLS['prefixes'][key]} " for key in ("bench", "prod", "sp_bench", "sp_prod")
+    )
+    header = attribution_header(file_path)
+    value_columns = select_columns(
+        header, names=[l0_bench, l0_prod], prefixes=security_prefixes
+    )
+    df = read_attribution(
+        file_path,
+        columns=select_columns(
+            header, names=["Date", "Fund", "ISIN", "Bench Weight", "Port Exp Wgt"] + value_columns
+        ),
+        numeric_columns=value_columns,
+        start=window_start,
+        end=selected_date,
+        funds=[selected_fund],
+        required=("Date", "Fund", "ISIN"),
+    )
+
     # --- Filter and Join Data ---
     df = df[df["Fund"] == selected_fund]
     if selected_type:
@@ -1245,9 +1285,21 @@ def security_attribution_timeseries():
             link_security_details=None,
         )
 
-    df = pd.read_csv(att_path)
-    df.columns = df.columns.str.strip()
-    df = df[df["ISIN"] == isin]
+    # Stream the file keeping only this ISIN's rows and the factor columns
+    header = attribution_header(att_path)
+    value_columns = select_columns(
+        header,
+        names=[ATTR_COLS['prefixes']['l0_bench'], ATTR_COLS['prefixes']['l0_prod']],
+        prefixes=("L1 Bench ", "L2 Bench ")
+        + tuple(f"{ATTR_COLS['prefixes'][key]} " for key in ("bench", "prod", "sp_bench", "sp_prod")),
+    )
+    df = read_attribution(
+        att_path,
+        columns=select_columns(header, names=["Date", "ISIN"] + value_columns),
+        numeric_columns=value_columns,
+        isins=[isin],
+        required=("ISIN",),
+    )
     if df.empty:
         return render_template(
             "attribution_security_timeseries.html",
@@ -1265,8 +1317,7 @@ def security_attribution_timeseries():
             link_security_details=None,
         )
 
-    # Ensure Date is datetime and sort
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+    # Date is already parsed by the reader; drop unparseable dates and sort
     df = df.dropna(subset=["Date"]).sort_values("Date")
 
     # -----------------------------
@@ -22,6 +22,7 @@ import os
 import sys
 
 import pandas as pd
+from core.data_catalog import load_table
 from flask import Blueprint, current_app, jsonify, render_template, request, send_file
 
 # --- Make tools/SpreadOMatic importable ---
@@ -461,7 +462,7 @@ def api_calculate_bond() -> Any:
                 if currency == str(payload.get("currency", "USD")):  # If not updated from sec_Price
                     ref_path = _os.path.join(data_folder, "reference.csv")
                     if _os.path.exists(ref_path):
-                        ref_df = pd.read_csv(ref_path)
+                        ref_df = load_table(ref_path)
                         # Find currency column
                         currency_col = None
                         for col in ref_df.columns:
@@ -686,7 +687,7 @@ def api_lookup_bond() -> Any:
         try:
             ref_path = os.path.join(data_folder, "reference.csv")
             if os.path.exists(ref_path):
-                ref_df = pd.read_csv(ref_path, dtype=str, encoding_errors="replace", on_bad_lines="skip")
+                ref_df = load_table(ref_path, dtype=str, encoding_errors="replace", on_bad_lines="skip")
                 # Normalize columns
                 cols = {c.lower(): c for c in ref_df.columns}
                 isin_col = cols.get("isin")
@@ -987,7 +988,7 @@ def api_create_excel() -> Any:
             try:
                 ref_path = _os.path.join(data_folder, "reference.csv")
                 if _os.path.exists(ref_path):
-                    ref_df = pd.read_csv(ref_path)
+                    ref_df = load_table(ref_path)
                     # Find currency column
                     currency_col = None
                     for col in ref_df.columns:
@@ -1094,7 +1095,7 @@ def _load_available_securities_for_debug() -> List[Dict[str, Any]]:
         if not _os.path.exists(reference_path):
             return []
         
-        df = pd.read_csv(reference_path, encoding_errors="replace", on_bad_lines="skip")
+        df = load_table(reference_path, encoding_errors="replace", on_bad_lines="skip")
         
         # Filter for relevant columns
         required_cols = ["ISIN", "Security Name"]
@@ -1442,7 +1443,7 @@ def api_debug_load_security() -> Any:
                 data_folder = _get_data_folder()
                 ref_path = _os.path.join(data_folder, "reference.csv")
                 if _os.path.exists(ref_path):
-                    ref_df = pd.read_csv(ref_path)
+                    ref_df = load_table(ref_path)
                     row = ref_df[ref_df["ISIN"] == isin]
                     if not row.empty:
                         bond_data = {"reference": row.iloc[0].to_dict()}
@@ -2347,7 +2348,7 @@ def api_debug_curve_analysis() -> Any:
                 data_folder = _get_data_folder()
                 ref_path = _os.path.join(data_folder, "reference.csv")
                 if _os.path.exists(ref_path):
-                    ref_df = pd.read_csv(ref_path)
+                    ref_df = load_table(ref_path)
                     row = ref_df[ref_df["ISIN"] == isin]
                     if not row.empty:
                         bond_data = {"reference": row.iloc[0].to_dict()}
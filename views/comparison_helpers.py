@@ -12,6 +12,7 @@ import os
 from core import config
 
 from core.utils import load_weights_and_held_status, parse_fund_list
+from core.data_catalog import load_table
 from analytics.security_processing import load_and_process_security_data
 
 
@@ -312,7 +313,7 @@ def get_holdings_for_security(security_id, chart_dates, data_folder):
         if not os.path.exists(holdings_file):
             log.warning(f"Holdings file not found: {holdings_file}")
             return holdings_data, chart_dates, "Holdings file (w_secs.csv) not found."
-        df_holdings = pd.read_csv(holdings_file, low_memory=False)
+        df_holdings = load_table(holdings_file, low_memory=False)
         log.info(f"Loaded w_secs.csv with columns: {df_holdings.columns.tolist()}")
         id_col_holding = config.ISIN_COL
         fund_col_holding = config.FUNDS_COL
@@ -16,6 +16,8 @@ from data_processing.curve_processing import (
     get_latest_curve_date,
 )
 from core.config import COLOR_PALETTE
+from core.columnar_cache import read_csv_cached
+from core.data_catalog import load_table
 
 curve_bp = Blueprint("curve_bp", __name__, template_folder="../templates")
 
@@ -371,10 +373,10 @@ def govt_yield_curve():
         reference_path = os.path.join(data_folder, "reference.csv")
         
         # Read the data files
-        sec_ytm_df = pd.read_csv(sec_ytm_path)
-        sec_ytmsp_df = pd.read_csv(sec_ytmsp_path)
-        curves_df = pd.read_csv(curves_path)
-        reference_df = pd.read_csv(reference_path)
+        sec_ytm_df = read_csv_cached(sec_ytm_path)
+        sec_ytmsp_df = read_csv_cached(sec_ytmsp_path)
+        curves_df = load_table(curves_path)
+        reference_df = load_table(reference_path)
         
         # ---------------------------------------------------------------
         # Derive available dates using the same canonicalisation logic as
@@ -499,10 +501,10 @@ def api_govt_yield_curve_data():
         curves_path = os.path.join(data_folder, "curves.csv")
         reference_path = os.path.join(data_folder, "reference.csv")
         
-        sec_ytm_df = pd.read_csv(sec_ytm_path)
-        sec_ytmsp_df = pd.read_csv(sec_ytmsp_path)
-        curves_df = pd.read_csv(curves_path)
-        reference_df = pd.read_csv(reference_path)
+        sec_ytm_df = read_csv_cached(sec_ytm_path)
+        sec_ytmsp_df = read_csv_cached(sec_ytmsp_path)
+        curves_df = load_table(curves_path)
+        reference_df = load_table(reference_path)
         
         # ------------------------------------------------------------------
         # Canonicalise date columns – handle both YYYY-MM-DD and DD/MM/YYYY.
@@ -8,6 +8,7 @@
 
 import os
 import pandas as pd
+from core.data_catalog import load_table
 from flask import Blueprint, render_template, request, redirect, url_for, current_app
 from datetime import datetime
 import logging
@@ -43,7 +44,7 @@ def load_exclusions(data_folder_path: str):
     exclusions_path = os.path.join(data_folder_path, EXCLUSIONS_FILE)
     try:
         if os.path.exists(exclusions_path) and os.path.getsize(exclusions_path) > 0:
-            df = pd.read_csv(
+            df = load_table(
                 exclusions_path, parse_dates=["AddDate", "EndDate"], dayfirst=False
             )  # Specify date format if needed
             # Ensure correct types after loading
@@ -94,7 +95,7 @@ def load_available_securities(data_folder_path: str):
                 "Security Sub Type",
                 "Country Of Risk",
             ]
-            df = pd.read_csv(
+            df = load_table(
                 reference_file_path,
                 usecols=usecols,
                 encoding_errors="replace",
@@ -131,7 +132,7 @@ def load_users(data_folder_path: str):
     users_file_path = os.path.join(data_folder_path, "users.csv")
     try:
         if os.path.exists(users_file_path):
-            df = pd.read_csv(users_file_path)
+            df = load_table(users_file_path)
             if "Name" in df.columns:
                 users = df["Name"].dropna().astype(str).tolist()
                 return users
@@ -253,7 +254,7 @@ def remove_exclusion(
             )
             return False, "Exclusion file is empty or missing."
 
-        df = pd.read_csv(exclusions_path)
+        df = load_table(exclusions_path)
 
         # Ensure columns used for matching are strings
         df["SecurityID"] = df["SecurityID"].astype(str)
@@ -372,7 +373,7 @@ def update_exclusion_end_date(
         return False, "Exclusions file not found."
 
     try:
-        df = pd.read_csv(exclusions_path)
+        df = load_table(exclusions_path)
         mask = (df["SecurityID"].astype(str) == str(security_id)) & (
             df["AddDate"].astype(str) == str(add_date_str)
         )
@@ -411,7 +412,7 @@ def update_exclusion_entry(
         return False, "Exclusions file not found."
 
     try:
-        df = pd.read_csv(exclusions_path)
+        df = load_table(exclusions_path)
         mask = (df["SecurityID"].astype(str) == str(security_id)) & (
             df["AddDate"].astype(str) == str(add_date_str)
         )
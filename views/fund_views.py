@@ -17,6 +17,9 @@ from core.utils import _is_date_like, parse_fund_list, filter_business_dates  #
 
 # Updated import to include data loader
 from core.data_loader import load_and_process_data
+from core.columnar_cache import read_csv_cached
+from core.column_roles import read_header
+from core.data_catalog import load_table
 from analytics.security_processing import (
     load_and_process_security_data,
     calculate_security_latest_metrics,
@@ -52,9 +55,11 @@ def fund_duration_details(fund_code):
         return f"Error: Data file '{duration_filename}' not found.", 404
 
     try:
-        # 1. Load the duration data (only header first for column identification)
-        header_df = pd.read_csv(data_filepath, nrows=0, encoding="utf-8")
-        all_cols = [col.strip() for col in header_df.columns.tolist()]
+        # 1. Identify columns from the header (cached by file stamp, no extra read)
+        raw_cols = read_header(data_filepath, encoding="utf-8")
+        if raw_cols is None:
+            return f"Error: Could not read header of '{duration_filename}'.", 500
+        all_cols = [col.strip() for col in raw_cols]
 
         # Define ID column (specific to this file/route)
         id_col_name = config.ISIN_COL
@@ -94,10 +99,6 @@ def fund_duration_details(fund_code):
                 500,
             )
 
-        # Now read the full data
-        df = pd.read_csv(data_filepath, encoding="utf-8")
-        df.columns = df.columns.str.strip()  # Strip again after full read
-
         # Ensure the Funds column exists (still needed for filtering)
         funds_col = (
             config.FUNDS_COL
@@ -140,6 +141,16 @@ def fund_duration_details(fund_code):
             f"Using dates for change calculation: {second_last_date_col} and {last_date_col}"
         )
 
+        # Now read the data once, limited to the ID, static and two latest date columns
+        needed_cols = {id_col_name, config.SEC_NAME_COL, second_last_date_col, last_date_col}
+        needed_cols.update(static_cols)
+        df = read_csv_cached(
+            data_filepath,
+            encoding="utf-8",
+            usecols=[i for i, col in enumerate(all_cols) if col in needed_cols],
+        )
+        df.columns = df.columns.str.strip()  # Strip again after full read
+
         # Ensure the relevant date columns are numeric for calculation
         df[last_date_col] = pd.to_numeric(df[last_date_col], errors="coerce")
         df[second_last_date_col] = pd.to_numeric(
@@ -167,7 +178,7 @@ def fund_duration_details(fund_code):
         else:
             try:
                 current_app.logger.info(f"Loading weight file: {weights_filename}")
-                weights_df = pd.read_csv(weights_filepath, encoding="utf-8")
+                weights_df = load_table(weights_filepath, encoding="utf-8")
                 weights_df.columns = weights_df.columns.str.strip()
 
                 # Define expected columns in weights file
@@ -848,9 +859,11 @@ def fund_metric_details(metric_name, fund_code):
     if not os.path.exists(data_filepath):
         return f"Error: Data file '{sec_file}' not found.", 404
 
-    # Load header to get columns
-    header_df = pd.read_csv(data_filepath, nrows=0, encoding="utf-8")
-    all_cols = [col.strip() for col in header_df.columns.tolist()]
+    # Get columns from the (stamp-cached) header
+    raw_cols = read_header(data_filepath, encoding="utf-8")
+    if raw_cols is None:
+        return f"Error: Could not read header of '{sec_file}'.", 500
+    all_cols = [col.strip() for col in raw_cols]
     id_col_name = config.ISIN_COL
     if id_col_name not in all_cols:
         return f"Error: Required ID column '{id_col_name}' not found in '{sec_file}'.", 500
@@ -882,8 +895,14 @@ def fund_metric_details(metric_name, fund_code):
         if idx > 0:
             prev_date = date_cols_sorted[idx - 1]
 
-    # Load full data
-    df = pd.read_csv(data_filepath, encoding="utf-8")
+    # Load only the ID, static and displayed date columns
+    needed_cols = {id_col_name, config.SEC_NAME_COL, prev_date, selected_date}
+    needed_cols.update(static_cols)
+    df = read_csv_cached(
+        data_filepath,
+        encoding="utf-8",
+        usecols=[i for i, col in enumerate(all_cols) if col in needed_cols],
+    )
     df.columns = df.columns.str.strip()
     funds_col = config.FUNDS_COL
     if funds_col not in static_cols:
@@ -11,6 +11,7 @@ from typing import Optional, List, Tuple, Dict
 from flask import current_app, url_for, request
 from urllib.parse import urlencode
 from core import config
+from core.data_catalog import load_table
 
 # Import shared utilities and processing functions
 from core.utils import (
@@ -255,7 +256,7 @@ def get_holdings_for_security(security_id, chart_dates, data_folder):
 
         # Load the holdings file - assuming ISIN is the first column
         # We need to be careful with date parsing here, as headers might be strings
-        df_holdings = pd.read_csv(holdings_file, low_memory=False)
+        df_holdings = load_table(holdings_file, low_memory=False)
         log.info(f"Loaded w_secs.csv with columns: {df_holdings.columns.tolist()}")
 
         # Identify potential date columns (heuristic: check format like DD/MM/YYYY or YYYY-MM-DD)
@@ -15,6 +15,7 @@ import pandas as pd
 from datetime import datetime
 import os  # Added to check for users.csv
 from core.config import DATA_SOURCES, JIRA_BASE_URL  # Import from config.py
+from core.data_catalog import load_table
 from analytics.issue_processing import get_issue_by_id, add_comment_to_issue
 from typing import List
 import re  # Added for regex pattern matching
@@ -66,7 +67,7 @@ def load_users() -> List[str]:
     users_file = os.path.join(data_folder, "users.csv") # Use data_folder
     if os.path.exists(users_file):
         try:
-            users_df = pd.read_csv(users_file)
+            users_df = load_table(users_file)
             # Assuming the column name is 'Name'
             if "Name" in users_df.columns:
                 return users_df["Name"].dropna().tolist()
@@ -14,6 +14,8 @@ import pandas as pd
 from flask import Blueprint, current_app, render_template, request, jsonify
 import logging
 
+from core.columnar_cache import read_csv_cached
+
 krd_bp = Blueprint("krd_bp", __name__, template_folder="../templates")
 
 logger = logging.getLogger(__name__)
@@ -67,7 +69,7 @@ def load_krd_vs_duration(data_folder: str, *, sp: bool = False, tol: float = 1.0
         if not os.path.exists(sec_dur_path):
             raise FileNotFoundError(f"Security duration file not found in {data_folder}")
 
-    sec_dur_df = pd.read_csv(sec_dur_path)
+    sec_dur_df = read_csv_cached(sec_dur_path)
     logger.info(f"Loaded Security Duration file: {sec_dur_file} with shape {sec_dur_df.shape}")
     
     # Identify date columns in sec_duration.csv (exclude metadata columns)
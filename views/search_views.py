@@ -5,6 +5,7 @@ Provides API endpoints for autocomplete search of securities from reference.csv.
 
 import os
 import pandas as pd
+from core.data_catalog import load_table
 from flask import Blueprint, request, jsonify, current_app
 import logging
 
@@ -25,7 +26,7 @@ def load_securities_for_search(data_folder_path: str):
         if os.path.exists(reference_file_path):
             # Load only the columns we need for search
             columns_to_load = ["ISIN", "Security Name", "Position Currency", "Ticker", "Security Sub Type"]
-            df = pd.read_csv(
+            df = load_table(
                 reference_file_path,
                 usecols=columns_to_load,
                 dtype=str,
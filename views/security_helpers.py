@@ -24,6 +24,7 @@ from flask import current_app
 
 from core import config
 from analytics.security_processing import load_and_process_security_data
+from analytics.metric_store import get_security_variants
 from core.utils import load_fund_groups, parse_fund_list
 from views.exclusion_views import load_exclusions
 
@@ -260,7 +261,17 @@ def load_filter_and_extract(
         return None, set(), {}
 
     try:
-        df_long, static_cols = load_and_process_security_data(filename, data_folder)
+        # Indexed lookup in the preprocessed metric store when one is current:
+        # only this ISIN and its hyphenated variants are materialised
+        indexed = (
+            get_security_variants(data_folder, filename, security_id_to_filter)
+            if id_column_name == config.ISIN_COL
+            else None
+        )
+        if indexed is not None:
+            df_long, static_cols = indexed
+        else:
+            df_long, static_cols = load_and_process_security_data(filename, data_folder)
         if df_long is None or df_long.empty:
             current_app.logger.warning("No data loaded from %s", filename)
             return None, set(), {}
@@ -50,6 +50,7 @@ from core.utils import load_fund_groups, parse_fund_list, load_weights_and_held_
 # Import get_holdings_for_security for fund holdings tile
 from views.comparison_helpers import get_holdings_for_security
 from core.utils import filter_business_dates
+from core.data_catalog import load_table
 
 # Import get_active_exclusions, apply_security_filters, apply_security_sorting, paginate_security_data, load_filter_and_extract from security_helpers
 from views.security_helpers import (
@@ -229,7 +230,7 @@ def securities_page(metric_name: str = "Spread"):
             w_secs_path = os.path.join(data_folder, config.W_SECS_FILENAME)
             if os.path.exists(w_secs_path):
                 try:
-                    df_w_secs = pd.read_csv(w_secs_path, low_memory=False)
+                    df_w_secs = load_table(w_secs_path, low_memory=False)
                     # Ensure 'Fund Code' or similar exists. Assuming config.CODE_COL refers to fund code in w_secs
                     fund_col_in_w_secs = config.CODE_COL 
                     if fund_col_in_w_secs not in df_w_secs.columns:
@@ -414,7 +415,7 @@ def security_details(metric_name, security_id):
             w_secs_path = os.path.join(current_app.config["DATA_FOLDER"], "w_secs.csv")
             if os.path.exists(w_secs_path):
                 try:
-                    w_df = pd.read_csv(w_secs_path, usecols=[config.ISIN_COL])
+                    w_df = load_table(w_secs_path, usecols=[config.ISIN_COL])
                     alt_candidates = w_df[config.ISIN_COL].dropna().astype(str).unique().tolist()
                 except Exception as e:
                     current_app.logger.warning(f"Could not load w_secs.csv for alternate ISIN lookup: {e}")
@@ -444,7 +445,7 @@ def security_details(metric_name, security_id):
     try:
         users_file = os.path.join(data_folder, "users.csv")
         if os.path.exists(users_file):
-            users_df = pd.read_csv(users_file)
+            users_df = load_table(users_file)
             if "Name" in users_df.columns:
                 users = users_df["Name"].dropna().tolist()
             else:
@@ -464,7 +465,7 @@ def security_details(metric_name, security_id):
     reference_columns = []
     if os.path.exists(reference_path):
         try:
-            ref_df = pd.read_csv(reference_path, dtype=str)
+            ref_df = load_table(reference_path, dtype=str)
             reference_columns = ref_df.columns.tolist()
             # Robust equality: ignore leading/trailing whitespace and case
             isin_col_series = ref_df[config.ISIN_COL].astype(str).str.strip()
@@ -948,7 +949,7 @@ def security_spreads(security_id):
     ref_path = os.path.join(data_folder, "reference.csv")
     if os.path.exists(ref_path):
         try:
-            ref_df = pd.read_csv(ref_path)
+            ref_df = load_table(ref_path)
             # Clean the ISIN for lookup
             cleaned_isin = re.sub(r"-\d+$", "", decoded_security_id)
             ref_row = ref_df[ref_df[config.ISIN_COL] == cleaned_isin]
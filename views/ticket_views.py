@@ -12,7 +12,7 @@ from flask import (
     jsonify,
 )
 from analytics import ticket_processing
-import pandas as pd
+from core.data_catalog import load_table
 from datetime import datetime
 import os
 from typing import List
@@ -28,7 +28,7 @@ def load_users(data_folder_path: str) -> List[str]:
     users_file_path = os.path.join(data_folder_path, "users.csv")
     try:
         if os.path.exists(users_file_path):
-            df = pd.read_csv(users_file_path)
+            df = load_table(users_file_path)
             if "Name" in df.columns:
                 users = df["Name"].dropna().astype(str).tolist()
                 return sorted(users)
@@ -16,6 +16,7 @@ Features:
 
 import os
 import pandas as pd
+from core.data_catalog import load_table
 from flask import (
     Blueprint,
     render_template,
@@ -86,7 +87,7 @@ def load_users(data_folder_path: str):
     users_file_path = os.path.join(data_folder_path, "users.csv")
     try:
         if os.path.exists(users_file_path):
-            df = pd.read_csv(users_file_path)
+            df = load_table(users_file_path)
             if "Name" in df.columns:
                 return df["Name"].dropna().astype(str).tolist()
         return []
@@ -101,7 +102,7 @@ def load_available_securities(data_folder_path: str):
     try:
         if os.path.exists(reference_file_path):
             usecols = ["ISIN", "Security Name", "Ticker", "Security Sub Type"]
-            df = pd.read_csv(
+            df = load_table(
                 reference_file_path,
                 usecols=usecols,
                 encoding_errors="replace",